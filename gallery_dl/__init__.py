@@ -97,6 +97,10 @@ def main():
                 else:
                     signal.signal(signal_num, signal.SIG_IGN)
 
+        # let "batch" archives write pending IDs on SIGTERM and SIGHUP
+        from . import archive
+        archive.SIGNALS = True
+
         if signals := config.get((), "signals-actions"):
             from . import actions
             actions.parse_signals(signals)
@@ -165,24 +169,28 @@ def main():
                           requests.packages.urllib3.__version__)
             except AttributeError:
                 pass
+            log.debug("JSON backend %s", util.JSON_BACKEND)
 
             log.debug("Configuration Files %s", config._files)
 
         if args.cache_file:
             config.set(("cache",), "file", args.cache_file)
 
+        if args.cache_stats:
+            import atexit
+            from . import cache
+            atexit.register(cache.stats)
+
         if args.cache_show:
             from . import cache
             rows = cache.get(args.cache_show)
             if rows is None:
                 return cache.error()
             import pickle
-            cut = (21 if args.cache_show in {"ALL", "EXP", "VAL"} else
-                   22 + len(args.cache_show))
             for key, value, expires in rows:
                 value = util.json_dumps(pickle.loads(value))
                 expires = f" ({expires})" if expires else ""
-                sys.stdout.write(f"{key[cut:]}{expires}:\n  {value}\n\n")
+                sys.stdout.write(f"{key}{expires}:\n  {value}\n\n")
             return 0
 
         if args.cache_clear:
@@ -236,6 +244,7 @@ def main():
             if isinstance(modules, str):
                 modules = modules.split(",")
             extractor.modules = modules
+            extractor._index = False
 
         # external modules
         if args.extractor_sources:
@@ -246,6 +255,7 @@ def main():
 
         if sources:
             modules = []
+            extractor._index = False
 
             for source in sources:
                 if source:
@@ -297,7 +307,7 @@ def main():
                         input_file = (input_file, None)
                     args.input_files.append(input_file)
 
-            if not args.urls and not args.input_files:
+            if not args.urls and not args.input_files and not args.serve:
                 if args.cookies_from_browser or config.interpolate(
                         ("extractor",), "cookies"):
                     args.urls.append("noop")
@@ -370,7 +380,17 @@ def main():
                 from .extractor import common
                 common.CATEGORY_MAP = catmap
 
+            if args.serve:
+                from . import server
+                return server.serve(args.serve)
+
             # process input URLs
+            if args.jobs > 1 and len(input_manager.urls) > 1:
+                from . import parallel
+                if (retval := parallel.run(
+                        input_manager, jobtype, args.jobs)) is not None:
+                    return retval
+
             retval = 0
             for url in input_manager:
                 try:
@@ -598,23 +618,27 @@ class InputManager():
         for i in indicies:
             lines[i] = ""
 
+    def select(self, index):
+        """Select the URL at 'index' for success() and error()"""
+        url = self.urls[index]
+        if isinstance(url, tuple):
+            self._item = url
+            url = url[0]
+        else:
+            self._item = None
+        self._url = url
+        return url
+
     def __iter__(self):
         self._index = 0
         return self
 
     def __next__(self):
         try:
-            url = self.urls[self._index]
+            url = self.select(self._index)
         except IndexError:
             raise StopIteration
 
-        if isinstance(url, tuple):
-            self._item = url
-            url = url[0]
-        else:
-            self._item = None
-        self._url = url
-
         if self._pformat:
             output.stderr_write(self._pformat({
                 "total"  : len(self.urls),
@@ -9,14 +9,18 @@
 """Download Archives"""
 
 import os
+import time
+import atexit
 import logging
 from . import util, formatter
 
 log = logging.getLogger("archive")
+CONNECTIONS = None  # dict of shared SQLite connections, if enabled
+SIGNALS = False  # exit on SIGTERM and SIGHUP when opening "batch" archives
 
 
-def connect(path, prefix, format,
-            table=None, mode=None, pragma=None, pathfmt=None, cache_key=None):
+def connect(path, prefix, format, table=None, mode=None, pragma=None,
+            pathfmt=None, cache_key=None, batch=None):
     keygen = formatter.parse(prefix + format).format_map
 
     if isinstance(path, str) and path.startswith(
@@ -32,12 +36,28 @@ def connect(path, prefix, format,
                           "no longer supported. Use a list of strings "
                           "instead.")
             path = util.expand_path(path)
-        cls = DownloadArchiveMemory if mode == "memory" else DownloadArchive
+        if mode == "memory":
+            cls = DownloadArchiveMemory
+        elif mode == "preload":
+            cls = DownloadArchivePreload
+        elif mode == "batch":
+            cls = DownloadArchiveBatch
+            if SIGNALS:
+                _init_signals()
+            pragma = ("journal_mode=WAL", "synchronous=NORMAL",
+                      *(pragma or ()))
+        else:
+            cls = DownloadArchive
 
     if pathfmt is not None and table:
         table = formatter.parse(table).format_map(pathfmt.kwdict)
 
-    return cls(path, keygen, table, pragma, cache_key)
+    archive = cls(path, keygen, table, pragma, cache_key)
+    if cls is DownloadArchivePreload:
+        archive.prefixgen = formatter.parse(prefix).format_map
+    elif cls is DownloadArchiveBatch and batch:
+        archive.batch_size, archive.batch_interval = batch
+    return archive
 
 
 def sanitize(name):
@@ -48,21 +68,16 @@ class DownloadArchive():
     _sqlite3 = None
 
     def __init__(self, path, keygen, table=None, pragma=None, cache_key=None):
-        if self._sqlite3 is None:
-            DownloadArchive._sqlite3 = __import__("sqlite3")
-
-        try:
-            con = self._sqlite3.connect(
-                path, timeout=60, check_same_thread=False)
-        except self._sqlite3.OperationalError:
-            os.makedirs(os.path.dirname(path))
-            con = self._sqlite3.connect(
-                path, timeout=60, check_same_thread=False)
-        con.isolation_level = None
+        if CONNECTIONS is None:
+            con = self._connect(path)
+            self.close = con.close
+        else:
+            if (con := CONNECTIONS.get(path)) is None:
+                con = CONNECTIONS[path] = self._connect(path)
+            self.close = util.noop
 
         self.keygen = keygen
         self.connection = con
-        self.close = con.close
         self.cursor = cursor = con.cursor()
         self._cache_key = cache_key or "_archive_key"
 
@@ -88,6 +103,20 @@ class DownloadArchive():
             cursor.execute(f"CREATE TABLE IF NOT EXISTS {table} "
                            f"(entry TEXT PRIMARY KEY)")
 
+    def _connect(self, path):
+        if self._sqlite3 is None:
+            DownloadArchive._sqlite3 = __import__("sqlite3")
+
+        try:
+            con = self._sqlite3.connect(
+                path, timeout=60, check_same_thread=False)
+        except self._sqlite3.OperationalError:
+            os.makedirs(os.path.dirname(path))
+            con = self._sqlite3.connect(
+                path, timeout=60, check_same_thread=False)
+        con.isolation_level = None
+        return con
+
     def add(self, kwdict):
         """Add item described by 'kwdict' to archive"""
         key = kwdict.get(self._cache_key) or self.keygen(kwdict)
@@ -141,6 +170,205 @@ class DownloadArchiveMemory(DownloadArchive):
                 cursor.executemany(stmt, ((key,) for key in self.keys))
 
 
+class DownloadArchiveBatch(DownloadArchiveMemory):
+    """Archive writing IDs in batches, one transaction per batch
+
+    Pending IDs get written when there are 'batch_size' of them,
+    when adding an ID 'batch_interval' seconds after the first pending one,
+    and on finalize(), close(), or interpreter exit.
+    """
+
+    def __init__(self, path, keygen, table=None, pragma=None, cache_key=None):
+        DownloadArchiveMemory.__init__(
+            self, path, keygen, table, pragma, cache_key)
+        self._close_connection = self.close
+        self.close = self._close
+        self.batch_size = 100
+        self.batch_interval = 10.0
+        self._deadline = 0.0
+        atexit.register(self.flush)
+
+    def add(self, kwdict):
+        keys = self.keys
+        if not keys:
+            self._deadline = time.monotonic() + self.batch_interval
+        keys.add(kwdict.get(self._cache_key) or self.keygen(kwdict))
+        if len(keys) >= self.batch_size or \
+                time.monotonic() >= self._deadline:
+            self.flush()
+
+    def flush(self):
+        """Write all pending IDs to the archive database"""
+        if not self.keys:
+            return
+
+        cursor = self.cursor
+        # acquire the write lock right away to avoid
+        # failing to upgrade a read lock held by another process
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.executemany(
+                self._stmt_insert, ((key,) for key in self.keys))
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        cursor.execute("COMMIT")
+        self.keys.clear()
+
+    finalize = flush
+
+    def _close(self):
+        atexit.unregister(self.flush)
+        try:
+            self.flush()
+        finally:
+            self._close_connection()
+
+
+class DownloadArchivePreload(DownloadArchive):
+    """Archive checking IDs against preloaded Bloom filters
+
+    All IDs starting with an item's archive prefix get loaded into
+    a Bloom filter on first use, and only IDs that might be present
+    in the archive result in an actual database query.
+
+    IDs added by other connections after loading a filter are missing
+    from it, so once 'PRAGMA data_version' reports such changes,
+    filter misses get checked against the database as well.
+    """
+
+    def __init__(self, path, keygen, table=None, pragma=None, cache_key=None):
+        DownloadArchive.__init__(
+            self, path, keygen, table, pragma, cache_key)
+        self.prefixgen = lambda _: ""
+        self.filters = {}
+        self._prefix = ""
+        self._keys = None
+        self._version = None
+
+        table = "archive" if table is None else sanitize(table)
+        self._stmt_count = f"SELECT count(*) FROM {table}"
+        self._stmt_entries = f"SELECT entry FROM {table}"
+        self._stmt_range = " WHERE entry >= ? AND entry < ?"
+
+    def add(self, kwdict):
+        key = kwdict.get(self._cache_key) or self.keygen(kwdict)
+        self.cursor.execute(self._stmt_insert, (key,))
+        for prefix, keys in self.filters.items():
+            if key.startswith(prefix):
+                keys.add(key)
+
+    def check(self, kwdict):
+        key = kwdict[self._cache_key] = self.keygen(kwdict)
+
+        # a filter for 'prefix' contains all IDs starting with 'prefix',
+        # so it can be reused for any key starting with it
+        if self._keys is None or not key.startswith(self._prefix):
+            self._prefix = prefix = self.prefixgen(kwdict)
+            if (keys := self.filters.get(prefix)) is None:
+                keys = self.filters[prefix] = self.preload(prefix)
+            self._keys = keys
+
+        if key not in self._keys and self._version is not False:
+            if self._data_version() == self._version:
+                return False
+            log.debug("Archive modified by another connection; "
+                      "checking all IDs against the database")
+            self._version = False
+        self.cursor.execute(self._stmt_select, (key,))
+        return self.cursor.fetchone()
+
+    def _data_version(self):
+        # only changes when other connections modify the database
+        self.cursor.execute("PRAGMA data_version")
+        return self.cursor.fetchone()[0]
+
+    def preload(self, prefix):
+        """Return a BloomFilter of all IDs starting with 'prefix'"""
+        if prefix:
+            where = self._stmt_range
+            params = (prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1))
+        else:
+            where = ""
+            params = ()
+
+        cursor = self.connection.cursor()
+        if self._version is None:
+            self._version = self._data_version()
+
+        cursor.execute(self._stmt_count + where, params)
+        keys = BloomFilter(cursor.fetchone()[0])
+
+        cursor.execute(self._stmt_entries + where, params)
+        add = keys.add
+        for entry, in cursor:
+            add(entry)
+
+        log.debug("Preloaded %s IDs with prefix '%s' (%s KiB)",
+                  keys.count, prefix, len(keys.bits) >> 10)
+        return keys
+
+
+class BloomFilter():
+    """Set of strings with false positives but no false negatives
+
+    Uses about 12 bits per expected element for a false positive rate
+    of roughly 0.5%. String hashes are randomized per process,
+    so filters cannot be persisted.
+    """
+
+    def __init__(self, capacity, bits_per_element=12, hashes=4):
+        self.size = size = max((capacity * bits_per_element + 7) & ~7, 8192)
+        self.bits = bytearray(size >> 3)
+        self.hashes = hashes
+        self.count = 0
+
+    def add(self, element):
+        bits = self.bits
+        size = self.size
+        h1 = hash(element)
+        h2 = (h1 >> 32) | 1
+        for _ in range(self.hashes):
+            pos = h1 % size
+            bits[pos >> 3] |= 1 << (pos & 7)
+            h1 += h2
+        self.count += 1
+
+    def __contains__(self, element):
+        bits = self.bits
+        size = self.size
+        h1 = hash(element)
+        h2 = (h1 >> 32) | 1
+        for _ in range(self.hashes):
+            pos = h1 % size
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+            h1 += h2
+        return True
+
+
+def _init_signals():
+    """Exit through SystemExit on SIGTERM and SIGHUP
+
+    Lets atexit functions run and pending archive IDs get written
+    instead of the interpreter getting killed immediately.
+    """
+    import signal
+    try:
+        for name in ("SIGTERM", "SIGHUP"):
+            signum = getattr(signal, name, None)
+            if signum is not None and \
+                    signal.getsignal(signum) is signal.SIG_DFL:
+                signal.signal(signum, _signal_exit)
+    except ValueError:  # not called from the main thread
+        return
+    globals()["_init_signals"] = util.noop
+
+
+def _signal_exit(signum, frame):
+    raise SystemExit(128 + signum)
+
+
 class DownloadArchivePostgresql():
     _psycopg = None
 
@@ -10,8 +10,10 @@
 
 import os
 import time
+import pickle
 import logging
-from . import config, util
+import threading
+from . import config, text, util, lru
 
 log = logging.getLogger("cache")
 DATABASE = PATH = ERR = None
@@ -29,20 +31,97 @@ def database():
 
         import sqlite3
         DATABASE = sqlite3.connect(path_, timeout=60, check_same_thread=False)
+        _setup(DATABASE, path_ != ":memory:")
     except Exception as exc:
         log.debug("Failed to connect to SQLite3 database (%s: %s)",
                   exc.__class__.__name__, exc)
+        DATABASE = None
         ERR = exc
     else:
         log.debug("Connected to SQLite3 database '%s'", path_)
-        DATABASE.execute(
-            "CREATE TABLE IF NOT EXISTS data "
-            "(key TEXT PRIMARY KEY, value TEXT, expires INTEGER)")
+        if path_ != ":memory:":
+            threading.Thread(
+                target=_expire, args=(path_,), daemon=True).start()
 
     globals()["database"] = lambda: DATABASE
     return DATABASE
 
 
+def _setup(db, wal):
+    """Create tables and copy entries from the old 'data' table"""
+    if wal:
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+        except Exception as exc:
+            log.debug("Failed to enable WAL mode (%s: %s)",
+                      exc.__class__.__name__, exc)
+
+    with db:
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(module TEXT, key TEXT, value BLOB, expires INTEGER, "
+            "PRIMARY KEY (module, key)) WITHOUT ROWID")
+        db.execute(
+            "CREATE INDEX IF NOT EXISTS entries_expires "
+            "ON entries (expires) WHERE expires > 0")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS http "
+            "(key TEXT PRIMARY KEY, vary TEXT, status INTEGER, headers TEXT, "
+            "content BLOB, size INTEGER, expires INTEGER, accessed INTEGER)")
+        db.execute(
+            "CREATE INDEX IF NOT EXISTS http_accessed ON http (accessed)")
+
+    if not db.execute("PRAGMA user_version").fetchone()[0]:
+        _migrate(db)
+
+
+def _migrate(db):
+    """Copy entries from 'data(key, value, expires)' to 'entries'
+
+    The 'data' table stays in place for older versions
+    sharing the same database file.
+    """
+    with db:
+        db.execute("BEGIN IMMEDIATE")
+        if db.execute("PRAGMA user_version").fetchone()[0]:
+            return  # already migrated by another process
+        db.execute("PRAGMA user_version = 1")
+
+        try:
+            rows = db.execute("SELECT key, value, expires FROM data")
+        except Exception:
+            return  # no 'data' table
+
+        entries = []
+        for key, value, expires in rows:
+            # 'key' is '<python module>.<function name>[-<argument>]'
+            head, sep, arg = key.partition("-")
+            module, _, name = head.rpartition(".")
+            entries.append((namespace(module), name + sep + arg,
+                            value, expires))
+
+        db.executemany(
+            "INSERT OR IGNORE INTO entries VALUES (?,?,?,?)", entries)
+    log.debug("Migrated %d cache entries", len(entries))
+
+
+def _expire(path):
+    """Delete expired entries using a separate connection"""
+    import sqlite3
+    try:
+        db = sqlite3.connect(path, timeout=60)
+        now = int(time.time())
+        with db:
+            db.execute(
+                "DELETE FROM entries WHERE expires > 0 AND expires < ?",
+                (now,))
+            db.execute("DELETE FROM http WHERE expires <= ?", (now,))
+        db.close()
+    except Exception as exc:
+        log.debug("Failed to delete expired entries (%s: %s)",
+                  exc.__class__.__name__, exc)
+
+
 def path():
     global PATH
 
@@ -50,6 +129,14 @@ def path():
     if path is not util.SENTINEL:
         return util.expand_path(path)
 
+    PATH = os.path.join(directory(), "cache.sqlite3")
+
+    globals()["path"] = lambda: PATH
+    return PATH
+
+
+def directory():
+    """Return the default cache directory and create it if necessary"""
     if util.WINDOWS:
         cachedir = os.environ.get("APPDATA", "~")
     else:
@@ -57,10 +144,7 @@ def path():
 
     cachedir = util.expand_path(os.path.join(cachedir, "gallery-dl"))
     os.makedirs(cachedir, exist_ok=True)
-    PATH = os.path.join(cachedir, "cache.sqlite3")
-
-    globals()["path"] = lambda: PATH
-    return PATH
+    return cachedir
 
 
 def error(ret=1):
@@ -68,6 +152,60 @@ def error(ret=1):
     return ret
 
 
+def namespace(module):
+    """Return the namespace of entries created by Python module 'module'"""
+    if module.startswith("gallery_dl.extractor."):
+        return module[21:]
+    return module
+
+
+def load(db, module, key, now=0):
+    """Return (value, expires) of a valid entry or None"""
+    row = db.execute(
+        "SELECT value, expires FROM entries WHERE module=? AND key=?",
+        (module, key)).fetchone()
+    if row is not None and (not row[1] or row[1] > now):
+        return pickle.loads(row[0]), row[1]
+    return None
+
+
+def store(db, module, key, value, expires=0):
+    """Insert or replace an entry"""
+    db.execute(
+        "INSERT OR REPLACE INTO entries VALUES (?,?,?,?)",
+        (module, key, pickle.dumps(value), expires))
+
+
+def load_many(db, module, keys, now=0):
+    """Return a dict mapping 'keys' of valid entries to their value"""
+    keys = list(keys)
+    result = {}
+    for i in range(0, len(keys), 500):
+        chunk = keys[i:i+500]
+        rows = db.execute(
+            f"SELECT key, value, expires FROM entries "
+            f"WHERE module=? AND key IN ({','.join('?' * len(chunk))})",
+            (module, *chunk))
+        for key, value, expires in rows:
+            if not expires or expires > now:
+                result[key] = pickle.loads(value)
+    return result
+
+
+def store_many(db, module, items, expires=0):
+    """Insert or replace entries for all (key, value) pairs of 'items'"""
+    db.executemany(
+        "INSERT OR REPLACE INTO entries VALUES (?,?,?,?)",
+        [(module, key, pickle.dumps(value), expires)
+         for key, value in items])
+
+
+def delete(db, module, key):
+    """Delete an entry"""
+    db.execute(
+        "DELETE FROM entries WHERE module=? AND key=?", (module, key))
+
+
 def get(module):
     if (db := database()) is None:
         return
@@ -75,18 +213,19 @@ def get(module):
     try:
         if module == "ALL":
             return db.execute(
-                "SELECT * FROM data")
+                "SELECT module || '.' || key, value, expires FROM entries")
         if module == "VAL":
             return db.execute(
-                "SELECT * FROM data WHERE expires > ?",
+                "SELECT module || '.' || key, value, expires FROM entries "
+                "WHERE expires > ?",
                 (int(time.time()),))
         if module == "EXP":
             return db.execute(
-                "SELECT * FROM data WHERE expires < ? AND expires <> 0",
+                "SELECT module || '.' || key, value, expires FROM entries "
+                "WHERE expires < ? AND expires > 0",
                 (int(time.time()),))
         return db.execute(
-            "SELECT * FROM data "
-            "WHERE key LIKE 'gallery_dl.extractor.' || ? || '.%'",
+            "SELECT key, value, expires FROM entries WHERE module=?",
             (module.lower(),))
     except Exception:
         pass  # database not initialized, cannot be modified, etc.
@@ -103,19 +242,142 @@ def clear(module):
 
     try:
         if module == "ALL":
-            cursor.execute("DELETE FROM data")
+            cursor.execute("DELETE FROM entries")
         elif module == "EXP":
             cursor.execute(
-                "DELETE FROM data WHERE expires < ? AND expires <> 0",
+                "DELETE FROM entries WHERE expires < ? AND expires > 0",
                 (int(time.time()),))
         else:
             cursor.execute(
-                "DELETE FROM data "
-                "WHERE key LIKE 'gallery_dl.extractor.' || ? || '.%'",
-                (module.lower(),))
+                "DELETE FROM entries WHERE module=?", (module.lower(),))
     except Exception:
         pass  # database not initialized, cannot be modified, etc.
     else:
         rowcount = cursor.rowcount
         db.commit()
     return rowcount
+
+
+def stats():
+    """Log statistics of all in-memory and HTTP response caches"""
+    for name, cache in lru.CACHES.items():
+        log.info("%-9s %5d/%d entries, %d hits, %d misses, %d evictions",
+                 name, len(cache), cache.maxsize,
+                 cache.hits, cache.misses, cache.evictions)
+
+    stats = ResponseCache.stats
+    log.info("%-9s %d hits, %d misses, %d stored",
+             "http", stats["hit"], stats["miss"], stats["store"])
+
+
+class ResponseCache():
+    """Store HTTP responses to revalidate them with conditional requests
+
+    Only responses with an 'ETag' or 'Last-Modified' header get stored.
+    Entries expire after 'ttl' seconds and the least recently used ones
+    get removed when their total size exceeds 'http-size'.
+    """
+    _lock = threading.Lock()
+    stats = {"hit": 0, "miss": 0, "store": 0}
+
+    # response headers restored for cached responses
+    HEADERS = (
+        "Content-Type",
+        "Content-Range",
+        "ETag",
+        "Last-Modified",
+    )
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self.size = text.parse_bytes(config.get(
+            ("cache",), "http-size", "256M"))
+
+    def lookup(self, key, headers):
+        """Return a cached entry for 'key' matching 'headers' or None"""
+        if (db := database()) is None:
+            return None
+
+        with self._lock:
+            row = db.execute(
+                "SELECT vary, status, headers, content FROM http "
+                "WHERE key=? AND expires > ?",
+                (key, int(time.time()))).fetchone()
+        if row is None:
+            return None
+
+        vary, status, rheaders, content = row
+        vary = util.json_loads(vary)
+        for name, value in vary.items():
+            if headers.get(name) != value:
+                return None
+        return status, util.json_loads(rheaders), content
+
+    def store(self, key, headers, response):
+        """Store 'response' for 'key'"""
+        rheaders = response.headers
+        cache_control = rheaders.get("Cache-Control", "")
+        if "no-store" in cache_control or \
+                "ETag" not in rheaders and "Last-Modified" not in rheaders:
+            return False
+
+        vary = {}
+        if names := rheaders.get("Vary"):
+            for name in names.split(","):
+                if (name := name.strip()) == "*":
+                    return False
+                vary[name] = headers.get(name)
+
+        if (db := database()) is None:
+            return False
+        content = response.content
+        now = int(time.time())
+
+        with self._lock, db:
+            db.execute(
+                "INSERT OR REPLACE INTO http VALUES (?,?,?,?,?,?,?,?)", (
+                    key,
+                    util.json_dumps(vary),
+                    response.status_code,
+                    util.json_dumps({
+                        name: rheaders[name]
+                        for name in self.HEADERS
+                        if name in rheaders
+                    }),
+                    content,
+                    len(content),
+                    now + self.ttl,
+                    now,
+                ))
+            self._evict(db, now)
+
+        self.stats["store"] += 1
+        return True
+
+    def touch(self, key):
+        """Mark the entry for 'key' as recently used"""
+        if (db := database()) is None:
+            return
+        now = int(time.time())
+        with self._lock, db:
+            db.execute(
+                "UPDATE http SET accessed=?, expires=? WHERE key=?",
+                (now, now + self.ttl, key))
+
+    def _evict(self, db, now):
+        db.execute("DELETE FROM http WHERE expires <= ?", (now,))
+
+        total = db.execute("SELECT SUM(size) FROM http").fetchone()[0]
+        if not total or total <= self.size:
+            return
+
+        excess = total - self.size
+        rows = db.execute(
+            "SELECT key, size FROM http ORDER BY accessed").fetchall()
+        keys = []
+        for key, size in rows:
+            keys.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        db.executemany("DELETE FROM http WHERE key=?", keys)
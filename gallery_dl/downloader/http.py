@@ -8,7 +8,9 @@
 
 """Downloader module for http:// and https:// URLs"""
 
+import os
 import time
+import threading
 import mimetypes
 from requests.exceptions import RequestException, ConnectionError, Timeout
 from .common import DownloaderBase
@@ -40,6 +42,9 @@ class HttpDownloader(DownloaderBase):
         self.verify = self.config("verify", extractor._verify)
         self.mtime = self.config("mtime", True)
         self.rate = self.config("rate")
+        self.segments = self.config("segments", 1)
+        self.digests = job.digests
+        self.stream = job.stream
         interval_429 = self.config("sleep-429")
 
         if self.config("consume-content", False):
@@ -64,6 +69,15 @@ class HttpDownloader(DownloaderBase):
                 self.log.warning(
                     "Invalid maximum file size (%r)", self.maxsize)
             self.maxsize = maxsize
+        if self.segments and self.segments > 1 and not self.rate:
+            threshold = self.config("segments-threshold", "32M")
+            self.segments_threshold = text.parse_bytes(threshold)
+            if not self.segments_threshold:
+                self.log.warning(
+                    "Invalid segments threshold (%r)", threshold)
+                self.segments_threshold = 33554432
+        else:
+            self.segments = 0
         if isinstance(self.chunk_size, str):
             chunk_size = text.parse_bytes(self.chunk_size)
             if not chunk_size:
@@ -110,8 +124,9 @@ class HttpDownloader(DownloaderBase):
                 util.remove_file(pathfmt.temppath)
 
     def _download_impl(self, url, pathfmt):
-        response = None
+        response = retry_after = state = None
         tries = code = 0
+        segments = self.segments
         msg = ""
 
         metadata = self.metadata
@@ -130,6 +145,8 @@ class HttpDownloader(DownloaderBase):
 
             if tries:
                 if response:
+                    if code == 429:
+                        retry_after = util.retry_after(response)
                     self.release_conn(response)
                     response = None
 
@@ -138,14 +155,20 @@ class HttpDownloader(DownloaderBase):
                     return False
 
                 if code == 429 and self.interval_429:
-                    s = self.interval_429(tries)
-                    time.sleep(s if s > tries else tries)
+                    s = (self.interval_429(tries) if retry_after is None else
+                         retry_after)
+                    # delay all downloads from this host
+                    util.ratelimiter(url, "download").block(
+                        s if s > tries else tries)
                 else:
                     time.sleep(tries)
                 code = 0
 
             tries += 1
-            file_header = None
+            file_header = hashes = None
+
+            if (seconds := util.ratelimiter(url, "download").acquire()) > 0.0:
+                time.sleep(seconds)
 
             # collect HTTP headers
             headers = {"Accept": "*/*"}
@@ -157,7 +180,11 @@ class HttpDownloader(DownloaderBase):
                 headers.update(self.headers)
             #   partial content
             if file_size := pathfmt.part_size():
-                headers["Range"] = f"bytes={file_size}-"
+                if (state := self._segments_load(pathfmt)) is not None:
+                    # segmented downloads use preallocated files
+                    file_size = 0
+                else:
+                    headers["Range"] = f"bytes={file_size}-"
 
             # connect to (remote) source
             try:
@@ -318,18 +345,60 @@ class HttpDownloader(DownloaderBase):
                     response.close()
                     return True
 
+            # download content using multiple connections
+            if segments and code == 200 and \
+                    size and size >= self.segments_threshold and \
+                    response.headers.get("Accept-Ranges") == "bytes" and \
+                    response.headers.get(
+                        "Content-Encoding", "identity") == "identity" and \
+                    "_http_data" not in kwdict and \
+                    "_http_segmented" not in kwdict:
+                response.close()
+                self.downloading = True
+                result = self._download_segments(
+                    response.url, pathfmt, headers, size, state)
+                if result is None:
+                    # byte ranges not supported as advertised
+                    segments = 0
+                    state = response = None
+                    util.remove_file(pathfmt.temppath)
+                    msg = "Falling back to a single connection"
+                    tries -= 1
+                    continue
+                if not result:
+                    return False
+
+                if self.digests:
+                    with open(pathfmt.temppath, "rb") as fp:
+                        hashes = self._digests_init(fp, size)
+                    kwdict["_digests"] = self._digests_result(
+                        pathfmt.temppath, hashes)
+                break
+
             # set open mode
             if not offset:
                 mode = "w+b"
                 if file_size:
                     self.log.debug("Unable to resume partial download")
+                elif state is not None:
+                    state = None
+                    self.log.debug("Unable to resume segmented download")
+                    util.remove_file(pathfmt.temppath + ".segments")
             else:
                 mode = "r+b"
                 self.log.debug("Resuming download at byte %d", offset)
 
+            # write content directly to its destination
+            # unless this is a retry or resumed download
+            if self.stream is not None and tries == 1 and \
+                    not offset and not pathfmt.part_size():
+                stream = self.stream(pathfmt, size)
+            else:
+                stream = None
+
             # download content
             self.downloading = True
-            with pathfmt.open(mode) as fp:
+            with pathfmt.open(mode) if stream is None else stream as fp:
                 if fp is None:
                     # '.part' file no longer exists
                     break
@@ -342,9 +411,15 @@ class HttpDownloader(DownloaderBase):
                         self._adjust_extension(pathfmt, fp.read(16))
                     fp.seek(offset)
 
+                if self.digests:
+                    hashes = self._digests_init(fp, offset)
+                    writer = DigestWriter(fp, hashes)
+                else:
+                    writer = fp
+
                 self.out.start(pathfmt.path)
                 try:
-                    self.receive(fp, content, size, offset)
+                    self.receive(writer, content, size, offset)
                 except (RequestException, SSLError) as exc:
                     msg = str(exc)
                     output.stderr_write("\n")
@@ -368,6 +443,12 @@ class HttpDownloader(DownloaderBase):
                         output.stderr_write("\n")
                     continue
 
+                if stream is not None:
+                    stream.commit()
+
+            if hashes is not None:
+                kwdict["_digests"] = self._digests_result(
+                    pathfmt.temppath, hashes)
             break
 
         self.downloading = False
@@ -381,6 +462,240 @@ class HttpDownloader(DownloaderBase):
 
         return True
 
+    def _download_segments(self, url, pathfmt, headers, size, state):
+        """Download 'url' as multiple byte ranges simultaneously
+
+        Progress of each segment gets stored in a '.segments' file
+        next to the '.part' file to be able to resume all of them.
+
+        Return None if the server does not respond with the requested
+        byte ranges and the file needs to be downloaded as a whole.
+        """
+        import concurrent.futures
+
+        path = pathfmt.temppath
+        statepath = path + ".segments" if self.part else None
+
+        if state and state.get("size") == size:
+            segments = state["segments"]
+            self.log.debug("Resuming segmented download at byte %d",
+                           size - self._segments_remaining(segments))
+        else:
+            step = -(-size // self.segments)
+            segments = [[start, min(start + step, size) - 1]
+                        for start in range(0, size, step)]
+            with pathfmt.open("wb") as fp:
+                fp.truncate(size)
+
+        self.log.debug("Downloading %s bytes in %s segments",
+                       size, len(segments))
+        stop = threading.Event()
+        executor = concurrent.futures.ThreadPoolExecutor(
+            len(segments), "segment")
+        futures = [
+            executor.submit(
+                self._receive_segment,
+                url, path, headers, size, segment, stop)
+            for segment in segments
+        ]
+
+        progress = self.progress
+        bytes_start = size - self._segments_remaining(segments)
+        time_start = time.monotonic()
+        success = fallback = False
+
+        self.out.start(pathfmt.path)
+        try:
+            while True:
+                done, futures = concurrent.futures.wait(
+                    futures, 1.0, concurrent.futures.FIRST_EXCEPTION)
+                for future in done:
+                    if (result := future.result()) is None:
+                        fallback = True
+                    if not result:
+                        return result
+                if not futures:
+                    success = True
+                    return True
+
+                if FLAGS.DOWNLOAD is not None:
+                    return FLAGS.process("DOWNLOAD")
+                if statepath:
+                    self._segments_save(statepath, size, segments)
+
+                if progress is not None:
+                    time_elapsed = time.monotonic() - time_start
+                    if time_elapsed > progress:
+                        bytes_downloaded = \
+                            size - self._segments_remaining(segments)
+                        self.out.progress(size, bytes_downloaded, int(
+                            (bytes_downloaded - bytes_start) / time_elapsed))
+        finally:
+            stop.set()
+            executor.shutdown()
+            if statepath:
+                if success or fallback:
+                    util.remove_file(statepath)
+                else:
+                    self._segments_save(statepath, size, segments)
+
+    def _receive_segment(self, url, path, headers, size, segment, stop):
+        """Write the byte range of 'segment' to 'path'
+
+        'segment' is a [position, end] list updated while downloading.
+        Return False if the segment could not be completed
+        and None if the server ignored the requested range.
+        """
+        # byte ranges refer to the encoded content
+        headers = headers.copy()
+        headers["Accept-Encoding"] = "identity"
+        retry_after = None
+        tries = code = 0
+        msg = ""
+
+        while not stop.is_set():
+            if segment[0] > segment[1]:
+                return True
+            if tries:
+                self.log.warning("%s (%s/%s)", msg, tries, self.retries+1)
+                if tries > self.retries:
+                    return False
+                if code == 429 and self.interval_429:
+                    s = (self.interval_429(tries) if retry_after is None else
+                         retry_after)
+                    # delay all downloads from this host
+                    util.ratelimiter(url, "download").block(
+                        s if s > tries else tries)
+                else:
+                    stop.wait(tries)
+                code = 0
+            tries += 1
+
+            if (seconds := util.ratelimiter(url, "download").acquire()) > 0.0:
+                stop.wait(seconds)
+
+            start, end = segment
+            headers["Range"] = f"bytes={start}-{end}"
+            try:
+                response = self.session.request(
+                    "GET", url,
+                    stream=True,
+                    headers=headers,
+                    timeout=self.timeout,
+                    proxies=self.proxies,
+                    verify=self.verify,
+                )
+            except (RequestException, SSLError) as exc:
+                msg = str(exc)
+                continue
+
+            code = response.status_code
+            if code == 200 or code == 206 and not self._check_content_range(
+                    response.headers.get("Content-Range"), start, end, size):
+                response.close()
+                self.log.warning(
+                    "Invalid response for bytes %s-%s ('%s %s', "
+                    "Content-Range: %s)", start, end, code, response.reason,
+                    response.headers.get("Content-Range"))
+                return None
+            if code != 206:
+                if code == 429:
+                    retry_after = util.retry_after(response)
+                response.close()
+                msg = f"'{code} {response.reason}' for bytes {start}-{end}"
+                if code == 429 or code in self.retry_codes or \
+                        500 <= code < 600:
+                    continue
+                self.log.warning(msg)
+                return False
+
+            try:
+                with open(path, "r+b", buffering=0) as fp:
+                    fp.seek(start)
+                    for data in response.iter_content(self.chunk_size):
+                        if stop.is_set():
+                            return False
+                        remaining = end + 1 - segment[0]
+                        if len(data) >= remaining:
+                            fp.write(data[:remaining])
+                            segment[0] = end + 1
+                            return True
+                        fp.write(data)
+                        segment[0] += len(data)
+            except (RequestException, SSLError) as exc:
+                msg = str(exc)
+            else:
+                msg = f"Incomplete segment ({segment[0]} <= {end})"
+            finally:
+                response.close()
+
+        return False
+
+    def _check_content_range(self, value, start, end, size):
+        """Return True if 'value' describes a range from 'start' to
+        at most 'end' of a 'size' bytes file"""
+        try:
+            unit, _, value = value.partition(" ")
+            first, _, value = value.partition("-")
+            last, _, total = value.partition("/")
+            return (unit == "bytes" and int(first) == start and
+                    start <= int(last) <= end and
+                    (total == "*" or int(total) == size))
+        except (AttributeError, ValueError):
+            return False
+
+    def _digests_init(self, fp, offset):
+        """Return hash objects for all requested digests
+
+        Data already on disk, i.e. from a resumed '.part' file,
+        gets read back from 'fp' up to 'offset'.
+        """
+        import hashlib
+        hashes = [(name, hashlib.new(name)) for name in self.digests]
+
+        if offset:
+            fp.seek(0)
+            size = self.chunk_size
+            while offset > 0:
+                data = fp.read(size if size < offset else offset)
+                if not data:
+                    break
+                for _, h in hashes:
+                    h.update(data)
+                offset -= len(data)
+
+        return hashes
+
+    def _digests_result(self, path, hashes):
+        """Return digests of a finished download and its file status"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return {
+            "path" : path,
+            "size" : stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "hexdigests": {name: h.hexdigest() for name, h in hashes},
+        }
+
+    def _segments_load(self, pathfmt):
+        """Return the state of an interrupted segmented download"""
+        try:
+            with open(pathfmt.temppath + ".segments") as fp:
+                return util.json_loads(fp.read())
+        except (OSError, ValueError):
+            return None
+
+    def _segments_save(self, path, size, segments):
+        """Store the progress of all segments in 'path'"""
+        with open(path + ".tmp", "w") as fp:
+            fp.write(util.json_dumps({"size": size, "segments": segments}))
+        os.replace(path + ".tmp", path)
+
+    def _segments_remaining(self, segments):
+        return sum(end + 1 - pos for pos, end in segments)
+
     def _release_conn_impl(self, response):
         """Release connection back to pool by consuming response body"""
         try:
@@ -460,6 +775,22 @@ class HttpDownloader(DownloaderBase):
         return False
 
 
+class DigestWriter():
+    """Update hash objects with all data written to a file"""
+
+    def __init__(self, fp, hashes):
+        self.fp = fp
+        self.updates = [h.update for _, h in hashes]
+
+    def write(self, data):
+        for update in self.updates:
+            update(data)
+        return self.fp.write(data)
+
+    def tell(self):
+        return self.fp.tell()
+
+
 MIME_TYPES = {
     "image/jpeg"    : "jpg",
     "image/jpg"     : "jpg",
@@ -32,7 +32,7 @@ class YoutubeDLDownloader(DownloaderBase):
             "ignoreerrors": True,
         }
 
-        self.ytdl_instance = None
+        self.module = None
         self.rate_dyn = None
         self.forward_cookies = self.config("forward-cookies", True)
         self.progress = self.config("progress", 3.0)
@@ -40,86 +40,96 @@ class YoutubeDLDownloader(DownloaderBase):
 
     def download(self, url, pathfmt):
         kwdict = pathfmt.kwdict
-        tries = 0
-
         kwdict["_mtime_http"] = None
+
         if ytdl_instance := kwdict.pop("_ytdl_instance", None):
             # 'ytdl' extractor
             self._prepare(ytdl_instance)
             info_dict = kwdict.pop("_ytdl_info_dict")
-        else:
-            # other extractors
-            ytdl_instance = self.ytdl_instance
-            if not ytdl_instance:
-                try:
-                    module = ytdl.import_module(self.config("module"))
-                except (ImportError, SyntaxError) as exc:
-                    if exc.__context__:
-                        self.log.error("Cannot import yt-dlp or youtube-dl")
-                    else:
-                        self.log.error("Cannot import module '%s'",
-                                       getattr(exc, "name", ""))
-                    self.log.traceback(exc)
-                    self.download = lambda u, p: False
-                    return False
+            return self._download(ytdl_instance, pathfmt, info_dict, 0)
 
-                try:
-                    ytdl_version = module.version.__version__
-                except Exception:
-                    ytdl_version = ""
-                self.log.debug("Using %s version %s", module, ytdl_version)
-
-                self.ytdl_instance = ytdl_instance = ytdl.construct_YoutubeDL(
-                    module, self, self.ytdl_opts, kwdict.get("_ytdl_params"))
-                self.ytdl_pp = module.postprocessor
-                if self.outtmpl == "default":
-                    self.outtmpl = module.DEFAULT_OUTTMPL
-                self._prepare(ytdl_instance)
+        # other extractors
+        if (module := self.module) is None:
+            try:
+                module = ytdl.import_module(self.config("module"))
+            except (ImportError, SyntaxError) as exc:
+                if exc.__context__:
+                    self.log.error("Cannot import yt-dlp or youtube-dl")
+                else:
+                    self.log.error("Cannot import module '%s'",
+                                   getattr(exc, "name", ""))
+                self.log.traceback(exc)
+                self.download = lambda u, p: False
+                return False
 
+            try:
+                ytdl_version = module.version.__version__
+            except Exception:
+                ytdl_version = ""
+            self.log.debug("Using %s version %s", module, ytdl_version)
+
+            self.module = module
+            self.ytdl_pp = module.postprocessor
+            if self.outtmpl == "default":
+                self.outtmpl = module.DEFAULT_OUTTMPL
+
+        ytdl_instance = ytdl.acquire_YoutubeDL(
+            module, self, self.ytdl_opts, kwdict.get("_ytdl_params"))
+        try:
+            self._prepare(ytdl_instance)
             if self.forward_cookies:
                 self.log.debug("Forwarding cookies to %s",
                                ytdl_instance.__module__)
-                set_cookie = ytdl_instance.cookiejar.set_cookie
-                for cookie in self.session.cookies:
-                    set_cookie(cookie)
-
-            url = url[5:]
-            manifest = kwdict.get("_ytdl_manifest")
-            while True:
-                if FLAGS.DOWNLOAD is not None:
-                    return FLAGS.process("DOWNLOAD")
-
-                tries += 1
-                self.error = None
-                try:
-                    if manifest is None:
-                        info_dict = self._extract_url(
-                            ytdl_instance, url)
-                    else:
-                        info_dict = self._extract_manifest(
-                            ytdl_instance, url, kwdict)
-                except Exception as exc:
-                    self.log.traceback(exc)
-                    cls = exc.__class__
-                    if cls.__module__ == "builtins":
-                        tries = False
-                    msg = f"{cls.__name__}: {exc}"
+                ytdl.set_cookies(ytdl_instance, self.session.cookies)
+
+            info_dict, tries = self._extract(ytdl_instance, url[5:], kwdict)
+            if not info_dict:
+                return info_dict
+            return self._download(ytdl_instance, pathfmt, info_dict, tries)
+        finally:
+            ytdl.release_YoutubeDL(ytdl_instance)
+
+    def _extract(self, ytdl_instance, url, kwdict):
+        manifest = kwdict.get("_ytdl_manifest")
+        tries = 0
+
+        while True:
+            if FLAGS.DOWNLOAD is not None:
+                return FLAGS.process("DOWNLOAD"), tries
+
+            tries += 1
+            self.error = None
+            try:
+                if manifest is None:
+                    info_dict = self._extract_url(
+                        ytdl_instance, url)
                 else:
-                    if self.error is not None:
-                        msg = self.error
-                    elif not info_dict:
-                        msg = "Empty 'info_dict' data"
-                    else:
-                        break
-
-                if tries:
-                    self.log.error("%s (%s/%s)", msg, tries, self.retries+1)
+                    info_dict = self._extract_manifest(
+                        ytdl_instance, url, kwdict)
+            except Exception as exc:
+                self.log.traceback(exc)
+                cls = exc.__class__
+                if cls.__module__ == "builtins":
+                    tries = False
+                msg = f"{cls.__name__}: {exc}"
+            else:
+                if self.error is not None:
+                    msg = self.error
+                elif not info_dict:
+                    msg = "Empty 'info_dict' data"
                 else:
-                    self.log.error(msg)
-                    return False
-                if tries > self.retries:
-                    return False
+                    return info_dict, tries
+
+            if tries:
+                self.log.error("%s (%s/%s)", msg, tries, self.retries+1)
+            else:
+                self.log.error(msg)
+                return False, tries
+            if tries > self.retries:
+                return False, tries
 
+    def _download(self, ytdl_instance, pathfmt, info_dict, tries):
+        kwdict = pathfmt.kwdict
         if extra := kwdict.get("_ytdl_extra"):
             info_dict.update(extra)
 
@@ -240,7 +250,7 @@ class YoutubeDLDownloader(DownloaderBase):
 
         if remux:
             info_dict["__postprocessors"] = [
-                self.ytdl_pp.FFmpegVideoRemuxerPP(self.ytdl_instance, remux)]
+                self.ytdl_pp.FFmpegVideoRemuxerPP(ytdl, remux)]
 
         return info_dict
 
@@ -322,15 +332,22 @@ class YoutubeDLDownloader(DownloaderBase):
         return status
 
     def _prepare(self, ytdl_instance):
-        if "__gdl_initialize" not in ytdl_instance.params:
+        params = ytdl_instance.params
+        if "__gdl_initialize" not in params:
             return
 
-        del ytdl_instance.params["__gdl_initialize"]
+        del params["__gdl_initialize"]
         if self.progress is not None:
-            ytdl_instance.add_progress_hook(self._progress_hook)
-        if rlf := ytdl_instance.params.pop("__gdl_ratelimit_func", False):
+            if "__gdl_progress" not in params:
+                # pooled instances keep their hooks between uses
+                ytdl_instance.add_progress_hook(
+                    lambda info: params["__gdl_progress"](info))
+            params["__gdl_progress"] = self._progress_hook
+        elif "__gdl_progress" in params:
+            params["__gdl_progress"] = util.noop
+        if rlf := params.pop("__gdl_ratelimit_func", False):
             self.rate_dyn = rlf
-        ytdl_instance.params["logger"] = LoggerAdapter(self, ytdl_instance)
+        params["logger"] = LoggerAdapter(self, ytdl_instance)
 
     def _progress_hook(self, info):
         if info["status"] == "downloading" and \
@@ -7,6 +7,7 @@
 # published by the Free Software Foundation.
 
 import sys
+from .. import config
 from ..text import re_compile
 
 modules = [
@@ -272,7 +273,7 @@ modules = [
 
 def find(url):
     """Find a suitable extractor for the given URL"""
-    for cls in _list_classes():
+    for cls in _classes_for(url):
         if match := cls.pattern.match(url):
             return cls(match)
     return None
@@ -280,20 +281,19 @@ def find(url):
 
 def add(cls):
     """Add 'cls' to the list of available extractors"""
+    global _index
     if isinstance(cls.pattern, str):
         cls.pattern = re_compile(cls.pattern)
     _cache.append(cls)
+    _index = False
     return cls
 
 
 def add_module(module):
     """Add all extractors in 'module' to the list of available extractors"""
-    if classes := _get_classes(module):
-        if isinstance(classes[0].pattern, str):
-            for cls in classes:
-                cls.pattern = re_compile(cls.pattern)
-        _cache.extend(classes)
-    return classes
+    global _index
+    _index = False
+    return _add_module(module)
 
 
 def extractors():
@@ -313,11 +313,81 @@ def _list_classes():
     yield from _cache
 
     for module in _module_iter:
-        yield from add_module(module)
+        yield from _add_module(module)
 
     globals()["_list_classes"] = lambda : _cache
 
 
+def _classes_for(url):
+    """Yield extractor classes whose pattern could match 'url'"""
+    if _index is None:
+        _index_load()
+    return _index_lookup(url) if _index else _list_classes()
+
+
+def _index_load():
+    """Load the precomputed URL dispatch index"""
+    global _index
+    try:
+        from . import index
+    except ImportError:
+        index = False
+    _index = index
+
+
+def _index_lookup(url):
+    """Yield candidate extractor classes for 'url' from the index"""
+    if not isinstance(url, str):
+        yield from _list_classes()
+        return
+
+    index = _index
+    url = url.lower()
+    positions = set(index.FALLBACK)
+
+    scheme, sep, _ = url.partition(":")
+    if sep and scheme + sep in index.SCHEMES:
+        positions.update(index.SCHEMES[scheme + sep])
+
+    host = _index_host(url).group(1)
+    if host in index.HOSTS:
+        positions.update(index.HOSTS[host])
+    suffixes = index.SUFFIXES
+    idx = host.find(".")
+    while idx >= 0:
+        if host[idx:] in suffixes:
+            positions.update(suffixes[host[idx:]])
+        idx = host.find(".", idx + 1)
+
+    for basecategory, pos in index.BASECATEGORIES.items():
+        if config.get(("extractor",), basecategory):
+            positions.update(pos)
+    for (category, key), pos in index.CONDITIONAL.items():
+        if config.get(("extractor", category), key):
+            positions.update(pos)
+
+    for pos in sorted(positions):
+        try:
+            cls = _index_cache[pos]
+        except KeyError:
+            module_name, name = index.CLASSES[pos]
+            module = __import__(module_name, globals(), None, None, 1)
+            cls = _index_cache[pos] = getattr(module, name)
+            if isinstance(cls.pattern, str):
+                cls.pattern = re_compile(cls.pattern)
+        yield cls
+
+
+def _add_module(module):
+    """Add all extractors in 'module' to the list of classes"""
+    if classes := _get_classes(module):
+        for cls in classes:
+            if isinstance(cls.pattern, str):
+                cls.pattern = re_compile(cls.pattern)
+        _cache.extend(classes)
+    return classes
+
+
 def _modules_internal():
     globals_ = globals()
     for module_name in modules:
@@ -347,3 +417,6 @@ def _get_classes(module):
 
 _cache = []
 _module_iter = _modules_internal()
+_index = None
+_index_cache = {}
+_index_host = re_compile(r"(?:https?://)?([^/?#]*)").match
@@ -9,8 +9,13 @@
 """Extractors for *booru sites"""
 
 from .common import BaseExtractor, Message
-from .. import text
+from .. import text, cache, lru
+import itertools
 import operator
+import time
+
+# (category, tag name) -> tag type
+TAG_TYPES = lru.LRUCache("tagtypes", 16384)
 
 
 class BooruExtractor(BaseExtractor):
@@ -19,12 +24,18 @@ class BooruExtractor(BaseExtractor):
     filename_fmt = "{category}_{id}_{md5}.{extension}"
     page_start = 0
     per_page = 100
+    tags_expires = 2592000
 
     def items(self):
         self.login()
         data = self.metadata()
+        posts = self.posts()
         tags = self.config("tags", False)
         notes = self.config("notes", False)
+
+        if tags and not notes and self._tag_types is not None:
+            posts = self._tags_resolve(posts)
+            tags = False
         fetch_html = tags or notes
 
         if url_key := self.config("url"):
@@ -34,7 +45,7 @@ class BooruExtractor(BaseExtractor):
             else:
                 self._file_url = operator.itemgetter(url_key)
 
-        for post in self.posts():
+        for post in posts:
             try:
                 url = self._file_url(post)
                 if url[0] == "/":
@@ -92,5 +103,104 @@ class BooruExtractor(BaseExtractor):
     def _tags(self, post, page):
         """Extract extended tag metadata"""
 
+    # Return a dict mapping tag names to their type for a list of names.
+    # Enables '_tags_resolve()' when implemented by a subclass.
+    _tag_types = None
+
+    def _tags_resolve(self, posts):
+        """Add extended tag metadata to 'posts' in batches
+
+        Tag types get looked up in a shared cache and requested
+        from the site's API only when unknown.
+        Posts with unresolvable tags fall back to '_html()' & '_tags()'.
+        """
+        posts = iter(posts)
+        unescape = text.unescape
+        while batch := list(itertools.islice(posts, self.per_page)):
+            # 'tags' strings contain HTML-escaped names like "&#039;"
+            names = [
+                [unescape(name) for name in post["tags"].split()]
+                for post in batch
+            ]
+            types = self._tag_types_lookup({
+                name
+                for post_names in names
+                for name in post_names
+            })
+
+            for post, post_names in zip(batch, names):
+                tags = {}
+                for name in post_names:
+                    if (tag_type := types.get(name)) is None:
+                        self._tags(post, self._html(post))
+                        break
+                    if tag_type in tags:
+                        tags[tag_type].append(name)
+                    else:
+                        tags[tag_type] = [name]
+                else:
+                    for key, value in tags.items():
+                        post["tags_" + key] = " ".join(value)
+                yield post
+
+    def _tag_types_lookup(self, names):
+        """Return a dict with the types of all known tags in 'names'"""
+        category = self.category
+        types = {}
+        missing = []
+        for name in names:
+            try:
+                types[name] = TAG_TYPES[(category, name)]
+            except KeyError:
+                missing.append(name)
+        if not missing:
+            return types
+
+        db = cache.database()
+        module = cache.namespace(__name__)
+        prefix = f"tagtype-{category}-"
+
+        if db is not None:
+            found = cache.load_many(
+                db, module, [prefix + name for name in missing],
+                int(time.time()))
+            if found:
+                offset = len(prefix)
+                for key, tag_type in found.items():
+                    name = key[offset:]
+                    types[name] = TAG_TYPES[(category, name)] = tag_type
+                missing = [name for name in missing if name not in types]
+
+        if not missing or self._tag_types is None:
+            return types
+
+        self.log.debug("Requesting types of %s tags", len(missing))
+        fetched = {}
+        try:
+            for i in range(0, len(missing), 100):
+                fetched.update(self._tag_types(missing[i:i+100]))
+        except Exception as exc:
+            self.log.warning("Unable to fetch tag types from API (%s: %s)",
+                             exc.__class__.__name__, exc)
+            self._tag_types = None
+        else:
+            for name in missing:
+                if name not in fetched:
+                    # remember unknown tags for this process only
+                    TAG_TYPES[(category, name)] = None
+
+        for name, tag_type in fetched.items():
+            types[name] = TAG_TYPES[(category, name)] = tag_type
+
+        if db is not None and fetched:
+            with db:
+                cache.store_many(
+                    db, module,
+                    [(prefix + name, tag_type)
+                     for name, tag_type in fetched.items()
+                     if tag_type is not None],
+                    int(time.time()) + self.tags_expires)
+        return types
+
     def _notes(self, post, page):
         """Extract notes metadata"""
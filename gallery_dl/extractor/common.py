@@ -14,16 +14,16 @@ import ssl
 import time
 import netrc
 import queue
-import pickle
 import random
 import getpass
+import hashlib
 import logging
 import requests
 import threading
 from xml.etree import ElementTree
 from requests.adapters import HTTPAdapter
 from .message import Message
-from .. import config, output, text, util, dt, cache, exception
+from .. import config, output, text, util, dt, cache, lru, exception
 urllib3 = requests.packages.urllib3
 
 
@@ -53,8 +53,8 @@ class Extractor():
     request_interval = 0.0
     request_interval_min = 0.0
     request_interval_429 = 60.0
-    request_timestamp = 0.0
     finalize = skip_files = skip_posts = skip_children = skip_date = None
+    watermark = None
     exc = exception
 
     def __init__(self, match):
@@ -168,16 +168,26 @@ class Extractor():
                 else:
                     kwargs["headers"] = {"Content-Type": "application/json"}
 
+        if self._http_cache is not None and method == "GET" and \
+                "data" not in kwargs and not kwargs.get("stream"):
+            cached = self._http_cache_lookup(url, session, kwargs)
+        else:
+            cached = None
+
         response = challenge = None
         tries = 1
 
-        if self._interval_request is not None and interval:
-            seconds = (self._interval_request() -
-                       (time.time() - Extractor.request_timestamp))
-            if seconds > 0.0:
-                self.sleep(seconds, "request")
+        limiter = util.ratelimiter(url) if interval else None
 
         while True:
+            if limiter is not None:
+                # every attempt, including retries, takes its own slot
+                seconds = limiter.acquire(
+                    0.0 if self._interval_request is None else
+                    self._interval_request())
+                if seconds > 0.0:
+                    self.sleep(seconds, "request")
+
             try:
                 response = session.request(method, url, **kwargs)
             except requests.exceptions.ConnectionError as exc:
@@ -198,6 +208,8 @@ class Extractor():
                 msg = exc
                 break
             else:
+                if cached is not None:
+                    response = self._http_cache_update(response, *cached)
                 code = response.status_code
                 if self._write_pages:
                     self._dump_response(response)
@@ -231,8 +243,8 @@ class Extractor():
                     break
 
             finally:
-                if interval:
-                    Extractor.request_timestamp = time.time()
+                if limiter is not None:
+                    limiter.release()
 
             self.log.debug("%s (%s/%s)", msg, tries, retries+1)
             if tries > retries:
@@ -244,9 +256,12 @@ class Extractor():
                 if seconds < s:
                     seconds = s
             if code == 429 and self._interval_429 is not None:
-                s = self._interval_429(tries)
+                if (s := util.retry_after(response)) is None:
+                    s = self._interval_429(tries)
                 if seconds < s:
                     seconds = s
+                if limiter is not None:
+                    limiter.block(seconds)
                 self.wait(seconds=seconds, reason="429 Too Many Requests")
             else:
                 self.sleep(seconds, "retry")
@@ -347,6 +362,17 @@ class Extractor():
                        seconds, reason)
         time.sleep(seconds)
 
+    def prefetch(self, pages):
+        """Return an iterator over 'pages' fetching pages in advance
+
+        The number of pages fetched ahead of the consumer is set by
+        the 'prefetch' option, with '0' (default) disabling
+        the background thread.
+        """
+        if (size := self.config("prefetch", 0)) and size > 0:
+            return prefetch(pages, size)
+        return pages
+
     def utils(self, module="", name=None):
         module = (self.__class__.category if not module else
                   module[1:] if module[0] == "/" else
@@ -360,9 +386,10 @@ class Extractor():
 
     def cache(self, func, *args, _key=0, _exp=0, _mem=True):
         if _key is None:
-            key = f"{func.__module__}.{func.__name__}"
+            name = func.__name__
         else:
-            key = f"{func.__module__}.{func.__name__}-{args[_key]}"
+            name = f"{func.__name__}-{args[_key]}"
+        key = f"{func.__module__}.{name}"
 
         try:
             value, expires = CACHE_MEMORY[key]
@@ -373,26 +400,20 @@ class Extractor():
             return value
 
         if not _mem and (db := cache.database()):
-            with db:
-                cursor = db.cursor()
-                try:
-                    cursor.execute("BEGIN EXCLUSIVE")
-                except Exception:
-                    pass  # swallow exception when already in a transaction
-                cursor.execute(
-                    "SELECT value, expires FROM data WHERE key=? LIMIT 1",
-                    (key,))
-
-                if (result := cursor.fetchone()) and (
-                        not (expires := result[1]) or expires > now):
-                    value, expires = result
-                    value = pickle.loads(value)
-                else:
-                    value = func(*args)
-                    expires = _exp and _exp+now
-                    cursor.execute(
-                        "INSERT OR REPLACE INTO data VALUES (?,?,?)",
-                        (key, pickle.dumps(value), expires))
+            module = cache.namespace(func.__module__)
+
+            # only take an exclusive lock when there is no valid entry
+            if (result := cache.load(db, module, name, now)) is None:
+                with db:
+                    try:
+                        db.execute("BEGIN EXCLUSIVE")
+                    except Exception:
+                        pass  # swallow exception when already in a transaction
+                    if (result := cache.load(db, module, name, now)) is None:
+                        result = value, expires = \
+                            func(*args), _exp and _exp+now
+                        cache.store(db, module, name, value, expires)
+            value, expires = result
         else:
             value = func(*args)
             expires = _exp and _exp+now
@@ -402,9 +423,10 @@ class Extractor():
 
     def cache_update(self, func, key=None, value=None, _exp=0, _mem=False):
         if key is None:
-            key = f"{func.__module__}.{func.__name__}"
+            name = func.__name__
         else:
-            key = f"{func.__module__}.{func.__name__}-{key}"
+            name = f"{func.__name__}-{key}"
+        key = f"{func.__module__}.{name}"
 
         if value is None:
             # delete cached value
@@ -414,16 +436,15 @@ class Extractor():
                 pass
             if not _mem and (db := cache.database()):
                 with db:
-                    db.execute("DELETE FROM data WHERE key=?", (key,))
+                    cache.delete(db, cache.namespace(func.__module__), name)
         else:
             # replace cached value
             expires = _exp and _exp+int(time.time())
             CACHE_MEMORY[key] = value, expires
             if not _mem and (db := cache.database()):
                 with db:
-                    db.execute(
-                        "INSERT OR REPLACE INTO data VALUES (?,?,?)",
-                        (key, pickle.dumps(value), expires))
+                    cache.store(db, cache.namespace(func.__module__),
+                                name, value, expires)
 
     def input(self, prompt, echo=True):
         self._check_input_allowed(prompt)
@@ -470,6 +491,11 @@ class Extractor():
 
     def _init_options(self):
         self._write_pages = self.config("write-pages", False)
+        self._http_cache = None
+        if http_cache := self.config("http-cache"):
+            self._http_cache = cache.ResponseCache(
+                604800 if http_cache is True else
+                text.parse_int(http_cache, 604800))
         self._retry_codes = self.config("retry-codes")
         self._retries = self.config("retries", 4)
         self._timeout = self.config("timeout", 30)
@@ -810,6 +836,18 @@ class Extractor():
             text.extr(page, " id='__NEXT_DATA__' type='application/json'>",
                       "</script>"))
 
+    def _init_watermark(self):
+        """Return a Watermark for this extractor's input URL
+
+        Returns None when 'watermark' is disabled.
+        """
+        if not self.config("watermark"):
+            return None
+        self.watermark = watermark = Watermark(self)
+        if watermark.value is not None:
+            self.log.debug("Watermark: %s", watermark.value)
+        return watermark
+
     def _get_date_min_max(self, dmin=None, dmax=None):
         """Retrieve and parse 'date-min' and 'date-max' config values"""
         def get(key, default):
@@ -828,6 +866,52 @@ class Extractor():
                            "Use ISO 8601 date/time values instead.")
         return get("date-min", dmin), get("date-max", dmax)
 
+    def _http_cache_lookup(self, url, session, kwargs):
+        # build the final URL and headers the same way 'session' would
+        request = session.prepare_request(requests.Request(
+            "GET", url,
+            params=kwargs.get("params"),
+            headers=kwargs.get("headers"),
+            cookies=kwargs.get("cookies"),
+            auth=kwargs.get("auth"),
+        ))
+        headers = request.headers
+
+        key = f"GET {request.url}"
+        if byterange := headers.get("Range"):
+            key = f"{key} {byterange}"
+        credentials = [headers.get(name) for name in ("Authorization",
+                                                      "Cookie")]
+        if any(credentials):
+            digest = hashlib.sha256(
+                util.json_dumps(credentials).encode()).hexdigest()
+            key = f"{key} {digest[:16]}"
+
+        if (entry := self._http_cache.lookup(key, headers)) is not None:
+            _, rheaders, _ = entry
+            conditional = kwargs["headers"] = {**(kwargs.get("headers") or {})}
+            if etag := rheaders.get("ETag"):
+                conditional["If-None-Match"] = etag
+            if modified := rheaders.get("Last-Modified"):
+                conditional["If-Modified-Since"] = modified
+        return key, headers, entry
+
+    def _http_cache_update(self, response, key, headers, entry):
+        code = response.status_code
+        cache = self._http_cache
+
+        if code == 304 and entry is not None:
+            self.log.debug("Using cached response for '%s'", response.url)
+            response.status_code, rheaders, response._content = entry
+            response.headers.update(rheaders)
+            response.reason = "OK"
+            cache.stats["hit"] += 1
+            cache.touch(key)
+        elif code == 200 or code == 206:
+            cache.stats["miss"] += 1
+            cache.store(key, headers, response)
+        return response
+
     def _dump_response(self, response, history=True):
         """Write the response content to a .txt file in the current directory.
 
@@ -1046,38 +1130,142 @@ class Dispatch():
         return iter(results)
 
 
+class Watermark():
+    """Newest post of an input URL seen by the last successful run
+
+    Values get loaded from and stored in the cache database
+    and must be comparable to each other, e.g. post IDs or ISO 8601 dates.
+    """
+
+    def __init__(self, extr):
+        self.log = extr.log
+        self.module = cache.namespace(extr.__class__.__module__)
+        self.key = (f"watermark-{extr.category}.{extr.subcategory}-"
+                    f"{self.normalize(extr.url)}")
+        self.value = self.newest = self.load()
+
+    def load(self):
+        if db := cache.database():
+            try:
+                if result := cache.load(db, self.module, self.key):
+                    return result[0]
+            except Exception as exc:
+                self.log.debug("Failed to load watermark (%s: %s)",
+                               exc.__class__.__name__, exc)
+
+    def commit(self):
+        """Store the newest value seen"""
+        if self.newest is None or self.newest == self.value:
+            return
+        if db := cache.database():
+            try:
+                with db:
+                    cache.store(db, self.module, self.key, self.newest)
+            except Exception as exc:
+                self.log.warning("Failed to store watermark (%s: %s)",
+                                 exc.__class__.__name__, exc)
+            else:
+                self.log.debug("Updated watermark to %s", self.newest)
+                self.value = self.newest
+
+    def filter(self, posts, key):
+        """Yield 'posts' until reaching the previous run's newest post
+
+        Posts for which 'key' returns None are never compared,
+        e.g. pinned posts at the start of a newest-first listing.
+        """
+        value = self.value
+        for post in posts:
+            if (current := key(post)) is not None:
+                if value is not None and type(value) is not type(current):
+                    self.log.debug("Ignoring watermark of a different "
+                                   "format (%r)", value)
+                    value = self.newest = None
+                if value is not None and current <= value:
+                    self.log.info("Reached watermark (%s)", value)
+                    return
+                if self.newest is None or current > self.newest:
+                    self.newest = current
+            yield post
+
+    def normalize(self, url):
+        """Return 'url' without scheme, 'www.', and trailing slashes"""
+        if (pos := url.find("://")) >= 0:
+            url = url[pos+3:]
+        host, sep, path = url.partition("/")
+        host = host.lower()
+        if host.startswith("www."):
+            host = host[4:]
+        return f"{host}{sep}{path}".rstrip("/")
+
+
 class AsynchronousMixin():
     """Run info extraction in a separate thread"""
 
     def __iter__(self):
         self.initialize()
-
-        messages = queue.Queue(5)
-        thread = threading.Thread(
-            target=self.async_items,
-            args=(messages,),
-            daemon=True,
-        )
-
-        thread.start()
+        return prefetch(self.items(), 5)
+
+
+def prefetch(iterable, size):
+    """Iterate over 'iterable' in a separate thread
+
+    Up to 'size' items get produced ahead of the consumer.
+    Closing the returned generator, e.g. on StopExtraction,
+    stops the thread once it has finished its current item.
+    """
+    items = queue.Queue(size)
+    stop = threading.Event()
+    thread = threading.Thread(
+        target=_prefetch_thread,
+        args=(iterable, items, stop,
+              getattr(output.LogBuffer.local, "buffer", None)),
+        daemon=True,
+    )
+
+    thread.start()
+    try:
         while True:
-            msg = messages.get()
-            if msg is None:
+            value, exc = items.get()
+            if exc is None:
+                yield value
+            elif exc is StopIteration:
                 thread.join()
                 return
-            if isinstance(msg, Exception):
-                thread.join()
-                raise msg
-            yield msg
-            messages.task_done()
-
-    def async_items(self, messages):
+            else:
+                raise exc
+    finally:
+        stop.set()
+        # unblock a waiting thread
         try:
-            for msg in self.items():
-                messages.put(msg)
-        except Exception as exc:
-            messages.put(exc)
-        messages.put(None)
+            while True:
+                items.get_nowait()
+        except queue.Empty:
+            pass
+
+
+def _prefetch_thread(iterable, items, stop, buffer):
+    if buffer is not None:
+        output.LogBuffer.local.buffer = buffer
+    end = StopIteration
+    try:
+        for value in iterable:
+            items.put((value, None))
+            if stop.is_set():
+                return
+    except BaseException as exc:
+        end = exc
+    finally:
+        # always let the consumer know this thread is done,
+        # unless it has stopped listening
+        while not stop.is_set():
+            try:
+                items.put((None, end), timeout=1.0)
+                break
+            except queue.Full:
+                pass
+        if close := getattr(iterable, "close", None):
+            close()
 
 
 class BaseExtractor(Extractor):
@@ -1219,7 +1407,7 @@ def _browser_useragent(browser):
 
 CACHE_ADAPTERS = {}
 CACHE_COOKIES = {}
-CACHE_MEMORY = {}
+CACHE_MEMORY = lru.LRUCache("memory", 4096, True)
 CACHE_UTILS = {}
 CATEGORY_MAP = ()
 
@@ -272,7 +272,10 @@ class DanbooruTagExtractor(DanbooruExtractor):
                 prefix = None
                 break
 
-        return self._pagination("/posts.json", {"tags": self.tags}, prefix)
+        posts = self._pagination("/posts.json", {"tags": self.tags}, prefix)
+        if prefix == "b" and (watermark := self._init_watermark()) is not None:
+            posts = watermark.filter(posts, lambda post: post["id"])
+        return posts
 
 
 class DanbooruRandomExtractor(DanbooruTagExtractor):
@@ -1591,6 +1591,13 @@ class DeviantartOAuthAPI():
 
     def _pagination(self, endpoint, params,
                     extend=True, public=None, unpack=False, key="results"):
+        pages = self._pagination_pages(
+            endpoint, params, extend, public, unpack, key)
+        for results in self.extractor.prefetch(pages):
+            yield from results
+
+    def _pagination_pages(self, endpoint, params,
+                          extend, public, unpack, key):
         warn = True
         if public is None:
             public = self.public
@@ -1637,7 +1644,7 @@ class DeviantartOAuthAPI():
                         if patch:
                             dev.update(patch)
 
-            yield from results
+            yield results
 
             if not data["has_more"] and (
                     self.strategy != "manual" or not results or not extend):
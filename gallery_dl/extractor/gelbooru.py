@@ -54,6 +54,14 @@ class GelbooruBase():
             return (posts,)
         return posts
 
+    def _tag_types(self, names):
+        params = {"s": "tag", "names": " ".join(names), "limit": len(names)}
+        return {
+            text.unescape(tag["name"]):
+                gelbooru_v02.TAG_TYPES.get(str(tag["type"]))
+            for tag in self._api_request(params, "tag")
+        }
+
     def _pagination(self, params):
         params["pid"] = self.page_start
         params["limit"] = self.per_page
@@ -12,6 +12,18 @@ from . import booru
 from .. import text, util
 import collections
 
+# tag type IDs of the tag API and their 'tag-type-*' names
+# Posts with tags of other types, like the unused or site-specific "2",
+# fall back to '_tags()'
+TAG_TYPES = {
+    "0": "general",
+    "1": "artist",
+    "3": "copyright",
+    "4": "character",
+    "5": "metadata",
+    "6": "deprecated",
+}
+
 
 class GelbooruV02Extractor(booru.BooruExtractor):
     basecategory = "gelbooru_v02"
@@ -142,6 +154,24 @@ class GelbooruV02Extractor(booru.BooruExtractor):
         for key, value in tags.items():
             post["tags_" + key] = " ".join(value)
 
+    def _tag_types(self, names):
+        url = self.root_api + "/index.php?page=dapi&s=tag&q=index"
+        params = {
+            "names"  : " ".join(names),
+            "limit"  : len(names),
+            "api_key": self.api_key,
+            "user_id": self.user_id,
+        }
+        root = self.request_xml(url, params=params)
+
+        if root.tag == "error":
+            raise self.exc.AbortExtraction(f"'{root.text}'")
+        return {
+            text.unescape(tag.attrib["name"]):
+                TAG_TYPES.get(tag.attrib["type"])
+            for tag in root
+        }
+
     def _notes(self, post, page):
         note_container = text.extr(page, 'id="note-container"', "<img ")
         if not note_container:
@@ -9,7 +9,7 @@
 """Extractors for https://hitomi.la/"""
 
 from .common import GalleryExtractor, Extractor, Message
-from .nozomi import decode_nozomi
+from .nozomi import decode_nozomi, search_ids, index_cache
 from .. import text, util
 import string
 
@@ -19,6 +19,7 @@ class HitomiExtractor(Extractor):
     category = "hitomi"
     root = "https://hitomi.la"
     domain = "gold-usergeneratedcontent.net"
+    index = None
 
     def load_nozomi(self, query, language="all", headers=None):
         ns, _, tag = query.strip().partition(":")
@@ -39,6 +40,8 @@ class HitomiExtractor(Extractor):
             headers = {}
         headers["Origin"] = self.root
         headers["Referer"] = self.root + "/"
+        if self.index is not None:
+            return decode_nozomi(self.index.get(url, headers))
         return decode_nozomi(self.request(url, headers=headers).content)
 
 
@@ -208,6 +211,9 @@ class HitomiSearchExtractor(HitomiExtractor):
     pattern = r"(?:https?://)?hitomi\.la/search\.html\?([^#]+)"
     example = "https://hitomi.la/search.html?QUERY"
 
+    def _init(self):
+        self.index = index_cache(self)
+
     def items(self):
         tags = text.unquote(self.groups[0])
 
@@ -221,7 +227,6 @@ class HitomiSearchExtractor(HitomiExtractor):
             yield Message.Queue, gallery_url, data
 
     def gallery_ids(self, tags):
-        result = None
         positive = []
         negative = []
 
@@ -231,20 +236,15 @@ class HitomiSearchExtractor(HitomiExtractor):
             else:
                 positive.append(tag)
 
-        for tag in positive:
-            ids = self.load_nozomi(tag)
-            if result is None:
-                result = set(ids)
-            else:
-                result.intersection_update(ids)
-
-        if result is None:
-            #  result = set(self.load_nozomi("index"))
-            result = set(self.load_nozomi("language:all"))
-        for tag in negative:
-            result.difference_update(self.load_nozomi(tag))
-
-        return sorted(result, reverse=True) if result else ()
+        try:
+            return search_ids(
+                map(self.load_nozomi, positive),
+                map(self.load_nozomi, negative),
+                #  lambda: self.load_nozomi("index"))
+                lambda: self.load_nozomi("language:all"))
+        finally:
+            if self.index is not None:
+                self.index.close()
 
 
 def _parse_gg(extr):
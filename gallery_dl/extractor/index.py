@@ -0,0 +1,2254 @@
+# -*- coding: utf-8 -*-
+
+# This file is generated by scripts/extractor_index.py - do not edit manually
+
+"""Precomputed URL dispatch index for extractor.find()"""
+
+CLASSES = (
+    ('2ch', '_2chThreadExtractor'),
+    ('2ch', '_2chBoardExtractor'),
+    ('2chan', '_2chanThreadExtractor'),
+    ('2chen', '_2chenThreadExtractor'),
+    ('2chen', '_2chenBoardExtractor'),
+    ('35photo', '_35photoUserExtractor'),
+    ('35photo', '_35photoTagExtractor'),
+    ('35photo', '_35photoGenreExtractor'),
+    ('35photo', '_35photoImageExtractor'),
+    ('3dbooru', '_3dbooruTagExtractor'),
+    ('3dbooru', '_3dbooruPoolExtractor'),
+    ('3dbooru', '_3dbooruPostExtractor'),
+    ('3dbooru', '_3dbooruPopularExtractor'),
+    ('4chan', '_4chanThreadExtractor'),
+    ('4chan', '_4chanBoardExtractor'),
+    ('4archive', '_4archiveThreadExtractor'),
+    ('4archive', '_4archiveBoardExtractor'),
+    ('4chanarchives', '_4chanarchivesThreadExtractor'),
+    ('4chanarchives', '_4chanarchivesBoardExtractor'),
+    ('500px', '_500pxUserExtractor'),
+    ('500px', '_500pxGalleryExtractor'),
+    ('500px', '_500pxFavoriteExtractor'),
+    ('500px', '_500pxImageExtractor'),
+    ('8chan', '_8chanThreadExtractor'),
+    ('8chan', '_8chanBoardExtractor'),
+    ('8muses', '_8musesAlbumExtractor'),
+    ('adultempire', 'AdultempireGalleryExtractor'),
+    ('agnph', 'AgnphTagExtractor'),
+    ('agnph', 'AgnphPostExtractor'),
+    ('ahottie', 'AhottieGalleryExtractor'),
+    ('ahottie', 'AhottieTagExtractor'),
+    ('ahottie', 'AhottieSearchExtractor'),
+    ('ao3', 'Ao3WorkExtractor'),
+    ('ao3', 'Ao3SeriesExtractor'),
+    ('ao3', 'Ao3TagExtractor'),
+    ('ao3', 'Ao3SearchExtractor'),
+    ('ao3', 'Ao3UserExtractor'),
+    ('ao3', 'Ao3UserWorksExtractor'),
+    ('ao3', 'Ao3UserSeriesExtractor'),
+    ('ao3', 'Ao3UserBookmarkExtractor'),
+    ('ao3', 'Ao3SubscriptionsExtractor'),
+    ('arcalive', 'ArcalivePostExtractor'),
+    ('arcalive', 'ArcaliveBoardExtractor'),
+    ('arcalive', 'ArcaliveUserExtractor'),
+    ('architizer', 'ArchitizerProjectExtractor'),
+    ('architizer', 'ArchitizerFirmExtractor'),
+    ('arena', 'ArenaChannelExtractor'),
+    ('artstation', 'ArtstationUserExtractor'),
+    ('artstation', 'ArtstationAlbumExtractor'),
+    ('artstation', 'ArtstationLikesExtractor'),
+    ('artstation', 'ArtstationCollectionExtractor'),
+    ('artstation', 'ArtstationCollectionsExtractor'),
+    ('artstation', 'ArtstationChallengeExtractor'),
+    ('artstation', 'ArtstationSearchExtractor'),
+    ('artstation', 'ArtstationArtworkExtractor'),
+    ('artstation', 'ArtstationImageExtractor'),
+    ('artstation', 'ArtstationFollowingExtractor'),
+    ('aryion', 'AryionGalleryExtractor'),
+    ('aryion', 'AryionFavoriteExtractor'),
+    ('aryion', 'AryionWatchExtractor'),
+    ('aryion', 'AryionTagExtractor'),
+    ('aryion', 'AryionSearchExtractor'),
+    ('aryion', 'AryionPostExtractor'),
+    ('audiochan', 'AudiochanAudioExtractor'),
+    ('audiochan', 'AudiochanUserExtractor'),
+    ('audiochan', 'AudiochanCollectionExtractor'),
+    ('audiochan', 'AudiochanSearchExtractor'),
+    ('bbc', 'BbcGalleryExtractor'),
+    ('bbc', 'BbcProgrammeExtractor'),
+    ('behance', 'BehanceGalleryExtractor'),
+    ('behance', 'BehanceUserExtractor'),
+    ('behance', 'BehanceCollectionExtractor'),
+    ('bellazon', 'BellazonPostExtractor'),
+    ('bellazon', 'BellazonThreadExtractor'),
+    ('bellazon', 'BellazonForumExtractor'),
+    ('bilibili', 'BilibiliArticleExtractor'),
+    ('bilibili', 'BilibiliUserArticlesExtractor'),
+    ('bilibili', 'BilibiliUserArticlesFavoriteExtractor'),
+    ('blogger', 'BloggerPostExtractor'),
+    ('blogger', 'BloggerBlogExtractor'),
+    ('blogger', 'BloggerSearchExtractor'),
+    ('blogger', 'BloggerLabelExtractor'),
+    ('bluesky', 'BlueskyUserExtractor'),
+    ('bluesky', 'BlueskyPostsExtractor'),
+    ('bluesky', 'BlueskyRepliesExtractor'),
+    ('bluesky', 'BlueskyMediaExtractor'),
+    ('bluesky', 'BlueskyVideoExtractor'),
+    ('bluesky', 'BlueskyLikesExtractor'),
+    ('bluesky', 'BlueskyFeedExtractor'),
+    ('bluesky', 'BlueskyListExtractor'),
+    ('bluesky', 'BlueskyFollowingExtractor'),
+    ('bluesky', 'BlueskyPostExtractor'),
+    ('bluesky', 'BlueskyInfoExtractor'),
+    ('bluesky', 'BlueskyAvatarExtractor'),
+    ('bluesky', 'BlueskyBackgroundExtractor'),
+    ('bluesky', 'BlueskySearchExtractor'),
+    ('bluesky', 'BlueskyHashtagExtractor'),
+    ('bluesky', 'BlueskyBookmarkExtractor'),
+    ('boosty', 'BoostyUserExtractor'),
+    ('boosty', 'BoostyMediaExtractor'),
+    ('boosty', 'BoostyFeedExtractor'),
+    ('boosty', 'BoostyPostExtractor'),
+    ('boosty', 'BoostyFollowingExtractor'),
+    ('boosty', 'BoostyDirectMessagesExtractor'),
+    ('booth', 'BoothItemExtractor'),
+    ('booth', 'BoothShopExtractor'),
+    ('booth', 'BoothCategoryExtractor'),
+    ('bunkr', 'BunkrAlbumExtractor'),
+    ('bunkr', 'BunkrMediaExtractor'),
+    ('catbox', 'CatboxAlbumExtractor'),
+    ('catbox', 'CatboxFileExtractor'),
+    ('cfake', 'CfakeCelebrityExtractor'),
+    ('cfake', 'CfakeCategoryExtractor'),
+    ('cfake', 'CfakeCreatedExtractor'),
+    ('cfake', 'CfakeCountryExtractor'),
+    ('chevereto', 'CheveretoFileExtractor'),
+    ('chevereto', 'CheveretoAlbumExtractor'),
+    ('chevereto', 'CheveretoCategoryExtractor'),
+    ('chevereto', 'CheveretoUserExtractor'),
+    ('cien', 'CienArticleExtractor'),
+    ('cien', 'CienCreatorExtractor'),
+    ('cien', 'CienRecentExtractor'),
+    ('cien', 'CienFollowingExtractor'),
+    ('civitai', 'CivitaiModelExtractor'),
+    ('civitai', 'CivitaiImageExtractor'),
+    ('civitai', 'CivitaiCollectionExtractor'),
+    ('civitai', 'CivitaiPostExtractor'),
+    ('civitai', 'CivitaiTagExtractor'),
+    ('civitai', 'CivitaiSearchModelsExtractor'),
+    ('civitai', 'CivitaiSearchImagesExtractor'),
+    ('civitai', 'CivitaiModelsExtractor'),
+    ('civitai', 'CivitaiImagesExtractor'),
+    ('civitai', 'CivitaiVideosExtractor'),
+    ('civitai', 'CivitaiPostsExtractor'),
+    ('civitai', 'CivitaiUserExtractor'),
+    ('civitai', 'CivitaiUserModelsExtractor'),
+    ('civitai', 'CivitaiUserPostsExtractor'),
+    ('civitai', 'CivitaiUserImagesExtractor'),
+    ('civitai', 'CivitaiUserVideosExtractor'),
+    ('civitai', 'CivitaiUserCollectionsExtractor'),
+    ('civitai', 'CivitaiGeneratedExtractor'),
+    ('comedywildlifephoto', 'ComedywildlifephotoGalleryExtractor'),
+    ('comick', 'ComickCoversExtractor'),
+    ('comick', 'ComickChapterExtractor'),
+    ('comick', 'ComickMangaExtractor'),
+    ('comicvine', 'ComicvineTagExtractor'),
+    ('cyberdrop', 'CyberdropAlbumExtractor'),
+    ('cyberdrop', 'CyberdropMediaExtractor'),
+    ('cyberfile', 'CyberfileFolderExtractor'),
+    ('cyberfile', 'CyberfileSharedExtractor'),
+    ('cyberfile', 'CyberfileFileExtractor'),
+    ('danbooru', 'DanbooruTagExtractor'),
+    ('danbooru', 'DanbooruRandomExtractor'),
+    ('danbooru', 'DanbooruPoolExtractor'),
+    ('danbooru', 'DanbooruFavgroupExtractor'),
+    ('danbooru', 'DanbooruPostExtractor'),
+    ('danbooru', 'DanbooruMediaassetExtractor'),
+    ('danbooru', 'DanbooruPopularExtractor'),
+    ('danbooru', 'DanbooruArtistExtractor'),
+    ('danbooru', 'DanbooruArtistSearchExtractor'),
+    ('dandadan', 'DandadanChapterExtractor'),
+    ('dandadan', 'DandadanMangaExtractor'),
+    ('dankefuerslesen', 'DankefuerslesenChapterExtractor'),
+    ('dankefuerslesen', 'DankefuerslesenMangaExtractor'),
+    ('desktopography', 'DesktopographySiteExtractor'),
+    ('desktopography', 'DesktopographyExhibitionExtractor'),
+    ('desktopography', 'DesktopographyEntryExtractor'),
+    ('deviantart', 'DeviantartUserExtractor'),
+    ('deviantart', 'DeviantartGalleryExtractor'),
+    ('deviantart', 'DeviantartAvatarExtractor'),
+    ('deviantart', 'DeviantartBackgroundExtractor'),
+    ('deviantart', 'DeviantartFolderExtractor'),
+    ('deviantart', 'DeviantartStashExtractor'),
+    ('deviantart', 'DeviantartFavoriteExtractor'),
+    ('deviantart', 'DeviantartCollectionExtractor'),
+    ('deviantart', 'DeviantartJournalExtractor'),
+    ('deviantart', 'DeviantartStatusExtractor'),
+    ('deviantart', 'DeviantartTagExtractor'),
+    ('deviantart', 'DeviantartWatchExtractor'),
+    ('deviantart', 'DeviantartWatchPostsExtractor'),
+    ('deviantart', 'DeviantartDeviationExtractor'),
+    ('deviantart', 'DeviantartScrapsExtractor'),
+    ('deviantart', 'DeviantartSearchExtractor'),
+    ('deviantart', 'DeviantartGallerySearchExtractor'),
+    ('deviantart', 'DeviantartFollowingExtractor'),
+    ('discord', 'DiscordChannelExtractor'),
+    ('discord', 'DiscordMessageExtractor'),
+    ('discord', 'DiscordServerAssetsExtractor'),
+    ('discord', 'DiscordServerSearchExtractor'),
+    ('discord', 'DiscordServerExtractor'),
+    ('discord', 'DiscordDirectMessagesExtractor'),
+    ('discord', 'DiscordDirectMessageExtractor'),
+    ('dynastyscans', 'DynastyscansChapterExtractor'),
+    ('dynastyscans', 'DynastyscansMangaExtractor'),
+    ('dynastyscans', 'DynastyscansSearchExtractor'),
+    ('dynastyscans', 'DynastyscansImageExtractor'),
+    ('dynastyscans', 'DynastyscansAnthologyExtractor'),
+    ('e621', 'E621TagExtractor'),
+    ('e621', 'E621PoolExtractor'),
+    ('e621', 'E621PostExtractor'),
+    ('e621', 'E621PopularExtractor'),
+    ('e621', 'E621ArtistExtractor'),
+    ('e621', 'E621ArtistSearchExtractor'),
+    ('e621', 'E621FavoriteExtractor'),
+    ('e621', 'E621FrontendExtractor'),
+    ('eporner', 'EpornerGalleryExtractor'),
+    ('erome', 'EromeAlbumExtractor'),
+    ('erome', 'EromeUserExtractor'),
+    ('erome', 'EromeSearchExtractor'),
+    ('everia', 'EveriaPostExtractor'),
+    ('everia', 'EveriaTagExtractor'),
+    ('everia', 'EveriaCategoryExtractor'),
+    ('everia', 'EveriaDateExtractor'),
+    ('everia', 'EveriaSearchExtractor'),
+    ('exhentai', 'ExhentaiGalleryExtractor'),
+    ('exhentai', 'ExhentaiSearchExtractor'),
+    ('exhentai', 'ExhentaiFavoriteExtractor'),
+    ('facebook', 'FacebookPhotoExtractor'),
+    ('facebook', 'FacebookSetExtractor'),
+    ('facebook', 'FacebookVideoExtractor'),
+    ('facebook', 'FacebookInfoExtractor'),
+    ('facebook', 'FacebookAlbumsExtractor'),
+    ('facebook', 'FacebookPhotosExtractor'),
+    ('facebook', 'FacebookAvatarExtractor'),
+    ('facebook', 'FacebookUserExtractor'),
+    ('fanbox', 'FanboxCreatorExtractor'),
+    ('fanbox', 'FanboxTagExtractor'),
+    ('fanbox', 'FanboxPostExtractor'),
+    ('fanbox', 'FanboxHomeExtractor'),
+    ('fanbox', 'FanboxSupportingExtractor'),
+    ('fanbox', 'FanboxRedirectExtractor'),
+    ('fansly', 'FanslyPostExtractor'),
+    ('fansly', 'FanslyHomeExtractor'),
+    ('fansly', 'FanslyListExtractor'),
+    ('fansly', 'FanslyListsExtractor'),
+    ('fansly', 'FanslyCreatorPostsExtractor'),
+    ('fansly', 'FanslyCreatorMediaExtractor'),
+    ('fantia', 'FantiaCreatorExtractor'),
+    ('fantia', 'FantiaPostExtractor'),
+    ('fapello', 'FapelloPostExtractor'),
+    ('fapello', 'FapelloModelExtractor'),
+    ('fapello', 'FapelloPathExtractor'),
+    ('fapachi', 'FapachiPostExtractor'),
+    ('fapachi', 'FapachiUserExtractor'),
+    ('fikfap', 'FikfapPostExtractor'),
+    ('fikfap', 'FikfapUserExtractor'),
+    ('fikfap', 'FikfapHashtagExtractor'),
+    ('filester', 'FilesterFileExtractor'),
+    ('filester', 'FilesterFolderExtractor'),
+    ('fitnakedgirls', 'FitnakedgirlsGalleryExtractor'),
+    ('fitnakedgirls', 'FitnakedgirlsCategoryExtractor'),
+    ('fitnakedgirls', 'FitnakedgirlsTagExtractor'),
+    ('fitnakedgirls', 'FitnakedgirlsVideoExtractor'),
+    ('fitnakedgirls', 'FitnakedgirlsBlogExtractor'),
+    ('flickr', 'FlickrImageExtractor'),
+    ('flickr', 'FlickrAlbumExtractor'),
+    ('flickr', 'FlickrGalleryExtractor'),
+    ('flickr', 'FlickrGroupExtractor'),
+    ('flickr', 'FlickrUserExtractor'),
+    ('flickr', 'FlickrFavoriteExtractor'),
+    ('flickr', 'FlickrSearchExtractor'),
+    ('furaffinity', 'FuraffinityGalleryExtractor'),
+    ('furaffinity', 'FuraffinityFolderExtractor'),
+    ('furaffinity', 'FuraffinityScrapsExtractor'),
+    ('furaffinity', 'FuraffinityFavoriteExtractor'),
+    ('furaffinity', 'FuraffinitySearchExtractor'),
+    ('furaffinity', 'FuraffinityPostExtractor'),
+    ('furaffinity', 'FuraffinityUserExtractor'),
+    ('furaffinity', 'FuraffinityFollowingExtractor'),
+    ('furaffinity', 'FuraffinitySubmissionsExtractor'),
+    ('furry34', 'Furry34PostExtractor'),
+    ('furry34', 'Furry34PlaylistExtractor'),
+    ('furry34', 'Furry34TagExtractor'),
+    ('fuskator', 'FuskatorGalleryExtractor'),
+    ('fuskator', 'FuskatorSearchExtractor'),
+    ('gelbooru', 'GelbooruTagExtractor'),
+    ('gelbooru', 'GelbooruPoolExtractor'),
+    ('gelbooru', 'GelbooruFavoriteExtractor'),
+    ('gelbooru', 'GelbooruPostExtractor'),
+    ('gelbooru', 'GelbooruRedirectExtractor'),
+    ('gelbooru_v01', 'GelbooruV01TagExtractor'),
+    ('gelbooru_v01', 'GelbooruV01FavoriteExtractor'),
+    ('gelbooru_v01', 'GelbooruV01PostExtractor'),
+    ('gelbooru_v02', 'GelbooruV02TagExtractor'),
+    ('gelbooru_v02', 'GelbooruV02PoolExtractor'),
+    ('gelbooru_v02', 'GelbooruV02FavoriteExtractor'),
+    ('gelbooru_v02', 'GelbooruV02PostExtractor'),
+    ('girlsreleased', 'GirlsreleasedSetExtractor'),
+    ('girlsreleased', 'GirlsreleasedModelExtractor'),
+    ('girlsreleased', 'GirlsreleasedSiteExtractor'),
+    ('girlswithmuscle', 'GirlswithmusclePostExtractor'),
+    ('girlswithmuscle', 'GirlswithmuscleSearchExtractor'),
+    ('gofile', 'GofileFolderExtractor'),
+    ('hatenablog', 'HatenablogEntryExtractor'),
+    ('hatenablog', 'HatenablogHomeExtractor'),
+    ('hatenablog', 'HatenablogArchiveExtractor'),
+    ('hatenablog', 'HatenablogSearchExtractor'),
+    ('hdoujin', 'HdoujinGalleryExtractor'),
+    ('hdoujin', 'HdoujinSearchExtractor'),
+    ('hdoujin', 'HdoujinFavoriteExtractor'),
+    ('hentai2read', 'Hentai2readChapterExtractor'),
+    ('hentai2read', 'Hentai2readMangaExtractor'),
+    ('hentaicosplays', 'HentaicosplaysGalleryExtractor'),
+    ('hentaifoundry', 'HentaifoundryUserExtractor'),
+    ('hentaifoundry', 'HentaifoundryPicturesExtractor'),
+    ('hentaifoundry', 'HentaifoundryScrapsExtractor'),
+    ('hentaifoundry', 'HentaifoundryFavoriteExtractor'),
+    ('hentaifoundry', 'HentaifoundryTagExtractor'),
+    ('hentaifoundry', 'HentaifoundryRecentExtractor'),
+    ('hentaifoundry', 'HentaifoundryPopularExtractor'),
+    ('hentaifoundry', 'HentaifoundryImageExtractor'),
+    ('hentaifoundry', 'HentaifoundryStoriesExtractor'),
+    ('hentaifoundry', 'HentaifoundryStoryExtractor'),
+    ('hentaihand', 'HentaihandGalleryExtractor'),
+    ('hentaihand', 'HentaihandTagExtractor'),
+    ('hentaihere', 'HentaihereChapterExtractor'),
+    ('hentaihere', 'HentaihereMangaExtractor'),
+    ('hentainexus', 'HentainexusGalleryExtractor'),
+    ('hentainexus', 'HentainexusSearchExtractor'),
+    ('hiperdex', 'HiperdexChapterExtractor'),
+    ('hiperdex', 'HiperdexMangaExtractor'),
+    ('hiperdex', 'HiperdexArtistExtractor'),
+    ('hitomi', 'HitomiGalleryExtractor'),
+    ('hitomi', 'HitomiTagExtractor'),
+    ('hitomi', 'HitomiIndexExtractor'),
+    ('hitomi', 'HitomiSearchExtractor'),
+    ('hotleak', 'HotleakPostExtractor'),
+    ('hotleak', 'HotleakCreatorExtractor'),
+    ('hotleak', 'HotleakCategoryExtractor'),
+    ('hotleak', 'HotleakSearchExtractor'),
+    ('idolcomplex', 'IdolcomplexTagExtractor'),
+    ('idolcomplex', 'IdolcomplexPoolExtractor'),
+    ('idolcomplex', 'IdolcomplexPostExtractor'),
+    ('imagebam', 'ImagebamGalleryExtractor'),
+    ('imagebam', 'ImagebamImageExtractor'),
+    ('imagechest', 'ImagechestGalleryExtractor'),
+    ('imagechest', 'ImagechestUserExtractor'),
+    ('imagefap', 'ImagefapGalleryExtractor'),
+    ('imagefap', 'ImagefapImageExtractor'),
+    ('imagefap', 'ImagefapFolderExtractor'),
+    ('imagefap', 'ImagefapUserExtractor'),
+    ('imagepond', 'ImagepondFileExtractor'),
+    ('imagepond', 'ImagepondAlbumExtractor'),
+    ('imagepond', 'ImagepondUserExtractor'),
+    ('imgbb', 'ImgbbAlbumExtractor'),
+    ('imgbb', 'ImgbbImageExtractor'),
+    ('imgbb', 'ImgbbUserExtractor'),
+    ('imgbox', 'ImgboxGalleryExtractor'),
+    ('imgbox', 'ImgboxImageExtractor'),
+    ('imgpile', 'ImgpilePostExtractor'),
+    ('imgpile', 'ImgpileUserExtractor'),
+    ('imgth', 'ImgthGalleryExtractor'),
+    ('imgur', 'ImgurImageExtractor'),
+    ('imgur', 'ImgurAlbumExtractor'),
+    ('imgur', 'ImgurGalleryExtractor'),
+    ('imgur', 'ImgurUserExtractor'),
+    ('imgur', 'ImgurFavoriteExtractor'),
+    ('imgur', 'ImgurFavoriteFolderExtractor'),
+    ('imgur', 'ImgurMeExtractor'),
+    ('imgur', 'ImgurSubredditExtractor'),
+    ('imgur', 'ImgurTagExtractor'),
+    ('imgur', 'ImgurSearchExtractor'),
+    ('imhentai', 'ImhentaiGalleryExtractor'),
+    ('imhentai', 'ImhentaiTagExtractor'),
+    ('imhentai', 'ImhentaiSearchExtractor'),
+    ('inkbunny', 'InkbunnyUserExtractor'),
+    ('inkbunny', 'InkbunnyPoolExtractor'),
+    ('inkbunny', 'InkbunnyFavoriteExtractor'),
+    ('inkbunny', 'InkbunnyUnreadExtractor'),
+    ('inkbunny', 'InkbunnySearchExtractor'),
+    ('inkbunny', 'InkbunnyFollowingExtractor'),
+    ('inkbunny', 'InkbunnyPostExtractor'),
+    ('instagram', 'InstagramPostExtractor'),
+    ('instagram', 'InstagramUserExtractor'),
+    ('instagram', 'InstagramPostsExtractor'),
+    ('instagram', 'InstagramReelsExtractor'),
+    ('instagram', 'InstagramTaggedExtractor'),
+    ('instagram', 'InstagramGuideExtractor'),
+    ('instagram', 'InstagramSavedExtractor'),
+    ('instagram', 'InstagramCollectionExtractor'),
+    ('instagram', 'InstagramStoriesTrayExtractor'),
+    ('instagram', 'InstagramStoriesExtractor'),
+    ('instagram', 'InstagramHighlightsExtractor'),
+    ('instagram', 'InstagramFollowersExtractor'),
+    ('instagram', 'InstagramFollowingExtractor'),
+    ('instagram', 'InstagramTagExtractor'),
+    ('instagram', 'InstagramInfoExtractor'),
+    ('instagram', 'InstagramAvatarExtractor'),
+    ('issuu', 'IssuuPublicationExtractor'),
+    ('issuu', 'IssuuUserExtractor'),
+    ('itaku', 'ItakuGalleryExtractor'),
+    ('itaku', 'ItakuPostsExtractor'),
+    ('itaku', 'ItakuStarsExtractor'),
+    ('itaku', 'ItakuFollowingExtractor'),
+    ('itaku', 'ItakuFollowersExtractor'),
+    ('itaku', 'ItakuBookmarksExtractor'),
+    ('itaku', 'ItakuUserExtractor'),
+    ('itaku', 'ItakuImageExtractor'),
+    ('itaku', 'ItakuPostExtractor'),
+    ('itaku', 'ItakuSearchExtractor'),
+    ('itchio', 'ItchioGameExtractor'),
+    ('iwara', 'IwaraUserExtractor'),
+    ('iwara', 'IwaraUserImagesExtractor'),
+    ('iwara', 'IwaraUserVideosExtractor'),
+    ('iwara', 'IwaraUserPlaylistsExtractor'),
+    ('iwara', 'IwaraFollowingExtractor'),
+    ('iwara', 'IwaraFollowersExtractor'),
+    ('iwara', 'IwaraImageExtractor'),
+    ('iwara', 'IwaraVideoExtractor'),
+    ('iwara', 'IwaraPlaylistExtractor'),
+    ('iwara', 'IwaraFavoriteExtractor'),
+    ('iwara', 'IwaraSearchExtractor'),
+    ('iwara', 'IwaraTagExtractor'),
+    ('jschan', 'JschanThreadExtractor'),
+    ('jschan', 'JschanBoardExtractor'),
+    ('kabeuchi', 'KabeuchiUserExtractor'),
+    ('kaliscan', 'KaliscanChapterExtractor'),
+    ('kaliscan', 'KaliscanMangaExtractor'),
+    ('keenspot', 'KeenspotComicExtractor'),
+    ('kemono', 'KemonoUserExtractor'),
+    ('kemono', 'KemonoPostsExtractor'),
+    ('kemono', 'KemonoPostExtractor'),
+    ('kemono', 'KemonoDiscordExtractor'),
+    ('kemono', 'KemonoDiscordServerExtractor'),
+    ('kemono', 'KemonoFavoriteExtractor'),
+    ('kemono', 'KemonoArtistsExtractor'),
+    ('khinsider', 'KhinsiderSoundtrackExtractor'),
+    ('komikcast', 'KomikcastChapterExtractor'),
+    ('komikcast', 'KomikcastMangaExtractor'),
+    ('koofr', 'KoofrSharedExtractor'),
+    ('leakgallery', 'LeakgalleryUserExtractor'),
+    ('leakgallery', 'LeakgalleryTrendingExtractor'),
+    ('leakgallery', 'LeakgalleryMostlikedExtractor'),
+    ('leakgallery', 'LeakgalleryPostExtractor'),
+    ('lensdump', 'LensdumpAlbumExtractor'),
+    ('lensdump', 'LensdumpAlbumsExtractor'),
+    ('lensdump', 'LensdumpImageExtractor'),
+    ('lexica', 'LexicaSearchExtractor'),
+    ('lightroom', 'LightroomGalleryExtractor'),
+    ('listal', 'ListalImageExtractor'),
+    ('listal', 'ListalPeopleExtractor'),
+    ('livedoor', 'LivedoorBlogExtractor'),
+    ('livedoor', 'LivedoorPostExtractor'),
+    ('lofter', 'LofterPostExtractor'),
+    ('lofter', 'LofterBlogPostsExtractor'),
+    ('luscious', 'LusciousAlbumExtractor'),
+    ('luscious', 'LusciousSearchExtractor'),
+    ('lynxchan', 'LynxchanThreadExtractor'),
+    ('lynxchan', 'LynxchanBoardExtractor'),
+    ('madokami', 'MadokamiMangaExtractor'),
+    ('mangadex', 'MangadexCoversExtractor'),
+    ('mangadex', 'MangadexChapterExtractor'),
+    ('mangadex', 'MangadexMangaExtractor'),
+    ('mangadex', 'MangadexFeedExtractor'),
+    ('mangadex', 'MangadexFollowingExtractor'),
+    ('mangadex', 'MangadexListExtractor'),
+    ('mangadex', 'MangadexAuthorExtractor'),
+    ('mangafire', 'MangafireChapterExtractor'),
+    ('mangafire', 'MangafireMangaExtractor'),
+    ('mangafox', 'MangafoxChapterExtractor'),
+    ('mangafox', 'MangafoxMangaExtractor'),
+    ('mangafreak', 'MangafreakChapterExtractor'),
+    ('mangafreak', 'MangafreakMangaExtractor'),
+    ('mangahere', 'MangahereChapterExtractor'),
+    ('mangahere', 'MangahereMangaExtractor'),
+    ('manganelo', 'ManganeloChapterExtractor'),
+    ('manganelo', 'ManganeloMangaExtractor'),
+    ('manganelo', 'ManganeloBookmarkExtractor'),
+    ('mangapark', 'MangaparkChapterExtractor'),
+    ('mangapark', 'MangaparkMangaExtractor'),
+    ('mangaread', 'MangareadChapterExtractor'),
+    ('mangaread', 'MangareadMangaExtractor'),
+    ('mangareader', 'MangareaderChapterExtractor'),
+    ('mangareader', 'MangareaderMangaExtractor'),
+    ('mangataro', 'MangataroChapterExtractor'),
+    ('mangataro', 'MangataroMangaExtractor'),
+    ('mangatown', 'MangatownChapterExtractor'),
+    ('mangatown', 'MangatownMangaExtractor'),
+    ('mangoxo', 'MangoxoAlbumExtractor'),
+    ('mangoxo', 'MangoxoChannelExtractor'),
+    ('misskey', 'MisskeyUserExtractor'),
+    ('misskey', 'MisskeyNotesExtractor'),
+    ('misskey', 'MisskeyInfoExtractor'),
+    ('misskey', 'MisskeyAvatarExtractor'),
+    ('misskey', 'MisskeyBackgroundExtractor'),
+    ('misskey', 'MisskeyFollowingExtractor'),
+    ('misskey', 'MisskeyNoteExtractor'),
+    ('misskey', 'MisskeyFavoriteExtractor'),
+    ('mixdrop', 'MixdropFileExtractor'),
+    ('motherless', 'MotherlessMediaExtractor'),
+    ('motherless', 'MotherlessGalleryExtractor'),
+    ('motherless', 'MotherlessGroupExtractor'),
+    ('myhentaigallery', 'MyhentaigalleryGalleryExtractor'),
+    ('myhentaigallery', 'MyhentaigalleryTagExtractor'),
+    ('myportfolio', 'MyportfolioGalleryExtractor'),
+    ('naverblog', 'NaverBlogPostExtractor'),
+    ('naverblog', 'NaverBlogBlogExtractor'),
+    ('naverchzzk', 'NaverChzzkCommentExtractor'),
+    ('naverchzzk', 'NaverChzzkCommunityExtractor'),
+    ('naverwebtoon', 'NaverWebtoonEpisodeExtractor'),
+    ('naverwebtoon', 'NaverWebtoonComicExtractor'),
+    ('nekohouse', 'NekohousePostExtractor'),
+    ('nekohouse', 'NekohouseUserExtractor'),
+    ('newgrounds', 'NewgroundsImageExtractor'),
+    ('newgrounds', 'NewgroundsMediaExtractor'),
+    ('newgrounds', 'NewgroundsArtExtractor'),
+    ('newgrounds', 'NewgroundsAudioExtractor'),
+    ('newgrounds', 'NewgroundsMoviesExtractor'),
+    ('newgrounds', 'NewgroundsGamesExtractor'),
+    ('newgrounds', 'NewgroundsUserExtractor'),
+    ('newgrounds', 'NewgroundsFavoriteExtractor'),
+    ('newgrounds', 'NewgroundsFollowingExtractor'),
+    ('newgrounds', 'NewgroundsSearchExtractor'),
+    ('nhentai', 'NhentaiGalleryExtractor'),
+    ('nhentai', 'NhentaiTagExtractor'),
+    ('nhentai', 'NhentaiSearchExtractor'),
+    ('nhentai', 'NhentaiFavoriteExtractor'),
+    ('nijie', 'NijieUserExtractor'),
+    ('nijie', 'NijieIllustrationExtractor'),
+    ('nijie', 'NijieDoujinExtractor'),
+    ('nijie', 'NijieFavoriteExtractor'),
+    ('nijie', 'NijieNuitaExtractor'),
+    ('nijie', 'NijieFeedExtractor'),
+    ('nijie', 'NijieFollowedExtractor'),
+    ('nijie', 'NijieImageExtractor'),
+    ('nitter', 'NitterTweetsExtractor'),
+    ('nitter', 'NitterRepliesExtractor'),
+    ('nitter', 'NitterMediaExtractor'),
+    ('nitter', 'NitterSearchExtractor'),
+    ('nitter', 'NitterTweetExtractor'),
+    ('nozomi', 'NozomiPostExtractor'),
+    ('nozomi', 'NozomiIndexExtractor'),
+    ('nozomi', 'NozomiTagExtractor'),
+    ('nozomi', 'NozomiSearchExtractor'),
+    ('nsfwalbum', 'NsfwalbumAlbumExtractor'),
+    ('nudostar', 'NudostarModelExtractor'),
+    ('nudostar', 'NudostarImageExtractor'),
+    ('okporn', 'OkpornGalleryExtractor'),
+    ('paheal', 'PahealTagExtractor'),
+    ('paheal', 'PahealPostExtractor'),
+    ('patreon', 'PatreonCollectionExtractor'),
+    ('patreon', 'PatreonCreatorExtractor'),
+    ('patreon', 'PatreonUserExtractor'),
+    ('patreon', 'PatreonPostExtractor'),
+    ('pexels', 'PexelsCollectionExtractor'),
+    ('pexels', 'PexelsSearchExtractor'),
+    ('pexels', 'PexelsUserExtractor'),
+    ('pexels', 'PexelsImageExtractor'),
+    ('philomena', 'PhilomenaPostExtractor'),
+    ('philomena', 'PhilomenaSearchExtractor'),
+    ('philomena', 'PhilomenaGalleryExtractor'),
+    ('pholder', 'PholderSubredditExtractor'),
+    ('pholder', 'PholderUserExtractor'),
+    ('pholder', 'PholderSearchExtractor'),
+    ('photovogue', 'PhotovogueUserExtractor'),
+    ('picarto', 'PicartoGalleryExtractor'),
+    ('picazor', 'PicazorUserExtractor'),
+    ('pictoa', 'PictoaImageExtractor'),
+    ('pictoa', 'PictoaAlbumExtractor'),
+    ('piczel', 'PiczelUserExtractor'),
+    ('piczel', 'PiczelFolderExtractor'),
+    ('piczel', 'PiczelImageExtractor'),
+    ('pillowfort', 'PillowfortPostExtractor'),
+    ('pillowfort', 'PillowfortUserExtractor'),
+    ('pinterest', 'PinterestUserExtractor'),
+    ('pinterest', 'PinterestAllpinsExtractor'),
+    ('pinterest', 'PinterestCreatedExtractor'),
+    ('pinterest', 'PinterestSectionExtractor'),
+    ('pinterest', 'PinterestSearchExtractor'),
+    ('pinterest', 'PinterestPinExtractor'),
+    ('pinterest', 'PinterestBoardExtractor'),
+    ('pinterest', 'PinterestRelatedPinExtractor'),
+    ('pinterest', 'PinterestRelatedBoardExtractor'),
+    ('pinterest', 'PinterestPinitExtractor'),
+    ('pixeldrain', 'PixeldrainFileExtractor'),
+    ('pixeldrain', 'PixeldrainAlbumExtractor'),
+    ('pixeldrain', 'PixeldrainFolderExtractor'),
+    ('pixiv', 'PixivUserExtractor'),
+    ('pixiv', 'PixivArtworksExtractor'),
+    ('pixiv', 'PixivAvatarExtractor'),
+    ('pixiv', 'PixivBackgroundExtractor'),
+    ('pixiv', 'PixivMeExtractor'),
+    ('pixiv', 'PixivWorkExtractor'),
+    ('pixiv', 'PixivUnlistedExtractor'),
+    ('pixiv', 'PixivFavoriteExtractor'),
+    ('pixiv', 'PixivRankingExtractor'),
+    ('pixiv', 'PixivSearchExtractor'),
+    ('pixiv', 'PixivFollowedExtractor'),
+    ('pixiv', 'PixivPixivisionExtractor'),
+    ('pixiv', 'PixivSeriesExtractor'),
+    ('pixiv', 'PixivSketchExtractor'),
+    ('pixiv', 'PixivNovelNovelExtractor'),
+    ('pixiv', 'PixivNovelUserExtractor'),
+    ('pixiv', 'PixivNovelSeriesExtractor'),
+    ('pixiv', 'PixivNovelBookmarkExtractor'),
+    ('pixnet', 'PixnetImageExtractor'),
+    ('pixnet', 'PixnetSetExtractor'),
+    ('pixnet', 'PixnetFolderExtractor'),
+    ('pixnet', 'PixnetUserExtractor'),
+    ('plurk', 'PlurkTimelineExtractor'),
+    ('plurk', 'PlurkPostExtractor'),
+    ('poipiku', 'PoipikuUserExtractor'),
+    ('poipiku', 'PoipikuPostExtractor'),
+    ('poringa', 'PoringaPostExtractor'),
+    ('poringa', 'PoringaUserExtractor'),
+    ('poringa', 'PoringaSearchExtractor'),
+    ('pornhub', 'PornhubGalleryExtractor'),
+    ('pornhub', 'PornhubGifExtractor'),
+    ('pornhub', 'PornhubUserExtractor'),
+    ('pornhub', 'PornhubPhotosExtractor'),
+    ('pornhub', 'PornhubGifsExtractor'),
+    ('pornpics', 'PornpicsGalleryExtractor'),
+    ('pornpics', 'PornpicsTagExtractor'),
+    ('pornpics', 'PornpicsSearchExtractor'),
+    ('pornpics', 'PornpicsListingExtractor'),
+    ('pornpics', 'PornpicsCategoryExtractor'),
+    ('pornstarstube', 'PornstarstubeGalleryExtractor'),
+    ('postmill', 'PostmillPostExtractor'),
+    ('postmill', 'PostmillShortURLExtractor'),
+    ('postmill', 'PostmillHomeExtractor'),
+    ('postmill', 'PostmillForumExtractor'),
+    ('postmill', 'PostmillUserSubmissionsExtractor'),
+    ('postmill', 'PostmillTagExtractor'),
+    ('postmill', 'PostmillSearchExtractor'),
+    ('rawkuma', 'RawkumaChapterExtractor'),
+    ('rawkuma', 'RawkumaMangaExtractor'),
+    ('reactor', 'ReactorTagExtractor'),
+    ('reactor', 'ReactorSearchExtractor'),
+    ('reactor', 'ReactorUserExtractor'),
+    ('reactor', 'ReactorPostExtractor'),
+    ('readcomiconline', 'ReadcomiconlineIssueExtractor'),
+    ('readcomiconline', 'ReadcomiconlineComicExtractor'),
+    ('readcomiconline', 'ReadcomiconlineTagExtractor'),
+    ('realbooru', 'RealbooruTagExtractor'),
+    ('realbooru', 'RealbooruFavoriteExtractor'),
+    ('realbooru', 'RealbooruPoolExtractor'),
+    ('realbooru', 'RealbooruPostExtractor'),
+    ('reddit', 'RedditSubredditExtractor'),
+    ('reddit', 'RedditHomeExtractor'),
+    ('reddit', 'RedditUserExtractor'),
+    ('reddit', 'RedditSubmissionExtractor'),
+    ('reddit', 'RedditImageExtractor'),
+    ('reddit', 'RedditRedirectExtractor'),
+    ('redgifs', 'RedgifsUserExtractor'),
+    ('redgifs', 'RedgifsCollectionExtractor'),
+    ('redgifs', 'RedgifsCollectionsExtractor'),
+    ('redgifs', 'RedgifsNichesExtractor'),
+    ('redgifs', 'RedgifsSearchExtractor'),
+    ('redgifs', 'RedgifsImageExtractor'),
+    ('rule34us', 'Rule34usTagExtractor'),
+    ('rule34us', 'Rule34usPostExtractor'),
+    ('rule34vault', 'Rule34vaultPostExtractor'),
+    ('rule34vault', 'Rule34vaultPlaylistExtractor'),
+    ('rule34vault', 'Rule34vaultTagExtractor'),
+    ('rule34xyz', 'Rule34xyzPostExtractor'),
+    ('rule34xyz', 'Rule34xyzPlaylistExtractor'),
+    ('rule34xyz', 'Rule34xyzTagExtractor'),
+    ('s3ndpics', 'S3ndpicsPostExtractor'),
+    ('s3ndpics', 'S3ndpicsUserExtractor'),
+    ('s3ndpics', 'S3ndpicsSearchExtractor'),
+    ('sankaku', 'SankakuTagExtractor'),
+    ('sankaku', 'SankakuPoolExtractor'),
+    ('sankaku', 'SankakuPostExtractor'),
+    ('sankaku', 'SankakuBooksExtractor'),
+    ('sankakucomplex', 'SankakucomplexArticleExtractor'),
+    ('sankakucomplex', 'SankakucomplexTagExtractor'),
+    ('schalenetwork', 'SchalenetworkGalleryExtractor'),
+    ('schalenetwork', 'SchalenetworkSearchExtractor'),
+    ('schalenetwork', 'SchalenetworkFavoriteExtractor'),
+    ('scrolller', 'ScrolllerSubredditExtractor'),
+    ('scrolller', 'ScrolllerUserExtractor'),
+    ('scrolller', 'ScrolllerFollowingExtractor'),
+    ('scrolller', 'ScrolllerPostExtractor'),
+    ('seiga', 'SeigaUserExtractor'),
+    ('seiga', 'SeigaImageExtractor'),
+    ('senmanga', 'SenmangaChapterExtractor'),
+    ('sexcom', 'SexcomPinExtractor'),
+    ('sexcom', 'SexcomRelatedPinExtractor'),
+    ('sexcom', 'SexcomPinsExtractor'),
+    ('sexcom', 'SexcomLikesExtractor'),
+    ('sexcom', 'SexcomBoardExtractor'),
+    ('sexcom', 'SexcomFeedExtractor'),
+    ('sexcom', 'SexcomSearchExtractor'),
+    ('shimmie2', 'Shimmie2TagExtractor'),
+    ('shimmie2', 'Shimmie2PostExtractor'),
+    ('simplyhentai', 'SimplyhentaiSeriesExtractor'),
+    ('simplyhentai', 'SimplyhentaiMangaExtractor'),
+    ('simplyhentai', 'SimplyhentaiTagExtractor'),
+    ('simplyhentai', 'SimplyhentaiLanguageExtractor'),
+    ('simplyhentai', 'SimplyhentaiGalleryExtractor'),
+    ('sizebooru', 'SizebooruPostExtractor'),
+    ('sizebooru', 'SizebooruTagExtractor'),
+    ('sizebooru', 'SizebooruGalleryExtractor'),
+    ('sizebooru', 'SizebooruUserExtractor'),
+    ('sizebooru', 'SizebooruFavoriteExtractor'),
+    ('skeb', 'SkebPostExtractor'),
+    ('skeb', 'SkebWorksExtractor'),
+    ('skeb', 'SkebSentrequestsExtractor'),
+    ('skeb', 'SkebUserExtractor'),
+    ('skeb', 'SkebSearchExtractor'),
+    ('skeb', 'SkebFollowingExtractor'),
+    ('skeb', 'SkebFollowingUsersExtractor'),
+    ('slickpic', 'SlickpicAlbumExtractor'),
+    ('slickpic', 'SlickpicUserExtractor'),
+    ('slideshare', 'SlidesharePresentationExtractor'),
+    ('smugmug', 'SmugmugAlbumExtractor'),
+    ('smugmug', 'SmugmugImageExtractor'),
+    ('smugmug', 'SmugmugPathExtractor'),
+    ('soundgasm', 'SoundgasmAudioExtractor'),
+    ('soundgasm', 'SoundgasmUserExtractor'),
+    ('speakerdeck', 'SpeakerdeckPresentationExtractor'),
+    ('steamgriddb', 'SteamgriddbAssetExtractor'),
+    ('steamgriddb', 'SteamgriddbGridsExtractor'),
+    ('steamgriddb', 'SteamgriddbHeroesExtractor'),
+    ('steamgriddb', 'SteamgriddbLogosExtractor'),
+    ('steamgriddb', 'SteamgriddbIconsExtractor'),
+    ('subscribestar', 'SubscribestarUserExtractor'),
+    ('subscribestar', 'SubscribestarPostExtractor'),
+    ('sxypix', 'SxypixGalleryExtractor'),
+    ('szurubooru', 'SzurubooruTagExtractor'),
+    ('szurubooru', 'SzurubooruPostExtractor'),
+    ('tapas', 'TapasEpisodeExtractor'),
+    ('tapas', 'TapasSeriesExtractor'),
+    ('tapas', 'TapasCreatorExtractor'),
+    ('tcbscans', 'TcbscansChapterExtractor'),
+    ('tcbscans', 'TcbscansMangaExtractor'),
+    ('telegraph', 'TelegraphGalleryExtractor'),
+    ('tenor', 'TenorImageExtractor'),
+    ('tenor', 'TenorSearchExtractor'),
+    ('tenor', 'TenorUserExtractor'),
+    ('thefap', 'ThefapPostExtractor'),
+    ('thefap', 'ThefapModelExtractor'),
+    ('thehentaiworld', 'ThehentaiworldTagExtractor'),
+    ('thehentaiworld', 'ThehentaiworldPostExtractor'),
+    ('tiktok', 'TiktokPostExtractor'),
+    ('tiktok', 'TiktokVmpostExtractor'),
+    ('tiktok', 'TiktokUserExtractor'),
+    ('tiktok', 'TiktokAvatarExtractor'),
+    ('tiktok', 'TiktokPostsExtractor'),
+    ('tiktok', 'TiktokRepostsExtractor'),
+    ('tiktok', 'TiktokStoriesExtractor'),
+    ('tiktok', 'TiktokLikesExtractor'),
+    ('tiktok', 'TiktokSavedExtractor'),
+    ('tiktok', 'TiktokFollowingExtractor'),
+    ('tmohentai', 'TmohentaiGalleryExtractor'),
+    ('toyhouse', 'ToyhouseArtExtractor'),
+    ('toyhouse', 'ToyhouseImageExtractor'),
+    ('tumblr', 'TumblrUserExtractor'),
+    ('tumblr', 'TumblrPostExtractor'),
+    ('tumblr', 'TumblrTagExtractor'),
+    ('tumblr', 'TumblrDayExtractor'),
+    ('tumblr', 'TumblrLikesExtractor'),
+    ('tumblr', 'TumblrFollowingExtractor'),
+    ('tumblr', 'TumblrFollowersExtractor'),
+    ('tumblr', 'TumblrSearchExtractor'),
+    ('tumblrgallery', 'TumblrgalleryTumblrblogExtractor'),
+    ('tumblrgallery', 'TumblrgalleryPostExtractor'),
+    ('tumblrgallery', 'TumblrgallerySearchExtractor'),
+    ('tungsten', 'TungstenPostExtractor'),
+    ('tungsten', 'TungstenModelExtractor'),
+    ('tungsten', 'TungstenUserExtractor'),
+    ('turbo', 'TurboAlbumExtractor'),
+    ('turbo', 'TurboMediaExtractor'),
+    ('twibooru', 'TwibooruPostExtractor'),
+    ('twibooru', 'TwibooruSearchExtractor'),
+    ('twibooru', 'TwibooruGalleryExtractor'),
+    ('twitter', 'TwitterHomeExtractor'),
+    ('twitter', 'TwitterNotificationsExtractor'),
+    ('twitter', 'TwitterSearchExtractor'),
+    ('twitter', 'TwitterHashtagExtractor'),
+    ('twitter', 'TwitterUserExtractor'),
+    ('twitter', 'TwitterTimelineExtractor'),
+    ('twitter', 'TwitterTweetsExtractor'),
+    ('twitter', 'TwitterWithRepliesExtractor'),
+    ('twitter', 'TwitterHighlightsExtractor'),
+    ('twitter', 'TwitterMediaExtractor'),
+    ('twitter', 'TwitterLikesExtractor'),
+    ('twitter', 'TwitterBookmarkExtractor'),
+    ('twitter', 'TwitterListExtractor'),
+    ('twitter', 'TwitterListMembersExtractor'),
+    ('twitter', 'TwitterFollowingExtractor'),
+    ('twitter', 'TwitterFollowersExtractor'),
+    ('twitter', 'TwitterCommunityExtractor'),
+    ('twitter', 'TwitterCommunitiesExtractor'),
+    ('twitter', 'TwitterEventExtractor'),
+    ('twitter', 'TwitterTweetExtractor'),
+    ('twitter', 'TwitterQuotesExtractor'),
+    ('twitter', 'TwitterInfoExtractor'),
+    ('twitter', 'TwitterAvatarExtractor'),
+    ('twitter', 'TwitterBackgroundExtractor'),
+    ('twitter', 'TwitterImageExtractor'),
+    ('urlgalleries', 'UrlgalleriesGalleryExtractor'),
+    ('unsplash', 'UnsplashImageExtractor'),
+    ('unsplash', 'UnsplashUserExtractor'),
+    ('unsplash', 'UnsplashFavoriteExtractor'),
+    ('unsplash', 'UnsplashCollectionExtractor'),
+    ('unsplash', 'UnsplashSearchExtractor'),
+    ('uploadir', 'UploadirFileExtractor'),
+    ('urlshortener', 'UrlshortenerLinkExtractor'),
+    ('vanillarock', 'VanillarockPostExtractor'),
+    ('vanillarock', 'VanillarockTagExtractor'),
+    ('vichan', 'VichanThreadExtractor'),
+    ('vichan', 'VichanBoardExtractor'),
+    ('vipergirls', 'VipergirlsThreadExtractor'),
+    ('vipergirls', 'VipergirlsPostExtractor'),
+    ('vk', 'VkPhotosExtractor'),
+    ('vk', 'VkAlbumExtractor'),
+    ('vk', 'VkTaggedExtractor'),
+    ('vk', 'VkWallPostExtractor'),
+    ('vsco', 'VscoUserExtractor'),
+    ('vsco', 'VscoGalleryExtractor'),
+    ('vsco', 'VscoCollectionExtractor'),
+    ('vsco', 'VscoSpaceExtractor'),
+    ('vsco', 'VscoSpacesExtractor'),
+    ('vsco', 'VscoAvatarExtractor'),
+    ('vsco', 'VscoImageExtractor'),
+    ('vsco', 'VscoVideoExtractor'),
+    ('wallhaven', 'WallhavenSearchExtractor'),
+    ('wallhaven', 'WallhavenCollectionExtractor'),
+    ('wallhaven', 'WallhavenUserExtractor'),
+    ('wallhaven', 'WallhavenCollectionsExtractor'),
+    ('wallhaven', 'WallhavenUploadsExtractor'),
+    ('wallhaven', 'WallhavenImageExtractor'),
+    ('wallpapercave', 'WallpapercaveImageExtractor'),
+    ('warosu', 'WarosuThreadExtractor'),
+    ('weasyl', 'WeasylSubmissionExtractor'),
+    ('weasyl', 'WeasylSubmissionsExtractor'),
+    ('weasyl', 'WeasylFolderExtractor'),
+    ('weasyl', 'WeasylJournalExtractor'),
+    ('weasyl', 'WeasylJournalsExtractor'),
+    ('weasyl', 'WeasylFavoriteExtractor'),
+    ('webmshare', 'WebmshareVideoExtractor'),
+    ('webtoons', 'WebtoonsEpisodeExtractor'),
+    ('webtoons', 'WebtoonsComicExtractor'),
+    ('webtoons', 'WebtoonsArtistExtractor'),
+    ('weebcentral', 'WeebcentralChapterExtractor'),
+    ('weebcentral', 'WeebcentralMangaExtractor'),
+    ('weebdex', 'WeebdexChapterExtractor'),
+    ('weebdex', 'WeebdexMangaExtractor'),
+    ('weibo', 'WeiboUserExtractor'),
+    ('weibo', 'WeiboHomeExtractor'),
+    ('weibo', 'WeiboFeedExtractor'),
+    ('weibo', 'WeiboVideosExtractor'),
+    ('weibo', 'WeiboNewvideoExtractor'),
+    ('weibo', 'WeiboArticleExtractor'),
+    ('weibo', 'WeiboAlbumExtractor'),
+    ('weibo', 'WeiboStatusExtractor'),
+    ('whyp', 'WhypAudioExtractor'),
+    ('whyp', 'WhypUserExtractor'),
+    ('whyp', 'WhypCollectionExtractor'),
+    ('wikiart', 'WikiartArtistExtractor'),
+    ('wikiart', 'WikiartImageExtractor'),
+    ('wikiart', 'WikiartArtworksExtractor'),
+    ('wikiart', 'WikiartArtistsExtractor'),
+    ('wikifeet', 'WikifeetGalleryExtractor'),
+    ('wikimedia', 'WikimediaArticleExtractor'),
+    ('wikimedia', 'WikimediaWikiExtractor'),
+    ('xasiat', 'XasiatAlbumExtractor'),
+    ('xasiat', 'XasiatTagExtractor'),
+    ('xasiat', 'XasiatCategoryExtractor'),
+    ('xasiat', 'XasiatModelExtractor'),
+    ('xenforo', 'XenforoPostExtractor'),
+    ('xenforo', 'XenforoThreadExtractor'),
+    ('xenforo', 'XenforoForumExtractor'),
+    ('xenforo', 'XenforoMediaUserExtractor'),
+    ('xenforo', 'XenforoMediaAlbumExtractor'),
+    ('xenforo', 'XenforoMediaCategoryExtractor'),
+    ('xenforo', 'XenforoMediaItemExtractor'),
+    ('xenforo', 'XenforoProfileExtractor'),
+    ('xfolio', 'XfolioWorkExtractor'),
+    ('xfolio', 'XfolioUserExtractor'),
+    ('xfolio', 'XfolioSeriesExtractor'),
+    ('xhamster', 'XhamsterGalleryExtractor'),
+    ('xhamster', 'XhamsterUserExtractor'),
+    ('xvideos', 'XvideosGalleryExtractor'),
+    ('xvideos', 'XvideosUserExtractor'),
+    ('yiffverse', 'YiffversePostExtractor'),
+    ('yiffverse', 'YiffversePlaylistExtractor'),
+    ('yiffverse', 'YiffverseTagExtractor'),
+    ('yourlesbians', 'YourlesbiansAlbumExtractor'),
+    ('zerochan', 'ZerochanTagExtractor'),
+    ('zerochan', 'ZerochanImageExtractor'),
+    ('moebooru', 'MoebooruTagExtractor'),
+    ('moebooru', 'MoebooruPoolExtractor'),
+    ('moebooru', 'MoebooruPostExtractor'),
+    ('moebooru', 'MoebooruPopularExtractor'),
+    ('foolfuuka', 'FoolfuukaThreadExtractor'),
+    ('foolfuuka', 'FoolfuukaBoardExtractor'),
+    ('foolfuuka', 'FoolfuukaSearchExtractor'),
+    ('foolfuuka', 'FoolfuukaGalleryExtractor'),
+    ('foolslide', 'FoolslideChapterExtractor'),
+    ('foolslide', 'FoolslideMangaExtractor'),
+    ('mastodon', 'MastodonUserExtractor'),
+    ('mastodon', 'MastodonBookmarkExtractor'),
+    ('mastodon', 'MastodonFavoriteExtractor'),
+    ('mastodon', 'MastodonListExtractor'),
+    ('mastodon', 'MastodonHashtagExtractor'),
+    ('mastodon', 'MastodonFollowingExtractor'),
+    ('mastodon', 'MastodonStatusExtractor'),
+    ('shopify', 'ShopifyCollectionExtractor'),
+    ('shopify', 'ShopifyProductExtractor'),
+    ('lolisafe', 'LolisafeAlbumExtractor'),
+    ('imagehosts', 'ImxtoImageExtractor'),
+    ('imagehosts', 'ImxtoGalleryExtractor'),
+    ('imagehosts', 'AcidimgImageExtractor'),
+    ('imagehosts', 'ImagevenueImageExtractor'),
+    ('imagehosts', 'ImagetwistImageExtractor'),
+    ('imagehosts', 'ImagetwistGalleryExtractor'),
+    ('imagehosts', 'ImgadultImageExtractor'),
+    ('imagehosts', 'ImgspiceImageExtractor'),
+    ('imagehosts', 'PixhostImageExtractor'),
+    ('imagehosts', 'PixhostGalleryExtractor'),
+    ('imagehosts', 'PostimgImageExtractor'),
+    ('imagehosts', 'PostimgGalleryExtractor'),
+    ('imagehosts', 'TurboimagehostImageExtractor'),
+    ('imagehosts', 'TurboimagehostGalleryExtractor'),
+    ('imagehosts', 'ViprImageExtractor'),
+    ('imagehosts', 'ImgclickImageExtractor'),
+    ('imagehosts', 'FappicImageExtractor'),
+    ('imagehosts', 'PicstateImageExtractor'),
+    ('imagehosts', 'ImgdriveImageExtractor'),
+    ('imagehosts', 'SilverpicImageExtractor'),
+    ('imagehosts', 'ImgpvImageExtractor'),
+    ('directlink', 'DirectlinkExtractor'),
+    ('recursive', 'RecursiveExtractor'),
+    ('oauth', 'OAuthFlickr'),
+    ('oauth', 'OAuthSmugmug'),
+    ('oauth', 'OAuthTumblr'),
+    ('oauth', 'OAuthDeviantart'),
+    ('oauth', 'OAuthReddit'),
+    ('oauth', 'OAuthMastodon'),
+    ('oauth', 'OAuthPixiv'),
+    ('noop', 'NoopExtractor'),
+    ('ytdl', 'YoutubeDLExtractor'),
+    ('generic', 'GenericExtractor'),
+)
+
+HOSTS = {
+    '1sthiperdex.com': (319, 320, 321),
+    '1sthiperdex.info': (319, 320, 321),
+    '1sthiperdex.net': (319, 320, 321),
+    '1sthiperdex.top': (319, 320, 321),
+    '1sthipertoon.com': (319, 320, 321),
+    '1sthipertoon.info': (319, 320, 321),
+    '1sthipertoon.net': (319, 320, 321),
+    '1sthipertoon.top': (319, 320, 321),
+    '2ch.hk': (0, 1),
+    '2ch.life': (0, 1),
+    '2ch.org': (0, 1),
+    '2ch.su': (0, 1),
+    '2chen.club': (3, 4),
+    '2chen.moe': (3, 4),
+    '35photo.pro': (5, 6, 7, 8),
+    '4archive.org': (15, 16),
+    '4chanarchives.com': (17, 18),
+    '4plebs.org': (886, 887, 888, 889),
+    '500px.com': (19, 20, 21, 22),
+    '8chan.cc': (23, 24),
+    '8chan.moe': (23, 24),
+    '8chan.se': (23, 24),
+    '8kun.top': (801, 802),
+    '8muses.com': (25,),
+    '94chan.org': (413, 414),
+    'acidimg.cc': (904,),
+    'adultdvdempire.com': (26,),
+    'adultempire.com': (26,),
+    'agn.ph': (27, 28),
+    'ahottie.top': (29, 30, 31),
+    'aibooru.download': (151, 152, 153, 154, 155, 156, 157, 158, 159),
+    'aibooru.online': (151, 152, 153, 154, 155, 156, 157, 158, 159),
+    'allgirl.booru.org': (280, 281, 282),
+    'allthefallen.moe': (861, 862, 863, 864, 865, 866, 867, 868),
+    'anchira.to': (666, 667, 668),
+    'ao3.com': (32, 33, 34, 35, 36, 37, 38, 39, 40),
+    'ao3.net': (32, 33, 34, 35, 36, 37, 38, 39, 40),
+    'ao3.org': (32, 33, 34, 35, 36, 37, 38, 39, 40),
+    'app.koofr.eu': (429,),
+    'app.koofr.net': (429,),
+    'arca.live': (41, 42, 43),
+    'arch.b4k.co': (886, 887, 888, 889),
+    'arch.b4k.dev': (886, 887, 888, 889),
+    'architizer.com': (44, 45),
+    'archive.4plebs.org': (886, 887, 888, 889),
+    'archive.palanq.win': (886, 887, 888, 889),
+    'archive.rebeccablacktech.com': (886, 887, 888, 889),
+    'archived.moe': (886, 887, 888, 889),
+    'archiveofourown.com': (32, 33, 34, 35, 36, 37, 38, 39, 40),
+    'archiveofourown.net': (32, 33, 34, 35, 36, 37, 38, 39, 40),
+    'archiveofourown.org': (32, 33, 34, 35, 36, 37, 38, 39, 40),
+    'archiveofsins.com': (886, 887, 888, 889),
+    'archives.bulbagarden.net': (855, 856),
+    'are.na': (46,),
+    'art.ngfiles.com': (503,),
+    'artstation.com': (47, 48, 49, 50, 51, 52, 53, 54, 55, 56),
+    'artstn.co': (55,),
+    'aryion.com': (57, 58, 59, 60, 61, 62),
+    'audiochan.com': (63, 64, 65, 66),
+    'azurlane.koumakan.jp': (855, 856),
+    'baraag.net': (892, 893, 894, 895, 896, 897, 898),
+    'bbc.co.uk': (67, 68),
+    'bbw-chan.link': (447, 448),
+    'bbw-chan.nl': (447, 448),
+    'behance.net': (69, 70, 71),
+    'behoimi.org': (9, 10, 11, 12),
+    'bellazon.com': (72, 73, 74),
+    'beta.coomer.cr': (419, 420, 421, 422, 423, 424, 425),
+    'beta.coomer.party': (419, 420, 421, 422, 423, 424, 425),
+    'beta.coomer.st': (419, 420, 421, 422, 423, 424, 425),
+    'beta.coomer.su': (419, 420, 421, 422, 423, 424, 425),
+    'beta.imagefap.com': (337, 338, 339, 340),
+    'beta.kemono.cr': (419, 420, 421, 422, 423, 424, 425),
+    'beta.kemono.party': (419, 420, 421, 422, 423, 424, 425),
+    'beta.kemono.st': (419, 420, 421, 422, 423, 424, 425),
+    'beta.kemono.su': (419, 420, 421, 422, 423, 424, 425),
+    'beta.sankakucomplex.com': (660, 661, 662, 663),
+    'bit.ly': (798,),
+    'black.sankakucomplex.com': (660, 661, 662, 663),
+    'blog.livedoor.jp': (441, 442),
+    'blog.naver.com': (495, 496),
+    'boards.4chan.org': (13, 14),
+    'boards.4channel.org': (13, 14),
+    'boards.fireden.net': (886, 887, 888, 889),
+    'boards.guro.cx': (801, 802),
+    'booru.allthefallen.moe': (151, 152, 153, 154, 155, 156, 157, 158, 159),
+    'booru.bcbnsfw.space': (719, 720),
+    'booru.borvar.art': (151, 152, 153, 154, 155, 156, 157, 158, 159),
+    'booru.cavemanon.xyz': (683, 684),
+    'boosty.to': (98, 99, 100, 101, 102, 103),
+    'booth.pm': (104, 106),
+    'bsky.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'bskye.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'bskyx.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'bsyy.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'bsyye.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'bsyyx.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'bulbapedia.bulbagarden.net': (855, 856),
+    'c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid.onion': (
+        617, 618, 619, 620, 621, 622, 623,
+    ),
+    'catbox.moe': (109,),
+    'cbsky.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'cbskye.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'cbskyx.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'cbsyy.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'cbsyye.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'cbsyyx.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'celebforum.to': (861, 862, 863, 864, 865, 866, 867, 868),
+    'cfake.com': (111, 112, 113, 114),
+    'chan.sankakucomplex.com': (660, 661, 662, 663),
+    'chelseacrew.com': (899, 900),
+    'chzzk.naver.com': (497, 498),
+    'ci-en.dlsite.com': (119, 120, 121, 122),
+    'ci-en.net': (119, 120, 121, 122),
+    'civitai.com': (
+        123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136,
+        137, 138, 139, 140,
+    ),
+    'co.llection.pics': (683, 684),
+    'comedywildlifephoto.com': (141,),
+    'comic.naver.com': (499, 500),
+    'comick.io': (142, 143, 144),
+    'comicpark.com': (468, 469),
+    'comicpark.io': (468, 469),
+    'comicpark.me': (468, 469),
+    'comicpark.net': (468, 469),
+    'comicpark.org': (468, 469),
+    'comicpark.to': (468, 469),
+    'comics.8muses.com': (25,),
+    'comicvine.gamespot.com': (145,),
+    'commons.wikimedia.org': (855, 856),
+    'coomer.cr': (419, 420, 421, 422, 423, 424, 425),
+    'coomer.party': (419, 420, 421, 422, 423, 424, 425),
+    'coomer.st': (419, 420, 421, 422, 423, 424, 425),
+    'coomer.su': (419, 420, 421, 422, 423, 424, 425),
+    'cosplay.paheal.net': (538, 539),
+    'cyberdrop.cr': (146, 147),
+    'cyberdrop.me': (146, 147),
+    'cyberdrop.to': (146, 147),
+    'cyberfile.me': (148, 149, 150),
+    'danbooru.donmai.us': (151, 152, 153, 154, 155, 156, 157, 158, 159),
+    'dandadan.net': (160, 161),
+    'danke.moe': (162, 163),
+    'de.catbox.moe': (110,),
+    'derpibooru.org': (548, 549, 550),
+    'desktopography.net': (164, 165, 166),
+    'desuarchive.org': (886, 887, 888, 889),
+    'deviantart.com': (
+        167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 178, 179, 180, 181,
+        183, 184,
+    ),
+    'discord.com': (185, 186, 187, 188, 189, 190, 191),
+    'donmai.moe': (151, 152, 153, 154, 155, 156, 157, 158, 159),
+    'downloads.khinsider.com': (426,),
+    'drawfriends.booru.org': (280, 281, 282),
+    'dynasty-scans.com': (192, 193, 194, 195, 196),
+    'e-hentai.org': (214, 215, 216),
+    'e621.anthro.fr': (204,),
+    'e621.cc': (197, 198, 199, 200, 201, 202, 203, 204),
+    'e621.net': (197, 198, 199, 200, 201, 202, 203),
+    'e6ai.net': (197, 198, 199, 200, 201, 202, 203),
+    'e926.net': (197, 198, 199, 200, 201, 202, 203),
+    'endchan.gg': (447, 448),
+    'endchan.net': (447, 448),
+    'endchan.org': (447, 448),
+    'eporner.com': (205,),
+    'erome.com': (206, 207, 208),
+    'everia.club': (209, 210, 211, 212, 213),
+    'exhentai.org': (214, 215, 216),
+    'facebook.com': (217, 218, 219, 220, 221, 222, 223, 224),
+    'fanbox.cc': (225, 226, 227, 228, 229),
+    'fanfox.net': (459, 460),
+    'fansly.com': (231, 232, 233, 234, 235, 236),
+    'fantia.jp': (237, 238),
+    'fapachi.com': (242, 243),
+    'fapello.com': (239, 240, 241),
+    'fapello.su': (239, 240, 241),
+    'fappic.com': (918,),
+    'fashionnova.com': (899, 900),
+    'fav.me': (180,),
+    'fikfap.com': (244, 245, 246),
+    'files.catbox.moe': (110,),
+    'filester.me': (247, 248),
+    'fitnakedgirls.com': (249, 250, 251, 252, 253),
+    'fixupx.com': (
+        766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779,
+        780, 781, 782, 783, 784, 785, 786, 787, 788, 789,
+    ),
+    'fixvx.com': (
+        766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779,
+        780, 781, 782, 783, 784, 785, 786, 787, 788, 789,
+    ),
+    'flic.kr': (254,),
+    'flickr.com': (254, 255, 256, 257, 258, 259, 260),
+    'forums.socialmediagirls.com': (861, 862, 863, 864, 865, 866, 867, 868),
+    'furaffinity.net': (261, 262, 263, 264, 265, 266, 267, 268, 269),
+    'furbooru.org': (548, 549, 550),
+    'furry34.com': (270, 271, 272),
+    'fuskator.com': (273, 274),
+    'fxbsky.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'fxbskye.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'fxbskyx.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'fxbsyy.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'fxbsyye.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'fxbsyyx.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'fxdeviantart.com': (
+        167, 168, 169, 170, 171, 173, 174, 175, 176, 180, 181, 183, 184,
+    ),
+    'fxfuraffinity.net': (261, 262, 263, 264, 265, 266, 267, 268, 269),
+    'fxraffinity.net': (261, 262, 263, 264, 265, 266, 267, 268, 269),
+    'fxtwitter.com': (
+        766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779,
+        780, 781, 782, 783, 784, 785, 786, 787, 788, 789,
+    ),
+    'g.e-hentai.org': (214, 215, 216),
+    'gelbooru.com': (275, 276, 277, 278, 279),
+    'general.aibooru.download': (151, 152, 153, 154, 155, 156, 157, 158, 159),
+    'general.aibooru.online': (151, 152, 153, 154, 155, 156, 157, 158, 159),
+    'gfycat.com': (648,),
+    'gifdeliverynetwork.com': (648,),
+    'girlsreleased.com': (287, 288, 289),
+    'girlswithmuscle.com': (290, 291),
+    'gofile.io': (292,),
+    'hdoujin.net': (297, 298, 299),
+    'hdoujin.org': (297, 298, 299),
+    'hentai-cosplay-xxx.com': (302,),
+    'hentai-cosplay.com': (302,),
+    'hentai-cosplays-xxx.com': (302,),
+    'hentai-cosplays.com': (302,),
+    'hentai-foundry.com': (303, 304, 305, 306, 307, 308, 309, 310, 311, 312),
+    'hentai-img-xxx.com': (302,),
+    'hentai-img.com': (302,),
+    'hentai2read.com': (300, 301),
+    'hentaienvy.com': (362, 363, 364),
+    'hentaiera.com': (362, 363, 364),
+    'hentaifox.com': (362, 363, 364),
+    'hentaihand.com': (313, 314),
+    'hentaihere.com': (315, 316),
+    'hentainexus.com': (317, 318),
+    'hentairox.com': (362, 363, 364),
+    'hentaizap.com': (362, 363, 364),
+    'hijiribe.donmai.us': (151, 152, 153, 154, 155, 156, 157, 158, 159),
+    'hiperdex.com': (319, 320, 321),
+    'hiperdex.info': (319, 320, 321),
+    'hiperdex.net': (319, 320, 321),
+    'hiperdex.top': (319, 320, 321),
+    'hipertoon.com': (319, 320, 321),
+    'hipertoon.info': (319, 320, 321),
+    'hipertoon.net': (319, 320, 321),
+    'hipertoon.top': (319, 320, 321),
+    'hitomi.la': (322, 323, 324, 325),
+    'horne.red': (517, 518, 519, 520, 521, 522, 523, 524),
+    'hoshino.one': (666, 667, 668),
+    'hotleak.vip': (326, 327, 328, 329),
+    'hypnohub.net': (283, 284, 285, 286),
+    'i.imgbox.com': (348,),
+    'i.imgur.com': (352, 353, 354, 355, 356, 357, 358, 359, 360, 361),
+    'i.imgur.io': (352, 353, 354, 355, 356, 357, 358, 359, 360, 361),
+    'i.lensdump.com': (436,),
+    'i.pximg.net': (582,),
+    'i.redd.it': (641,),
+    'i.reddituploads.com': (641,),
+    'i.redgifs.com': (648,),
+    'ibb.co': (344, 345),
+    'idol.sankakucomplex.com': (330, 331, 332),
+    'idolcomplex.com': (330, 331, 332),
+    'illusioncards.booru.org': (280, 281, 282),
+    'imagebam.com': (333, 334),
+    'imagefap.com': (337, 338, 339, 340),
+    'imagehaha.com': (906, 907),
+    'imagepond.net': (341, 342, 343),
+    'imagetwist.com': (906, 907),
+    'img.yt': (902,),
+    'imgadult.com': (908,),
+    'imgbox.com': (347, 348),
+    'imgchest.com': (335, 336),
+    'imgclick.net': (917,),
+    'imgdrive.com': (920,),
+    'imgdrive.net': (920,),
+    'imglike.com': (115, 116, 117, 118),
+    'imgpile.com': (349, 350),
+    'imgpv.com': (922,),
+    'imgspice.com': (909,),
+    'imgtaxi.com': (920,),
+    'imgtaxi.net': (920,),
+    'imgth.com': (351,),
+    'imgur.com': (352, 353, 354, 355, 356, 357, 358, 359, 360, 361),
+    'imgur.io': (352, 353, 354, 355, 356, 357, 358, 359, 360, 361),
+    'imgwallet.com': (920,),
+    'imgwallet.net': (920,),
+    'imhentai.xxx': (362, 363, 364),
+    'imx.to': (902, 903),
+    'inkbunny.net': (365, 366, 367, 368, 369, 370, 371),
+    'instagram.com': (
+        372, 373, 374, 375, 376, 377, 378, 379, 380, 381, 382, 383, 384, 385,
+        386, 387,
+    ),
+    'issuu.com': (388, 389),
+    'itaku.ee': (390, 391, 392, 393, 394, 395, 396, 397, 398, 399),
+    'iwara.tv': (401, 402, 403, 404, 405, 406, 407, 408, 409, 410, 411, 412),
+    'jpeg.church': (115, 116, 117, 118),
+    'jpeg.cr': (115, 116, 117, 118),
+    'jpeg.fish': (115, 116, 117, 118),
+    'jpeg.fishing': (115, 116, 117, 118),
+    'jpeg.pet': (115, 116, 117, 118),
+    'jpeg.su': (115, 116, 117, 118),
+    'jpg.church': (115, 116, 117, 118),
+    'jpg.cr': (115, 116, 117, 118),
+    'jpg.fish': (115, 116, 117, 118),
+    'jpg.fishing': (115, 116, 117, 118),
+    'jpg.pet': (115, 116, 117, 118),
+    'jpg.su': (115, 116, 117, 118),
+    'k00.fr': (429,),
+    'kabe-uchiroom.com': (415,),
+    'kaliscan.me': (416, 417),
+    'kemono.cr': (419, 420, 421, 422, 423, 424, 425),
+    'kemono.party': (419, 420, 421, 422, 423, 424, 425),
+    'kemono.st': (419, 420, 421, 422, 423, 424, 425),
+    'kemono.su': (419, 420, 421, 422, 423, 424, 425),
+    'koharu.to': (666, 667, 668),
+    'kohlchan.net': (447, 448),
+    'konachan.com': (882, 883, 884, 885),
+    'konachan.net': (882, 883, 884, 885),
+    'koofr.eu': (429,),
+    'koofr.net': (429,),
+    'leakgallery.com': (430, 431, 432, 433),
+    'lensdump.com': (434, 435, 436),
+    'lesbian.energy': (480, 481, 482, 483, 484, 485, 486, 487),
+    'lexica.art': (437,),
+    'lightbrd.com': (525, 526, 527, 528, 529),
+    'lightroom.adobe.com': (438,),
+    'listal.com': (439, 440),
+    'litter.catbox.moe': (110,),
+    'lohas.nicoseiga.jp': (674,),
+    'lolibooru.moe': (882, 883, 884, 885),
+    'loungeunderwear.com': (899, 900),
+    'luscious.net': (445, 446),
+    'm.fanfox.net': (459, 460),
+    'm.flickr.com': (254, 255, 256, 257, 258, 259, 260),
+    'm.imgur.com': (352, 353, 354, 355, 356, 357, 358, 359, 360, 361),
+    'm.imgur.io': (352, 353, 354, 355, 356, 357, 358, 359, 360, 361),
+    'm.mangafox.me': (459, 460),
+    'm.mangahere.cc': (463, 464),
+    'm.mangahere.co': (463, 464),
+    'm.vk.com': (805, 806, 807, 808),
+    'm.weibo.cn': (839, 840, 841, 842, 843, 844, 845, 846),
+    'm.weibo.com': (839, 840, 841, 842, 843, 844, 845, 846),
+    'm1xdrop.ag': (488,),
+    'm1xdrop.bz': (488,),
+    'm1xdrop.com': (488,),
+    'm1xdrop.net': (488,),
+    'm1xdrop.top': (488,),
+    'main.bsky.dev': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'manga.madokami.al': (449,),
+    'mangadex.cc': (450, 451, 452, 453, 454, 455, 456),
+    'mangadex.org': (450, 451, 452, 453, 454, 455, 456),
+    'mangafire.to': (457, 458),
+    'mangafox.me': (459, 460),
+    'mangafreak.me': (461, 462),
+    'mangahere.cc': (463, 464),
+    'mangahere.co': (463, 464),
+    'mangakakalot.gg': (465, 466, 467),
+    'manganato.gg': (465, 466, 467),
+    'mangapark.com': (468, 469),
+    'mangapark.io': (468, 469),
+    'mangapark.me': (468, 469),
+    'mangapark.net': (468, 469),
+    'mangapark.org': (468, 469),
+    'mangapark.to': (468, 469),
+    'mangaread.org': (470, 471),
+    'mangareader.to': (472, 473),
+    'mangataro.org': (474, 475),
+    'mangatown.com': (476, 477),
+    'mangoxo.com': (478, 479),
+    'mariowiki.com': (855, 856),
+    'mastodon.social': (892, 893, 894, 895, 896, 897, 898),
+    'mediawiki.org': (855, 856),
+    'members.luscious.net': (445, 446),
+    'men.wikifeet.com': (854,),
+    'michaels.com.au': (899, 900),
+    'misskey.art': (480, 481, 482, 483, 484, 485, 486, 487),
+    'misskey.design': (480, 481, 482, 483, 484, 485, 486, 487),
+    'misskey.io': (480, 481, 482, 483, 484, 485, 486, 487),
+    'mixdrop.ag': (488,),
+    'mixdrop.bz': (488,),
+    'mixdrop.com': (488,),
+    'mixdrop.net': (488,),
+    'mixdrop.top': (488,),
+    'mobile.fixupx.com': (
+        766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779,
+        780, 781, 782, 783, 784, 785, 786, 787, 788, 789,
+    ),
+    'mobile.fixvx.com': (
+        766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779,
+        780, 781, 782, 783, 784, 785, 786, 787, 788, 789,
+    ),
+    'mobile.fxtwitter.com': (
+        766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779,
+        780, 781, 782, 783, 784, 785, 786, 787, 788, 789,
+    ),
+    'mobile.twitter.com': (
+        766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779,
+        780, 781, 782, 783, 784, 785, 786, 787, 788, 789,
+    ),
+    'mobile.vxtwitter.com': (
+        766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779,
+        780, 781, 782, 783, 784, 785, 786, 787, 788, 789,
+    ),
+    'mobile.x.com': (
+        766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779,
+        780, 781, 782, 783, 784, 785, 786, 787, 788, 789,
+    ),
+    'modcloth.com': (899, 900),
+    'motherless.com': (489, 490, 491),
+    'mpark.to': (468, 469),
+    'myhentaigallery.com': (492, 493),
+    'natomanga.com': (465, 466, 467),
+    'nekohouse.su': (501, 502),
+    'nelomanga.net': (465, 466, 467),
+    'newgrounds.com': (503, 504, 512),
+    'news.sankakucomplex.com': (664, 665),
+    'nhentai.net': (513, 514, 515, 516),
+    'nicovideo.jp': (673, 674),
+    'nijie.info': (517, 518, 519, 520, 521, 522, 523, 524),
+    'nitter.net': (525, 526, 527, 528, 529),
+    'nitter.space': (525, 526, 527, 528, 529),
+    'nitter.tiekoetter.com': (525, 526, 527, 528, 529),
+    'niyaniya.moe': (666, 667, 668),
+    'noop': (932,),
+    'nop': (932,),
+    'noz.rip': (683, 684),
+    'nozomi.la': (530, 531, 532, 533),
+    'nsfwalbum.com': (534,),
+    'nudostar.com': (861, 862, 863, 864, 865, 866, 867, 868),
+    'ohpolly.com': (899, 900),
+    'ok.porn': (537,),
+    'omgmiamiswimwear.com': (899, 900),
+    'onepiecechapters.com': (724, 725),
+    'onepiecechapters.me': (724, 725),
+    'parkmanga.com': (468, 469),
+    'parkmanga.net': (468, 469),
+    'parkmanga.org': (468, 469),
+    'patreon.com': (540, 541, 542, 543),
+    'pawoo.net': (892, 893, 894, 895, 896, 897, 898),
+    'pbs.twimg.com': (790,),
+    'pexels.com': (544, 545, 546, 547),
+    'phixiv.net': (
+        577, 578, 579, 580, 582, 583, 584, 585, 586, 587, 589, 591, 592, 593,
+        594,
+    ),
+    'pholder.com': (551, 552, 553),
+    'phun.imagehaha.com': (906, 907),
+    'phun.imagetwist.com': (906, 907),
+    'picarto.tv': (555,),
+    'picazor.com': (556,),
+    'picstate.com': (919,),
+    'pictoa.com': (557, 558),
+    'pictoa.com.de': (557, 558),
+    'pictures.hentai-foundry.com': (310,),
+    'piczel.tv': (559, 560, 561),
+    'pidgi.net': (855, 856),
+    'pin.it': (573,),
+    'pinupgirlclothing.com': (899, 900),
+    'pixeldrain.com': (574, 575, 576),
+    'pixhost.org': (910, 911),
+    'pixhost.to': (910, 911),
+    'pixiv.me': (581,),
+    'pixiv.net': (
+        230, 577, 578, 579, 580, 582, 583, 584, 585, 586, 587, 589, 591, 592,
+        593, 594,
+    ),
+    'pixivision.net': (588,),
+    'pixxxels.cc': (912, 913),
+    'pixxxels.org': (912, 913),
+    'plurk.com': (599, 600),
+    'poipiku.com': (601, 602),
+    'ponybooru.org': (548, 549, 550),
+    'poringa.net': (603, 604, 605),
+    'porn-image-xxx.com': (302,),
+    'porn-image.com': (302,),
+    'porn-images-xxx.com': (302,),
+    'porn-images.com': (302,),
+    'pornhub.com': (606, 607, 608, 609, 610),
+    'pornpics.com': (611, 612, 613, 614, 615),
+    'pornstars.tube': (616,),
+    'postimages.cc': (912, 913),
+    'postimages.org': (912, 913),
+    'postimg.cc': (912, 913),
+    'postimg.org': (912, 913),
+    'preview.redd.it': (641,),
+    'raddle.me': (617, 618, 619, 620, 621, 622, 623),
+    'raidlondon.com': (899, 900),
+    'raw.senmanga.com': (675,),
+    'rawkuma.com': (624, 625),
+    'rawkuma.net': (624, 625),
+    'rbt.asia': (886, 887, 888, 889),
+    'readcomiconline.li': (630, 631, 632),
+    'readcomiconline.to': (630, 631, 632),
+    'readpark.com': (468, 469),
+    'readpark.io': (468, 469),
+    'readpark.me': (468, 469),
+    'readpark.net': (468, 469),
+    'readpark.org': (468, 469),
+    'readpark.to': (468, 469),
+    'realbooru.com': (633, 634, 635, 636),
+    'rebeccablacktech.com': (886, 887, 888, 889),
+    'redd.it': (640,),
+    'reddit.com': (637, 638, 639, 640, 642),
+    'redgifs.com': (643, 644, 645, 646, 647, 648),
+    'rule34.paheal.net': (538, 539),
+    'rule34.us': (649, 650),
+    'rule34.xxx': (283, 284, 285, 286),
+    'rule34.xyz': (654, 655, 656),
+    'rule34hentai.net': (683, 684),
+    'rule34vault.com': (651, 652, 653),
+    'rule63.paheal.net': (538, 539),
+    's3nd.pics': (657, 658, 659),
+    'safe.aibooru.download': (151, 152, 153, 154, 155, 156, 157, 158, 159),
+    'safe.aibooru.online': (151, 152, 153, 154, 155, 156, 157, 158, 159),
+    'safebooru.donmai.us': (151, 152, 153, 154, 155, 156, 157, 158, 159),
+    'safebooru.org': (283, 284, 285, 286),
+    'sakugabooru.com': (882, 883, 884, 885),
+    'sankaku.app': (660, 661, 662, 663),
+    'schan.help': (3, 4),
+    'scrolller.com': (669, 670, 671, 672),
+    'secure.flickr.com': (254, 255, 256, 257, 258, 259, 260),
+    'seia.to': (666, 667, 668),
+    'seiga.nicovideo.jp': (673, 674),
+    'sex.com': (676, 677, 678, 679, 680, 681, 682),
+    'sfw.furaffinity.net': (261, 262, 263, 264, 265, 266, 267, 268, 269),
+    'sfw.fxfuraffinity.net': (261, 262, 263, 264, 265, 266, 267, 268, 269),
+    'sfw.fxraffinity.net': (261, 262, 263, 264, 265, 266, 267, 268, 269),
+    'sfw.xfuraffinity.net': (261, 262, 263, 264, 265, 266, 267, 268, 269),
+    'shupogaki.moe': (666, 667, 668),
+    'silverpic.com': (921,),
+    'silverpic.net': (921,),
+    'simpcity.cr': (861, 862, 863, 864, 865, 866, 867, 868),
+    'simpcity.su': (861, 862, 863, 864, 865, 866, 867, 868),
+    'simply-hentai.com': (685, 686, 687, 688, 689),
+    'sizebooru.com': (690, 691, 692, 693, 694),
+    'skeb.jp': (695, 696, 697, 698, 699, 700, 701),
+    'sketch.pixiv.net': (590,),
+    'slideshare.net': (704,),
+    'smuglo.li': (801, 802),
+    'smugloli.net': (801, 802),
+    'snootbooru.com': (719, 720),
+    'sonohara.donmai.us': (151, 152, 153, 154, 155, 156, 157, 158, 159),
+    'soundgasm.net': (708, 709),
+    'soybooru.com': (683, 684),
+    'sp.seiga.nicovideo.jp': (673, 674),
+    'space.bilibili.com': (76, 77),
+    'speakerdeck.com': (710,),
+    'species.wikimedia.org': (855, 856),
+    'sta.sh': (172,),
+    'steamgriddb.com': (711, 712, 713, 714, 715),
+    'sturdychan.help': (3, 4),
+    'subscribestar.adult': (716, 717),
+    'subscribestar.com': (716, 717),
+    'sushi.ski': (480, 481, 482, 483, 484, 485, 486, 487),
+    'sxypix.com': (718,),
+    't.co': (798,),
+    'tapas.io': (721, 722, 723),
+    'tbib.org': (283, 284, 285, 286),
+    'tcb-backup.bihar-mirchi.com': (724, 725),
+    'tcb-backup.bihar-mirchi.me': (724, 725),
+    'tcbscans.com': (724, 725),
+    'tcbscans.me': (724, 725),
+    'telegra.ph': (726,),
+    'tenor.com': (727, 728, 729),
+    'the-collection.booru.org': (280, 281, 282),
+    'thebarchive.com': (886, 887, 888, 889),
+    'thefap.net': (730, 731),
+    'thehentaiworld.com': (732, 733),
+    'tiktok.com': (734, 735, 736, 737, 738, 739, 740, 741, 742, 743),
+    'tiktokv.com': (734, 736, 737, 738, 739, 740, 741, 742, 743),
+    'titsintops.com': (861, 862, 863, 864, 865, 866, 867, 868),
+    'tmohentai.com': (744,),
+    'touch.phixiv.net': (
+        577, 578, 579, 580, 582, 583, 584, 585, 586, 587, 589, 591, 592, 593,
+        594,
+    ),
+    'touch.pixiv.net': (
+        577, 578, 579, 580, 582, 583, 584, 585, 586, 587, 589, 591, 592, 593,
+        594,
+    ),
+    'toyhou.se': (745, 746),
+    'tumblr.com': (747, 748, 749, 750, 751, 752, 753, 754),
+    'tumblrgallery.xyz': (755, 756, 757),
+    'tungsten.run': (758, 759, 760),
+    'turbo.cr': (761, 762),
+    'turboimagehost.com': (914, 915),
+    'turbovid.cr': (761, 762),
+    'twibooru.org': (763, 764, 765),
+    'twitter.com': (
+        766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779,
+        780, 781, 782, 783, 784, 785, 786, 787, 788, 789,
+    ),
+    'unique-vintage.com': (899, 900),
+    'unsplash.com': (792, 793, 794, 795, 796),
+    'uploadir.com': (797,),
+    'urlgalleries.com': (791,),
+    'vanilla-rock.com': (799, 800),
+    'vidya.pics': (683, 684),
+    'vidyart2.booru.org': (280, 281, 282),
+    'vipergirls.to': (803, 804),
+    'vipr.im': (916,),
+    'visuabusters.com': (719, 720),
+    'vk.com': (805, 806, 807, 808),
+    'vm.tiktok.com': (735,),
+    'vogue.com': (554,),
+    'vsco.co': (809, 810, 811, 812, 813, 814, 815, 816),
+    'vt.tiktok.com': (735,),
+    'vxbsky.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'vxbskye.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'vxbskyx.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'vxbsyy.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'vxbsyye.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'vxbsyyx.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'vxtwitter.com': (
+        766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779,
+        780, 781, 782, 783, 784, 785, 786, 787, 788, 789,
+    ),
+    'w.wallhaven.cc': (822,),
+    'wallhaven.cc': (817, 818, 819, 820, 821, 822),
+    'wallpapercave.com': (823,),
+    'warosu.org': (824,),
+    'web.500px.com': (19, 20, 21, 22),
+    'webmshare.com': (831,),
+    'webtoons.com': (832, 833, 834),
+    'weebcentral.com': (835, 836),
+    'weebdex.org': (837, 838),
+    'weibo.cn': (839, 840, 841, 842, 843, 844, 845, 846),
+    'weibo.com': (839, 840, 841, 842, 843, 844, 845, 846),
+    'white.sankakucomplex.com': (660, 661, 662, 663),
+    'whvn.cc': (822,),
+    'whyp.it': (847, 848, 849),
+    'wikiart.org': (850, 851, 852, 853),
+    'wikifeet.com': (854,),
+    'wikifeetx.com': (854,),
+    'windsorstore.com': (899, 900),
+    'www.1sthiperdex.com': (319, 320, 321),
+    'www.1sthiperdex.info': (319, 320, 321),
+    'www.1sthiperdex.net': (319, 320, 321),
+    'www.1sthiperdex.top': (319, 320, 321),
+    'www.1sthipertoon.com': (319, 320, 321),
+    'www.1sthipertoon.info': (319, 320, 321),
+    'www.1sthipertoon.net': (319, 320, 321),
+    'www.1sthipertoon.top': (319, 320, 321),
+    'www.8muses.com': (25,),
+    'www.acidimg.cc': (904,),
+    'www.adultdvdempire.com': (26,),
+    'www.adultempire.com': (26,),
+    'www.ahottie.top': (29, 30, 31),
+    'www.allthefallen.moe': (861, 862, 863, 864, 865, 866, 867, 868),
+    'www.ao3.com': (32, 33, 34, 35, 36, 37, 38, 39, 40),
+    'www.ao3.net': (32, 33, 34, 35, 36, 37, 38, 39, 40),
+    'www.ao3.org': (32, 33, 34, 35, 36, 37, 38, 39, 40),
+    'www.arca.live': (41, 42, 43),
+    'www.archiveofourown.com': (32, 33, 34, 35, 36, 37, 38, 39, 40),
+    'www.archiveofourown.net': (32, 33, 34, 35, 36, 37, 38, 39, 40),
+    'www.archiveofourown.org': (32, 33, 34, 35, 36, 37, 38, 39, 40),
+    'www.archiveofsins.com': (886, 887, 888, 889),
+    'www.are.na': (46,),
+    'www.artstation.com': (47, 48, 49, 50, 51, 52, 56),
+    'www.aryion.com': (57, 58, 59, 60, 61, 62),
+    'www.audiochan.com': (63, 64, 65, 66),
+    'www.bbc.co.uk': (67, 68),
+    'www.behance.net': (69, 70, 71),
+    'www.behoimi.org': (9, 10, 11, 12),
+    'www.bellazon.com': (72, 73, 74),
+    'www.bsky.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.bskye.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.bskyx.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.bsyy.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.bsyye.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.bsyyx.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.catbox.moe': (109,),
+    'www.cbsky.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.cbskye.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.cbskyx.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.cbsyy.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.cbsyye.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.cbsyyx.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.celebforum.to': (861, 862, 863, 864, 865, 866, 867, 868),
+    'www.cfake.com': (111, 112, 113, 114),
+    'www.chelseacrew.com': (899, 900),
+    'www.comedywildlifephoto.com': (141,),
+    'www.comick.io': (142, 143, 144),
+    'www.comicpark.com': (468, 469),
+    'www.comicpark.io': (468, 469),
+    'www.comicpark.me': (468, 469),
+    'www.comicpark.net': (468, 469),
+    'www.comicpark.org': (468, 469),
+    'www.comicpark.to': (468, 469),
+    'www.coomer.cr': (419, 420, 421, 422, 423, 424, 425),
+    'www.coomer.party': (419, 420, 421, 422, 423, 424, 425),
+    'www.coomer.st': (419, 420, 421, 422, 423, 424, 425),
+    'www.coomer.su': (419, 420, 421, 422, 423, 424, 425),
+    'www.cyberdrop.cr': (146, 147),
+    'www.cyberdrop.me': (146, 147),
+    'www.cyberdrop.to': (146, 147),
+    'www.cyberfile.me': (148, 149, 150),
+    'www.dandadan.net': (160, 161),
+    'www.danke.moe': (162, 163),
+    'www.derpibooru.org': (548, 549, 550),
+    'www.deviantart.com': (
+        167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180,
+        181, 182, 183, 184,
+    ),
+    'www.dynasty-scans.com': (192, 193, 194, 195, 196),
+    'www.eporner.com': (205,),
+    'www.erome.com': (206, 207, 208),
+    'www.fanbox.cc': (225, 226, 227, 228, 229),
+    'www.fanfox.net': (459, 460),
+    'www.fansly.com': (231, 232, 233, 234, 235, 236),
+    'www.fantia.jp': (237, 238),
+    'www.fapachi.com': (242, 243),
+    'www.fapello.com': (239, 240, 241),
+    'www.fapello.su': (239, 240, 241),
+    'www.fappic.com': (918,),
+    'www.fashionnova.com': (899, 900),
+    'www.fikfap.com': (244, 245, 246),
+    'www.filester.me': (247, 248),
+    'www.fitnakedgirls.com': (249, 250, 251, 252, 253),
+    'www.fixupx.com': (
+        766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779,
+        780, 781, 782, 783, 784, 785, 786, 787, 788, 789,
+    ),
+    'www.fixvx.com': (
+        766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779,
+        780, 781, 782, 783, 784, 785, 786, 787, 788, 789,
+    ),
+    'www.flickr.com': (254, 255, 256, 257, 258, 259, 260),
+    'www.furaffinity.net': (261, 262, 263, 264, 265, 266, 267, 268, 269),
+    'www.furry34.com': (270, 271, 272),
+    'www.fxbsky.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.fxbskye.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.fxbskyx.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.fxbsyy.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.fxbsyye.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.fxbsyyx.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.fxdeviantart.com': (
+        167, 168, 169, 170, 171, 173, 174, 175, 176, 180, 181, 183, 184,
+    ),
+    'www.fxfuraffinity.net': (261, 262, 263, 264, 265, 266, 267, 268, 269),
+    'www.fxraffinity.net': (261, 262, 263, 264, 265, 266, 267, 268, 269),
+    'www.fxtwitter.com': (
+        766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779,
+        780, 781, 782, 783, 784, 785, 786, 787, 788, 789,
+    ),
+    'www.gelbooru.com': (275, 276, 277, 278, 279),
+    'www.gifdeliverynetwork.com': (648,),
+    'www.girlsreleased.com': (287, 288, 289),
+    'www.girlswithmuscle.com': (290, 291),
+    'www.gofile.io': (292,),
+    'www.hdoujin.net': (297, 298, 299),
+    'www.hdoujin.org': (297, 298, 299),
+    'www.hentai-foundry.com': (
+        303, 304, 305, 306, 307, 308, 309, 310, 311, 312,
+    ),
+    'www.hentai2read.com': (300, 301),
+    'www.hentaienvy.com': (362, 363, 364),
+    'www.hentaiera.com': (362, 363, 364),
+    'www.hentaifox.com': (362, 363, 364),
+    'www.hentaihand.com': (313, 314),
+    'www.hentaihere.com': (315, 316),
+    'www.hentainexus.com': (317, 318),
+    'www.hentairox.com': (362, 363, 364),
+    'www.hentaizap.com': (362, 363, 364),
+    'www.hiperdex.com': (319, 320, 321),
+    'www.hiperdex.info': (319, 320, 321),
+    'www.hiperdex.net': (319, 320, 321),
+    'www.hiperdex.top': (319, 320, 321),
+    'www.hipertoon.com': (319, 320, 321),
+    'www.hipertoon.info': (319, 320, 321),
+    'www.hipertoon.net': (319, 320, 321),
+    'www.hipertoon.top': (319, 320, 321),
+    'www.horne.red': (517, 518, 519, 520, 521, 522, 523, 524),
+    'www.hotleak.vip': (326, 327, 328, 329),
+    'www.idol.sankakucomplex.com': (330, 331, 332),
+    'www.idolcomplex.com': (330, 331, 332),
+    'www.imagebam.com': (333,),
+    'www.imagefap.com': (337, 338, 339, 340),
+    'www.imagehaha.com': (906, 907),
+    'www.imagepond.net': (341, 342, 343),
+    'www.imagetwist.com': (906, 907),
+    'www.imagevenue.com': (905,),
+    'www.img.yt': (902,),
+    'www.imgadult.com': (908,),
+    'www.imgbox.com': (347, 348),
+    'www.imgchest.com': (335, 336),
+    'www.imgclick.net': (917,),
+    'www.imgdrive.com': (920,),
+    'www.imgdrive.net': (920,),
+    'www.imglike.com': (115, 116, 117, 118),
+    'www.imgpile.com': (349, 350),
+    'www.imgpv.com': (922,),
+    'www.imgspice.com': (909,),
+    'www.imgtaxi.com': (920,),
+    'www.imgtaxi.net': (920,),
+    'www.imgth.com': (351,),
+    'www.imgur.com': (352, 353, 354, 355, 356, 357, 358, 359, 360, 361),
+    'www.imgur.io': (352, 353, 354, 355, 356, 357, 358, 359, 360, 361),
+    'www.imgwallet.com': (920,),
+    'www.imgwallet.net': (920,),
+    'www.imhentai.xxx': (362, 363, 364),
+    'www.imx.to': (902, 903),
+    'www.inkbunny.net': (365, 366, 367, 368, 369, 370, 371),
+    'www.instagram.com': (
+        372, 373, 374, 375, 376, 377, 378, 379, 380, 381, 382, 383, 384, 385,
+        386, 387,
+    ),
+    'www.iwara.tv': (
+        401, 402, 403, 404, 405, 406, 407, 408, 409, 410, 411, 412,
+    ),
+    'www.jpeg.church': (115, 116, 117, 118),
+    'www.jpeg.cr': (115, 116, 117, 118),
+    'www.jpeg.fish': (115, 116, 117, 118),
+    'www.jpeg.fishing': (115, 116, 117, 118),
+    'www.jpeg.pet': (115, 116, 117, 118),
+    'www.jpeg.su': (115, 116, 117, 118),
+    'www.jpg.church': (115, 116, 117, 118),
+    'www.jpg.cr': (115, 116, 117, 118),
+    'www.jpg.fish': (115, 116, 117, 118),
+    'www.jpg.fishing': (115, 116, 117, 118),
+    'www.jpg.pet': (115, 116, 117, 118),
+    'www.jpg.su': (115, 116, 117, 118),
+    'www.kemono.cr': (419, 420, 421, 422, 423, 424, 425),
+    'www.kemono.party': (419, 420, 421, 422, 423, 424, 425),
+    'www.kemono.st': (419, 420, 421, 422, 423, 424, 425),
+    'www.kemono.su': (419, 420, 421, 422, 423, 424, 425),
+    'www.leakgallery.com': (430, 431, 432, 433),
+    'www.lightbrd.com': (525, 526, 527, 528, 529),
+    'www.listal.com': (439, 440),
+    'www.lofter.com': (444,),
+    'www.luscious.net': (445, 446),
+    'www.m1xdrop.ag': (488,),
+    'www.m1xdrop.bz': (488,),
+    'www.m1xdrop.com': (488,),
+    'www.m1xdrop.net': (488,),
+    'www.m1xdrop.top': (488,),
+    'www.mangadex.cc': (450, 451, 452, 453, 454, 455, 456),
+    'www.mangadex.org': (450, 451, 452, 453, 454, 455, 456),
+    'www.mangafire.to': (457, 458),
+    'www.mangafox.me': (459, 460),
+    'www.mangahere.cc': (463, 464),
+    'www.mangahere.co': (463, 464),
+    'www.mangakakalot.gg': (465, 466, 467),
+    'www.manganato.gg': (465, 466, 467),
+    'www.mangapark.com': (468, 469),
+    'www.mangapark.io': (468, 469),
+    'www.mangapark.me': (468, 469),
+    'www.mangapark.net': (468, 469),
+    'www.mangapark.org': (468, 469),
+    'www.mangapark.to': (468, 469),
+    'www.mangaread.org': (470, 471),
+    'www.mangareader.to': (472, 473),
+    'www.mangatown.com': (476, 477),
+    'www.mangoxo.com': (478, 479),
+    'www.mariowiki.com': (855, 856),
+    'www.mediawiki.org': (855, 856),
+    'www.mixdrop.ag': (488,),
+    'www.mixdrop.bz': (488,),
+    'www.mixdrop.com': (488,),
+    'www.mixdrop.net': (488,),
+    'www.mixdrop.top': (488,),
+    'www.mpark.to': (468, 469),
+    'www.natomanga.com': (465, 466, 467),
+    'www.nelomanga.net': (465, 466, 467),
+    'www.newgrounds.com': (503, 504, 512),
+    'www.nicovideo.jp': (673, 674),
+    'www.nijie.info': (517, 518, 519, 520, 521, 522, 523, 524),
+    'www.nitter.net': (525, 526, 527, 528, 529),
+    'www.nitter.space': (525, 526, 527, 528, 529),
+    'www.nitter.tiekoetter.com': (525, 526, 527, 528, 529),
+    'www.nsfwalbum.com': (534,),
+    'www.nudostar.com': (861, 862, 863, 864, 865, 866, 867, 868),
+    'www.ohpolly.com': (899, 900),
+    'www.ok.porn': (537,),
+    'www.omgmiamiswimwear.com': (899, 900),
+    'www.parkmanga.com': (468, 469),
+    'www.parkmanga.net': (468, 469),
+    'www.parkmanga.org': (468, 469),
+    'www.patreon.com': (540, 541, 542, 543),
+    'www.pexels.com': (544, 545, 546, 547),
+    'www.phixiv.net': (
+        577, 578, 579, 580, 582, 583, 584, 585, 586, 587, 589, 591, 592, 593,
+        594,
+    ),
+    'www.pholder.com': (551, 552, 553),
+    'www.picazor.com': (556,),
+    'www.picstate.com': (919,),
+    'www.piczel.tv': (559, 560, 561),
+    'www.pidgi.net': (855, 856),
+    'www.pillowfort.social': (562, 563),
+    'www.pixhost.org': (910, 911),
+    'www.pixhost.to': (910, 911),
+    'www.pixiv.net': (
+        230, 577, 578, 579, 580, 582, 583, 584, 585, 586, 587, 589, 591, 592,
+        593, 594,
+    ),
+    'www.pixivision.net': (588,),
+    'www.pixxxels.cc': (912, 913),
+    'www.pixxxels.org': (912, 913),
+    'www.plurk.com': (599, 600),
+    'www.ponybooru.org': (548, 549, 550),
+    'www.poringa.net': (603, 604, 605),
+    'www.pornpics.com': (611, 612, 613, 614, 615),
+    'www.pornstars.tube': (616,),
+    'www.postimages.cc': (912, 913),
+    'www.postimages.org': (912, 913),
+    'www.postimg.cc': (912, 913),
+    'www.postimg.org': (912, 913),
+    'www.raidlondon.com': (899, 900),
+    'www.readcomiconline.li': (630, 631, 632),
+    'www.readcomiconline.to': (630, 631, 632),
+    'www.readpark.com': (468, 469),
+    'www.readpark.io': (468, 469),
+    'www.readpark.me': (468, 469),
+    'www.readpark.net': (468, 469),
+    'www.readpark.org': (468, 469),
+    'www.readpark.to': (468, 469),
+    'www.reddit.com': (637, 638, 639, 640, 642),
+    'www.redgifs.com': (644, 645, 646),
+    'www.rule34.xxx': (283, 284, 285, 286),
+    'www.rule34.xyz': (654, 655, 656),
+    'www.s3nd.pics': (657, 658, 659),
+    'www.sakugabooru.com': (882, 883, 884, 885),
+    'www.sankakucomplex.com': (660, 661, 662, 663, 664, 665),
+    'www.scrolller.com': (669, 670, 671, 672),
+    'www.sex.com': (676, 677, 678, 679, 680, 681, 682),
+    'www.silverpic.com': (921,),
+    'www.silverpic.net': (921,),
+    'www.simpcity.cr': (861, 862, 863, 864, 865, 866, 867, 868),
+    'www.simpcity.su': (861, 862, 863, 864, 865, 866, 867, 868),
+    'www.simply-hentai.com': (685, 686, 687, 688, 689),
+    'www.sizebooru.com': (690, 691, 692, 693, 694),
+    'www.slideshare.net': (704,),
+    'www.soundgasm.net': (708, 709),
+    'www.speakerdeck.com': (710,),
+    'www.steamgriddb.com': (711, 712, 713, 714, 715),
+    'www.subscribestar.adult': (716, 717),
+    'www.subscribestar.com': (716, 717),
+    'www.sxypix.com': (718,),
+    'www.telegra.ph': (726,),
+    'www.thefap.net': (730, 731),
+    'www.thehentaiworld.com': (732, 733),
+    'www.tiktok.com': (734, 735, 736, 737, 738, 739, 740, 741, 742, 743),
+    'www.tiktokv.com': (734, 736, 737, 738, 739, 740, 741, 742, 743),
+    'www.titsintops.com': (861, 862, 863, 864, 865, 866, 867, 868),
+    'www.toyhou.se': (745, 746),
+    'www.tumblr.com': (747, 748, 749, 750, 751, 752, 753, 754),
+    'www.tungsten.run': (758, 759, 760),
+    'www.turbo.cr': (761, 762),
+    'www.turboimagehost.com': (914, 915),
+    'www.turbovid.cr': (761, 762),
+    'www.twibooru.org': (763, 764, 765),
+    'www.twitter.com': (
+        766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779,
+        780, 781, 782, 783, 784, 785, 786, 787, 788, 789,
+    ),
+    'www.unique-vintage.com': (899, 900),
+    'www.vanilla-rock.com': (799, 800),
+    'www.vipergirls.to': (803, 804),
+    'www.visuabusters.com': (719, 720),
+    'www.vk.com': (805, 806, 807, 808),
+    'www.vogue.com': (554,),
+    'www.vsco.co': (809, 810, 811, 812, 813, 814, 815, 816),
+    'www.vxbsky.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.vxbskye.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.vxbskyx.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.vxbsyy.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.vxbsyye.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.vxbsyyx.app': (
+        82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97,
+    ),
+    'www.vxtwitter.com': (
+        766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779,
+        780, 781, 782, 783, 784, 785, 786, 787, 788, 789,
+    ),
+    'www.wallpapercave.com': (823,),
+    'www.warosu.org': (824,),
+    'www.webtoons.com': (832, 833, 834),
+    'www.weebcentral.com': (835, 836),
+    'www.weibo.cn': (839, 840, 841, 842, 843, 844, 845, 846),
+    'www.weibo.com': (839, 840, 841, 842, 843, 844, 845, 846),
+    'www.whyp.it': (847, 848, 849),
+    'www.wikiart.org': (850, 851, 852, 853),
+    'www.wikifeet.com': (854,),
+    'www.wikifeetx.com': (854,),
+    'www.windsorstore.com': (899, 900),
+    'www.x.com': (
+        766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779,
+        780, 781, 782, 783, 784, 785, 786, 787, 788, 789,
+    ),
+    'www.xasiat.com': (857, 858, 859, 860),
+    'www.xcancel.com': (525, 526, 527, 528, 529),
+    'www.xfuraffinity.net': (261, 262, 263, 264, 265, 266, 267, 268, 269),
+    'www.xvideos.com': (874, 875),
+    'www.yiffverse.com': (876, 877, 878),
+    'www.yourlesbians.com': (879,),
+    'www.zerochan.net': (880, 881),
+    'x.com': (
+        766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779,
+        780, 781, 782, 783, 784, 785, 786, 787, 788, 789,
+    ),
+    'xasiat.com': (857, 858, 859, 860),
+    'xbooru.com': (283, 284, 285, 286),
+    'xcancel.com': (525, 526, 527, 528, 529),
+    'xfolio.jp': (869, 870, 871),
+    'xfuraffinity.net': (261, 262, 263, 264, 265, 266, 267, 268, 269),
+    'xhamster.com': (872, 873),
+    'xhamster.desi': (872, 873),
+    'xhamster.one': (872, 873),
+    'xhamster.porncache.net': (872, 873),
+    'xvideos.com': (874, 875),
+    'yande.re': (882, 883, 884, 885),
+    'yiffverse.com': (876, 877, 878),
+    'yourlesbians.com': (879,),
+    'zerochan.net': (880, 881),
+}
+
+SUFFIXES = {
+    '.2chan.net': (2,),
+    '.35photo.pro': (5, 6, 7, 8),
+    '.ac': (107, 108),
+    '.artstation.com': (47, 48, 53, 54, 55),
+    '.ax': (107, 108),
+    '.black': (107, 108),
+    '.blogspot.com': (78, 79, 80, 81),
+    '.booth.pm': (104, 105),
+    '.cat': (107, 108),
+    '.church': (115, 116, 117, 118),
+    '.ci': (107, 108),
+    '.com': (319, 320, 321, 427, 428, 872, 873),
+    '.cr': (107, 108, 115, 116, 117, 118, 761, 762),
+    '.cz': (427, 428),
+    '.desi': (872, 873),
+    '.deviantart.com': (
+        167, 168, 169, 170, 171, 173, 174, 175, 176, 180, 181, 183, 184,
+    ),
+    '.facebook.com': (217, 218, 219, 220, 221, 222, 223, 224),
+    '.fanbox.cc': (225, 226, 227),
+    '.fandom.com': (855, 856),
+    '.fappic.com': (918,),
+    '.fi': (107, 108),
+    '.fish': (115, 116, 117, 118),
+    '.fishing': (115, 116, 117, 118),
+    '.fxdeviantart.com': (
+        167, 168, 169, 170, 171, 173, 174, 175, 176, 180, 181, 183, 184,
+    ),
+    '.gfycat.com': (648,),
+    '.hateblo.jp': (293, 294, 295, 296),
+    '.hatenablog.com': (293, 294, 295, 296),
+    '.hatenablog.jp': (293, 294, 295, 296),
+    '.hatenadiary.com': (293, 294, 295, 296),
+    '.hentai-cosplay-xxx.com': (302,),
+    '.hentai-cosplay.com': (302,),
+    '.hentai-cosplays-xxx.com': (302,),
+    '.hentai-cosplays.com': (302,),
+    '.hentai-img-xxx.com': (302,),
+    '.hentai-img.com': (302,),
+    '.imagebam.com': (334,),
+    '.imagevenue.com': (905,),
+    '.imgbox.com': (348,),
+    '.info': (319, 320, 321),
+    '.is': (107, 108),
+    '.itch.io': (400,),
+    '.l3n.co': (436,),
+    '.la': (107, 108, 427, 428),
+    '.lensdump.com': (436,),
+    '.li': (427, 428),
+    '.lofter.com': (443, 444),
+    '.lol': (427, 428),
+    '.loungeunderwear.com': (899, 900),
+    '.mangafreak.me': (461, 462),
+    '.me': (427, 428),
+    '.media': (107, 108),
+    '.moe': (427, 428),
+    '.net': (319, 320, 321),
+    '.newgrounds.com': (505, 506, 507, 508, 509, 510, 511),
+    '.one': (872, 873),
+    '.org': (107, 108),
+    '.pet': (115, 116, 117, 118),
+    '.ph': (107, 108),
+    '.pictoa.com': (557, 558),
+    '.pictoa.com.de': (557, 558),
+    '.pixiv.net': (582,),
+    '.pk': (107, 108, 761, 762),
+    '.porn-image-xxx.com': (302,),
+    '.porn-image.com': (302,),
+    '.porn-images-xxx.com': (302,),
+    '.porn-images.com': (302,),
+    '.pornhub.com': (606, 607, 608, 609, 610),
+    '.ps': (107, 108),
+    '.red': (107, 108),
+    '.reddit.com': (637, 638, 639, 640, 642),
+    '.redgifs.com': (643, 647, 648),
+    '.ru': (107, 108),
+    '.si': (107, 108),
+    '.site': (107, 108, 427, 428),
+    '.sk': (107, 108),
+    '.slickpic.com': (702, 703),
+    '.static.flickr.com': (254,),
+    '.staticflickr.com': (254,),
+    '.su': (107, 108, 115, 116, 117, 118, 761, 762),
+    '.to': (107, 108, 761, 762),
+    '.top': (319, 320, 321),
+    '.toyhou.se': (746,),
+    '.tumblr.com': (747, 748, 749, 750, 751, 752, 753),
+    '.urlgalleries.com': (791,),
+    '.webmshare.com': (831,),
+    '.wiki.gg': (855, 856),
+    '.wikibooks.org': (855, 856),
+    '.wikidata.org': (855, 856),
+    '.wikinews.org': (855, 856),
+    '.wikipedia.org': (855, 856),
+    '.wikiquote.org': (855, 856),
+    '.wikisource.org': (855, 856),
+    '.wikiversity.org': (855, 856),
+    '.wikivoyage.org': (855, 856),
+    '.wiktionary.org': (855, 856),
+    '.ws': (107, 108),
+    '.xhamster.com': (872, 873),
+    '.xhamster.desi': (872, 873),
+    '.xhamster.one': (872, 873),
+    '.xhamster.porncache.net': (872, 873),
+}
+
+SCHEMES = {
+    '2chen:': (3, 4),
+    'blogger:': (78, 79, 80, 81),
+    'bunkr:': (107, 108),
+    'chevereto:': (115, 116, 117, 118),
+    'danbooru:': (151, 152, 153, 154, 155, 156, 157, 158, 159),
+    'e621:': (197, 198, 199, 200, 201, 202, 203),
+    'foolfuuka:': (886, 887, 888, 889),
+    'g:': (934,),
+    'gelbooru_v01:': (280, 281, 282),
+    'gelbooru_v02:': (283, 284, 285, 286),
+    'generic:': (934,),
+    'hatenablog:': (293, 294, 295, 296),
+    'hentaicosplays:': (302,),
+    'imhentai:': (362, 363, 364),
+    'jschan:': (413, 414),
+    'lynxchan:': (447, 448),
+    'manganelo:': (465, 466, 467),
+    'mastodon:': (892, 893, 894, 895, 896, 897, 898),
+    'misskey:': (480, 481, 482, 483, 484, 485, 486, 487),
+    'moebooru:': (882, 883, 884, 885),
+    'nijie:': (517, 518, 519, 520, 521, 522, 523, 524),
+    'nitter:': (525, 526, 527, 528, 529),
+    'oauth:': (925, 926, 927, 928, 929, 930, 931),
+    'philomena:': (548, 549, 550),
+    'postmill:': (617, 618, 619, 620, 621, 622, 623),
+    'r:': (924,),
+    'recursive:': (924,),
+    'shimmie2:': (683, 684),
+    'shopify:': (899, 900),
+    'smugmug:': (705,),
+    'szurubooru:': (719, 720),
+    'tumblr:': (747, 748, 749, 750, 751, 752, 753),
+    'urlshortener:': (798,),
+    'vichan:': (801, 802),
+    'wikimedia:': (855, 856),
+    'xenforo:': (861, 862, 863, 864, 865, 866, 867, 868),
+    'ytdl:': (933,),
+}
+
+BASECATEGORIES = {
+    '2chen': (3, 4),
+    'Danbooru': (151, 152, 153, 154, 155, 156, 157, 158, 159),
+    'E621': (197, 198, 199, 200, 201, 202, 203),
+    'IMHentai': (362, 363, 364),
+    'Nijie': (517, 518, 519, 520, 521, 522, 523, 524),
+    'blogger': (78, 79, 80, 81),
+    'booru': (9, 10, 11, 12, 275, 276, 277, 278),
+    'chevereto': (115, 116, 117, 118),
+    'foolfuuka': (886, 887, 888, 889),
+    'gelbooru_v01': (280, 281, 282),
+    'gelbooru_v02': (283, 284, 285, 286),
+    'hentaicosplays': (302,),
+    'jschan': (413, 414),
+    'lynxchan': (447, 448),
+    'manganelo': (465, 466, 467),
+    'mastodon': (892, 893, 894, 895, 896, 897, 898),
+    'misskey': (480, 481, 482, 483, 484, 485, 486, 487),
+    'moebooru': (882, 883, 884, 885),
+    'nitter': (525, 526, 527, 528, 529),
+    'philomena': (548, 549, 550),
+    'postmill': (617, 618, 619, 620, 621, 622, 623),
+    'reactor': (626, 627, 628, 629),
+    'shimmie2': (683, 684),
+    'shopify': (899, 900),
+    'szurubooru': (719, 720),
+    'urlshortener': (798,),
+    'vichan': (801, 802),
+    'wikimedia': (855, 856),
+    'xenforo': (861, 862, 863, 864, 865, 866, 867, 868),
+}
+
+CONDITIONAL = {
+    ('bunkr', 'tlds'): (107, 108),
+    ('generic', 'enabled'): (934,),
+    ('ytdl', 'enabled'): (933,),
+}
+
+FALLBACK = (
+    75, 346, 418, 494, 535, 536, 564, 565, 566, 567, 568, 569, 570, 571, 572,
+    595, 596, 597, 598, 626, 627, 628, 629, 706, 707, 825, 826, 827, 828, 829,
+    830, 890, 891, 901, 923,
+)
@@ -370,8 +370,19 @@ class KemonoUserExtractor(KemonoExtractor):
         else:
             endpoint = self.api.creator_posts
 
-        return endpoint(service, creator_id,
-                        params.get("o"), params.get("q"), params.get("tag"))
+        posts = endpoint(service, creator_id,
+                         params.get("o"), params.get("q"), params.get("tag"))
+        if not params.get("o") and (
+                watermark := self._init_watermark()) is not None:
+            posts = watermark.filter(posts, self._watermark_key)
+        return posts
+
+    def _watermark_key(self, post):
+        # several posts can share a 'published' date;
+        # break ties by ID, ordering numeric IDs by their length first
+        if published := post.get("published"):
+            post_id = str(post.get("id") or "")
+            return (published, len(post_id), post_id)
 
 
 class KemonoPostsExtractor(KemonoExtractor):
@@ -728,6 +739,11 @@ class KemonoAPI():
             encoding="utf-8", fatal=fatal)
 
     def _pagination(self, endpoint, params, batch=50, key=None):
+        pages = self._pagination_pages(endpoint, params, batch, key)
+        for data in self.extractor.prefetch(pages):
+            yield from data
+
+    def _pagination_pages(self, endpoint, params, batch, key):
         offset = text.parse_int(params.get("o"))
         params["o"] = offset - offset % batch
 
@@ -738,13 +754,18 @@ class KemonoAPI():
                 data = data.get(key)
             if not data:
                 return
-            yield from data
+            yield data
 
             if len(data) < batch:
                 return
             params["o"] += batch
 
     def _pagination_reverse(self, endpoint, params, batch, count):
+        pages = self._pagination_reverse_pages(endpoint, params, batch, count)
+        for data in self.extractor.prefetch(pages):
+            yield from data
+
+    def _pagination_reverse_pages(self, endpoint, params, batch, count):
         params["o"] = count // batch * batch
 
         while True:
@@ -753,7 +774,7 @@ class KemonoAPI():
             if not data:
                 return
             data.reverse()
-            yield from data
+            yield data
 
             if not params["o"]:
                 return
@@ -477,9 +477,14 @@ class MangadexAPI():
                     del params[key]
             params.update(api_params)
 
+        for results in self.extractor.prefetch(
+                self._pagination_pages(endpoint, params, auth)):
+            yield from results
+
+    def _pagination_pages(self, endpoint, params, auth):
         while True:
             data = self._call(endpoint, params, auth)
-            yield from data["data"]
+            yield data["data"]
 
             params["offset"] = data["offset"] + data["limit"]
             if params["offset"] >= data["total"]:
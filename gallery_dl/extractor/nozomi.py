@@ -9,12 +9,233 @@
 """Extractors for https://nozomi.la/"""
 
 from .common import Extractor, Message
-from .. import text, dt
+from .. import text, util, dt, cache
+from bisect import bisect_left
+from itertools import filterfalse, islice
+import collections
+import operator
+import tempfile
+import hashlib
+import array
+import mmap
+import sys
+import os
+
+TYPECODE = "I" if array.array("I").itemsize == 4 else "L"
+# size ratio above which binary searches beat building a set
+GALLOP = 8
 
 
 def decode_nozomi(n):
-    for i in range(0, len(n), 4):
-        yield (n[i] << 24) + (n[i+1] << 16) + (n[i+2] << 8) + n[i+3]
+    """Return an array of all big-endian 32-bit IDs in 'n'"""
+    ids = array.array(TYPECODE)
+    ids.frombytes(memoryview(n)[:len(n) & ~3])
+    if sys.byteorder == "little":
+        ids.byteswap()
+    return ids
+
+
+def sort_ids(ids):
+    """Sort an ID array in ascending order and remove duplicates,
+    in place if possible
+
+    Nozomi files list unique IDs in descending order,
+    which makes reversing them sufficient most of the time.
+    """
+    ids.reverse()
+    if not all(map(operator.lt, ids, islice(ids, 1, None))):
+        ids = array.array(TYPECODE, sorted(set(ids)))
+    return ids
+
+
+def intersect_ids(a, b):
+    """Return the common IDs of two sorted arrays as sorted array"""
+    if len(a) > len(b):
+        a, b = b, a
+    if not a:
+        return a
+
+    if len(a) * GALLOP < len(b):
+        result = array.array(TYPECODE)
+        append = result.append
+        lo = 0
+        end = len(b)
+        for id in a:
+            lo = bisect_left(b, id, lo)
+            if lo >= end:
+                break
+            if b[lo] == id:
+                append(id)
+        return result
+
+    return array.array(TYPECODE, filter(set(a).__contains__, b))
+
+
+def subtract_ids(a, b):
+    """Return the IDs of sorted array 'a' not in 'b' as sorted array"""
+    if not a or not b:
+        return a
+
+    if len(a) * GALLOP < len(b):
+        # look up each ID of 'a' in 'b'
+        result = array.array(TYPECODE)
+        append = result.append
+        lo = 0
+        end = len(b)
+        for id in a:
+            lo = bisect_left(b, id, lo)
+            if lo >= end or b[lo] != id:
+                append(id)
+        return result
+
+    if len(b) * GALLOP < len(a):
+        # cut each ID of 'b' out of 'a'
+        result = array.array(TYPECODE)
+        lo = 0
+        for id in b:
+            idx = bisect_left(a, id, lo)
+            if idx < len(a) and a[idx] == id:
+                result += a[lo:idx]
+                lo = idx + 1
+        result += a[lo:]
+        return result
+
+    common = set(b) if len(b) <= len(a) else set(a).intersection(b)
+    return array.array(TYPECODE, filterfalse(common.__contains__, a))
+
+
+def search_ids(positive, negative, index):
+    """Return an iterator over all IDs in descending order
+    that are in all 'positive' and in none of the 'negative' arrays
+
+    'index' gets called to load all IDs when there are no positive arrays.
+    """
+    if positive := sorted(map(sort_ids, positive), key=len):
+        result = positive[0]
+        for ids in positive[1:]:
+            result = intersect_ids(result, ids)
+    else:
+        result = sort_ids(index())
+
+    for ids in negative:
+        if not result:
+            break
+        result = subtract_ids(result, sort_ids(ids))
+
+    return reversed(result)
+
+
+def index_cache(extr):
+    """Return a NozomiIndex if enabled by 'extr's 'index-cache' option"""
+    if not (directory := extr.config("index-cache")):
+        return None
+
+    if directory is True:
+        path = cache.path()
+        if not path or path == ":memory:":
+            extr.log.warning("'index-cache' requires a cache file")
+            return None
+        directory = os.path.join(os.path.dirname(path), "nozomi")
+    else:
+        directory = util.expand_path(directory)
+    return NozomiIndex(extr, directory)
+
+
+class NozomiIndex():
+    """Local copies of nozomi files
+
+    Files get stored with their 'ETag' and 'Last-Modified' values
+    in their first line, revalidated once per extractor,
+    and memory-mapped until calling close().
+    """
+
+    def __init__(self, extr, directory):
+        self.extr = extr
+        self.directory = directory
+        self.files = {}
+        self.maps = []
+
+    def close(self):
+        """Release all memory maps"""
+        self.files.clear()
+        for data in self.maps:
+            try:
+                data.close()
+            except BufferError:
+                pass  # still in use, gets closed when garbage collected
+        self.maps.clear()
+
+    def get(self, url, headers=None):
+        """Return the current content of the nozomi file at 'url'"""
+        if (data := self.files.get(url)) is None:
+            data = self.files[url] = self._load(url, headers)
+        return data
+
+    def _load(self, url, headers):
+        extr = self.extr
+        path = os.path.join(
+            self.directory, hashlib.sha1(url.encode()).hexdigest())
+        headers = headers.copy() if headers else {}
+
+        data, meta = self._open(path)
+        if meta is not None:
+            if etag := meta.get("etag"):
+                headers["If-None-Match"] = etag
+            if modified := meta.get("modified"):
+                headers["If-Modified-Since"] = modified
+
+        response = extr.request(url, headers=headers)
+        if response.status_code == 304 and data is not None:
+            extr.log.debug("Using cached '%s'", url)
+            return data
+
+        content = response.content
+        meta = {
+            "url"     : url,
+            "etag"    : response.headers.get("ETag"),
+            "modified": response.headers.get("Last-Modified"),
+        }
+        if not meta["etag"] and not meta["modified"]:
+            return content
+
+        temp = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp = tempfile.mkstemp(suffix=".part", dir=self.directory)
+            with open(fd, "wb") as fp:
+                fp.write(util.json_dumps(meta).encode())
+                fp.write(b"\n")
+                fp.write(content)
+            os.replace(temp, path)
+        except OSError as exc:
+            extr.log.warning("Failed to store '%s' (%s: %s)",
+                             url, exc.__class__.__name__, exc)
+            if temp:
+                util.remove_file(temp)
+            return content
+        return self._open(path)[0] or content
+
+    def _open(self, path):
+        """Return a memory map of the file at 'path' and its metadata"""
+        try:
+            with open(path, "rb") as fp:
+                data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            return None, None
+
+        try:
+            pos = data.find(b"\n")
+            meta = util.json_loads(data[:pos].decode())
+            if not isinstance(meta, dict):
+                raise ValueError("Invalid metadata")
+        except Exception as exc:
+            self.extr.log.debug("Ignoring '%s' (%s: %s)",
+                                path, exc.__class__.__name__, exc)
+            data.close()
+            return None, None
+
+        self.maps.append(data)
+        return memoryview(data)[pos+1:], meta
 
 
 class NozomiExtractor(Extractor):
@@ -27,15 +248,12 @@ class NozomiExtractor(Extractor):
 
     def _init(self):
         self.session.headers["Origin"] = self.root
+        self.index = index_cache(self)
 
     def items(self):
         data = self.metadata()
 
-        for post_id in map(str, self.posts()):
-            url = (f"https://j.{self.domain}/post"
-                   f"/{post_id[-1]}/{post_id[-3:-1]}/{post_id}.json")
-            response = self.request(url, fatal=False)
-
+        for post_id, response in self._fetch(map(str, self.posts())):
             if response.status_code >= 400:
                 self.log.warning(
                     "Skipping post %s ('%s %s')",
@@ -80,10 +298,49 @@ class NozomiExtractor(Extractor):
                                      f"/{did[-1]}/{did[-3:-1]}/{did}.{ext}")
                 yield Message.Url, url, post
 
+    def _fetch(self, post_ids):
+        """Yield (post_id, response) for each post JSON in order
+
+        Up to 'workers' requests run simultaneously.
+        """
+        def fetch(post_id):
+            url = (f"https://j.{self.domain}/post"
+                   f"/{post_id[-1]}/{post_id[-3:-1]}/{post_id}.json")
+            return post_id, self.request(url, fatal=False)
+
+        if (workers := self.config("workers") or 1) <= 1:
+            yield from map(fetch, post_ids)
+            return
+
+        import concurrent.futures
+        pending = collections.deque()
+        executor = concurrent.futures.ThreadPoolExecutor(workers, "nozomi")
+        try:
+            for post_id in post_ids:
+                pending.append(executor.submit(fetch, post_id))
+                if len(pending) >= workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown()
+
     def posts(self):
         url = "https://n.nozomi.la" + self.nozomi
         offset = (text.parse_int(self.pnum, 1) - 1) * 256
 
+        if self.index is not None:
+            try:
+                data = self.index.get(url)
+                for offset in range(offset, len(data), 256):
+                    yield from decode_nozomi(data[offset:offset + 256])
+            finally:
+                data = None
+                self.index.close()
+            return
+
         while True:
             headers = {"Range": f"bytes={offset}-{offset + 255}"}
             response = self.request(url, headers=headers)
@@ -162,28 +419,26 @@ class NozomiSearchExtractor(NozomiExtractor):
         return {"search_tags": self.tags}
 
     def posts(self):
-        result = None
         positive = []
         negative = []
 
         def nozomi(path):
             url = f"https://j.{self.domain}/{path}.nozomi"
+            if self.index is not None:
+                return decode_nozomi(self.index.get(url))
             return decode_nozomi(self.request(url).content)
 
         for tag in self.tags:
-            (negative if tag[0] == "-" else positive).append(
-                text.quote(tag.replace("/", "")))
-
-        for tag in positive:
-            ids = nozomi("nozomi/" + tag)
-            if result is None:
-                result = set(ids)
+            tag = text.quote(tag.replace("/", ""))
+            if tag[0] == "-":
+                negative.append("nozomi/" + tag[1:])
             else:
-                result.intersection_update(ids)
-
-        if result is None:
-            result = set(nozomi("index"))
-        for tag in negative:
-            result.difference_update(nozomi("nozomi/" + tag[1:]))
-
-        return sorted(result, reverse=True) if result else ()
+                positive.append("nozomi/" + tag)
+
+        try:
+            return search_ids(
+                map(nozomi, positive), map(nozomi, negative),
+                lambda: nozomi("index"))
+        finally:
+            if self.index is not None:
+                self.index.close()
@@ -290,7 +290,17 @@ class RedditSubredditExtractor(RedditExtractor):
         RedditExtractor.__init__(self, match)
 
     def submissions(self):
-        return self.api.submissions_subreddit(self.subreddit, self.params)
+        submissions = self.api.submissions_subreddit(
+            self.subreddit, self.params)
+        if self.groups[1] == "new" and (
+                watermark := self._init_watermark()) is not None:
+            submissions = watermark.filter(submissions, self._watermark_key)
+        return submissions
+
+    def _watermark_key(self, entry):
+        if submission := entry[0]:
+            return self.api._decode(submission["id"])
+        return None
 
 
 class RedditHomeExtractor(RedditSubredditExtractor):
@@ -335,39 +335,55 @@ class SankakuAPI():
         params["lang"] = "en"
         params["limit"] = str(self.extractor.per_page)
 
-        if refresh := self.extractor.config("refresh", False):
-            offset = expires = 0
-            from time import time
-
+        if self.extractor.config("refresh", False):
+            # download URLs get checked for expiration while consuming
+            # posts, which requires fetching pages one at a time
+            return self._pagination_refresh(endpoint, params)
+        return self._pagination_prefetch(endpoint, params)
+
+    def _pagination_prefetch(self, endpoint, params):
+        for posts in self.extractor.prefetch(
+                self._pagination_pages(endpoint, params)):
+            yield from posts
+
+    def _pagination_pages(self, endpoint, params):
         while True:
             data = self._call(endpoint, params)
+            yield data["data"]
 
-            if refresh:
-                posts = data["data"]
-                if offset:
-                    posts = util.advance(posts, offset)
+            params["next"] = data["meta"]["next"]
+            if not params["next"]:
+                return
 
-                for post in posts:
-                    if not expires:
-                        if url := post["file_url"]:
-                            expires = text.parse_int(
-                                text.extr(url, "e=", "&")) - 60
+    def _pagination_refresh(self, endpoint, params):
+        offset = expires = 0
+        from time import time
 
-                    if 0 < expires <= time():
-                        self.extractor.log.debug("Refreshing download URLs")
-                        expires = None
-                        break
+        while True:
+            data = self._call(endpoint, params)
 
-                    offset += 1
-                    yield post
+            posts = data["data"]
+            if offset:
+                posts = util.advance(posts, offset)
 
-                if expires is None:
-                    expires = 0
-                    continue
-                offset = expires = 0
+            for post in posts:
+                if not expires:
+                    if url := post["file_url"]:
+                        expires = text.parse_int(
+                            text.extr(url, "e=", "&")) - 60
 
-            else:
-                yield from data["data"]
+                if 0 < expires <= time():
+                    self.extractor.log.debug("Refreshing download URLs")
+                    expires = None
+                    break
+
+                offset += 1
+                yield post
+
+            if expires is None:
+                expires = 0
+                continue
+            offset = expires = 0
 
             params["next"] = data["meta"]["next"]
             if not params["next"]:
@@ -9,14 +9,21 @@
 """Extractors for https://x.com/"""
 
 from .common import Extractor, Message, Dispatch
-from .. import text, util, dt
+from .. import text, util, dt, cache
 import itertools
+import threading
+import hashlib
 import random
+import time
 
 BASE_PATTERN = (r"(?:https?://)?(?:www\.|mobile\.)?"
                 r"(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\.com")
 USER_PATTERN = BASE_PATTERN + r"/([^/?#]+)"
 
+# rate limit states without cache database
+RATELIMIT_STATE = {}
+RATELIMIT_LOCK = threading.Lock()
+
 
 class TwitterExtractor(Extractor):
     """Base class for twitter extractors"""
@@ -28,6 +35,7 @@ class TwitterExtractor(Extractor):
     cookies_names = ("auth_token",)
     root = "https://x.com"
     browser = "firefox"
+    newest_first = False
 
     def __init__(self, match):
         Extractor.__init__(self, match)
@@ -80,6 +88,9 @@ class TwitterExtractor(Extractor):
                 r"https?(://twitpic\.com/(?!photos/)\w+)").findall
 
         tweets = self.tweets()
+        if self.newest_first and (
+                watermark := self._init_watermark()) is not None:
+            tweets = watermark.filter(tweets, self._watermark_key)
         if self.config("expand"):
             tweets = self._expand_tweets(tweets)
         for tweet in tweets:
@@ -696,6 +707,18 @@ class TwitterExtractor(Extractor):
         self._cursor = cursor
         return cursor
 
+    def _watermark_key(self, tweet):
+        # only compare top-level timeline entries;
+        # quoted Tweets and retweeted originals can be arbitrarily old
+        if "pinned" in tweet:
+            return None
+        legacy = tweet.get("legacy", tweet)
+        if "quoted_by_id_str" in legacy:
+            return None
+        if retweet_id := tweet.get("_retweet_id_str"):
+            return int(retweet_id)
+        return int(legacy["id_str"])
+
     def _tweetid_to_datetime(self, tweet_id):
         return dt.parse_ts(((tweet_id >> 22) + 1_288_834_974_657) / 1000)
 
@@ -824,6 +847,7 @@ class TwitterTimelineExtractor(TwitterExtractor):
     subcategory = "timeline"
     pattern = USER_PATTERN + r"/timeline(?!\w)"
     example = "https://x.com/USER/timeline"
+    newest_first = True
 
     def _init_cursor(self):
         if self._cursor:
@@ -921,6 +945,7 @@ class TwitterTweetsExtractor(TwitterExtractor):
     subcategory = "tweets"
     pattern = USER_PATTERN + r"/tweets(?!\w)"
     example = "https://x.com/USER/tweets"
+    newest_first = True
 
     def tweets(self):
         return self.api.user_tweets(self.user)
@@ -931,6 +956,7 @@ class TwitterWithRepliesExtractor(TwitterExtractor):
     subcategory = "with-replies"
     pattern = USER_PATTERN + r"/with_replies(?!\w)"
     example = "https://x.com/USER/with_replies"
+    newest_first = True
 
     def tweets(self):
         return self.api.user_tweets_and_replies(self.user)
@@ -951,6 +977,7 @@ class TwitterMediaExtractor(TwitterExtractor):
     subcategory = "media"
     pattern = USER_PATTERN + r"/media(?!\w)"
     example = "https://x.com/USER/media"
+    newest_first = True
 
     def tweets(self):
         return self.api.user_media(self.user)
@@ -1384,6 +1411,14 @@ class TwitterAPI():
             "responsive_web_enhance_cards_enabled": False,
         }
 
+        if not extractor.config("ratelimit-pacing"):
+            self._ratelimit_account = None
+        elif auth_token:
+            self._ratelimit_account = hashlib.sha1(
+                auth_token.encode()).hexdigest()[:16]
+        else:
+            self._ratelimit_account = "guest"
+
     def tweet_result_by_rest_id(self, tweet_id):
         endpoint = "/graphql/qxWQxcMLiTPcavz9Qy5hwQ/TweetResultByRestId"
         variables = {
@@ -1805,6 +1840,12 @@ class TwitterAPI():
     def _call(self, endpoint, params, method="GET", auth=True, root=None):
         url = (self.root if root is None else root) + endpoint
 
+        if self._ratelimit_account is not None:
+            key = (f"ratelimit-{self._ratelimit_account}-"
+                   f"{endpoint.rpartition('/')[2]}")
+        else:
+            key = None
+
         while True:
             if auth:
                 if self.headers["x-twitter-auth-type"]:
@@ -1812,9 +1853,13 @@ class TwitterAPI():
                 else:
                     self._authenticate_guest()
 
+            if key is not None:
+                self._ratelimit_pace(key)
             response = self.extractor.request(
                 url, method=method, params=params,
                 headers=self.headers, fatal=None)
+            if key is not None:
+                self._ratelimit_update(key, response)
 
             # update 'x-csrf-token' header (#1170)
             if csrf_token := response.cookies.get("ct0"):
@@ -1979,6 +2024,24 @@ class TwitterAPI():
                            path=None, stop_tweets=0, update_variables=None,
                            features=None, field_toggles=None):
         extr = self.extractor
+        pages = self._pagination_tweets_pages(
+            endpoint, variables, path, stop_tweets, update_variables,
+            features, field_toggles)
+
+        # update cursors only after all Tweets of a page have been consumed
+        # 'update_variables' functions modify cursor state on their own
+        if update_variables is None:
+            pages = extr.prefetch(pages)
+        for tweets, cursor in pages:
+            yield from tweets
+            if cursor is not util.SENTINEL:
+                extr._update_cursor(cursor)
+
+    def _pagination_tweets_pages(self, endpoint, variables, path,
+                                 stop_tweets, update_variables,
+                                 features, field_toggles):
+        """Yield (tweets, cursor) tuples for each page of results"""
+        extr = self.extractor
         original_retweets = (extr.retweets == "original")
         pinned_tweet = True if extr.pinned else None
         stop_tweets_max = stop_tweets
@@ -2036,7 +2099,8 @@ class TwitterAPI():
                             cursor = entry["content"]["value"]
                 if entries is None:
                     if not cursor:
-                        return extr._update_cursor(None)
+                        yield (), None
+                        return
                     entries = ()
 
             except LookupError:
@@ -2082,6 +2146,7 @@ class TwitterAPI():
                     "Unable to retrieve Tweets from this timeline")
 
             tweets = []
+            results = []
             tweet = last_tweet = retry = None
             api_tries = 1
 
@@ -2217,7 +2282,7 @@ class TwitterAPI():
                             tweet.get("rest_id"), exc.__class__.__name__, exc)
                         continue
 
-                yield tweet
+                results.append(tweet)
 
                 if "quoted_status_result" in tweet:
                     try:
@@ -2228,7 +2293,7 @@ class TwitterAPI():
                         quoted["legacy"]["quoted_by_id_str"] = tweet["rest_id"]
                         quoted["sortIndex"] = entry.get("sortIndex")
 
-                        yield quoted
+                        results.append(quoted)
                     except KeyError:
                         extr.log.debug(
                             "Skipping quote of %s (deleted)",
@@ -2242,9 +2307,11 @@ class TwitterAPI():
                 last_tweet = tweet
             elif stop_tweets <= 0:
                 if not count:
-                    return extr._update_cursor(None)
+                    yield results, None
+                    return
                 self.log.debug("Switching to 'count: %s'", count[-1])
                 variables["count"] = count.pop()
+                yield results, util.SENTINEL
                 continue
             else:
                 self.log.debug(
@@ -2254,12 +2321,15 @@ class TwitterAPI():
 
             if not cursor or cursor == variables.get("cursor"):
                 self.log.debug("No continuation cursor")
-                return extr._update_cursor(None)
+                yield results, None
+                return
 
             if update_variables is None:
-                variables["cursor"] = extr._update_cursor(cursor)
+                variables["cursor"] = cursor
+                yield results, cursor
             else:
                 variables = update_variables(variables, cursor, last_tweet)
+                yield results, util.SENTINEL
 
     def _pagination_users(self, endpoint, variables, path=None):
         extr = self.extractor
@@ -2305,6 +2375,89 @@ class TwitterAPI():
                 return extr._update_cursor(None)
             variables["cursor"] = extr._update_cursor(cursor)
 
+    def _ratelimit_pace(self, key):
+        """Delay a request to spread the remaining budget until reset"""
+        slot = now = time.time()
+
+        def pace(state):
+            nonlocal slot
+            if state is None:
+                return None
+
+            if slot < state["next"]:
+                slot = state["next"]
+            # keep a reserve of 5 requests, see '_call()'
+            if (budget := state["remaining"] - 5) > 0:
+                state["next"] = slot + (state["reset"] - slot) / budget
+            else:
+                if slot < state["reset"]:
+                    slot = state["reset"]
+                state["next"] = slot
+            state["remaining"] -= 1
+            return state
+
+        self._ratelimit_modify(key, pace)
+        if (seconds := slot - now) > 0.0:
+            self.extractor.sleep(seconds, "rate limit")
+
+    def _ratelimit_update(self, key, response):
+        """Store the rate limit state of 'response'"""
+        headers = response.headers
+        try:
+            limit = int(headers["x-rate-limit-limit"])
+            remaining = int(headers["x-rate-limit-remaining"])
+            reset = int(headers["x-rate-limit-reset"])
+        except (KeyError, ValueError):
+            return
+
+        def update(state):
+            if state is not None and state["reset"] == reset:
+                if state["remaining"] > remaining:
+                    state["remaining"] = remaining
+                state["limit"] = limit
+                return state
+            return {
+                "limit"    : limit,
+                "remaining": remaining,
+                "reset"    : reset,
+                "next"     : 0.0 if state is None else state["next"],
+            }
+
+        state = self._ratelimit_modify(key, update)
+        self.extractor.kwdict["ratelimit"] = {
+            "endpoint" : key.split("-", 2)[2],
+            "limit"    : limit,
+            "remaining": state["remaining"],
+            "reset"    : dt.parse_ts(reset),
+        }
+
+    def _ratelimit_modify(self, key, func):
+        """Replace the stored rate limit state of 'key' with func(state)
+
+        The state is shared with other processes through the cache
+        database, or kept in memory when it is not available.
+        """
+        with RATELIMIT_LOCK:
+            if (db := cache.database()) is None:
+                state = RATELIMIT_STATE.get(key)
+                if state is not None and state["reset"] <= time.time():
+                    state = None
+                RATELIMIT_STATE[key] = state = func(state)
+                return state
+
+            module = cache.namespace(__name__)
+            with db:
+                # lock the database against other processes
+                # until this read-modify-write cycle is committed
+                if not db.in_transaction:
+                    db.execute("BEGIN IMMEDIATE")
+                if (result := cache.load(
+                        db, module, key, int(time.time()))) is not None:
+                    result = result[0]
+                if (state := func(result)) is not None:
+                    cache.store(db, module, key, state, state["reset"])
+            return state
+
     def _handle_ratelimit(self, response):
         rl = self.extractor.config("ratelimit")
         if rl == "abort":
@@ -78,14 +78,23 @@ class YoutubeDLExtractor(Extractor):
             user_opts["username"], user_opts["password"] = username, password
         del username, password
 
-        ytdl_instance = ytdl.construct_YoutubeDL(
-            ytdl_module, self, user_opts, extr_opts)
+        # with download workers, queued downloads might still be using
+        # 'ytdl_instance' after this generator is done
+        workers = config.interpolate(("downloader",), "workers", 1)
+        if workers and workers > 1:
+            ytdl_instance = ytdl.construct_YoutubeDL(
+                ytdl_module, self, user_opts, extr_opts)
+        else:
+            ytdl_instance = ytdl.acquire_YoutubeDL(
+                ytdl_module, self, user_opts, extr_opts)
+        try:
+            yield from self._items(ytdl_module, ytdl_instance)
+        finally:
+            ytdl.release_YoutubeDL(ytdl_instance)
 
+    def _items(self, ytdl_module, ytdl_instance):
         # transfer cookies to ytdl
-        if cookies := self.cookies:
-            set_cookie = ytdl_instance.cookiejar.set_cookie
-            for cookie in cookies:
-                set_cookie(cookie)
+        ytdl.set_cookies(ytdl_instance, self.cookies)
 
         # extract youtube_dl info_dict
         try:
@@ -14,7 +14,7 @@ import time
 import string
 import _string
 import operator
-from . import text, util, dt
+from . import text, util, dt, lru
 
 NONE = util.NONE
 
@@ -582,7 +582,7 @@ class Literal():
 
 _literal = Literal()
 
-_CACHE = {}
+_CACHE = lru.LRUCache("formatter", 1024)
 _ENCODING = sys.getfilesystemencoding()
 _SEPARATOR = "/"
 _FORMATTERS = {
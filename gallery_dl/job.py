@@ -7,9 +7,11 @@
 # published by the Free Software Foundation.
 
 import sys
+import copy
 import errno
 import logging
 import functools
+import threading
 import collections
 
 from . import (
@@ -399,18 +401,85 @@ class DownloadJob(Job):
         self.sleep = None
         self.hooks = ()
         self.downloaders = {}
-        self.out = output.select()
-        self.visited = set() if parent is None else parent.visited
+        if parent is None:
+            self.out = output.select()
+            self.visited = set()
+            self._visited_lock = threading.Lock()
+        else:
+            self.out = output.BufferOutput(output.select())
+            self.visited = parent.visited
+            self._visited_lock = parent._visited_lock
         self._extractor_filter = None
         self._skipcnt = 0
+        self._skipreset = False
+        self._pending = None
+        self._children = None
+        self._children_max = None
+        self._pp_pending = None
+        self.workers = 0
+        self.digests = set()
+        self.stream = None
 
     def handle_url(self, url, kwdict):
         """Download the resource specified in 'url'"""
-        hooks = self.hooks
         pathfmt = self.pathfmt
+        if not self._handle_url_prepare(pathfmt, kwdict):
+            return
+
+        if self.sleep is not None:
+            self.extractor.sleep(self.sleep(), "download")
+
+        failed = self._handle_url_download(url, pathfmt)
+        if self._handle_url_commit(url, pathfmt, failed):
+            self._skipcnt = 0
+            self._skipreset = True
+
+    def handle_url_workers(self, url, kwdict):
+        """Download the resource specified in 'url' in a worker thread"""
+        pathfmt = self.pathfmt
+        if not self._handle_url_prepare(pathfmt, kwdict):
+            return
+
+        if self.sleep is not None:
+            self.extractor.sleep(self.sleep(), "download")
+
+        pending = self._pending
+        if pending is None:
+            import concurrent.futures
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                self.workers, "download")
+            self._pending = pending = collections.deque()
+        else:
+            # wait for downloads writing to the same file
+            if realpath := pathfmt.realpath:
+                for _, pfmt, _ in pending:
+                    if pfmt.realpath == realpath:
+                        self._handle_url_join()
+                        break
+            if len(pending) >= self.workers * 2:
+                self._handle_url_join(len(pending) - 1)
+
+        # give each download its own PathFormat and kwdict snapshot
+        pathfmt = copy.copy(pathfmt)
+        pathfmt.kwdict = kwdict.copy()
+
+        pending.append((url, pathfmt, self._executor.submit(
+            self._handle_url_download, url, pathfmt)))
+
+    def _handle_url_join(self, remaining=0):
+        """Commit finished downloads in submission order"""
+        pending = self._pending
+        while len(pending) > remaining:
+            url, pathfmt, future = pending.popleft()
+            if self._handle_url_commit(url, pathfmt, future.result()):
+                self._skipcnt = 0
+                self._skipreset = True
+
+    def _handle_url_prepare(self, pathfmt, kwdict):
+        """Prepare 'pathfmt' and return True if a download is required"""
+        hooks = self.hooks
         archive = self.archive
 
-        # prepare download
         pathfmt.set_filename(kwdict)
 
         if "prepare" in hooks:
@@ -420,16 +489,24 @@ class DownloadJob(Job):
         if archive is not None and archive.check(kwdict):
             pathfmt.fix_extension()
             self.handle_skip()
-            return
+            return False
 
         if pathfmt.extension and not self.metadata_http:
             pathfmt.build_path()
 
+            # wait for postprocessors of files not yet moved to the same path
+            if self._pp_pending:
+                realpath = pathfmt.realpath
+                for _, pfmt, index, _ in self._pp_pending:
+                    if index is not None and pfmt.realpath == realpath:
+                        self._handle_pp_join()
+                        break
+
             if pathfmt.exists():
                 if archive is not None and self._archive_write_skip:
                     archive.add(kwdict)
                 self.handle_skip()
-                return
+                return False
 
         if "prepare-after" in hooks:
             for callback in hooks["prepare-after"]:
@@ -439,26 +516,35 @@ class DownloadJob(Job):
                 if archive is not None and self._archive_write_skip:
                     archive.add(kwdict)
                 self.handle_skip()
-                return
+                return False
 
-        if self.sleep is not None:
-            self.extractor.sleep(self.sleep(), "download")
+        return True
 
-        # download from URL
-        failed = False
+    def _handle_url_download(self, url, pathfmt):
+        """Download 'url' or its fallbacks and return True on failure"""
         try:
-            if not self.download(url):
-                # use fallback URLs if available/enabled
-                fallback = kwdict.get("_fallback", ()) if self.fallback else ()
-                for num, url in enumerate(fallback, 1):
-                    util.remove_file(pathfmt.temppath)
-                    self.log.info("Trying fallback URL #%d", num)
-                    if self.download(url):
-                        break
-                else:
-                    failed = True
+            if self.download(url, pathfmt):
+                return False
+            # use fallback URLs if available/enabled
+            fallback = \
+                pathfmt.kwdict.get("_fallback", ()) if self.fallback else ()
+            for num, url in enumerate(fallback, 1):
+                util.remove_file(pathfmt.temppath)
+                self.log.info("Trying fallback URL #%d", num)
+                if self.download(url, pathfmt):
+                    return False
         except exception.StopDownload:
-            failed = True
+            pass
+        return True
+
+    def _handle_url_commit(self, url, pathfmt, failed):
+        """Run postprocessors and update the archive for a finished download
+
+        Return True if the file was successfully downloaded
+        """
+        hooks = self.hooks
+        archive = self.archive
+        kwdict = pathfmt.kwdict
 
         if failed:
             self.status |= 4
@@ -466,19 +552,33 @@ class DownloadJob(Job):
             if "error" in hooks:
                 for callback in hooks["error"]:
                     callback(pathfmt)
-            return
+            return False
 
         if not pathfmt.temppath:
             if archive is not None and self._archive_write_skip:
                 archive.add(kwdict)
-            self.handle_skip()
-            return
+            self.handle_skip(pathfmt)
+            return False
 
         # run postprocessors
+        if (pending := self._pp_pending) is not None and \
+                len(pending) >= self._pp_max:
+            self._handle_pp_join(len(pending) - 1)
         if "file" in hooks:
-            for callback in hooks["file"]:
+            for index, callback in enumerate(hooks["file"]):
+                if callback.__class__ is AsyncHook:
+                    return self._handle_pp_submit(
+                        url, pathfmt, callback, index)
                 callback(pathfmt)
 
+        return self._handle_url_finalize(url, pathfmt)
+
+    def _handle_url_finalize(self, url, pathfmt):
+        """Move a postprocessed file into place and run 'after' hooks"""
+        hooks = self.hooks
+        archive = self.archive
+        kwdict = pathfmt.kwdict
+
         # process download flag
         if FLAGS.DOWNLOAD is not None:
             FLAGS.DOWNLOAD = None
@@ -487,25 +587,75 @@ class DownloadJob(Job):
             if "error" in hooks:
                 for callback in hooks["error"]:
                     callback(pathfmt)
-            return
+            return False
 
         # download succeeded
         pathfmt.finalize()
         self.out.success(pathfmt.path)
-        self._skipcnt = 0
         if archive is not None and self._archive_write_file:
             archive.add(kwdict)
         if "after" in hooks:
             for callback in hooks["after"]:
-                callback(pathfmt)
+                if callback.__class__ is AsyncHook:
+                    self._handle_pp_submit(None, pathfmt, callback, None)
+                else:
+                    callback(pathfmt)
         if archive is not None and self._archive_write_after:
             archive.add(kwdict)
+        return True
+
+    def _handle_pp_submit(self, url, pathfmt, hook, index):
+        """Run 'hook' for a copy of 'pathfmt' in a background thread
+
+        When 'index' is not None, the remaining 'file' hooks
+        starting at 'index' run once 'hook' has finished.
+        """
+        pathfmt = copy.copy(pathfmt)
+        pathfmt.kwdict = pathfmt.kwdict.copy()
+        self._pp_pending.append((url, pathfmt, index, hook.executor.submit(
+            hook.callback, pathfmt)))
+        return True
+
+    def _handle_pp_join(self, remaining=0):
+        """Wait for background postprocessors in submission order
+
+        Files whose callbacks raised an exception get skipped,
+        the first of these exceptions gets raised
+        after all other files have been handled.
+        """
+        pending = self._pp_pending
+        error = None
+        while len(pending) > remaining:
+            url, pathfmt, index, future = pending.popleft()
+            try:
+                future.result()
+                if index is None:
+                    continue
+
+                callbacks = self.hooks["file"]
+                for index in range(index + 1, len(callbacks)):
+                    callbacks[index](pathfmt)
+                self._handle_url_finalize(url, pathfmt)
+            except Exception as exc:
+                if error is None:
+                    error = exc
+                else:
+                    self.log.error("%s: %s", exc.__class__.__name__, exc)
+                    self.log.traceback(exc)
+        if error is not None:
+            raise error
 
     def handle_directory(self, kwdict):
         """Set and create the target directory for downloads"""
         if self.pathfmt is None:
             self.initialize(kwdict)
         else:
+            if self._pending:
+                self._handle_url_join()
+            if self._pp_pending:
+                self._handle_pp_join()
+            if self._children:
+                self._handle_queue_join()
             if "post-after" in self.hooks:
                 for callback in self.hooks["post-after"]:
                     callback(self.pathfmt)
@@ -517,9 +667,13 @@ class DownloadJob(Job):
                 callback(self.pathfmt)
 
     def handle_queue(self, url, kwdict):
-        if url in self.visited:
-            return
-        self.visited.add(url)
+        with self._visited_lock:
+            if url in self.visited:
+                return
+            self.visited.add(url)
+
+        if self._pending:
+            self._handle_url_join()
 
         if "child" in self.hooks:
             pathfmt = self.pathfmt
@@ -565,53 +719,164 @@ class DownloadJob(Job):
             if pextr.config("parent-session", parent):
                 extr.session = pextr.session
 
-            while True:
-                try:
-                    if pextr.config("parent-skip", parent):
-                        job._skipcnt = self._skipcnt
-                        status = job.run()
-                        self._skipcnt = job._skipcnt
-                    else:
-                        status = job.run()
-
-                    if status:
-                        self.status |= status
-                        if (status & 95 and   # not FormatError or OSError
-                                "_fallback" in kwdict and self.fallback):
-                            fallback = kwdict["_fallback"] = \
-                                iter(kwdict["_fallback"])
-                            try:
-                                url = next(fallback)
-                            except StopIteration:
-                                pass
-                            else:
-                                pextr.log.info("Downloading fallback URL")
-                                text.nameext_from_url(url, kwdict)
-                                if kwdict["filename"].startswith((
-                                        "HLS", "DASH")):
-                                    kwdict["filename"] = url.rsplit("/", 2)[-2]
-                                if url.startswith("ytdl:"):
-                                    kwdict["extension"] = "mp4"
-                                self.handle_url(url, kwdict)
-                    break
-                except exception.RestartExtraction:
-                    pass
+            if skip := pextr.config("parent-skip", parent):
+                job._skipcnt = self._skipcnt
+
+            if (concurrency := self._children_max) is None:
+                concurrency = self._children_max = self._init_children()
+            if concurrency:
+                self._handle_queue_submit(job, kwdict.copy(), skip)
+            else:
+                self._handle_queue_commit(
+                    job, kwdict, self._run_child(job), skip)
 
         else:
             self._write_unsupported(url)
 
+            if "child-after" in self.hooks:
+                pathfmt = self.pathfmt
+                pathfmt.kwdict = kwdict
+                for callback in self.hooks["child-after"]:
+                    callback(pathfmt)
+
+    def _handle_queue_submit(self, job, kwdict, skip):
+        """Run child 'job' in a worker thread"""
+        children = self._children
+        if children is None:
+            import concurrent.futures
+            self._children_executor = concurrent.futures.ThreadPoolExecutor(
+                self._children_max, "child")
+            self._children = children = collections.deque()
+        elif len(children) >= self._children_max * 2:
+            self._handle_queue_join(len(children) - 1)
+
+        if skip:
+            job._skipbase = job._skipcnt
+        buffer = output.LogBuffer(() if self.ulog is None else (self.ulog,))
+        children.append((job, kwdict, skip, buffer, self._children_executor
+                         .submit(self._run_child, job, buffer)))
+
+    def _handle_queue_join(self, remaining=0):
+        """Commit finished child jobs in submission order"""
+        children = self._children
+        while len(children) > remaining:
+            job, kwdict, skip, buffer, future = children.popleft()
+            try:
+                status = future.result()
+            except BaseException:
+                buffer.replay()
+                self._handle_queue_cancel()
+                raise
+            buffer.replay()
+            self._handle_queue_commit(job, kwdict, status, skip)
+
+    def _handle_queue_cancel(self):
+        """Cancel child jobs that have not been started yet"""
+        children = self._children
+        for _, _, _, _, future in children:
+            future.cancel()
+        for _, _, _, buffer, future in children:
+            if not future.cancelled():
+                future.exception()
+                buffer.replay()
+        children.clear()
+
+    def _handle_queue_commit(self, job, kwdict, status, skip):
+        """Merge the results of a finished child job"""
+        if skip:
+            if self._children_max and not job._skipreset:
+                # add skips of a child that started with an older count
+                self._skipcnt += job._skipcnt - job._skipbase
+            else:
+                self._skipcnt = job._skipcnt
+
+        if status:
+            self.status |= status
+            if (status & 95 and   # not FormatError or OSError
+                    "_fallback" in kwdict and self.fallback):
+                fallback = kwdict["_fallback"] = iter(kwdict["_fallback"])
+                try:
+                    url = next(fallback)
+                except StopIteration:
+                    pass
+                else:
+                    self.extractor.log.info("Downloading fallback URL")
+                    text.nameext_from_url(url, kwdict)
+                    if kwdict["filename"].startswith(("HLS", "DASH")):
+                        kwdict["filename"] = url.rsplit("/", 2)[-2]
+                    if url.startswith("ytdl:"):
+                        kwdict["extension"] = "mp4"
+                    self.handle_url(url, kwdict)
+
         if "child-after" in self.hooks:
             pathfmt = self.pathfmt
             pathfmt.kwdict = kwdict
             for callback in self.hooks["child-after"]:
                 callback(pathfmt)
 
+    def _run_child(self, job, buffer=None):
+        """Run child 'job' and return its exit status"""
+        if buffer is not None:
+            with buffer:
+                return self._run_child(job)
+        while True:
+            try:
+                return job.run()
+            except exception.RestartExtraction:
+                pass
+
+    def _init_children(self):
+        concurrency = self.extractor.config("children-concurrency", 1)
+        return concurrency if concurrency and concurrency > 1 else 0
+
     def handle_finalize(self):
+        if self._children is not None:
+            try:
+                self._handle_queue_join()
+            except exception.ControlException:
+                pass
+            except Exception as exc:
+                self.status |= 1
+                self.log.error("%s: %s", exc.__class__.__name__, exc)
+                self.log.traceback(exc)
+            finally:
+                self._children_executor.shutdown()
+
+        if self._pending is not None:
+            try:
+                self._handle_url_join()
+            except exception.ControlException:
+                pass
+            except Exception as exc:
+                self.status |= 4
+                self.log.error("%s: %s", exc.__class__.__name__, exc)
+                self.log.traceback(exc)
+            finally:
+                self._pending.clear()
+                self._executor.shutdown()
+
+        if self._pp_pending is not None:
+            try:
+                self._handle_pp_join()
+            except exception.ControlException:
+                pass
+            except Exception as exc:
+                self.status |= 1
+                self.log.error("%s: %s", exc.__class__.__name__, exc)
+                self.log.traceback(exc)
+            finally:
+                self._pp_pending.clear()
+                for executor in self._pp_executors:
+                    executor.shutdown()
+
         if self.archive is not None:
             if not self.status:
                 self.archive.finalize()
             self.archive.close()
 
+        if not self.status:
+            self._commit_watermark()
+
         if pathfmt := self.pathfmt:
             hooks = self.hooks
             if "post-after" in hooks:
@@ -632,8 +897,13 @@ class DownloadJob(Job):
                 for callback in hooks["finalize"]:
                     callback(pathfmt)
 
-    def handle_skip(self):
-        pathfmt = self.pathfmt
+    def _commit_watermark(self):
+        if self.extractor.watermark is not None:
+            self.extractor.watermark.commit()
+
+    def handle_skip(self, pathfmt=None):
+        if pathfmt is None:
+            pathfmt = self.pathfmt
         if "skip" in self.hooks:
             for callback in self.hooks["skip"]:
                 callback(pathfmt)
@@ -648,11 +918,12 @@ class DownloadJob(Job):
         if self.sleep_skip is not None:
             self.extractor.sleep(self.sleep_skip(), "skip")
 
-    def download(self, url):
+    def download(self, url, pathfmt=None):
         """Download 'url'"""
         if downloader := self.get_downloader(url[:url.find(":")]):
             try:
-                return downloader.download(url, self.pathfmt)
+                return downloader.download(
+                    url, self.pathfmt if pathfmt is None else pathfmt)
             except OSError as exc:
                 if exc.errno == errno.ENOSPC:
                     raise
@@ -695,7 +966,9 @@ class DownloadJob(Job):
         self.fallback = cfg("fallback", True)
         if not cfg("download", True):
             # monkey-patch method to do nothing and always return True
-            self.download = pathfmt.fix_extension
+            self.download = lambda _, pfmt=pathfmt: pfmt.fix_extension()
+        else:
+            self._init_workers()
 
         if archive_path := cfg("archive"):
             archive_table = cfg("archive-table")
@@ -707,15 +980,23 @@ class DownloadJob(Job):
             if archive_format is None:
                 archive_format = extr.archive_fmt
 
+            if (archive_mode := cfg("archive-mode")) == "batch":
+                archive_batch = (cfg("archive-batch-size", 100),
+                                 cfg("archive-batch-interval", 10.0))
+            else:
+                archive_batch = None
+
             try:
                 self.archive = archive.connect(
                     archive_path,
                     archive_prefix,
                     archive_format,
                     archive_table,
-                    cfg("archive-mode"),
+                    archive_mode,
                     cfg("archive-pragma"),
                     pathfmt,
+                    None,
+                    archive_batch,
                 )
             except Exception as exc:
                 extr.log.warning(
@@ -832,21 +1113,102 @@ class DownloadJob(Job):
 
             if pp_list:
                 extr.log.debug("Active postprocessor modules: %s", pp_list)
+                if self.stream is not None and (
+                        self.workers or len(self.hooks["file"]) > 1 or
+                        self._hooks_foreign(self.stream, (
+                            "after", "finalize",
+                            "finalize-success", "finalize-error"))):
+                    # other postprocessors need actual files
+                    # and concurrent downloads cannot share one stream
+                    self.log.debug("Disabling streaming downloads")
+                    self.stream = None
                 if "init" in self.hooks:
                     for callback in self.hooks["init"]:
                         callback(pathfmt)
 
-    def register_hooks(self, hooks, options=None):
-        expr = options.get("filter") if options else None
+    def _init_workers(self):
+        workers = config.interpolate(("downloader",), "workers", 1)
+        if workers and workers > 1:
+            self.workers = workers
+            self.handle_url = self.handle_url_workers
+            self.downloaders = DownloaderCache()
 
-        if expr:
-            condition = util.compile_filter(expr)
-            for hook, callback in hooks.items():
-                self.hooks[hook].append(functools.partial(
-                    _call_hook_condition, callback, condition))
+    def register_hooks(self, hooks, options=None):
+        if options:
+            expr = options.get("filter")
+            workers = options.get("workers")
         else:
-            for hook, callback in hooks.items():
-                self.hooks[hook].append(callback)
+            expr = workers = None
+
+        if "prepare" in hooks or "prepare-after" in hooks:
+            # 'prepare' callbacks may keep state
+            # until their corresponding 'file' callback runs
+            if self.workers:
+                self.log.debug("Disabling download workers "
+                               "due to 'prepare' postprocessors")
+                self.workers = 0
+                del self.handle_url
+            if workers:
+                self.log.debug("Running '%s' postprocessor synchronously "
+                               "due to 'prepare' callbacks",
+                               options.get("name"))
+                workers = None
+
+        condition = util.compile_filter(expr) if expr else None
+        executor = lock = None
+        for hook, callback in hooks.items():
+            if condition is not None:
+                callback = functools.partial(
+                    _call_hook_condition, callback, condition)
+            if workers and hook in ("file", "after"):
+                if executor is None:
+                    executor = self._init_pp_workers(workers)
+                # postprocessors keeping per-file state on their instance
+                # must not process several files at once
+                if not getattr(getattr(callback, "__self__", None),
+                               "threadsafe", False):
+                    if lock is None:
+                        lock = threading.Lock()
+                    callback = functools.partial(
+                        _call_hook_locked, callback, lock)
+                callback = AsyncHook(callback, executor)
+            self.hooks[hook].append(callback)
+
+    def _init_pp_workers(self, workers):
+        import concurrent.futures
+        executor = concurrent.futures.ThreadPoolExecutor(
+            workers, "postprocessor")
+        if self._pp_pending is None:
+            self._pp_pending = collections.deque()
+            self._pp_executors = []
+            self._pp_max = 0
+        self._pp_executors.append(executor)
+        self._pp_max = max(self._pp_max, workers * 2)
+        return executor
+
+    def _hooks_foreign(self, callback, events):
+        """Return True if 'events' have hooks not bound to the same
+        object as 'callback'"""
+        owner = getattr(callback, "__self__", None)
+        hooks = self.hooks
+        for event in events:
+            if event in hooks:
+                for hook in hooks[event]:
+                    if getattr(hook, "__self__", None) is not owner:
+                        return True
+        return False
+
+    def register_stream(self, callback):
+        """Let downloaders write files to the object returned by 'callback'
+
+        'callback(pathfmt, size)' returns a file-like object
+        or None to download to 'pathfmt.temppath' as usual.
+        """
+        self.stream = callback
+
+    def register_digests(self, names):
+        """Compute 'hashlib' digests of 'names' while downloading files"""
+        self.digests.update(names)
 
     def _build_extractor_filter(self):
         clist = self.extractor.config("whitelist")
@@ -863,13 +1225,51 @@ class DownloadJob(Job):
         return util.build_extractor_filter(clist, negate, special)
 
 
+def _number_to_string(kwdict):
+    """Return a copy of 'kwdict' with all numbers converted to strings"""
+    return {
+        key: (_number_to_string(value) if isinstance(value, dict) else
+              util.number_to_string(value))
+        for key, value in kwdict.items()
+    }
+
+
 def _call_hook_condition(callback, condition, pathfmt):
     if condition(pathfmt.kwdict):
         callback(pathfmt)
 
 
+def _call_hook_locked(callback, lock, pathfmt):
+    with lock:
+        callback(pathfmt)
+
+
+class AsyncHook():
+    """Postprocessor callback running in a background thread"""
+    __slots__ = ("callback", "executor")
+
+    def __init__(self, callback, executor):
+        self.callback = callback
+        self.executor = executor
+
+    def __call__(self, pathfmt):
+        return self.executor.submit(self.callback, pathfmt).result()
+
+
+class DownloaderCache(threading.local):
+    """Thread-local downloader instances"""
+
+    def __getitem__(self, scheme):
+        return self.__dict__[scheme]
+
+    def __setitem__(self, scheme, instance):
+        self.__dict__[scheme] = instance
+
+
 class SimulationJob(DownloadJob):
     """Simulate the extraction process without downloading anything"""
+    _init_workers = util.noop
+    _commit_watermark = util.noop
 
     def handle_url(self, url, kwdict):
         ext = kwdict["extension"] or "jpg"
@@ -1054,8 +1454,11 @@ class DataJob(Job):
         self.data_post = []
         self.data_meta = []
         self.exception = None
+        self.writer = None
         self.ascii = config.get(("output",), "ascii", ensure_ascii)
         self.jsonl = config.get(("output",), "jsonl", False)
+        self.stream = config.get(("output",), "stream", False)
+        self.num_to_str = False
         self.resolve = 128 if resolve is True else (resolve or self.resolve)
 
         private = config.get(("output",), "private")
@@ -1063,7 +1466,9 @@ class DataJob(Job):
 
         if self.resolve > 0:
             self.handle_queue = self.handle_queue_resolve
-        if not self.jsonl:
+        if self.stream:
+            self.out = self.out_stream
+        elif not self.jsonl:
             self.out = util.noop
 
     def run(self):
@@ -1075,6 +1480,11 @@ class DataJob(Job):
         if sleep is not None:
             extractor.sleep(sleep(), "extractor")
 
+        self.num_to_str = config.get(("output",), "num-to-str", False)
+        if self.stream and self.file:
+            self.writer = output.JSONWriter(
+                self.file, self.ascii, self.jsonl, self.stream)
+
         # collect data
         try:
             self.dispatch(extractor)
@@ -1082,15 +1492,29 @@ class DataJob(Job):
             pass
         except Exception as exc:
             self.exception = exc
-            self.data.append((-1, {
+            msg = (-1, {
                 "error"  : exc.__class__.__name__,
                 "message": str(exc),
-            }))
+            })
+            if self.stream:
+                self.out(msg)
+            else:
+                self.data.append(msg)
         except BaseException:
             pass
 
+        if self.stream:
+            if self.writer is not None:
+                # finish streamed output
+                try:
+                    self.writer.close()
+                except Exception:
+                    pass
+                self.writer = None
+            return 0
+
         # convert numbers to string
-        if config.get(("output",), "num-to-str", False):
+        if self.num_to_str and not self.jsonl:
             for msg in self.data:
                 util.transform_dict(msg[-1], util.number_to_string)
 
@@ -1105,29 +1529,41 @@ class DataJob(Job):
         return 0
 
     def out(self, msg):
+        if self.num_to_str:
+            msg = (*msg[:-1], _number_to_string(msg[-1]))
         self.file.write(util.json_dumps(msg))
         self.file.write("\n")
         self.file.flush()
 
+    def out_stream(self, msg):
+        """Write 'msg' without keeping a reference to it"""
+        if self.num_to_str:
+            msg = (*msg[:-1], _number_to_string(msg[-1]))
+        if self.writer is not None:
+            self.writer.write(msg)
+
     def handle_url(self, url, kwdict):
         kwdict = self.filter(kwdict)
         self.out(msg := (Message.Url, url, kwdict))
-        self.data_urls.append(url)
-        self.data_meta.append(kwdict)
-        self.data.append(msg)
+        if not self.stream:
+            self.data_urls.append(url)
+            self.data_meta.append(kwdict)
+            self.data.append(msg)
 
     def handle_directory(self, kwdict):
         kwdict = self.filter(kwdict)
         self.out(msg := (Message.Directory, kwdict))
-        self.data_post.append(kwdict)
-        self.data.append(msg)
+        if not self.stream:
+            self.data_post.append(kwdict)
+            self.data.append(msg)
 
     def handle_queue(self, url, kwdict):
         kwdict = self.filter(kwdict)
         self.out(msg := (Message.Queue, url, kwdict))
-        self.data_urls.append(url)
-        self.data_meta.append(kwdict)
-        self.data.append(msg)
+        if not self.stream:
+            self.data_urls.append(url)
+            self.data_meta.append(kwdict)
+            self.data.append(msg)
 
     def handle_queue_resolve(self, url, kwdict):
         if cls := kwdict.get("_extractor"):
@@ -1136,13 +1572,10 @@ class DataJob(Job):
             extr = extractor.find(url)
 
         if not extr:
-            kwdict = self.filter(kwdict)
-            self.out(msg := (Message.Queue, url, kwdict))
-            self.data_urls.append(url)
-            self.data_meta.append(kwdict)
-            return self.data.append(msg)
+            return DataJob.handle_queue(self, url, kwdict)
 
         job = self.__class__(extr, self, None, self.ascii, self.resolve-1)
+        job.out = self.out
         job.data = self.data
         job.data_urls = self.data_urls
         job.data_post = self.data_post
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Bounded in-memory caches"""
+
+import time
+import threading
+from collections import OrderedDict
+
+# all named caches, for statistics
+CACHES = {}
+
+
+class LRUCache(OrderedDict):
+    """Mapping with at most 'maxsize' entries
+
+    Adding an entry to a full cache removes the least recently used one.
+    With 'expires' enabled, values are (value, expires) tuples
+    and expired entries get removed first.
+    """
+
+    def __init__(self, name, maxsize=1024, expires=False):
+        OrderedDict.__init__(self)
+        self.name = name
+        self.maxsize = maxsize
+        self.expires = expires
+        self.hits = self.misses = self.evictions = 0
+        self._lock = threading.Lock()
+        CACHES[name] = self
+
+    def __getitem__(self, key):
+        with self._lock:
+            try:
+                value = OrderedDict.__getitem__(self, key)
+            except KeyError:
+                self.misses += 1
+                raise
+            self.hits += 1
+            self.move_to_end(key)
+            return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            OrderedDict.__setitem__(self, key, value)
+            self.move_to_end(key)
+            if len(self) > self.maxsize:
+                self._evict()
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}({self.name!r}, "
+                f"{len(self)}/{self.maxsize})")
+
+    def _evict(self):
+        if self.expires:
+            now = time.time()
+            expired = [
+                key
+                for key, (_, expires) in self.items()
+                if expires and expires <= now
+            ]
+            for key in expired:
+                del self[key]
+            self.evictions += len(expired)
+
+        while len(self) > self.maxsize:
+            self.popitem(False)
+            self.evictions += 1
@@ -342,6 +342,18 @@ def build_parser():
         help=("Download URLs found in FILE. "
               "Delete them after they were downloaded successfully."),
     )
+    input.add_argument(
+        "--jobs",
+        dest="jobs", metavar="N", type=int, default=1,
+        help=("Process input URLs in N parallel processes, "
+              "keeping URLs of the same site in the same process"),
+    )
+    input.add_argument(
+        "--serve",
+        dest="serve", metavar="ADDRESS",
+        help=("Keep running and process URLs sent as JSON to ADDRESS, "
+              "a Unix socket PATH or a loopback [HOST:]PORT"),
+    )
     input.add_argument(
         "--no-input",
         dest="input", nargs=0, action=ConfigConstAction, const=False,
@@ -684,6 +696,12 @@ def build_parser():
         help="Clean up the cache database by removing unused space and "
              "reorganizing the data to improve performance",
     )
+    cache.add_argument(
+        "--cache-stats",
+        dest="cache_stats", action="store_true",
+        help="Print hit, miss, and eviction counts of in-memory and "
+             "HTTP response caches before exiting",
+    )
     cache.add_argument(
         "--clear-cache", dest="cache_clear", help=SUPPRESS)
 
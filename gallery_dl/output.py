@@ -10,6 +10,7 @@ import os
 import sys
 import shutil
 import logging
+import threading
 import unicodedata
 from . import config, util, formatter
 
@@ -218,6 +219,84 @@ class FileHandler(logging.StreamHandler):
         self.emit(record)
 
 
+class LogBuffer():
+    """Hold back log records of the current thread until 'replay()'
+
+    Records get collected by filters added to all handlers of
+    the root logger and 'loggers' while a LogBuffer is active
+    as context manager in the current thread.
+    """
+    local = threading.local()
+
+    def __init__(self, loggers=()):
+        self.records = []
+        for logger in (logging.getLogger(), *loggers):
+            for handler in logger.handlers:
+                if not any(isinstance(f, LogBufferFilter)
+                           for f in handler.filters):
+                    handler.addFilter(LogBufferFilter(handler))
+
+    def __enter__(self):
+        self.previous = getattr(self.local, "buffer", None)
+        self.local.buffer = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.local.buffer = self.previous
+
+    def replay(self):
+        """Pass all collected records to their handlers"""
+        records = self.records
+        self.records = []
+        for func, arg in records:
+            func(arg)
+
+
+class LogBufferFilter():
+    """Divert records to the current thread's LogBuffer"""
+    __slots__ = ("handler",)
+
+    def __init__(self, handler):
+        self.handler = handler
+
+    def filter(self, record):
+        if (buffer := getattr(LogBuffer.local, "buffer", None)) is None:
+            return True
+        buffer.records.append((self.handler.handle, record))
+        return False
+
+
+class BufferOutput():
+    """Divert skip and success messages to the current thread's LogBuffer
+
+    Start and progress messages get dropped while a LogBuffer is active.
+    """
+    __slots__ = ("out",)
+
+    def __init__(self, out):
+        self.out = out
+
+    def start(self, path):
+        if getattr(LogBuffer.local, "buffer", None) is None:
+            self.out.start(path)
+
+    def skip(self, path):
+        if (buffer := getattr(LogBuffer.local, "buffer", None)) is None:
+            self.out.skip(path)
+        else:
+            buffer.records.append((self.out.skip, path))
+
+    def success(self, path):
+        if (buffer := getattr(LogBuffer.local, "buffer", None)) is None:
+            self.out.success(path)
+        else:
+            buffer.records.append((self.out.success, path))
+
+    def progress(self, bytes_total, bytes_downloaded, bytes_per_second):
+        if getattr(LogBuffer.local, "buffer", None) is None:
+            self.out.progress(bytes_total, bytes_downloaded, bytes_per_second)
+
+
 def initialize_logging(loglevel):
     """Setup basic logging functionality before configfiles have been loaded"""
     # convert levelnames to lowercase
@@ -536,6 +615,53 @@ class CustomOutput():
                 bytes_downloaded * 100 // bytes_total))
 
 
+class JSONWriter():
+    """Write JSON messages to 'fp' one at a time
+
+    The output is identical to util.dump_json(messages, fp, ascii, 2),
+    or one compact message per line with 'jsonl' enabled.
+    Messages get buffered until 'buffer' of them are available.
+    """
+
+    def __init__(self, fp, ensure_ascii=True, jsonl=False, buffer=1):
+        self.fp = fp
+        self.jsonl = jsonl
+        self.size = max(int(buffer), 1)
+        self.buffer = []
+        self.count = 0
+
+        if jsonl:
+            self.dumps = util.json_dumps
+        else:
+            # indent each message by one level as an element of a list
+            dumps = util.json_encoder(ensure_ascii, True, None, 2)
+            self.dumps = lambda msg: dumps(msg).replace("\n", "\n  ")
+
+    def write(self, msg):
+        data = self.dumps(msg)
+        if self.jsonl:
+            self.buffer.append(f"{data}\n")
+        elif self.count:
+            self.buffer.append(f",\n  {data}")
+        else:
+            self.buffer.append(f"[\n  {data}")
+        self.count += 1
+
+        if len(self.buffer) >= self.size:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.fp.write("".join(self.buffer))
+            self.buffer.clear()
+        self.fp.flush()
+
+    def close(self):
+        if not self.jsonl:
+            self.buffer.append("\n]\n" if self.count else "[]\n")
+        self.flush()
+
+
 class EAWCache(dict):
 
     def __missing__(self, key):
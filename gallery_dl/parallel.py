@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Process input URLs in multiple worker processes"""
+
+import os
+import queue
+import logging
+from . import config, extractor, exception, job, output, ExtendedUrl
+
+log = logging.getLogger("parallel")
+
+# categories whose 'subcategory' identifies the site
+SUBCATEGORY_SITES = {"directlink", "generic", "ytdl"}
+
+
+def run(input_manager, jobtype, processes):
+    """Run 'jobtype' for all URLs of 'input_manager' in 'processes' workers
+
+    URLs of the same extractor category get processed by the same worker,
+    one after another and in input order.
+    Success and error handling for each URL happens in this process.
+
+    Return None if multiple processes are not supported.
+    """
+    import multiprocessing
+    try:
+        ctx = multiprocessing.get_context("fork")
+    except ValueError:
+        log.warning("'--jobs' is not supported on this platform")
+        return None
+
+    groups = group_urls(input_manager.urls)
+    processes = min(processes, len(groups))
+
+    tasks = ctx.Queue()
+    results = ctx.Queue()
+    # start with the largest groups
+    for group in sorted(groups, key=len, reverse=True):
+        tasks.put(group)
+    for _ in range(processes):
+        tasks.put(None)
+
+    _share_log_files(False)
+    # no daemon processes, which cannot start child processes of their own
+    workers = [
+        ctx.Process(target=worker, args=(jobtype, tasks, results),
+                    name=f"gallery-dl-{num}")
+        for num in range(processes)
+    ]
+    log.debug("Starting %s worker processes for %s groups of URLs",
+              processes, len(groups))
+
+    retval = 0
+    pending = len(input_manager.urls)
+    try:
+        for process in workers:
+            process.start()
+
+        while pending:
+            try:
+                index, status = results.get(timeout=1.0)
+            except queue.Empty:
+                if any(process.is_alive() for process in workers):
+                    continue
+                break
+            pending -= 1
+
+            input_manager.select(index)
+            if status is None:
+                pass
+            elif status:
+                retval |= status
+                input_manager.error()
+            else:
+                input_manager.success()
+    finally:
+        for process in workers:
+            if process.is_alive() and pending:
+                process.terminate()
+            process.join()
+
+    if pending:
+        log.error("%s input URL%s did not finish",
+                  pending, "" if pending == 1 else "s")
+        retval |= 1
+    return retval
+
+
+def group_urls(urls):
+    """Split 'urls' into lists of (index, url, config) tuples per category"""
+    groups = {}
+    gconf = []
+
+    for index, url in enumerate(urls):
+        if isinstance(url, tuple):
+            url = url[0]
+        if isinstance(url, ExtendedUrl):
+            if url.gconfig:
+                gconf = gconf + url.gconfig
+            conf = gconf + url.lconfig
+            url = url.value
+        else:
+            conf = gconf
+
+        try:
+            if extr := extractor.find(url):
+                key = extr.category
+                if key in SUBCATEGORY_SITES:
+                    key = f"{key}:{extr.subcategory}"
+            else:
+                key = None
+        except Exception:
+            key = None
+        groups.setdefault(key, []).append((index, url, conf))
+
+    return list(groups.values())
+
+
+def worker(jobtype, tasks, results):
+    """Process groups of URLs from 'tasks'"""
+    _share_log_files(True)
+
+    try:
+        while (group := tasks.get()) is not None:
+            for index, url, conf in group:
+                results.put((index, run_job(jobtype, url, conf)))
+    except KeyboardInterrupt:
+        pass
+
+
+def run_job(jobtype, url, conf):
+    """Run a single job and return its status or None
+
+    Unexpected exceptions get logged and result in status 1.
+    """
+    while True:
+        try:
+            log.debug("Starting %s for '%s'", jobtype.__name__, url)
+            with config.apply(conf):
+                return jobtype(url).run()
+        except exception.RestartExtraction:
+            log.debug("Restarting '%s'", url)
+        except exception.ControlException:
+            return None
+        except exception.NoExtractorError:
+            log.error("Unsupported URL '%s'", url)
+            return 64
+        except Exception as exc:
+            log.error("%s: %s", exc.__class__.__name__, exc)
+            log.debug("", exc_info=exc)
+            return 1
+
+
+def _share_log_files(child):
+    """Make all processes append to the same log files
+
+    The parent truncates files opened with mode "w" once,
+    each child opens its own file handles.
+    """
+    loggers = [logging.getLogger()]
+    if job.Job.ulog is not None:
+        loggers.append(job.Job.ulog)
+
+    for logger in loggers:
+        for handler in logger.handlers:
+            if not isinstance(handler, output.FileHandler):
+                continue
+
+            if child:
+                if handler.stream is not None:
+                    handler.stream.close()
+                    handler.stream = handler._open()
+                continue
+
+            handler.flush()
+            if handler.mode == "w":
+                handler.mode = "a"
+                if handler.stream is not None:
+                    handler.stream.close()
+                    handler.stream = handler._open()
+                elif os.path.exists(handler.path):
+                    open(handler.path, "w").close()
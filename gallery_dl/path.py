@@ -386,7 +386,11 @@ class PathFormat():
         """Move tempfile to its target location"""
         if self.delete:
             self.delete = False
-            os.unlink(self.temppath)
+            try:
+                os.unlink(self.temppath)
+            except FileNotFoundError:
+                # streamed directly to its destination
+                pass
             return
 
         if self.temppath != self.realpath:
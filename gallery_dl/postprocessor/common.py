@@ -9,10 +9,13 @@
 """Common classes and constants used by postprocessor modules."""
 
 from .. import archive
+import os
 
 
 class PostProcessor():
     """Base class for postprocessors"""
+    # callbacks can run for several files at once ('workers' option)
+    threadsafe = False
 
     def __init__(self, job):
         self.name = self.__class__.__name__[:-2].lower()
@@ -21,6 +24,30 @@ class PostProcessor():
     def __repr__(self):
         return self.__class__.__name__
 
+    def _digests(self, pathfmt, names):
+        """Return hexdigests computed while downloading the current file
+
+        Return None if any of 'names' is missing
+        or the file has been modified since then.
+        """
+        digests = pathfmt.kwdict.get("_digests")
+        if not digests or digests["path"] != pathfmt.temppath:
+            return None
+
+        hexdigests = digests["hexdigests"]
+        for name in names:
+            if name not in hexdigests:
+                return None
+
+        try:
+            stat = os.stat(pathfmt.temppath)
+        except OSError:
+            return None
+        if stat.st_size != digests["size"] or \
+                stat.st_mtime_ns != digests["mtime"]:
+            return None
+        return hexdigests
+
     def _archive_init(self, job, options, prefix=None):
         if archive_path := options.get("archive"):
             extr = job.extractor
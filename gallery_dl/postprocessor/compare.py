@@ -10,6 +10,7 @@
 
 from .common import PostProcessor
 from .. import text, util, output, exception
+import hashlib
 import os
 
 
@@ -39,7 +40,8 @@ class ComparePP(PostProcessor):
 
     def replace(self, pathfmt):
         try:
-            if self._compare(pathfmt.realpath, pathfmt.temppath):
+            if self._compare(pathfmt.realpath, pathfmt.temppath,
+                             self._digest(pathfmt)):
                 return self._equal(pathfmt)
         except OSError:
             pass
@@ -47,8 +49,10 @@ class ComparePP(PostProcessor):
 
     def enumerate(self, pathfmt):
         num = 1
+        digest = self._digest(pathfmt)
         try:
-            while not self._compare(pathfmt.realpath, pathfmt.temppath):
+            while not self._compare(
+                    pathfmt.realpath, pathfmt.temppath, digest):
                 pathfmt.prefix = prefix = format(num) + "."
                 pathfmt.kwdict["extension"] = prefix + pathfmt.extension
                 pathfmt.build_path()
@@ -58,14 +62,24 @@ class ComparePP(PostProcessor):
             pass
         self._equal_cnt = 0
 
-    def _compare(self, f1, f2):
-        return self._compare_size(f1, f2) and self._compare_content(f1, f2)
+    def _compare(self, f1, f2, digest=None):
+        return (self._compare_size(f1, f2) and
+                self._compare_content(f1, f2, digest))
 
-    def _compare_size(self, f1, f2):
+    def _compare_size(self, f1, f2, digest=None):
         return os.stat(f1).st_size == os.stat(f2).st_size
 
-    def _compare_content(self, f1, f2):
+    def _compare_content(self, f1, f2, digest=None):
         size = 16384
+        if digest is not None:
+            # compare 'f1' against the digest of 'f2'
+            # computed while downloading it for another postprocessor
+            h = hashlib.sha256()
+            with open(f1, "rb") as fp:
+                while data := fp.read(size):
+                    h.update(data)
+            return h.hexdigest() == digest
+
         with open(f1, "rb") as fp1, open(f2, "rb") as fp2:
             while True:
                 buf1 = fp1.read(size)
@@ -75,6 +89,11 @@ class ComparePP(PostProcessor):
                 if not buf1:
                     return True
 
+    def _digest(self, pathfmt):
+        if hexdigests := self._digests(pathfmt, ("sha256",)):
+            return hexdigests["sha256"]
+        return None
+
     def _equal(self, pathfmt):
         if self._equal_exc:
             self._equal_cnt += 1
@@ -13,6 +13,7 @@ import hashlib
 
 
 class HashPP(PostProcessor):
+    threadsafe = True
 
     def __init__(self, job, options):
         PostProcessor.__init__(self, job)
@@ -39,8 +40,20 @@ class HashPP(PostProcessor):
         elif isinstance(events, str):
             events = events.split(",")
         job.register_hooks({event: self.run for event in events}, options)
+        job.register_digests(name for _, name in self.hashes)
 
     def run(self, pathfmt):
+        if hexdigests := self._digests(
+                pathfmt, [name for _, name in self.hashes]):
+            for key, name in self.hashes:
+                pathfmt.kwdict[key] = hexdigests[name]
+        else:
+            self._hash(pathfmt)
+
+        if self.filename:
+            pathfmt.build_path()
+
+    def _hash(self, pathfmt):
         hashes = [
             (key, hashlib.new(name))
             for key, name in self.hashes
@@ -58,9 +71,6 @@ class HashPP(PostProcessor):
         for key, h in hashes:
             pathfmt.kwdict[key] = h.hexdigest()
 
-        if self.filename:
-            pathfmt.build_path()
-
     def _open(self, pathfmt):
         try:
             return open(pathfmt.temppath, "rb")
@@ -10,7 +10,6 @@
 
 from .common import PostProcessor
 from .. import util, formatter
-import json
 import sys
 import os
 
@@ -56,12 +55,12 @@ class MetadataPP(PostProcessor):
             filename = "-"
         elif mode == "jsonl":
             self.write = self._write_json
-            self._json_encode = self._make_encoder(options).encode
+            self._json_encode = self._make_encoder(options)
             omode = "a"
             filename = "data.jsonl"
         else:
             self.write = self._write_json
-            self._json_encode = self._make_encoder(options, 4).encode
+            self._json_encode = self._make_encoder(options, 4)
             ext = "json"
 
         if base_directory := options.get("base-directory"):
@@ -273,13 +272,11 @@ class MetadataPP(PostProcessor):
             return util.filter_dict
 
     def _make_encoder(self, options, indent=None):
-        return json.JSONEncoder(
-            ensure_ascii=options.get("ascii", False),
-            sort_keys=options.get("sort", False),
-            separators=options.get("separators"),
-            indent=options.get("indent", indent),
-            check_circular=False,
-            default=util.json_default,
+        return util.json_encoder(
+            options.get("ascii", False),
+            options.get("sort", False),
+            options.get("separators"),
+            options.get("indent", indent),
         )
 
 
@@ -13,6 +13,7 @@ from .. import text, util, dt, formatter
 
 
 class MtimePP(PostProcessor):
+    threadsafe = True
 
     def __init__(self, job, options):
         PostProcessor.__init__(self, job)
@@ -10,7 +10,10 @@
 
 from .common import PostProcessor
 from .. import util
+from email.utils import mktime_tz, parsedate_tz
 import zipfile
+import struct
+import time
 import os
 
 
@@ -36,6 +39,7 @@ class ZipPP(PostProcessor):
             algorithm = "store"
 
         self.zfile = None
+        self.streamed = None
         self.path = job.pathfmt.realdirectory[:-1]
         self.args = (self.path + ext, "a",
                      self.COMPRESSION_ALGORITHMS[algorithm], True)
@@ -46,6 +50,10 @@ class ZipPP(PostProcessor):
         }, options)
         job.hooks["finalize"].append(self.finalize)
 
+        if algorithm == "store" and self.delete and \
+                options.get("stream", True) and not options.get("filter"):
+            job.register_stream(self.stream)
+
     def open(self):
         try:
             return zipfile.ZipFile(*self.args)
@@ -60,7 +68,13 @@ class ZipPP(PostProcessor):
         if self.files:
             self.write_extra(pathfmt, zfile, self.files)
             self.files = None
-        if pathfmt.filename not in zfile.NameToInfo:
+        if self.streamed is not None and \
+                self.streamed.filename == pathfmt.filename:
+            # already written by the downloader
+            self.write_mtime(pathfmt, zfile, self.streamed)
+            self.streamed = None
+            pathfmt.delete = True
+        elif pathfmt.filename not in zfile.NameToInfo:
             zfile.write(pathfmt.temppath, pathfmt.filename)
             pathfmt.delete = self.delete
 
@@ -70,8 +84,70 @@ class ZipPP(PostProcessor):
         self.write(pathfmt, self.zfile)
 
     def write_safe(self, pathfmt):
-        with self.open() as zfile:
-            self.write(pathfmt, zfile)
+        if self.zfile is None:
+            self.zfile = self.open()
+        self.write(pathfmt, self.zfile)
+        self.write_central_directory(self.zfile)
+
+    def write_central_directory(self, zfile):
+        """Update the central directory without closing 'zfile'
+
+        The next entry gets written over it, same as when reopening
+        the archive in append mode.
+        Close 'zfile' instead when ZipFile internals are not available.
+        """
+        if not has_internals(zfile):
+            zfile.close()
+            self.zfile = None
+        elif zfile._didModify:
+            zfile.fp.seek(zfile.start_dir)
+            zfile._write_end_record()
+
+    def write_mtime(self, pathfmt, zfile, zinfo):
+        """Set the timestamp of a streamed entry to its file's mtime
+
+        Streamed entries get created before a download's Last-Modified
+        or metadata mtime is known, so this updates the 'last mod file
+        time/date' fields of its local header in place.
+        """
+        kwdict = pathfmt.kwdict
+        if not (mtime := (kwdict.get("_mtime_meta") or
+                          kwdict.get("_mtime_http"))):
+            return
+        try:
+            if isinstance(mtime, str):
+                mtime = mktime_tz(parsedate_tz(mtime))
+            date_time = time.localtime(mtime)[:6]
+        except Exception:
+            return
+        if date_time[0] < 1980:
+            return
+
+        zinfo.date_time = date_time
+        fp = zfile.fp
+        pos = fp.tell()
+        fp.seek(zinfo.header_offset + 10)
+        fp.write(struct.pack(
+            "<HH",
+            date_time[3] << 11 | date_time[4] << 5 | date_time[5] // 2,
+            (date_time[0] - 1980) << 9 | date_time[1] << 5 | date_time[2],
+        ))
+        fp.seek(pos)
+
+    def stream(self, pathfmt, size):
+        """Return a file object writing into a new archive entry"""
+        if self.zfile is None:
+            self.zfile = self.open()
+        if pathfmt.filename in self.zfile.NameToInfo or \
+                not has_internals(self.zfile):
+            return None
+
+        zinfo = zipfile.ZipInfo(pathfmt.filename, time.localtime()[:6])
+        zinfo.compress_type = zipfile.ZIP_STORED
+        zinfo.external_attr = 0o100644 << 16
+        if size:
+            zinfo.file_size = size
+        return ZipStream(self, zinfo)
 
     def write_extra(self, pathfmt, zfile, files):
         for path in map(util.expand_path, files):
@@ -100,4 +176,66 @@ class ZipPP(PostProcessor):
                 util.remove_file(self.zfile.filename)
 
 
+def has_internals(zfile):
+    """Check for private ZipFile attributes used by ZipPP
+
+    These are needed to update the central directory
+    and to remove the last entry of an open archive.
+    """
+    return (hasattr(zfile, "_didModify") and
+            hasattr(zfile, "start_dir") and
+            hasattr(zfile, "_write_end_record"))
+
+
+class ZipStream():
+    """Archive entry written to by a downloader
+
+    Entries of failed downloads, i.e. without a call to commit(),
+    get removed again when closing this object.
+    """
+
+    def __init__(self, zpp, zinfo):
+        self.zpp = zpp
+        self.zinfo = zinfo
+        self.fp = zpp.zfile.open(zinfo, "w", force_zip64=not zinfo.file_size)
+        self.size = 0
+        self.committed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc, value, tb):
+        self.close()
+
+    def write(self, data):
+        self.size += len(data)
+        return self.fp.write(data)
+
+    def tell(self):
+        return self.size
+
+    def commit(self):
+        self.committed = True
+
+    def close(self):
+        if self.fp is None:
+            return
+        self.fp.close()
+        self.fp = None
+
+        if self.committed:
+            self.zpp.streamed = self.zinfo
+            return
+
+        # remove this entry, which is always the last one
+        zfile = self.zpp.zfile
+        zinfo = self.zinfo
+        zfile.filelist.remove(zinfo)
+        del zfile.NameToInfo[zinfo.filename]
+        zfile.start_dir = zinfo.header_offset
+        zfile.fp.seek(zinfo.header_offset)
+        zfile.fp.truncate()
+        self.zpp.write_central_directory(zfile)
+
+
 __postprocessor__ = ZipPP
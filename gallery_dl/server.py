@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Long-running server processing jobs sent over a local socket
+
+Clients send one JSON object per line:
+
+    {"url": "https://example.org/...",
+     "type": "download",
+     "options": {"extractor.example.videos": false},
+      "loglevel": "info",
+     "token": "..."}
+
+'type' is one of "download" (default), "simulate", or "data",
+'options' apply to this job only, similar to '-option=value' lines
+in input files. Only the keys in OPTIONS can be set this way;
+post processors, filters, and '\\f' format strings are rejected.
+
+'token' has to match the secret the server writes to a file
+only readable by its owner when it starts listening,
+'<socket>.token' for Unix sockets and 'server-<port>.token'
+in the cache directory for TCP sockets. TCP servers only accept
+loopback addresses.
+
+The server answers with one JSON object per line for each event,
+"log", "skip", and "success" for DownloadJobs, "data" for DataJobs,
+and a final "status" event. Jobs run one at a time.
+
+Extractor modules, configuration, compiled format strings,
+connection pools, and SQLite archive connections
+stay loaded between jobs.
+"""
+
+import os
+import hmac
+import logging
+import secrets
+import threading
+import socketserver
+from . import archive, cache, config, exception, job, util
+
+log = logging.getLogger("server")
+
+
+def serve(address):
+    """Process jobs sent to 'address' until interrupted"""
+    # keep archive databases open between jobs
+    archive.CONNECTIONS = {}
+
+    host, sep, port = address.rpartition(":")
+    if port.isdecimal():
+        host = host.strip("[]") or "127.0.0.1"
+        if host not in LOOPBACK:
+            log.error("Refusing to listen on non-loopback address '%s'",
+                      host)
+            return 1
+        server = TCPServer((host, int(port)), Handler)
+        path = None
+        tokenfile = os.path.join(cache.directory(), f"server-{port}.token")
+    elif util.WINDOWS:
+        log.error("Unix sockets are not supported on Windows")
+        return 1
+    else:
+        path = util.expand_path(address)
+        if not _remove_stale_socket(path):
+            log.error("'%s' is already in use", path)
+            return 1
+        server = socketserver.UnixStreamServer(path, Handler)
+        os.chmod(path, 0o600)
+        tokenfile = path + ".token"
+
+    try:
+        server.token = _write_token(tokenfile)
+        log.info("Listening on %s (token in '%s')", address, tokenfile)
+        server.serve_forever()
+    finally:
+        server.server_close()
+        util.remove_file(tokenfile)
+        if path:
+            util.remove_file(path)
+    return 0
+
+
+def _write_token(path):
+    """Write a new random token to a file only readable by its owner"""
+    token = secrets.token_hex(16)
+    util.remove_file(path)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w") as fp:
+        fp.write(token + "\n")
+    return token
+
+
+def _check_option(key, value):
+    """Raise ValueError if a client must not set option 'key'"""
+    if key[-1] not in OPTIONS or \
+            len(key) > 1 and key[0] not in ("extractor", "downloader",
+                                            "output"):
+        raise ValueError(f"Option '{'.'.join(key)}' not allowed")
+    values = value if isinstance(value, list) else (value,)
+    for value in values:
+        if isinstance(value, str):
+            if value.startswith("\f"):
+                raise ValueError(f"Format string '{value}' not allowed")
+        elif value is not None and \
+                not isinstance(value, (bool, int, float)):
+            raise ValueError(f"Invalid value for '{'.'.join(key)}'")
+
+
+def _remove_stale_socket(path):
+    """Remove a socket file left behind by a server that is not running
+
+    Return False if another server is still listening on 'path'.
+    """
+    if not os.path.exists(path):
+        return True
+    import socket
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        os.unlink(path)
+        return True
+    finally:
+        sock.close()
+    return False
+
+
+class Handler(socketserver.StreamRequestHandler):
+    """Run the jobs requested by a single client connection"""
+
+    def setup(self):
+        socketserver.StreamRequestHandler.setup(self)
+        self.lock = threading.Lock()
+        self.connected = True
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = util.json_loads(line.decode())
+                if not isinstance(request, dict) or \
+                        not isinstance(request.get("url"), str):
+                    raise ValueError("Missing 'url'")
+            except ValueError as exc:
+                self.send("status", status=128, message=f"Invalid request "
+                          f"({exc.__class__.__name__}: {exc})")
+                continue
+
+            token = request.get("token")
+            if not isinstance(token, str) or not hmac.compare_digest(
+                    token.encode(), self.server.token.encode()):
+                self.send("status", status=128, message="Invalid token")
+                break
+
+            self.send("status", status=self.run(request))
+            if not self.connected:
+                break
+
+    def run(self, request):
+        """Run the job described by 'request' and return its exit status"""
+        try:
+            jobtype = JOBTYPES[request.get("type") or "download"]
+            options = [
+                (key[:-1], key[-1], value)
+                for key, value in (request.get("options") or {}).items()
+                for key in (key.split("."),)
+            ]
+            for path, key, value in options:
+                _check_option((*path, key), value)
+            handler = LogHandler(
+                self, LOGLEVELS[request.get("loglevel") or "info"])
+        except Exception as exc:
+            self.send("log", level="error", name="server",
+                      message=f"Invalid request ({exc.__class__.__name__}: "
+                              f"{exc})")
+            return 128
+
+        url = request["url"]
+        root = logging.getLogger()
+        root.addHandler(handler)
+        JobMixin.client = self
+        try:
+            with config.apply(options):
+                while True:
+                    try:
+                        log.debug("Starting %s for '%s'",
+                                  jobtype.__name__, url)
+                        return jobtype(url).run()
+                    except exception.RestartExtraction:
+                        log.debug("Restarting '%s'", url)
+        except exception.NoExtractorError:
+            log.error("Unsupported URL '%s'", url)
+            return 64
+        except exception.ControlException:
+            return 0
+        except Exception as exc:
+            log.error("%s: %s", exc.__class__.__name__, exc)
+            log.debug("", exc_info=exc)
+            return 1
+        finally:
+            JobMixin.client = None
+            root.removeHandler(handler)
+
+    def send(self, event, **data):
+        """Send 'event' to the client"""
+        if not self.connected:
+            return
+        data["event"] = event
+        line = util.json_dumps(data).encode() + b"\n"
+        with self.lock:
+            try:
+                self.wfile.write(line)
+                self.wfile.flush()
+            except OSError:
+                self.connected = False
+
+
+class LogHandler(logging.Handler):
+    """Forward log records to a client"""
+
+    def __init__(self, client, level):
+        logging.Handler.__init__(self, level)
+        self.client = client
+
+    def emit(self, record):
+        try:
+            self.client.send(
+                "log",
+                level=record.levelname.lower(),
+                name=record.name,
+                message=record.getMessage(),
+            )
+        except Exception:
+            self.handleError(record)
+
+
+class ClientOutput():
+    """Report skipped and downloaded files to a client"""
+
+    def __init__(self, out, client):
+        self.out = out
+        self.client = client
+        self.start = out.start
+        self.progress = out.progress
+
+    def skip(self, path):
+        self.out.skip(path)
+        self.client.send("skip", path=path)
+
+    def success(self, path):
+        self.out.success(path)
+        self.client.send("success", path=path)
+
+
+class JobMixin():
+    client = None
+
+
+class DownloadJob(JobMixin, job.DownloadJob):
+
+    def __init__(self, url, parent=None):
+        job.DownloadJob.__init__(self, url, parent)
+        self.out = ClientOutput(self.out, self.client)
+
+
+class SimulationJob(JobMixin, job.SimulationJob):
+
+    def __init__(self, url, parent=None):
+        job.SimulationJob.__init__(self, url, parent)
+        self.out = ClientOutput(self.out, self.client)
+
+
+class DataJob(JobMixin, job.DataJob):
+
+    def __init__(self, url, parent=None):
+        job.DataJob.__init__(self, url, parent, None)
+        self.out = self.send
+
+    def send(self, msg):
+        self.client.send("data", message=msg)
+
+
+class TCPServer(socketserver.TCPServer):
+    allow_reuse_address = True
+
+
+JOBTYPES = {
+    "download": DownloadJob,
+    "simulate": SimulationJob,
+    "data"    : DataJob,
+}
+
+LOGLEVELS = {
+    "debug"  : logging.DEBUG,
+    "info"   : logging.INFO,
+    "warning": logging.WARNING,
+    "error"  : logging.ERROR,
+}
+
+LOOPBACK = {"127.0.0.1", "::1", "localhost"}
+
+OPTIONS = {
+    "filename", "directory", "path-restrict",
+    "path-replace", "path-remove", "path-strip", "path-extended",
+    "skip", "image-range", "chapter-range", "include", "videos",
+    "retries", "timeout", "verify", "sleep", "sleep-request",
+    "sleep-extractor", "rate", "part", "mtime", "user-agent",
+    "username", "password", "ascii", "private", "jsonl", "num-to-str",
+    "stream",
+}
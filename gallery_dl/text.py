@@ -11,6 +11,7 @@
 import html
 import urllib.parse
 import re as re_module
+from . import lru
 
 try:
     re_compile = re_module._compiler.compile
@@ -18,7 +19,7 @@ except AttributeError:
     re_compile = re_module.sre_compile.compile
 
 HTML_RE = re_compile(r"<[^>]+>")
-PATTERN_CACHE = {}
+PATTERN_CACHE = lru.LRUCache("pattern", 512)
 
 
 def re(pattern):
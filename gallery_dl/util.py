@@ -16,6 +16,7 @@ import random
 import getpass
 import hashlib
 import binascii
+import threading
 import functools
 import itertools
 import subprocess
@@ -23,7 +24,7 @@ import collections
 import urllib.parse
 from http.cookiejar import Cookie
 from email.utils import mktime_tz, parsedate_tz
-from . import text, dt, version, exception
+from . import text, dt, lru, version, exception
 
 
 def bencode(num, alphabet="0123456789"):
@@ -233,23 +234,91 @@ def json_default(obj):
     return str(obj)
 
 
+def json_encoder(ensure_ascii=True, sort_keys=False,
+                 separators=None, indent=None):
+    """Return a function serializing objects as JSON strings
+
+    Uses orjson when enabled with GDL_JSON_BACKEND=orjson
+    and it supports these arguments. Its output matches json.JSONEncoder's
+    except for floats: NaN and Infinity become 'null',
+    and exponents lose their sign and leading zeros ('1e16', '1e-7').
+    """
+    encode = json.JSONEncoder(
+        ensure_ascii=ensure_ascii,
+        sort_keys=sort_keys,
+        separators=separators,
+        indent=indent,
+        check_circular=False,
+        default=json_default,
+    ).encode
+
+    if orjson is None:
+        return encode
+    if separators is not None:
+        separators = tuple(separators)
+    if indent is None:
+        if separators != (",", ":"):
+            return encode
+        option = 0
+    elif indent == 2 and separators in (None, (",", ": ")):
+        option = orjson.OPT_INDENT_2
+    else:
+        return encode
+
+    if sort_keys:
+        # let json.JSONEncoder sort and convert non-string keys
+        option |= orjson.OPT_SORT_KEYS
+    else:
+        option |= orjson.OPT_NON_STR_KEYS
+    # serialize dates and dataclasses with 'json_default'
+    option |= (orjson.OPT_PASSTHROUGH_DATETIME |
+               orjson.OPT_PASSTHROUGH_DATACLASS)
+    dumps = orjson.dumps
+
+    def encode_orjson(obj):
+        try:
+            data = dumps(obj, json_default, option).decode()
+        except TypeError:
+            # unsupported types, integers beyond 64 bit, nesting depth
+            return encode(obj)
+        if ensure_ascii and (not data.isascii() or "\x7f" in data):
+            data = _json_escape(_json_escape_repl, data.encode(
+                "ascii", "backslashreplace").decode()).replace(
+                "\x7f", "\\u007f")
+        return data
+    return encode_orjson
+
+
+def _json_escape_repl(match):
+    # convert '\xNN' and '\UNNNNNNNN' from 'backslashreplace' to JSON,
+    # skip over escaped backslashes
+    if match[1]:
+        return match[0]
+    if match[2]:
+        return "\\u00" + match[2]
+    char = int(match[3], 16) - 0x10000
+    return f"\\u{0xd800 | char >> 10:04x}\\u{0xdc00 | char & 0x3ff:04x}"
+
+
+if os.environ.get("GDL_JSON_BACKEND") == "orjson":
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+else:
+    orjson = None
+
+# orjson.loads() converts integers beyond 64 bit to float,
+# and checking for them beforehand costs more than it saves
 json_loads = json._default_decoder.decode
-json_dumps = json.JSONEncoder(
-    check_circular=False,
-    separators=(",", ":"),
-    default=json_default,
-).encode
+_json_escape = text.re(r"\\(?:(\\)|x([0-9a-f]{2})|U([0-9a-f]{8}))").sub
+JSON_BACKEND = "json" if orjson is None else f"orjson {orjson.__version__}"
+json_dumps = json_encoder(True, False, (",", ":"))
 
 
 def dump_json(obj, fp=sys.stdout, ensure_ascii=True, indent=4):
     """Serialize 'obj' as JSON and write it to 'fp'"""
-    json.dump(
-        obj, fp,
-        ensure_ascii=ensure_ascii,
-        indent=indent,
-        default=json_default,
-        sort_keys=True,
-    )
+    fp.write(json_encoder(ensure_ascii, True, None, indent)(obj))
     fp.write("\n")
 
 
@@ -351,6 +420,20 @@ def detect_challenge(response):
             return "DDoS-Guard challenge"
 
 
+def retry_after(response):
+    """Return the number of seconds from a 'Retry-After' header or None"""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        if (date := parsedate_tz(value)) is None:
+            return None
+        seconds = mktime_tz(date) - time.time()
+    return seconds if seconds > 0.0 else 0.0
+
+
 @functools.lru_cache(maxsize=None)
 def git_head():
     try:
@@ -695,6 +778,59 @@ class Flags():
         raise exception.StopExtraction()
 
 
+class RateLimiter():
+    """Thread-safe request scheduler for a single host
+
+    Reserves a time slot for each request at least 'interval' seconds
+    after the end of the previous one and delays all requests
+    while the host is blocked, e.g. after '429 Too Many Requests'.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.timestamp = 0.0
+        self.until = 0.0
+
+    def acquire(self, interval=0.0):
+        """Reserve the next slot and return the seconds until it starts"""
+        with self.lock:
+            now = time.monotonic()
+            slot = self.timestamp + interval
+            if slot < self.until:
+                slot = self.until
+            if slot < now:
+                slot = now
+            self.timestamp = slot
+        return slot - now
+
+    def release(self):
+        """Mark the end of a request"""
+        with self.lock:
+            now = time.monotonic()
+            if self.timestamp < now:
+                self.timestamp = now
+
+    def block(self, seconds):
+        """Delay all requests for the next 'seconds'"""
+        with self.lock:
+            until = time.monotonic() + seconds
+            if self.until < until:
+                self.until = until
+
+
+def ratelimiter(url, scope="request"):
+    """Return the RateLimiter shared by all 'scope' requests to 'url's host"""
+    key = (scope, text.root_from_url(url))
+    try:
+        return RATE_LIMITERS[key]
+    except KeyError:
+        pass
+    with _ratelimiter_lock:
+        if (limiter := RATE_LIMITERS.get(key)) is None:
+            limiter = RATE_LIMITERS[key] = RateLimiter()
+    return limiter
+
+
 # v137.0 release of Firefox on 2025-04-01 has ordinal 739342
 # 735506 == 739342 - 137 * 28
 # v135.0 release of Chrome  on 2025-04-01 has ordinal 739342
@@ -712,6 +848,8 @@ re_compile = text.re_compile
 
 NONE = CustomNone()
 FLAGS = Flags()
+RATE_LIMITERS = lru.LRUCache("ratelimit", 512)
+_ratelimiter_lock = threading.Lock()
 WINDOWS = (os.name == "nt")
 SENTINEL = object()
 EXECUTABLE = getattr(sys, "frozen", False)
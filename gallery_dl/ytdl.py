@@ -10,8 +10,14 @@
 
 import shlex
 import itertools
+import threading
 from . import text, util, exception
 
+# idle YoutubeDL instances by module and options
+POOL = {}
+POOL_LOCK = threading.Lock()
+POOL_SIZE = 4
+
 
 def import_module(module_name):
     if module_name is None:
@@ -23,6 +29,109 @@ def import_module(module_name):
 
 
 def construct_YoutubeDL(module, obj, user_opts, system_opts=None):
+    opts = build_options(module, obj, user_opts, system_opts)
+    return module.YoutubeDL(opts)
+
+
+def acquire_YoutubeDL(module, obj, user_opts, system_opts=None):
+    """Return a YoutubeDL instance for exclusive use
+
+    Instances returned by release_YoutubeDL() get reused
+    by later calls resulting in the same options,
+    with their 'params' and cookies reset to their initial state.
+    Options with callable values, e.g. 'match_filter' or 'progress_hooks',
+    disable reuse.
+    """
+    opts = build_options(module, obj, user_opts, system_opts)
+    try:
+        key = (module.__name__, _pool_key({
+            name: value
+            for name, value in opts.items()
+            if name not in POOL_IGNORE
+        }))
+    except TypeError:
+        return module.YoutubeDL(opts)
+
+    with POOL_LOCK:
+        if idle := POOL.get(key):
+            ytdl_instance = idle.pop()
+            ytdl_instance.params.update(
+                (name, opts.get(name)) for name in POOL_IGNORE)
+            return ytdl_instance
+
+    ytdl_instance = module.YoutubeDL(opts)
+    params = ytdl_instance.params
+    params["__gdl_state"] = (params.copy(), tuple(ytdl_instance.cookiejar))
+    params["__gdl_pool"] = key
+    return ytdl_instance
+
+
+def release_YoutubeDL(ytdl_instance):
+    """Make 'ytdl_instance' available to acquire_YoutubeDL() again
+
+    Instances not created by acquire_YoutubeDL() get ignored.
+    """
+    params = ytdl_instance.params
+    if (key := params.get("__gdl_pool")) is None:
+        return
+
+    # drop options and cookies set by the previous user
+    state = params["__gdl_state"]
+    progress = "__gdl_progress" in params
+    params.clear()
+    params.update(state[0])
+    params["__gdl_state"] = state
+    params["__gdl_pool"] = key
+    params["logger"] = None
+    if progress:
+        # its progress hook stays installed
+        params["__gdl_progress"] = util.noop
+
+    cookiejar = ytdl_instance.cookiejar
+    cookiejar.clear()
+    for cookie in state[1]:
+        cookiejar.set_cookie(cookie)
+
+    with POOL_LOCK:
+        idle = POOL.setdefault(key, [])
+        if len(idle) < POOL_SIZE:
+            idle.append(ytdl_instance)
+
+
+def _pool_key(value):
+    """Return a hashable representation of an option value
+
+    Raise TypeError for callables and other values
+    that cannot be compared by their contents.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted(
+            (name, _pool_key(value)) for name, value in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(map(_pool_key, value))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(map(_pool_key, value))
+    if value is None or isinstance(value, (str, int, float, bytes)):
+        return value
+    raise TypeError(f"Cannot pool option value {value!r}")
+
+
+def set_cookies(ytdl_instance, cookies):
+    """Replace cookies set by a previous call with 'cookies'"""
+    cookiejar = ytdl_instance.cookiejar
+    for domain, path, name in ytdl_instance.params.get("__gdl_cookies", ()):
+        try:
+            cookiejar.clear(domain, path, name)
+        except KeyError:
+            pass
+
+    ytdl_instance.params["__gdl_cookies"] = names = []
+    for cookie in cookies:
+        cookiejar.set_cookie(cookie)
+        names.append((cookie.domain, cookie.path, cookie.name))
+
+
+def build_options(module, obj, user_opts, system_opts=None):
     opts = argv = None
     config = obj.config
 
@@ -75,7 +184,11 @@ def construct_YoutubeDL(module, obj, user_opts, system_opts=None):
         opts.update(system_opts)
 
     opts["__gdl_initialize"] = True
-    return module.YoutubeDL(opts)
+    return opts
+
+
+# per-use options excluded from POOL keys
+POOL_IGNORE = ("logger", "__gdl_initialize", "__gdl_ratelimit_func")
 
 
 def parse_command_line(module, argv):
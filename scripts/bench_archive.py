@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Benchmark download archive lookups for different 'archive-mode' values"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+
+import util  # noqa F401 - sets up sys.path
+from gallery_dl import archive
+
+CATEGORIES = ("twitter", "danbooru", "kemono", "reddit", "pixiv",
+              "instagram", "deviantart", "gelbooru", "e621", "tumblr")
+
+
+def create(path, entries):
+    con = sqlite3.connect(path)
+    con.execute("CREATE TABLE archive (entry TEXT PRIMARY KEY) WITHOUT ROWID")
+    with con:
+        con.executemany("INSERT INTO archive (entry) VALUES (?)", (
+            (f"{category}{num}_1",)
+            for num in range(entries // len(CATEGORIES))
+            for category in CATEGORIES
+        ))
+    con.close()
+
+
+def bench(path, mode, kwdicts):
+    # memory allocated by opening the archive and checking its first ID
+    tracemalloc.start()
+    arch = archive.connect(path, "{category}", "{id}_{num}", mode=mode)
+    arch.check(kwdicts[0].copy())
+    memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    arch.close()
+
+    start = time.perf_counter()
+    arch = archive.connect(path, "{category}", "{id}_{num}", mode=mode)
+    check = arch.check
+    check(kwdicts[0].copy())
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = [check(kwdict) for kwdict in kwdicts]
+    total = time.perf_counter() - start
+
+    arch.close()
+    return first, total, memory, sum(map(bool, results))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-e", "--entries", type=int, default=2_000_000,
+                        help="total number of archive entries")
+    parser.add_argument("-l", "--lookups", type=int, default=100_000)
+    parser.add_argument("--hit-ratio", type=float, default=0.1)
+    args = parser.parse_args()
+
+    per_category = args.entries // len(CATEGORIES)
+    hits = int(args.lookups * args.hit_ratio)
+    kwdicts = [
+        {"category": "twitter", "id": num % per_category, "num": 1}
+        for num in range(hits)
+    ] + [
+        {"category": "twitter", "id": per_category + num, "num": 1}
+        for num in range(args.lookups - hits)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "archive.sqlite3")
+        print(f"Creating archive with {args.entries} entries ...")
+        create(path, args.entries)
+        print(f"{args.lookups} lookups, {hits} hits, "
+              f"{per_category} entries for 'twitter'\n")
+
+        print(f"{'mode':<8} {'first check':>12} {'lookups':>10} "
+              f"{'per lookup':>11} {'peak memory':>12}")
+        for mode in ("file", "memory", "preload"):
+            first, total, memory, found = bench(path, mode, kwdicts)
+            if found != hits:
+                print(f"{mode}: expected {hits} hits, got {found}")
+            print(f"{mode:<8} {first * 1000:9.1f} ms {total * 1000:7.1f} ms "
+                  f"{total / len(kwdicts) * 1e6:8.2f} µs "
+                  f"{memory / 1024 / 1024:8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
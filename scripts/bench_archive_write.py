@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Benchmark concurrent writes to a shared download archive
+
+Starts multiple processes adding IDs to the same SQLite archive
+and compares 'archive-mode' "file" against "batch".
+"""
+
+import argparse
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import time
+
+import util  # noqa F401 - sets up sys.path
+from gallery_dl import archive
+
+
+def worker(path, mode, num, entries, delay, barrier, queue):
+    arch = archive.connect(path, "{category}", "{id}", mode=mode)
+    errors = 0
+    barrier.wait()
+
+    start = time.perf_counter()
+    for i in range(entries):
+        kwdict = {"category": f"proc{num}_", "id": i}
+        arch.check(kwdict)
+        while True:
+            try:
+                arch.add(kwdict)
+                break
+            except sqlite3.OperationalError:  # database is locked
+                errors += 1
+        if delay:
+            time.sleep(delay)
+    arch.finalize()
+    arch.close()
+    queue.put((time.perf_counter() - start, errors))
+
+
+def bench(path, mode, procs, entries, delay):
+    barrier = multiprocessing.Barrier(procs)
+    queue = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=worker, args=(
+            path, mode, num, entries, delay, barrier, queue))
+        for num in range(procs)
+    ]
+    for process in processes:
+        process.start()
+    results = [queue.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    con = sqlite3.connect(path)
+    written = con.execute("SELECT count(*) FROM archive").fetchone()[0]
+    con.close()
+
+    return max(t for t, _ in results), sum(e for _, e in results), written
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-p", "--processes", type=int, default=4)
+    parser.add_argument("-e", "--entries", type=int, default=1000,
+                        help="number of IDs written by each process")
+    parser.add_argument("-d", "--delay", type=float, default=0.0,
+                        help="seconds to sleep between IDs")
+    args = parser.parse_args()
+
+    total = args.processes * args.entries
+    print(f"{args.processes} processes, {args.entries} IDs each\n")
+    print(f"{'mode':<6} {'time':>9} {'IDs/s':>9} {'locked':>7} {'written':>8}")
+
+    for mode in ("file", "batch"):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "archive.sqlite3")
+            archive.connect(path, "", "").close()  # create table
+
+            elapsed, errors, written = bench(
+                path, mode, args.processes, args.entries, args.delay)
+            if written != total:
+                print(f"{mode}: expected {total} IDs, found {written}")
+            print(f"{mode:<6} {elapsed:7.2f} s {total / elapsed:9.0f} "
+                  f"{errors:7} {written:8}")
+
+
+if __name__ == "__main__":
+    main()
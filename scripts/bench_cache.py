@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Benchmark concurrent cache database lookups from multiple processes"""
+
+import argparse
+import multiprocessing
+import os
+import pickle
+import sqlite3
+import tempfile
+import time
+
+import util  # noqa F401 - sets up sys.path
+from gallery_dl import cache
+
+MODULES = ("twitter", "pixiv", "kemono", "deviantart", "instagram")
+
+
+def lookup_legacy(db, module, key, now):
+    """Lookup as done with the 'data' table, always locking the database"""
+    key = f"gallery_dl.extractor.{module}.{key}"
+    with db:
+        cursor = db.cursor()
+        cursor.execute("BEGIN EXCLUSIVE")
+        cursor.execute(
+            "SELECT value, expires FROM data WHERE key=? LIMIT 1", (key,))
+        if (result := cursor.fetchone()) and (
+                not (expires := result[1]) or expires > now):
+            return pickle.loads(result[0])
+        value = key
+        cursor.execute(
+            "INSERT OR REPLACE INTO data VALUES (?,?,?)",
+            (key, pickle.dumps(value), now + 3600))
+    return value
+
+
+def lookup_current(db, module, key, now):
+    """Lookup as done by Extractor.cache()"""
+    if (result := cache.load(db, module, key, now)) is None:
+        with db:
+            db.execute("BEGIN EXCLUSIVE")
+            if (result := cache.load(db, module, key, now)) is None:
+                result = key, now + 3600
+                cache.store(db, module, key, *result)
+    return result[0]
+
+
+def setup(path, scheme, entries):
+    db = sqlite3.connect(path)
+    if scheme == "legacy":
+        db.execute("CREATE TABLE data "
+                   "(key TEXT PRIMARY KEY, value TEXT, expires INTEGER)")
+        with db:
+            db.executemany("INSERT INTO data VALUES (?,?,?)", (
+                (f"gallery_dl.extractor.{module}.token-{num}",
+                 pickle.dumps(num), 0)
+                for num in range(entries)
+                for module in MODULES
+            ))
+    else:
+        cache._setup(db, True)
+        with db:
+            for num in range(entries):
+                for module in MODULES:
+                    cache.store(db, module, f"token-{num}", num)
+    db.close()
+
+
+def worker(path, scheme, index, lookups, entries, miss_ratio):
+    db = sqlite3.connect(path, timeout=60)
+    lookup = lookup_legacy if scheme == "legacy" else lookup_current
+    module = MODULES[index % len(MODULES)]
+    misses = int(1 / miss_ratio) if miss_ratio else 0
+
+    start = time.perf_counter()
+    for num in range(lookups):
+        if misses and not num % misses:
+            key = f"new-{index}-{num}"
+        else:
+            key = f"token-{num % entries}"
+        lookup(db, module, key, int(time.time()))
+    db.close()
+    return time.perf_counter() - start
+
+
+def bench(path, scheme, args):
+    setup(path, scheme, args.entries)
+    with multiprocessing.Pool(args.processes) as pool:
+        start = time.perf_counter()
+        times = pool.starmap(worker, (
+            (path, scheme, index, args.lookups, args.entries, args.misses)
+            for index in range(args.processes)
+        ))
+        total = time.perf_counter() - start
+    return total, max(times)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-p", "--processes", type=int, default=8)
+    parser.add_argument("-l", "--lookups", type=int, default=2_000,
+                        help="number of lookups per process")
+    parser.add_argument("-e", "--entries", type=int, default=1_000,
+                        help="number of entries per module")
+    parser.add_argument("--misses", type=float, default=0.01,
+                        help="ratio of lookups for missing entries")
+    args = parser.parse_args()
+
+    print(f"{args.processes} processes, {args.lookups} lookups each, "
+          f"{args.misses:.0%} misses\n")
+    print(f"{'scheme':<8} {'total':>10} {'slowest':>10} {'per lookup':>11}")
+
+    for scheme in ("legacy", "current"):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "cache.sqlite3")
+            total, slowest = bench(path, scheme, args)
+        print(f"{scheme:<8} {total * 1000:7.1f} ms {slowest * 1000:7.1f} ms "
+              f"{total / (args.processes * args.lookups) * 1e6:8.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Benchmark extractor.find() with and without the URL dispatch index
+
+'cold' measures fresh interpreters resolving a single URL each,
+'warm' resolves every extractor's example URL in a single process.
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+import util
+from gallery_dl import extractor
+
+COLD = """\
+import time
+start = time.perf_counter()
+from gallery_dl import extractor
+extractor._index = {index}
+for cls in extractor._classes_for({url!r}):
+    if cls.pattern.match({url!r}):
+        break
+print(time.perf_counter() - start)
+"""
+
+
+def bench_cold(urls, index, runs):
+    total = 0.0
+    for url in urls:
+        code = COLD.format(url=url, index="None" if index else "False")
+        timings = []
+        for _ in range(runs):
+            out = subprocess.run(
+                (sys.executable, "-c", code), cwd=util.ROOTDIR,
+                check=True, capture_output=True, text=True).stdout
+            timings.append(float(out))
+        total += min(timings)
+    return total / len(urls)
+
+
+def bench_warm(urls, index, runs):
+    extractor._index = None if index else False
+    classes_for = extractor._classes_for
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for url in urls:
+            for cls in classes_for(url):
+                if cls.pattern.match(url):
+                    break
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--runs", type=int, default=5)
+    parser.add_argument("-s", "--samples", type=int, default=10,
+                        help="number of URLs to resolve 'cold'")
+    parser.add_argument("urls", nargs="*")
+    args = parser.parse_args()
+
+    urls = args.urls or [
+        cls.example
+        for cls in extractor._list_classes()
+        if hasattr(cls, "example")
+    ]
+
+    samples = urls[::max(len(urls) // args.samples, 1)]
+    print(f"cold ({len(samples)} URLs, one process each)")
+    for index in (False, True):
+        t = bench_cold(samples, index, args.runs)
+        print(f"  index={index!s:<5}  {t * 1000:9.2f} ms/URL")
+
+    print(f"warm ({len(urls)} URLs)")
+    for index in (False, True):
+        t = bench_warm(urls, index, args.runs)
+        print(f"  index={index!s:<5}  {t * 1000:9.2f} ms  "
+              f"({t / len(urls) * 1e6:.1f} µs/URL)")
+
+
+if __name__ == "__main__":
+    main()
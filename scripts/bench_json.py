@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Benchmark JSON encoding with the stdlib and orjson backends"""
+
+import argparse
+import datetime
+import io
+import json
+import os
+import time
+
+os.environ.setdefault("GDL_JSON_BACKEND", "orjson")
+import util  # noqa E402 F401 - sets up sys.path
+from gallery_dl import util as gutil  # noqa E402
+
+
+def posts(num):
+    return [
+        {
+            "id"         : 1790000000000000000 + i,
+            "id_str"     : str(1790000000000000000 + i),
+            "date"       : datetime.datetime(2024, 1, 1, 12, i % 60),
+            "content"    : f"Post #{i} ✨ with some text and a #hashtag",
+            "tags"       : ["tag_" + str(t) for t in range(i % 20)],
+            "rating"     : "s",
+            "score"      : i * 3,
+            "width"      : 1920,
+            "height"     : 1080,
+            "author"     : {"id": i % 100, "name": f"user{i % 100}",
+                            "nick": "Ämélie"},
+            "sensitive"  : bool(i % 2),
+            "extension"  : "jpg",
+            "num"        : 1,
+            "category"   : "twitter",
+            "subcategory": "user",
+        }
+        for i in range(num)
+    ]
+
+
+def bench(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--posts", type=int, default=100_000)
+    args = parser.parse_args()
+
+    data = posts(args.posts)
+    messages = [(3, f"https://example.org/{p['id']}.jpg", p) for p in data]
+    messages_ascii = [(3, url, dict(kwdict, content="", author={}))
+                      for _, url, kwdict in messages]
+
+    std_dumps = json.JSONEncoder(
+        check_circular=False, separators=(",", ":"),
+        default=gutil.json_default).encode
+
+    def std_dump_json(obj):
+        json.dump(obj, io.StringIO(), ensure_ascii=True, indent=2,
+                  default=gutil.json_default, sort_keys=True)
+
+    def dump_json(obj):
+        gutil.dump_json(obj, io.StringIO(), True, 2)
+
+    def each(func):
+        return lambda objs: [func(obj) for obj in objs]
+
+    print(f"{args.posts} posts, backend: {gutil.JSON_BACKEND}\n")
+    print(f"{'operation':<24} {'json':>10} {'backend':>10} {'speedup':>8}")
+
+    for name, std, new, arg in (
+        ("dumps (-J, non-ASCII)", each(std_dumps), each(gutil.json_dumps),
+         messages),
+        ("dumps (-J, ASCII)", each(std_dumps), each(gutil.json_dumps),
+         messages_ascii),
+        ("dump_json (-j)", std_dump_json, dump_json, messages),
+    ):
+        t_std = bench(std, arg)
+        t_new = bench(new, arg)
+        print(f"{name:<24} {t_std * 1000:7.1f} ms {t_new * 1000:7.1f} ms "
+              f"{t_std / t_new:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
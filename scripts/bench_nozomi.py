@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Benchmark decoding and combining nozomi files of synthetic searches"""
+
+import argparse
+import random
+import struct
+import time
+
+import util  # noqa F401 - sets up sys.path
+from gallery_dl.extractor import nozomi
+
+
+def decode_legacy(n):
+    for i in range(0, len(n), 4):
+        yield (n[i] << 24) + (n[i+1] << 16) + (n[i+2] << 8) + n[i+3]
+
+
+def search_legacy(positive, negative, index):
+    result = None
+    for ids in positive:
+        if result is None:
+            result = set(decode_legacy(ids))
+        else:
+            result.intersection_update(decode_legacy(ids))
+    if result is None:
+        result = set(decode_legacy(index()))
+    for ids in negative:
+        result.difference_update(decode_legacy(ids))
+    return sorted(result, reverse=True) if result else ()
+
+
+def search_current(positive, negative, index):
+    return nozomi.search_ids(
+        map(nozomi.decode_nozomi, positive),
+        map(nozomi.decode_nozomi, negative),
+        lambda: nozomi.decode_nozomi(index()))
+
+
+def blob(ids):
+    """Encode 'ids' like a nozomi file, highest ID first"""
+    ids = sorted(ids, reverse=True)
+    return struct.pack(f">{len(ids)}I", *ids)
+
+
+def bench(func, *args):
+    start = time.perf_counter()
+    result = list(func(*args))
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--index", type=int, default=4_000_000,
+                        help="number of IDs in the index file")
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rand = random.Random(args.seed)
+    total = args.index
+    universe = range(1, total * 2)
+    index = blob(rand.sample(universe, total))
+
+    def tag(size):
+        return blob(rand.sample(universe, int(total * size)))
+
+    large, medium, small, tiny = tag(0.25), tag(0.05), tag(0.005), tag(1e-4)
+    searches = (
+        ("decode index", (index,), (), None),
+        ("large medium", (large, medium), (), None),
+        ("large tiny", (large, tiny), (), None),
+        ("medium small -tiny", (medium, small), (tiny,), None),
+        ("-tiny", (), (tiny,), index),
+        ("-large", (), (large,), index),
+    )
+
+    print(f"{total} IDs in index\n")
+    print(f"{'search':<20} {'sets':>10} {'arrays':>10} {'speedup':>8}")
+
+    for name, positive, negative, idx in searches:
+        t_old, r_old = bench(search_legacy, positive, negative, lambda: idx)
+        t_new, r_new = bench(search_current, positive, negative, lambda: idx)
+        if r_old != r_new:
+            print(f"{name}: results differ")
+            continue
+        print(f"{name:<20} {t_old * 1000:7.1f} ms {t_new * 1000:7.1f} ms "
+              f"{t_old / t_new:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
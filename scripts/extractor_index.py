@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Generate gallery_dl/extractor/index.py
+
+Map hostnames, hostname suffixes, and URL scheme prefixes
+accepted by each extractor's 'pattern' to its position
+in the list of all extractor classes.
+"""
+
+import textwrap
+
+import util
+from gallery_dl import extractor
+
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
+
+MAX_PATHS = 256
+MAX_TOKENS = 160
+TERMINATORS = "/?#"
+
+# extractor options that change patterns at import time
+CONDITIONAL = (
+    ("bunkr", "tlds"),
+    ("generic", "enabled"),
+    ("ytdl", "enabled"),
+)
+
+# special tokens
+END = ("END",)
+UNKNOWN = ("?",)
+WILD = ("W", False)
+WILD_TERMINATOR = ("W", True)
+
+CATEGORIES_NEGATED = {
+    sre_parse.CATEGORY_NOT_DIGIT,
+    sre_parse.CATEGORY_NOT_SPACE,
+    sre_parse.CATEGORY_NOT_WORD,
+    sre_parse.CATEGORY_NOT_LINEBREAK,
+}
+
+
+class Unindexable(Exception):
+    pass
+
+
+def build_index():
+    hosts = {}
+    suffixes = {}
+    schemes = {}
+    fallback = []
+    basecategories = {}
+    conditional = {}
+    classes = []
+
+    for pos, cls in enumerate(extractor._list_classes()):
+        module = cls.__module__.rpartition(".")[2]
+        classes.append((module, cls.__name__))
+
+        if cls.basecategory and getattr(cls, "instances", None):
+            basecategories.setdefault(cls.basecategory, []).append(pos)
+        for category, key in CONDITIONAL:
+            if module == category:
+                conditional.setdefault((category, key), []).append(pos)
+
+        try:
+            keys = pattern_keys(cls.pattern)
+        except Unindexable:
+            fallback.append(pos)
+            continue
+
+        for type, key in keys:
+            if type == "host":
+                index = hosts
+            elif type == "suffix":
+                index = suffixes
+            else:
+                index = schemes
+            positions = index.setdefault(key, [])
+            if not positions or positions[-1] != pos:
+                positions.append(pos)
+
+    return (classes, hosts, suffixes, schemes,
+            fallback, basecategories, conditional)
+
+
+def pattern_keys(pattern):
+    """Return all (type, key) pairs of URLs matched by 'pattern'"""
+    items = list(sre_parse.parse(pattern.pattern, pattern.flags))
+    keys = set()
+    stack = [([], items)]
+
+    while stack:
+        path, rest = stack.pop()
+        if not rest:
+            keys.add(path_key(path, True))
+            continue
+        if path and (key := path_key(path)) is not None:
+            keys.add(key)
+            continue
+
+        (op, av), rest = rest[0], rest[1:]
+        for tokens, items in alternatives(op, av):
+            stack.append((path + tokens, list(items) + rest))
+        if len(stack) > MAX_PATHS:
+            raise Unindexable()
+
+    return keys
+
+
+def alternatives(op, av):
+    """Return (tokens, items) pairs for each way to match node 'op'"""
+    if op is sre_parse.LITERAL:
+        return (([chr(av)], ()),)
+
+    if op is sre_parse.SUBPATTERN:
+        return (([], av[-1]),)
+
+    if op is getattr(sre_parse, "ATOMIC_GROUP", None):
+        return (([], av),)
+
+    if op is sre_parse.BRANCH:
+        return [([], alt) for alt in av[1]]
+
+    if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) or \
+            op is getattr(sre_parse, "POSSESSIVE_REPEAT", None):
+        min, max, sub = av
+        if max == 1:
+            return (([], sub), ([], ())) if not min else (([], sub),)
+        return (([wild(sub)], ()),)
+
+    if op is sre_parse.IN:
+        if len(av) <= 8 and all(o is sre_parse.LITERAL for o, _ in av):
+            return [([chr(c)], ()) for _, c in av]
+        return (([wild(((op, av),))], ()),)
+
+    if op in (sre_parse.ANY, sre_parse.NOT_LITERAL, sre_parse.CATEGORY):
+        return (([wild(((op, av),))], ()),)
+
+    if op is sre_parse.AT:
+        if av in (sre_parse.AT_END, sre_parse.AT_END_STRING):
+            return (([END], ()),)
+        return (([], ()),)  # zero-width
+
+    if op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+        return (([], ()),)  # zero-width; only restricts matches further
+
+    return (([UNKNOWN], ()),)
+
+
+def wild(items):
+    return WILD_TERMINATOR if may_terminate(items) else WILD
+
+
+def may_terminate(items):
+    """Return True if 'items' may match any of TERMINATORS"""
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            if chr(av) in TERMINATORS:
+                return True
+        elif op is sre_parse.IN:
+            negate = av and av[0][0] is sre_parse.NEGATE
+            for char in TERMINATORS:
+                if in_set(av, ord(char)) is not negate:
+                    return True
+        elif op is sre_parse.CATEGORY:
+            if av in CATEGORIES_NEGATED:
+                return True
+        elif op is sre_parse.SUBPATTERN:
+            if may_terminate(av[-1]):
+                return True
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            if may_terminate(av[-1]):
+                return True
+        elif op is sre_parse.BRANCH:
+            if any(may_terminate(alt) for alt in av[1]):
+                return True
+        elif op in (sre_parse.AT, sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            pass
+        else:
+            return True
+    return False
+
+
+def in_set(items, char):
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            if av == char:
+                return True
+        elif op is sre_parse.RANGE:
+            if av[0] <= char <= av[1]:
+                return True
+        elif op is sre_parse.CATEGORY:
+            if av in CATEGORIES_NEGATED:
+                return True
+        elif op is not sre_parse.NEGATE:
+            return True
+    return False
+
+
+def path_key(path, final=False):
+    """Return the (type, key) pair for a token sequence
+
+    Returns None if 'path' needs more tokens
+    and raises Unindexable if no key can be determined.
+    """
+    idx = 0
+    for token in path:
+        if token.__class__ is not str:
+            break
+        idx += 1
+    literal = "".join(path[:idx]).lower()
+
+    if ":" in literal:
+        scheme, _, rest = literal.partition(":")
+        if scheme not in ("http", "https"):
+            return ("scheme", scheme + ":")
+        if not rest.startswith("//"):
+            if len(rest) < 2 and idx == len(path) and not final:
+                return None
+            raise Unindexable()
+        start = len(scheme) + 3
+    elif idx == len(path) and not final and not any(
+            c in TERMINATORS for c in literal):
+        return None
+    else:
+        start = 0
+
+    host = []
+    for token in path[start:]:
+        if token.__class__ is str:
+            if token in TERMINATORS:
+                break
+            host.append(token.lower())
+        elif token is END:
+            break
+        elif token is WILD:
+            host.append(token)
+        else:
+            raise Unindexable()
+    else:
+        if final or len(path) >= MAX_TOKENS:
+            raise Unindexable()
+        return None
+
+    if not host:
+        raise Unindexable()
+    if WILD not in host:
+        return ("host", "".join(host))
+
+    idx = len(host) - host[::-1].index(WILD)
+    suffix = "".join(host[idx:])
+    if len(suffix) < 2 or suffix[0] != ".":
+        raise Unindexable()
+    return ("suffix", suffix)
+
+
+def write_index(path, index):
+    (classes, hosts, suffixes, schemes,
+     fallback, basecategories, conditional) = index
+
+    def write_positions(prefix, positions, indent="    "):
+        line = f"{prefix}{tuple(positions)!r}"
+        if len(line) < 79:
+            return fp.write(line)
+        fp.write(f"{prefix}(\n")
+        for chunk in textwrap.wrap(
+                ", ".join(map(str, positions)) + ",", 75 - len(indent)):
+            fp.write(f"{indent}    {chunk}\n")
+        fp.write(f"{indent})")
+
+    def write_dict(name, dct):
+        fp.write(f"\n{name} = {{\n")
+        for key in sorted(dct):
+            write_positions(f"    {key!r}: ", dct[key])
+            fp.write(",\n")
+        fp.write("}\n")
+
+    with util.lazy(path) as fp:
+        fp.write(f'''\
+# -*- coding: utf-8 -*-
+
+# This file is generated by {util.trim(__file__)} - do not edit manually
+
+"""Precomputed URL dispatch index for extractor.find()"""
+
+CLASSES = (
+''')
+        for entry in classes:
+            fp.write(f"    {entry!r},\n")
+        fp.write(")\n")
+
+        write_dict("HOSTS", hosts)
+        write_dict("SUFFIXES", suffixes)
+        write_dict("SCHEMES", schemes)
+        write_dict("BASECATEGORIES", basecategories)
+        write_dict("CONDITIONAL", conditional)
+        fp.write("\n")
+        write_positions("FALLBACK = ", fallback, "")
+        fp.write("\n")
+
+
+def main():
+    extractor._index = False
+    write_index(
+        util.path("gallery_dl", "extractor", "index.py"),
+        build_index(),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -114,6 +114,7 @@ def build_setuptools():
                 "requests[socks]",
                 "yt-dlp[default]",
                 "jinja2",
+                "orjson",
                 "pyyaml",
                 "toml; python_version < '3.11'",
                 "truststore; python_version >= '3.10'",
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+import signal
+import sqlite3
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gallery_dl import archive  # noqa E402
+
+
+class TestBloomFilter(unittest.TestCase):
+
+    def test_contains(self):
+        bloom = archive.BloomFilter(1000)
+        for i in range(1000):
+            bloom.add(f"key{i}")
+
+        self.assertEqual(bloom.count, 1000)
+        for i in range(1000):
+            self.assertIn(f"key{i}", bloom)
+
+        false_positives = sum(f"other{i}" in bloom for i in range(10000))
+        self.assertLess(false_positives, 100)
+
+    def test_empty(self):
+        bloom = archive.BloomFilter(0)
+        self.assertEqual(bloom.size, 8192)
+        self.assertEqual(len(bloom.bits), 1024)
+        self.assertNotIn("", bloom)
+        self.assertNotIn("key", bloom)
+
+
+class TestDownloadArchivePreload(unittest.TestCase):
+
+    def _connect(self, prefix="{category}"):
+        return archive.connect(
+            ":memory:", prefix, "{id}", mode="preload")
+
+    def test_connect(self):
+        arch = self._connect()
+        self.assertIsInstance(arch, archive.DownloadArchivePreload)
+        self.assertEqual(arch.prefixgen({"category": "foo"}), "foo")
+
+    def test_check(self):
+        arch = self._connect()
+        arch.cursor.executemany(
+            arch._stmt_insert,
+            [(f"foo{i}",) for i in range(100)] +
+            [(f"fop{i}",) for i in range(10)] +
+            [(f"fo{i}",) for i in range(10)],
+        )
+
+        self.assertTrue(arch.check({"category": "foo", "id": 1}))
+        self.assertTrue(arch.check({"category": "foo", "id": 99}))
+        self.assertFalse(arch.check({"category": "foo", "id": 100}))
+        self.assertEqual(list(arch.filters), ["foo"])
+        self.assertEqual(arch.filters["foo"].count, 100)
+
+        self.assertTrue(arch.check({"category": "fop", "id": 1}))
+        self.assertEqual(arch.filters["fop"].count, 10)
+
+        self.assertFalse(arch.check({"category": "bar", "id": 1}))
+        self.assertEqual(arch.filters["bar"].count, 0)
+
+    def test_add(self):
+        arch = self._connect()
+        kwdict = {"category": "foo", "id": 1}
+
+        self.assertFalse(arch.check(kwdict))
+        self.assertEqual(kwdict["_archive_key"], "foo1")
+        arch.add(kwdict)
+        self.assertIn("foo1", arch.filters["foo"])
+        self.assertTrue(arch.check({"category": "foo", "id": 1}))
+
+        # add to a prefix not loaded yet
+        arch.add({"category": "bar", "id": 2})
+        self.assertNotIn("bar", arch.filters)
+        self.assertTrue(arch.check({"category": "bar", "id": 2}))
+
+    def test_prefix_empty(self):
+        arch = self._connect("")
+        arch.cursor.executemany(
+            arch._stmt_insert, [(str(i),) for i in range(10)])
+
+        self.assertTrue(arch.check({"id": 5}))
+        self.assertFalse(arch.check({"id": 10}))
+        self.assertEqual(arch.filters[""].count, 10)
+
+    def test_concurrent(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "archive.sqlite3")
+            arch = archive.connect(path, "{category}", "{id}", mode="preload")
+            other = archive.connect(path, "{category}", "{id}")
+            try:
+                self.assertFalse(arch.check({"category": "foo", "id": 1}))
+                self.assertIsNot(arch._version, False)
+
+                # added by another connection after preloading 'foo'
+                other.add({"category": "foo", "id": 1})
+                self.assertNotIn("foo1", arch.filters["foo"])
+                self.assertTrue(arch.check({"category": "foo", "id": 1}))
+                self.assertFalse(arch.check({"category": "foo", "id": 2}))
+                self.assertIs(arch._version, False)
+            finally:
+                arch.close()
+                other.close()
+
+
+class TestDownloadArchiveBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "archive.sqlite3")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _connect(self, size=3, interval=10.0):
+        return archive.connect(
+            self.path, "{category}", "{id}", mode="batch",
+            batch=(size, interval))
+
+    def _entries(self):
+        con = sqlite3.connect(self.path)
+        try:
+            return {row[0] for row in con.execute("SELECT entry FROM archive")}
+        finally:
+            con.close()
+
+    def test_connect(self):
+        arch = self._connect(5, 2.5)
+        self.assertIsInstance(arch, archive.DownloadArchiveBatch)
+        self.assertEqual(arch.batch_size, 5)
+        self.assertEqual(arch.batch_interval, 2.5)
+
+        arch.cursor.execute("PRAGMA journal_mode")
+        self.assertEqual(arch.cursor.fetchone()[0], "wal")
+        arch.cursor.execute("PRAGMA synchronous")
+        self.assertEqual(arch.cursor.fetchone()[0], 1)  # NORMAL
+        arch.close()
+
+    def test_batch_size(self):
+        arch = self._connect(3)
+
+        arch.add({"category": "test", "id": 1})
+        arch.add({"category": "test", "id": 2})
+        self.assertEqual(self._entries(), set())
+        self.assertTrue(arch.check({"category": "test", "id": 1}))
+
+        arch.add({"category": "test", "id": 3})
+        self.assertEqual(self._entries(), {"test1", "test2", "test3"})
+        self.assertEqual(arch.keys, set())
+        self.assertTrue(arch.check({"category": "test", "id": 1}))
+
+        arch.add({"category": "test", "id": 4})
+        arch.close()
+        self.assertEqual(len(self._entries()), 4)
+
+    def test_batch_interval(self):
+        arch = self._connect(100, 5.0)
+
+        with patch("time.monotonic") as monotonic:
+            monotonic.return_value = 100.0
+            arch.add({"category": "test", "id": 1})
+            monotonic.return_value = 104.0
+            arch.add({"category": "test", "id": 2})
+            self.assertEqual(self._entries(), set())
+
+            monotonic.return_value = 105.0
+            arch.add({"category": "test", "id": 3})
+            self.assertEqual(len(self._entries()), 3)
+
+            # deadline restarts with the next pending ID
+            monotonic.return_value = 200.0
+            arch.add({"category": "test", "id": 4})
+            self.assertEqual(len(self._entries()), 3)
+        arch.finalize()
+        self.assertEqual(len(self._entries()), 4)
+        arch.close()
+
+    def test_signals(self):
+        handlers = {
+            signum: signal.getsignal(signum)
+            for signum in (signal.SIGTERM, getattr(signal, "SIGHUP", None))
+            if signum is not None
+        }
+        arch = self._connect()
+        for signum, handler in handlers.items():
+            self.assertIs(signal.getsignal(signum), handler)
+        arch.close()
+
+    def test_signals_enabled(self):
+        init_signals = archive._init_signals
+        with patch.object(archive, "SIGNALS", True), \
+                patch.object(archive, "_init_signals", init_signals), \
+                patch("signal.getsignal", return_value=signal.SIG_DFL), \
+                patch("signal.signal") as set_signal:
+            self._connect().close()
+            self._connect().close()
+
+        signums = [args[0] for args, _ in set_signal.call_args_list]
+        self.assertIn(signal.SIGTERM, signums)
+        self.assertEqual(len(signums), len(set(signums)))
+        for args, _ in set_signal.call_args_list:
+            self.assertIs(args[1], archive._signal_exit)
+
+        # other modes
+        with patch.object(archive, "SIGNALS", True), \
+                patch.object(archive, "_init_signals") as init:
+            archive.connect(self.path, "", "{id}").close()
+        init.assert_not_called()
+
+    def test_atexit(self):
+        with patch("gallery_dl.archive.atexit") as atexit:
+            arch = self._connect()
+            atexit.register.assert_called_once_with(arch.flush)
+            arch.add({"category": "test", "id": 1})
+
+            # what atexit would do
+            atexit.register.call_args[0][0]()
+            self.assertEqual(self._entries(), {"test1"})
+
+            arch.close()
+            atexit.unregister.assert_called_once_with(arch.flush)
+
+    def test_flush_rollback(self):
+        arch = self._connect(2)
+        arch.add({"category": "test", "id": 1})
+
+        with patch.object(arch, "_stmt_insert", "INSERT INTO foo"):
+            with self.assertRaises(sqlite3.OperationalError):
+                arch.add({"category": "test", "id": 2})
+        self.assertFalse(arch.connection.in_transaction)
+        self.assertEqual(len(arch.keys), 2)
+
+        arch.close()
+        self.assertEqual(self._entries(), {"test1", "test2"})
+
+
+class TestConnections(unittest.TestCase):
+
+    def tearDown(self):
+        archive.CONNECTIONS = None
+
+    def test_shared(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "archive.sqlite3")
+            archive.CONNECTIONS = {}
+
+            arch1 = archive.connect(path, "{category}", "{id}")
+            arch1.add({"category": "test", "id": 1})
+            arch1.close()
+
+            arch2 = archive.connect(path, "{category}", "{id}", mode="batch")
+            self.assertIs(arch2.connection, arch1.connection)
+            self.assertTrue(arch2.check({"category": "test", "id": 1}))
+            arch2.add({"category": "test", "id": 2})
+            arch2.close()
+
+            self.assertEqual(list(archive.CONNECTIONS), [path])
+            self.assertTrue(arch1.check({"category": "test", "id": 2}))
+            arch1.connection.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
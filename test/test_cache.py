@@ -10,10 +10,17 @@
 import os
 import sys
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, Mock
+
+import time
+import pickle
+import sqlite3
+import tempfile
+import threading
+import requests
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from gallery_dl import extractor, cache, config, util  # noqa E402
+from gallery_dl import extractor, cache, config, util, lru  # noqa E402
 from gallery_dl.extractor.common import CACHE_MEMORY as CACHE  # noqa E402
 
 
@@ -220,5 +227,318 @@ class TestCache(unittest.TestCase):
         self.assertEqual(CACHE["test.db-2"], (6, 0))
 
 
+class TestDatabase(unittest.TestCase):
+
+    def test_namespace(self):
+        self.assertEqual(
+            cache.namespace("gallery_dl.extractor.pixiv"), "pixiv")
+        self.assertEqual(cache.namespace("test"), "test")
+
+    def test_get_clear(self):
+        db = cache.database()
+        with db:
+            db.execute("DELETE FROM entries")
+            cache.store(db, "foo", "a-1", 1)
+            cache.store(db, "foo", "b", 2, int(time.time()) - 10)
+            cache.store(db, "bar", "a-1", 3, int(time.time()) + 10)
+
+        self.assertEqual(
+            [(k, pickle.loads(v)) for k, v, _ in cache.get("FOO")],
+            [("a-1", 1), ("b", 2)])
+        self.assertEqual(
+            [k for k, _, _ in cache.get("EXP")], ["foo.b"])
+        self.assertEqual(
+            [k for k, _, _ in cache.get("VAL")], ["bar.a-1"])
+        self.assertEqual(len(list(cache.get("ALL"))), 3)
+
+        self.assertEqual(cache.load(db, "foo", "a-1"), (1, 0))
+        self.assertIsNone(cache.load(db, "foo", "b", int(time.time())))
+
+        self.assertEqual(cache.clear("EXP"), 1)
+        self.assertEqual(cache.clear("foo"), 1)
+        self.assertEqual(cache.clear("ALL"), 1)
+
+    def test_load_store_many(self):
+        db = cache.database()
+        now = int(time.time())
+        with db:
+            db.execute("DELETE FROM entries")
+            cache.store_many(db, "foo", [(str(i), i) for i in range(600)])
+            cache.store_many(db, "foo", [("a", "b")], now - 10)
+            cache.store_many(db, "bar", [("1", 2)])
+
+        keys = [str(i) for i in range(0, 1200, 2)] + ["a"]
+        self.assertEqual(
+            cache.load_many(db, "foo", keys, now),
+            {str(i): i for i in range(0, 600, 2)})
+        self.assertEqual(cache.load_many(db, "foo", ["a"]), {"a": "b"})
+        self.assertEqual(cache.load_many(db, "foo", ()), {})
+        self.assertEqual(cache.clear("ALL"), 602)
+
+    def test_migrate(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "cache.sqlite3")
+            db = sqlite3.connect(path)
+            with db:
+                db.execute("CREATE TABLE data (key TEXT PRIMARY KEY, "
+                           "value TEXT, expires INTEGER)")
+                db.executemany("INSERT INTO data VALUES (?,?,?)", (
+                    ("gallery_dl.extractor.pixiv._login_impl-user.name",
+                     pickle.dumps("token"), 123),
+                    ("gallery_dl.extractor.generic.watermark-generic.x-x/y",
+                     pickle.dumps(1), 0),
+                    ("test.db", pickle.dumps(2), 0),
+                ))
+
+            cache._setup(db, True)
+            self.assertEqual(
+                db.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            # old table stays available for older versions
+            self.assertEqual(
+                db.execute("SELECT COUNT(*) FROM data").fetchone()[0], 3)
+            self.assertEqual(
+                db.execute("PRAGMA user_version").fetchone()[0], 1)
+            self.assertEqual(
+                db.execute("SELECT module, key, expires FROM entries "
+                           "ORDER BY module").fetchall(),
+                [("generic", "watermark-generic.x-x/y", 0),
+                 ("pixiv", "_login_impl-user.name", 123),
+                 ("test", "db", 0)])
+            self.assertEqual(
+                cache.load(db, "pixiv", "_login_impl-user.name"),
+                ("token", 123))
+
+            # running it again does not change anything
+            with db:
+                db.execute("DELETE FROM entries WHERE module='test'")
+            cache._setup(db, True)
+            self.assertEqual(
+                db.execute("SELECT COUNT(*) FROM entries").fetchone()[0], 2)
+            db.close()
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_evict(self):
+        cache = lru.LRUCache("test", 3)
+        for key in "abc":
+            cache[key] = key.upper()
+        self.assertEqual(cache["a"], "A")
+
+        cache["d"] = "D"
+        self.assertEqual(list(cache), ["c", "a", "d"])
+        with self.assertRaises(KeyError):
+            cache["b"]
+
+        self.assertEqual(
+            (cache.hits, cache.misses, cache.evictions), (1, 1, 1))
+
+    def test_get(self):
+        cache = lru.LRUCache("test", 3)
+        for key in "abc":
+            cache[key] = key.upper()
+        self.assertEqual(cache.get("a"), "A")
+        self.assertEqual(cache.get("x", "X"), "X")
+        self.assertIsNone(cache.get("y"))
+        self.assertEqual(list(cache), ["b", "c", "a"])
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_threads(self):
+        cache = lru.LRUCache("test", 256, True)
+        expires = time.time() + 60
+
+        errors = []
+
+        def run(offset):
+            try:
+                for i in range(5000):
+                    key = (i * 7 + offset) % 300
+                    cache[key] = (i, expires if i & 1 else 0)
+                    try:
+                        cache[(key * 3) % 300]
+                    except KeyError:
+                        pass
+            except Exception as exc:
+                errors.append(exc)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=run, args=(n,))
+                       for n in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(cache), 256)
+
+    def test_evict_expired(self):
+        cache = lru.LRUCache("test", 3, True)
+        now = time.time()
+        cache["a"] = (1, 0)
+        cache["b"] = (2, now - 10)
+        cache["c"] = (3, now + 10)
+        cache["d"] = (4, now - 10)
+        cache["e"] = (5, 0)
+
+        self.assertEqual(list(cache), ["a", "c", "e"])
+        self.assertEqual(cache.evictions, 2)
+
+        cache["f"] = (6, now + 10)
+        self.assertEqual(list(cache), ["c", "e", "f"])
+        self.assertEqual(cache.evictions, 3)
+
+    def test_registry(self):
+        self.assertIs(lru.CACHES["memory"], CACHE)
+        self.assertIn("pattern", lru.CACHES)
+        self.assertIn("formatter", lru.CACHES)
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        config.set(("extractor",), "http-cache", True)
+        self.extr = extractor.find("noop")
+        self.extr.initialize()
+        self.session = requests.Session()
+        self.session.headers = {"User-Agent": "UA"}
+        self.session.trust_env = False
+        self.session.request = Mock()
+        cache.database().execute("DELETE FROM http")
+        cache.ResponseCache.stats.update(hit=0, miss=0, store=0)
+
+    def tearDown(self):
+        config.clear()
+
+    def _response(self, status, content=b"", headers=None):
+        response = requests.Response()
+        response.status_code = status
+        response.url = "https://example.org/"
+        response._content = content
+        if headers:
+            response.headers.update(headers)
+        return response
+
+    def _request(self, url="https://example.org/", **kwargs):
+        return self.extr.request(url, session=self.session, **kwargs)
+
+    def test_revalidate(self):
+        self.session.request.return_value = self._response(
+            200, b"foo", {"ETag": '"abc"', "Content-Type": "text/plain"})
+        self.assertEqual(self._request().content, b"foo")
+
+        _, kwargs = self.session.request.call_args
+        self.assertNotIn("If-None-Match", kwargs.get("headers") or ())
+
+        self.session.request.return_value = self._response(304)
+        response = self._request(headers={"Accept": "*/*"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"foo")
+        self.assertEqual(response.headers["Content-Type"], "text/plain")
+
+        _, kwargs = self.session.request.call_args
+        self.assertEqual(kwargs["headers"], {
+            "Accept": "*/*", "If-None-Match": '"abc"'})
+        self.assertEqual(cache.ResponseCache.stats, {
+            "hit": 1, "miss": 1, "store": 1})
+
+    def test_not_stored(self):
+        self.session.request.return_value = self._response(200, b"foo")
+        self._request()
+        self.session.request.return_value = self._response(
+            200, b"foo", {"ETag": "abc", "Cache-Control": "no-store"})
+        self._request()
+        self.session.request.return_value = self._response(
+            200, b"foo", {"ETag": "abc", "Vary": "*"})
+        self._request()
+        self.session.request.return_value = self._response(
+            200, b"foo", {"ETag": "abc"})
+        self._request(stream=True)
+        self._request(method="POST")
+
+        self.assertEqual(cache.ResponseCache.stats, {
+            "hit": 0, "miss": 3, "store": 0})
+        for _, kwargs in self.session.request.call_args_list:
+            self.assertNotIn("If-None-Match", kwargs.get("headers") or ())
+
+    def test_vary(self):
+        self.session.request.return_value = self._response(
+            200, b"foo", {"Last-Modified": "Sat, 17 Oct 2026 00:00:00 GMT",
+                          "Vary": "User-Agent"})
+        self._request()
+
+        self.session.headers["User-Agent"] = "UA2"
+        self._request()
+        _, kwargs = self.session.request.call_args
+        self.assertNotIn("If-Modified-Since", kwargs.get("headers") or ())
+
+        self._request(headers={"User-Agent": "UA2"})
+        _, kwargs = self.session.request.call_args
+        self.assertEqual(
+            kwargs["headers"]["If-Modified-Since"],
+            "Sat, 17 Oct 2026 00:00:00 GMT")
+
+    def test_range(self):
+        self.session.request.return_value = self._response(
+            206, b"12", {"ETag": "abc", "Content-Range": "bytes 0-1/4"})
+        self._request(headers={"Range": "bytes=0-1"})
+
+        self._request(headers={"Range": "bytes=2-3"})
+        _, kwargs = self.session.request.call_args
+        self.assertNotIn("If-None-Match", kwargs["headers"])
+
+        self.session.request.return_value = self._response(304)
+        response = self._request(headers={"Range": "bytes=0-1"})
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.content, b"12")
+        self.assertEqual(response.headers["Content-Range"], "bytes 0-1/4")
+
+    def test_key(self):
+        self.session.request.return_value = self._response(
+            200, b"foo", {"ETag": "abc"})
+        self._request(params={"page": 1})
+
+        def conditional(**kwargs):
+            self._request(**kwargs)
+            _, kwargs = self.session.request.call_args
+            return "If-None-Match" in (kwargs.get("headers") or ())
+
+        self.assertFalse(conditional(params={"page": 2}))
+        self.assertFalse(conditional())
+        self.assertTrue(conditional(params={"page": 1}))
+        self.assertTrue(conditional(url="https://example.org/?page=1"))
+
+        self.assertFalse(conditional(
+            params={"page": 1}, headers={"Authorization": "Bearer foo"}))
+        self.assertFalse(conditional(
+            params={"page": 1}, cookies={"session": "foo"}))
+        self.session.cookies.set("session", "foo")
+        self.assertTrue(conditional(params={"page": 1}))
+        self.session.cookies.set("session", "bar")
+        self.assertFalse(conditional(params={"page": 1}))
+
+    def test_evict(self):
+        config.set(("cache",), "http-size", 10)
+        rcache = cache.ResponseCache(60)
+        response = self._response(200, b"1234", {"ETag": "abc"})
+
+        for key in "abc":
+            rcache.store(key, {}, response)
+        db = cache.database()
+        db.executemany("UPDATE http SET accessed=? WHERE key=?", (
+            (1, "b"), (2, "a"), (3, "c")))
+        rcache.store("d", {}, response)
+
+        self.assertIsNone(rcache.lookup("a", {}))
+        self.assertIsNone(rcache.lookup("b", {}))
+        self.assertEqual(
+            rcache.lookup("c", {}), (200, {"ETag": "abc"}, b"1234"))
+        self.assertIsNotNone(rcache.lookup("d", {}))
+
+
 if __name__ == "__main__":
     unittest.main()
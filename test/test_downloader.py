@@ -12,9 +12,11 @@ import sys
 import unittest
 from unittest.mock import Mock, MagicMock, patch
 
+import io
 import re
 import logging
 import os.path
+import hashlib
 import binascii
 import tempfile
 import threading
@@ -37,6 +39,8 @@ class FakeJob():
         self.pathfmt = path.PathFormat(self.extractor)
         self.out = output.NullOutput()
         self.get_logger = logging.getLogger
+        self.digests = set()
+        self.stream = None
 
 
 class TestDownloaderModule(unittest.TestCase):
@@ -259,6 +263,7 @@ class TestHTTPDownloader(TestDownloaderBase):
 
     def tearDown(self):
         self.downloader.minsize = self.downloader.maxsize = None
+        self.downloader.digests = ()
 
     def test_http_download(self):
         self._run_test("jpg", None, DATA["jpg"], "jpg", "jpg")
@@ -307,6 +312,184 @@ class TestHTTPDownloader(TestDownloaderBase):
         self.assertEqual(log_info.output[0],
                          "WARNING:downloader.http:Empty file")
 
+    def test_http_digests(self):
+        self.downloader.digests = ("md5", "sha256")
+        data = DATA["jpg"]
+
+        # complete download
+        pathfmt = self._prepare_destination(None, extension="jpg")
+        self.assertTrue(self.downloader.download(
+            f"{self.address}/jpg", pathfmt))
+        self._check_digests(pathfmt, data)
+
+        # resumed download
+        pathfmt = self._prepare_destination(None, extension="jpg")
+        os.makedirs(pathfmt.realdirectory, exist_ok=True)
+        with open(pathfmt.realpath + ".part", "wb") as fp:
+            fp.write(data[:123])
+        self.assertTrue(self.downloader.download(
+            f"{self.address}/jpg", pathfmt))
+        self._check_digests(pathfmt, data)
+
+    def _check_digests(self, pathfmt, data):
+        digests = pathfmt.kwdict["_digests"]
+        self.assertEqual(digests["path"], pathfmt.temppath)
+        self.assertEqual(digests["size"], len(data))
+        self.assertEqual(digests["hexdigests"], {
+            "md5"   : hashlib.md5(data).hexdigest(),
+            "sha256": hashlib.sha256(data).hexdigest(),
+        })
+
+    def test_http_stream(self):
+        streams = []
+
+        def stream(pathfmt, size):
+            fp = Stream()
+            streams.append((pathfmt.filename, size, fp))
+            return fp
+
+        class Stream(io.BytesIO):
+            committed = False
+
+            def commit(self):
+                self.committed = True
+                self.value = self.getvalue()
+
+        self.downloader.stream = stream
+        try:
+            pathfmt = self._prepare_destination(None, extension="jpg")
+            self.assertTrue(self.downloader.download(
+                f"{self.address}/jpg", pathfmt))
+        finally:
+            self.downloader.stream = None
+
+        self.assertFalse(os.path.exists(pathfmt.temppath))
+        name, size, fp = streams[0]
+        self.assertEqual(name, pathfmt.filename)
+        self.assertEqual(size, len(DATA["jpg"]))
+        self.assertTrue(fp.committed)
+        self.assertTrue(fp.closed)
+        self.assertEqual(fp.value, DATA["jpg"])
+
+    def test_http_segments(self):
+        downloader = self._segments_downloader()
+        pathfmt = self._prepare_destination(None, extension="bin")
+
+        HttpRequestHandler.ranges = ranges = []
+        self.assertTrue(downloader.download(
+            f"{self.address}/large", pathfmt))
+        with pathfmt.open("rb") as fp:
+            self.assertEqual(fp.read(), DATA["large"])
+        self.assertFalse(os.path.exists(pathfmt.temppath + ".segments"))
+        self.assertEqual(ranges[0], None)
+        self.assertEqual(sorted(ranges[1:]), [
+            "bytes=0-33332", "bytes=33333-66665", "bytes=66666-99998"])
+
+    def test_http_segments_resume(self):
+        downloader = self._segments_downloader()
+        pathfmt = self._prepare_destination(None, extension="bin")
+        path = pathfmt.realpath + ".part"
+
+        # interrupted download with 2 incomplete and 1 finished segment
+        data = DATA["large"]
+        os.makedirs(pathfmt.realdirectory, exist_ok=True)
+        with open(path, "wb") as fp:
+            fp.write(data[:100])
+            fp.truncate(len(data))
+        downloader._segments_save(path + ".segments", len(data), [
+            [100, 33332], [33333, 66665], [99999, 99998]])
+
+        HttpRequestHandler.ranges = ranges = []
+        self.assertTrue(downloader.download(
+            f"{self.address}/large", pathfmt))
+        with pathfmt.open("rb") as fp:
+            content = fp.read()
+        self.assertEqual(content[:66666], data[:66666])
+        self.assertEqual(content[66666:], bytes(33333))
+        self.assertEqual(ranges[0], None)
+        self.assertEqual(sorted(ranges[1:]), [
+            "bytes=100-33332", "bytes=33333-66665"])
+
+    def test_http_segments_encoding(self):
+        downloader = self._segments_downloader()
+        pathfmt = self._prepare_destination(None, extension="bin")
+
+        HttpRequestHandler.ranges = ranges = []
+        HttpRequestHandler.encodings = encodings = []
+        try:
+            self.assertTrue(downloader.download(
+                f"{self.address}/large", pathfmt))
+            self.assertEqual(encodings[1:], ["identity"] * 3)
+
+            # no segments for compressed responses
+            HttpRequestHandler.gzip = True
+            ranges.clear()
+            pathfmt = self._prepare_destination(None, extension="bin")
+            self.assertTrue(downloader.download(
+                f"{self.address}/large", pathfmt))
+        finally:
+            HttpRequestHandler.gzip = False
+            HttpRequestHandler.encodings = None
+        with pathfmt.open("rb") as fp:
+            self.assertEqual(fp.read(), DATA["large"])
+        self.assertEqual(ranges, [None])
+
+    def test_http_segments_429(self):
+        downloader = self._segments_downloader()
+        downloader.interval_429 = lambda tries: 60.0
+        pathfmt = self._prepare_destination(None, extension="bin")
+
+        HttpRequestHandler.fail = [429]
+        try:
+            with patch("gallery_dl.util.RateLimiter.block") as block:
+                self.assertTrue(downloader.download(
+                    f"{self.address}/large", pathfmt))
+        finally:
+            HttpRequestHandler.fail = None
+        with pathfmt.open("rb") as fp:
+            self.assertEqual(fp.read(), DATA["large"])
+        block.assert_called_once_with(5.0)
+
+    def test_http_segments_fallback(self):
+        downloader = self._segments_downloader()
+
+        for mode in ("ignore", "offset"):
+            pathfmt = self._prepare_destination(None, extension="bin")
+            HttpRequestHandler.ranges = ranges = []
+            HttpRequestHandler.invalid = mode
+            try:
+                with self.assertLogs(downloader.log, "WARNING"):
+                    self.assertTrue(downloader.download(
+                        f"{self.address}/large", pathfmt))
+            finally:
+                HttpRequestHandler.invalid = None
+
+            with pathfmt.open("rb") as fp:
+                self.assertEqual(fp.read(), DATA["large"])
+            self.assertFalse(os.path.exists(pathfmt.temppath + ".segments"))
+            self.assertEqual(ranges[0], None)
+            self.assertEqual(ranges[-1], None)
+
+    def test_http_segments_digests(self):
+        downloader = self._segments_downloader()
+        downloader.digests = ("md5", "sha256")
+        pathfmt = self._prepare_destination(None, extension="bin")
+
+        HttpRequestHandler.ranges = ranges = []
+        self.assertTrue(downloader.download(
+            f"{self.address}/large", pathfmt))
+        self.assertEqual(len(ranges), 4)
+        self._check_digests(pathfmt, DATA["large"])
+
+    def _segments_downloader(self):
+        config.set(("downloader", "http"), "segments", 3)
+        config.set(("downloader", "http"), "segments-threshold", "64k")
+        try:
+            return downloader.find("http")(self.job)
+        finally:
+            config.unset(("downloader", "http"), "segments")
+            config.unset(("downloader", "http"), "segments-threshold")
+
 
 class TestTextDownloader(TestDownloaderBase):
 
@@ -326,6 +509,11 @@ class TestTextDownloader(TestDownloaderBase):
 
 
 class HttpRequestHandler(http.server.BaseHTTPRequestHandler):
+    ranges = None
+    encodings = None
+    gzip = False
+    fail = None
+    invalid = None
 
     def do_GET(self):
         try:
@@ -336,16 +524,41 @@ class HttpRequestHandler(http.server.BaseHTTPRequestHandler):
             return
 
         headers = {"Content-Length": len(output)}
-
-        if "Range" in self.headers:
+        if self.path == "/large":
+            headers["Accept-Ranges"] = "bytes"
+            if self.ranges is not None:
+                self.ranges.append(self.headers.get("Range"))
+            if self.encodings is not None:
+                self.encodings.append(self.headers.get("Accept-Encoding"))
+
+            if self.fail and "Range" in self.headers:
+                self.send_response(self.fail.pop())
+                self.send_header("Retry-After", "5")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            if self.gzip and "Range" not in self.headers:
+                import gzip
+                output = gzip.compress(output)
+                headers["Content-Length"] = len(output)
+                headers["Content-Encoding"] = "gzip"
+
+        if self.invalid == "ignore":
+            status = 200
+        elif "Range" in self.headers:
             status = 206
 
-            match = re.match(r"bytes=(\d+)-", self.headers["Range"])
+            match = re.match(r"bytes=(\d+)-(\d*)", self.headers["Range"])
             start = int(match[1])
+            end = int(match[2]) if match[2] else len(output) - 1
 
+            if self.invalid == "offset":
+                start += 1
             headers["Content-Range"] = \
-                f"bytes {start}-{len(output) - 1}/{len(output)}"
-            output = output[start:]
+                f"bytes {start}-{end}/{len(output)}"
+            headers["Content-Length"] = end + 1 - start
+            output = output[start:end+1]
         else:
             status = 200
 
@@ -424,6 +637,8 @@ for ext, content in SAMPLES:
 for idx, (_, content) in enumerate(SAMPLES):
     DATA[f"S{idx:>02}"] = content
 
+DATA["large"] = bytes(range(256)) * 390 + bytes(159)
+
 
 # reverse mime types mapping
 MIME_TYPES = {
@@ -10,14 +10,19 @@
 import os
 import sys
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, Mock
 
 import time
 import string
+import logging
+import hashlib
+import tempfile
+import threading
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from gallery_dl import extractor, util, dt, config, cache  # noqa E402
-from gallery_dl.extractor import mastodon  # noqa E402
+from gallery_dl.extractor import (  # noqa E402
+    booru, gelbooru_v02, mastodon, nozomi)
 from gallery_dl.extractor.common import Extractor, Message  # noqa E402
 from gallery_dl.extractor.directlink import DirectlinkExtractor  # noqa E402
 
@@ -65,6 +70,7 @@ class TestExtractorModule(unittest.TestCase):
         extractor._cache.clear()
         extractor._module_iter = extractor._modules_internal()
         extractor._list_classes = _list_classes
+        extractor._index = None
 
     def test_find(self):
         for uri in self.VALID_URIS:
@@ -109,6 +115,41 @@ class TestExtractorModule(unittest.TestCase):
             with self.assertRaises(TypeError):
                 FakeExtractor.from_url(invalid)
 
+    def test_index(self):
+        from gallery_dl.extractor import index
+
+        classes = [
+            (cls.__module__.rpartition(".")[2], cls.__name__)
+            for cls in extractor._list_classes()
+        ]
+        self.assertEqual(
+            list(index.CLASSES), classes,
+            "outdated extractor index - run 'make index'")
+
+    def test_index_lookup(self):
+        extractor._index_load()
+        self.assertTrue(extractor._index)
+
+        urls = [
+            cls.example
+            for cls in extractor._list_classes()
+            if hasattr(cls, "example")
+        ]
+        if results:
+            urls.extend(result["#url"] for result in results.all())
+        urls.extend(self.VALID_URIS)
+
+        for url in urls:
+            expected = self._find_class(extractor._list_classes(), url)
+            self.assertIs(
+                self._find_class(extractor._index_lookup(url), url),
+                expected, url)
+
+    def _find_class(self, classes, url):
+        for cls in classes:
+            if cls.pattern.match(url):
+                return cls
+
     @unittest.skipIf(not results, "no test data")
     def test_categories(self):
         for result in results.all():
@@ -292,6 +333,41 @@ class TestExtractorWait(unittest.TestCase):
         return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
 
 
+class TestExtractorRequest(unittest.TestCase):
+
+    def setUp(self):
+        self.extr = extractor.find("generic:https://example.org/")
+        self.extr.initialize()
+        self.limiter = Mock()
+        self.limiter.acquire.return_value = 0.0
+
+    def _response(self, status):
+        return Mock(status_code=status, reason="", headers={},
+                    url="https://example.org/")
+
+    def test_ratelimiter(self):
+        self.extr.session.request = Mock(side_effect=[
+            self._response(500),
+            self._response(429),
+            self._response(200),
+        ])
+        with patch.object(util, "ratelimiter", return_value=self.limiter), \
+                patch.object(self.extr, "sleep"), \
+                patch.object(self.extr, "wait"):
+            response = self.extr.request("https://example.org/")
+
+        self.assertEqual(response.status_code, 200)
+        # every attempt acquires and releases a slot
+        self.assertEqual(self.limiter.acquire.call_count, 3)
+        self.assertEqual(self.limiter.release.call_count, 3)
+
+    def test_ratelimiter_disabled(self):
+        self.extr.session.request = Mock(return_value=self._response(200))
+        with patch.object(util, "ratelimiter") as ratelimiter:
+            self.extr.request("https://example.org/", interval=False)
+        ratelimiter.assert_not_called()
+
+
 class TextExtractorCommonDateminmax(unittest.TestCase):
 
     def setUp(self):
@@ -363,6 +439,266 @@ class TextExtractorCommonDateminmax(unittest.TestCase):
         self.assertEqual(dmax, 1262304061)
 
 
+class TestExtractorWatermark(unittest.TestCase):
+
+    def setUp(self):
+        config.set((), "watermark", True)
+
+    def tearDown(self):
+        config.unset((), "watermark")
+
+    def _watermark(self, url="generic:https://example.org/watermark"):
+        extr = extractor.find(url)
+        watermark = extr._init_watermark()
+        self.assertIs(extr.watermark, watermark)
+        return watermark
+
+    def test_disabled(self):
+        config.set((), "watermark", False)
+        extr = extractor.find("generic:https://example.org/")
+        self.assertIsNone(extr._init_watermark())
+        self.assertIsNone(extr.watermark)
+
+    def test_filter(self):
+        watermark = self._watermark("generic:https://example.org/filter")
+        self.assertIsNone(watermark.value)
+
+        posts = [{"id": 5, "pinned": True}, {"id": 9}, {"id": 8}, {"id": 3}]
+        key = lambda p: None if "pinned" in p else p["id"]  # noqa E731
+
+        self.assertEqual(list(watermark.filter(posts, key)), posts)
+        self.assertEqual(watermark.newest, 9)
+        watermark.commit()
+        self.assertEqual(watermark.value, 9)
+
+        watermark = self._watermark("generic:https://example.org/filter")
+        self.assertEqual(watermark.value, 9)
+        posts = [{"id": 5, "pinned": True}, {"id": 11}, {"id": 10},
+                 {"id": 9}, {"id": 8}]
+        self.assertEqual(list(watermark.filter(posts, key)), posts[:3])
+        self.assertEqual(watermark.newest, 11)
+
+        # not committed
+        watermark = self._watermark("generic:https://example.org/filter")
+        self.assertEqual(watermark.value, 9)
+
+    def test_filter_format(self):
+        watermark = self._watermark("generic:https://example.org/format")
+        watermark.value = watermark.newest = "2026-10-01T00:00:00"
+
+        posts = [{"id": 1}, {"id": 2}]
+        self.assertEqual(
+            list(watermark.filter(posts, lambda p: (p["id"],))), posts)
+        self.assertEqual(watermark.newest, (2,))
+
+    def test_twitter(self):
+        from gallery_dl.extractor import twitter
+        key = twitter.TwitterExtractor._watermark_key
+
+        watermark = self._watermark("https://x.com/user/timeline")
+        watermark.value = watermark.newest = 100
+        tweets = [
+            {"id_str": "90", "pinned": True},
+            {"id_str": "120"},
+            # quote of 120
+            {"id_str": "10", "quoted_by_id_str": "120"},
+            # retweet 110 of 20 with 'retweets: original'
+            {"id_str": "20", "retweeted_status_id_str": "20",
+             "_retweet_id_str": "110"},
+            {"legacy": {"id_str": "105"}},
+            {"legacy": {"id_str": "5", "quoted_by_id_str": "105"}},
+            {"id_str": "100"},
+            {"id_str": "99"},
+        ]
+        self.assertEqual(
+            list(watermark.filter(tweets, lambda t: key(None, t))),
+            tweets[:6])
+        self.assertEqual(watermark.newest, 120)
+
+    def test_kemono(self):
+        from gallery_dl.extractor import kemono
+        key = kemono.KemonoUserExtractor._watermark_key
+
+        watermark = self._watermark("https://kemono.cr/patreon/user/123")
+        watermark.value = watermark.newest = key(
+            None, {"id": "99", "published": "2026-10-01T00:00:00"})
+        posts = [
+            {"id": "101", "published": "2026-10-02T00:00:00"},
+            {"id": "100", "published": "2026-10-01T00:00:00"},
+            {"id": "99", "published": "2026-10-01T00:00:00"},
+            {"id": "98", "published": "2026-10-01T00:00:00"},
+        ]
+        self.assertEqual(
+            list(watermark.filter(posts, lambda p: key(None, p))),
+            posts[:2])
+
+    def test_key(self):
+        w1 = self._watermark("generic:https://example.org/path/")
+        w2 = self._watermark("generic:http://example.org/path")
+        w3 = self._watermark("generic:https://example.org/Path")
+        self.assertEqual(w1.key, w2.key)
+        self.assertNotEqual(w1.key, w3.key)
+        self.assertEqual(w1.module, "generic")
+        self.assertEqual(
+            w1.key, "watermark-generic.example.org-example.org/path")
+
+    def test_normalize(self):
+        normalize = extractor.common.Watermark.normalize
+        self.assertEqual(normalize(None, "https://www.Example.org/a/B/"),
+                         "example.org/a/B")
+        self.assertEqual(normalize(None, "example.org"), "example.org")
+        self.assertEqual(normalize(None, "http://example.org/?q=1"),
+                         "example.org/?q=1")
+
+
+class TestExtractorPrefetch(unittest.TestCase):
+
+    def tearDown(self):
+        config.clear()
+
+    def _pages(self, num, log, exc=None):
+        try:
+            for i in range(num):
+                log.append(i)
+                yield [i*2, i*2+1]
+            if exc:
+                raise exc
+        finally:
+            log.append("close")
+
+    def test_prefetch(self):
+        log = []
+        pages = extractor.common.prefetch(self._pages(4, log), 2)
+        self.assertEqual([p for page in pages for p in page],
+                         [0, 1, 2, 3, 4, 5, 6, 7])
+        self.assertEqual(log, [0, 1, 2, 3, "close"])
+
+    def test_prefetch_ahead(self):
+        log = []
+        pages = extractor.common.prefetch(self._pages(10, log), 2)
+        self.assertEqual(next(pages), [0, 1])
+
+        for _ in range(50):
+            if len(log) >= 4:
+                break
+            time.sleep(0.01)
+        time.sleep(0.05)
+        # 1 consumed, 2 queued, 1 waiting to be queued
+        self.assertEqual(log, [0, 1, 2, 3])
+
+    def test_prefetch_close(self):
+        log = []
+        pages = extractor.common.prefetch(self._pages(100, log), 2)
+        self.assertEqual(next(pages), [0, 1])
+        pages.close()
+
+        for _ in range(50):
+            if log[-1] == "close":
+                break
+            time.sleep(0.01)
+        self.assertEqual(log[-1], "close")
+        self.assertLess(len(log), 10)
+
+    def test_prefetch_exception(self):
+        log = []
+        pages = extractor.common.prefetch(
+            self._pages(2, log, ValueError("foo")), 2)
+        self.assertEqual(next(pages), [0, 1])
+        self.assertEqual(next(pages), [2, 3])
+        with self.assertRaises(ValueError):
+            next(pages)
+
+    def test_option(self):
+        extr = extractor.find("generic:https://example.org/")
+        pages = iter(())
+
+        self.assertIs(extr.prefetch(pages), pages)
+        config.set((), "prefetch", 1)
+        self.assertIsNot(extr.prefetch(pages), pages)
+        config.set((), "prefetch", 0)
+        self.assertIs(extr.prefetch(pages), pages)
+
+    def test_prefetch_base_exception(self):
+        log = []
+        pages = extractor.common.prefetch(
+            self._pages(1, log, KeyboardInterrupt()), 2)
+        self.assertEqual(next(pages), [0, 1])
+        with self.assertRaises(KeyboardInterrupt):
+            next(pages)
+        self.assertEqual(log, [0, "close"])
+
+
+class TestTwitterRatelimit(unittest.TestCase):
+
+    def setUp(self):
+        from gallery_dl.extractor import twitter
+        self.api = api = twitter.TwitterAPI.__new__(twitter.TwitterAPI)
+        api.extractor = Mock(kwdict={})
+        self.key = "ratelimit-test-Endpoint"
+        twitter.RATELIMIT_STATE.clear()
+        if db := cache.database():
+            with db:
+                cache.delete(db, cache.namespace(twitter.__name__), self.key)
+
+    def _update(self, limit, remaining, reset):
+        response = Mock(headers={
+            "x-rate-limit-limit"    : str(limit),
+            "x-rate-limit-remaining": str(remaining),
+            "x-rate-limit-reset"    : str(reset),
+        })
+        self.api._ratelimit_update(self.key, response)
+        return self.api.extractor.kwdict["ratelimit"]
+
+    def _pace(self, now):
+        sleep = self.api.extractor.sleep
+        sleep.reset_mock()
+        with patch("time.time", return_value=now):
+            self.api._ratelimit_pace(self.key)
+        if sleep.call_args is None:
+            return 0.0
+        return sleep.call_args[0][0]
+
+    def _run(self):
+        now = float(int(time.time()))
+        reset = int(now) + 100
+
+        # no state yet
+        self.assertEqual(self._pace(now), 0.0)
+
+        info = self._update(50, 15, reset)
+        self.assertEqual(info["endpoint"], "Endpoint")
+        self.assertEqual(info["remaining"], 15)
+
+        # 10 requests over the budget of 15 minus 5 in reserve
+        interval = (reset - now) / 10
+        self.assertEqual(self._pace(now), 0.0)
+        self.assertAlmostEqual(self._pace(now), interval)
+        slot = now + interval
+        self.assertAlmostEqual(
+            self._pace(now), interval + (reset - slot) / 9)
+
+        # responses from other clients do not raise 'remaining'
+        self.assertEqual(self._update(50, 14, reset)["remaining"], 12)
+        self.assertEqual(self._update(50, 9, reset)["remaining"], 9)
+
+        # a new window replaces the previous state
+        self.assertEqual(self._update(50, 49, reset + 900)["remaining"], 49)
+
+        # an exhausted budget waits for the next window
+        self._update(50, 5, reset + 1800)
+        self.assertAlmostEqual(self._pace(now), reset + 1800 - now)
+
+    def test_memory(self):
+        with patch.object(cache, "database", return_value=None):
+            self._run()
+
+    def test_database(self):
+        if cache.database() is None:
+            raise unittest.SkipTest("no cache database")
+        self._run()
+        self.assertFalse(cache.database().in_transaction)
+
+
 class TextExtractorOAuth(unittest.TestCase):
 
     def test_oauth1(self):
@@ -412,5 +748,331 @@ class TextExtractorOAuth(unittest.TestCase):
             self.assertEqual(len(m.mock_calls), 1)
 
 
+class TestBooruTags(unittest.TestCase):
+
+    class Extractor(booru.BooruExtractor):
+        category = "test_booru"
+        per_page = 3
+
+        def __init__(self):
+            self.log = logging.getLogger("test")
+            self.requested = []
+            self.html = []
+
+        def _tag_types(self, names):
+            self.requested.append(sorted(names))
+            return {
+                name: gelbooru_v02.TAG_TYPES.get(TYPES[name])
+                for name in names if name in TYPES
+            }
+
+        def _html(self, post):
+            self.html.append(post["id"])
+
+    def setUp(self):
+        import sqlite3
+        self.db = sqlite3.connect(":memory:")
+        cache._setup(self.db, False)
+        patcher = patch.object(cache, "database", return_value=self.db)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.db.close)
+        booru.TAG_TYPES.clear()
+
+    def tearDown(self):
+        booru.TAG_TYPES.clear()
+
+    def _resolve(self, *tags):
+        extr = self.Extractor()
+        posts = [{"id": num, "tags": value} for num, value in enumerate(tags)]
+        return extr, list(extr._tags_resolve(posts))
+
+    def test_batches(self):
+        extr, posts = self._resolve(
+            "foo bar", "foo", "baz", "mcdonald&#039;s", "rock_&amp;_roll")
+        self.assertEqual(extr.requested, [
+            ["bar", "baz", "foo"],
+            ["mcdonald's", "rock_&_roll"],
+        ])
+        self.assertEqual(extr.html, [])
+        self.assertEqual(posts[0]["tags_general"], "foo")
+        self.assertEqual(posts[0]["tags_artist"], "bar")
+        self.assertEqual(posts[2]["tags_character"], "baz")
+        self.assertEqual(posts[3]["tags_copyright"], "mcdonald's")
+        self.assertEqual(posts[4]["tags_metadata"], "rock_&_roll")
+
+    def test_cache(self):
+        self._resolve("foo bar")
+
+        # in memory
+        extr, posts = self._resolve("bar foo")
+        self.assertEqual(extr.requested, [])
+        self.assertEqual(posts[0]["tags_artist"], "bar")
+
+        # in the database
+        booru.TAG_TYPES.clear()
+        extr, posts = self._resolve("foo baz")
+        self.assertEqual(extr.requested, [["baz"]])
+        self.assertEqual(posts[0]["tags_general"], "foo")
+        self.assertEqual(booru.TAG_TYPES[("test_booru", "foo")], "general")
+
+    def test_fallback(self):
+        extr, posts = self._resolve("foo", "foo other", "foo missing", "baz")
+        self.assertEqual(extr.requested, [
+            ["foo", "missing", "other"],
+            ["baz"],
+        ])
+        # unknown tag type or tag
+        self.assertEqual(extr.html, [1, 2])
+        self.assertNotIn("tags_general", posts[1])
+        self.assertEqual(posts[3]["tags_character"], "baz")
+
+        # unknown types are not stored in the database
+        booru.TAG_TYPES.clear()
+        extr, _ = self._resolve("other")
+        self.assertEqual(extr.requested, [["other"]])
+        self.assertEqual(extr.html, [0])
+
+
+TYPES = {
+    "foo": "0", "bar": "1", "baz": "4",
+    "mcdonald's": "3", "rock_&_roll": "5", "other": "2",
+}
+
+
+class TestNozomiSearch(unittest.TestCase):
+
+    def _search(self, positive, negative=(), index=()):
+        return list(nozomi.search_ids(
+            [self._array(ids) for ids in positive],
+            [self._array(ids) for ids in negative],
+            lambda: self._array(index),
+        ))
+
+    def _array(self, ids):
+        # nozomi files list IDs in descending order
+        return nozomi.array.array(nozomi.TYPECODE, ids)
+
+    def _expected(self, positive, negative=(), index=()):
+        result = None
+        for ids in positive:
+            if result is None:
+                result = set(ids)
+            else:
+                result.intersection_update(ids)
+        if result is None:
+            result = set(index)
+        for ids in negative:
+            result.difference_update(ids)
+        return sorted(result, reverse=True)
+
+    def _check(self, positive, negative=(), index=()):
+        self.assertEqual(
+            self._search(positive, negative, index),
+            self._expected(positive, negative, index),
+        )
+
+    def test_intersect(self):
+        a = range(100, 0, -1)
+        b = range(100, 0, -3)
+        self._check((a, b))
+        self._check((b, a))
+        self._check((a, b, range(90, 50, -2)))
+        self._check((a, ()))
+        self._check((a, range(300, 200, -1)))
+
+    def test_intersect_gallop(self):
+        large = range(10000, 0, -1)
+        self._check((large, (9000, 500, 7, 1)))
+        self._check(((20000, 10000, 5000, 3), large))
+        self._check((large, (10001, 10000)))
+
+    def test_subtract(self):
+        a = range(100, 0, -1)
+        self._check((a,), (range(100, 0, -3),))
+        self._check((a,), (range(150, 50, -1), range(10, 0, -2)))
+        self._check((a,), ((1000, 500, 100, 1),))
+        self._check(((100, 50, 1),), (range(10000, 0, -1),))
+        self._check(((1000, 100),), (range(10000, 500, -1),))
+        self._check((a,), ((),))
+
+    def test_index(self):
+        index = range(50, 0, -1)
+        self._check((), (), index)
+        self._check((), (range(50, 0, -2),), index)
+        self._check((), ((50, 1),), index)
+        self._check((), (), ())
+
+    def test_duplicates(self):
+        self._check(((5, 5, 3, 3, 1),))
+        self._check(((5, 5, 3, 3, 1), (5, 3, 3)))
+        self._check(((5, 3, 1), (5, 5, 3, 3, 3)))
+        self._check(((5, 5, 3), range(10000, 0, -1)))
+        self._check((range(10000, 0, -1), (7, 7, 7)))
+        self._check(((5, 5, 3, 1),), ((3, 3),))
+        self._check((), ((2, 2),), (3, 3, 2, 1, 1))
+
+    def test_unsorted(self):
+        self._check(((1, 5, 3), (3, 1, 9, 5)))
+        self._check(((3, 1, 2, 3),), ((2, 4),))
+        self._check((), (), (1, 3, 2))
+
+    def test_random(self):
+        import random
+        rand = random.Random(0)
+
+        def ids(universe):
+            # sizes differing by more than GALLOP and some duplicates
+            size = len(universe) // rand.choice((1, 2, 10, 50)) + 1
+            return sorted(rand.choices(universe, k=rand.randrange(size)),
+                          reverse=True)
+
+        for _ in range(50):
+            universe = range(1, rand.randrange(2, 3000))
+            self._check(
+                [ids(universe) for _ in range(rand.randrange(3))],
+                [ids(universe) for _ in range(rand.randrange(3))],
+                sorted(rand.sample(universe, len(universe) // 2),
+                       reverse=True),
+            )
+
+
+class TestNozomiIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.extr = Mock(log=logging.getLogger("test"))
+        self.index = nozomi.NozomiIndex(self.extr, self.dir.name)
+        self.url = "https://n.nozomi.la/index.nozomi"
+
+    def tearDown(self):
+        self.index.close()
+        self.dir.cleanup()
+
+    def _response(self, status, content=b"", headers=None):
+        return Mock(status_code=status, content=content,
+                    headers=headers or {})
+
+    def _get(self, response):
+        self.extr.request.return_value = response
+        self.index.close()
+        return bytes(self.index.get(self.url, {"Referer": "foo"}))
+
+    def _headers(self):
+        _, kwargs = self.extr.request.call_args
+        return kwargs["headers"]
+
+    def test_store_revalidate(self):
+        data = b"\x00\x00\x00\x01\x00\x00\x00\x02"
+        self.assertEqual(self._get(self._response(
+            200, data, {"ETag": "abc", "Last-Modified": "yesterday"})), data)
+        self.assertEqual(self._headers(), {"Referer": "foo"})
+        self.assertEqual(os.listdir(self.dir.name), [
+            hashlib.sha1(self.url.encode()).hexdigest()])
+
+        # not modified
+        self.assertEqual(self._get(self._response(304)), data)
+        self.assertEqual(self._headers(), {
+            "Referer": "foo",
+            "If-None-Match": "abc",
+            "If-Modified-Since": "yesterday",
+        })
+        self.assertEqual(len(self.index.maps), 1)
+
+        # cached for the rest of this run
+        self.extr.request.reset_mock()
+        self.index.get(self.url)
+        self.extr.request.assert_not_called()
+
+        # modified
+        self.assertEqual(self._get(self._response(
+            200, b"\x00\x00\x00\x03", {"ETag": "def"})),
+            b"\x00\x00\x00\x03")
+        self.assertEqual(self._get(self._response(304)),
+                         b"\x00\x00\x00\x03")
+        self.assertEqual(self._headers()["If-None-Match"], "def")
+        self.assertEqual(len(os.listdir(self.dir.name)), 1)
+
+    def test_no_validators(self):
+        self.assertEqual(self._get(self._response(200, b"1234")), b"1234")
+        self.assertEqual(os.listdir(self.dir.name), [])
+
+    def test_corrupt(self):
+        self._get(self._response(200, b"1234", {"ETag": "abc"}))
+        path = os.path.join(self.dir.name, os.listdir(self.dir.name)[0])
+
+        for content in (b"", b"1234", b"[1, 2]\n1234", b"\xff\n1234"):
+            with open(path, "wb") as fp:
+                fp.write(content)
+            self.assertEqual(self._get(self._response(
+                200, b"5678", {"ETag": "abc"})), b"5678")
+            self.assertEqual(self._headers(), {"Referer": "foo"})
+
+    def test_close(self):
+        self._get(self._response(200, b"1234", {"ETag": "abc"}))
+        self._get(self._response(304))
+        data = self.index.maps[0]
+        self.index.close()
+        self.assertTrue(data.closed)
+        self.assertEqual(self.index.maps, [])
+        self.assertEqual(self.index.files, {})
+
+
+class TestNozomiExtractor(unittest.TestCase):
+
+    def setUp(self):
+        self.extr = nozomi.NozomiPostExtractor.from_url(
+            "https://nozomi.la/post/12345.html")
+        self.extr.initialize()
+
+    def tearDown(self):
+        config.clear()
+
+    def _request(self, url, fatal=True):
+        post_id = url.rpartition("/")[2].partition(".")[0]
+        # later posts finish first
+        time.sleep((10 - int(post_id)) / 200)
+        if post_id == "3":
+            return Mock(status_code=404, reason="Not Found")
+        return Mock(status_code=200, json=lambda: {
+            "date": "2020-01-01 00:00:00-00",
+            "imageurls": [{"dataid": f"abc{post_id}", "type": "jpg"}],
+        })
+
+    def _items(self, workers):
+        config.set(("extractor", "nozomi"), "workers", workers)
+        with patch.object(self.extr, "request", side_effect=self._request), \
+                patch.object(self.extr, "posts", return_value=range(1, 6)):
+            return [
+                kwdict["filename"]
+                for msg, _, kwdict in (
+                    msg for msg in self.extr.items() if msg[0] == Message.Url)
+            ]
+
+    def test_workers(self):
+        expected = ["abc1", "abc2", "abc4", "abc5"]
+        for workers in (None, 0, 1, 3):
+            with self.assertLogs(self.extr.log.name, "WARNING") as cm:
+                self.assertEqual(self._items(workers), expected)
+            self.assertEqual(cm.output, [
+                "WARNING:nozomi:Skipping post 3 ('404 Not Found')"])
+
+    def test_fetch_threads(self):
+        config.set(("extractor", "nozomi"), "workers", 3)
+        threads = set()
+
+        def request(url, fatal=True):
+            threads.add(threading.current_thread().name)
+            return url.rpartition("/")[2]
+
+        with patch.object(self.extr, "request", side_effect=request):
+            results = list(self.extr._fetch(map(str, range(100, 110))))
+        self.assertEqual(results, [
+            (str(post_id), f"{post_id}.json")
+            for post_id in range(100, 110)
+        ])
+        self.assertTrue(all(name.startswith("nozomi") for name in threads))
+
+
 if __name__ == "__main__":
     unittest.main()
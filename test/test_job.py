@@ -10,12 +10,16 @@
 import os
 import sys
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, Mock
 
 import io
+import time
+import collections
+import tempfile
+import threading
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from gallery_dl import job, config, text  # noqa E402
+from gallery_dl import job, config, text, util  # noqa E402
 from gallery_dl.extractor.common import Extractor, Message  # noqa E402
 
 
@@ -44,6 +48,13 @@ class TestJob(unittest.TestCase):
 class TestDownloadJob(TestJob):
     jobclass = job.DownloadJob
 
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        TestJob.tearDown(self)
+        self.dir.cleanup()
+
     def test_extractor_filter(self):
         extr = TestExtractor.from_url("test:")
         tjob = self.jobclass(extr)
@@ -107,6 +118,356 @@ class TestDownloadJob(TestJob):
         # no output if '_extractor' is overwritten (#8958)
         self.assertEqual(out, "11\n")
 
+    def test_workers(self):
+        config.set((), "base-directory", self.dir.name)
+        config.set(("output",), "mode", False)
+        config.set(("downloader",), "workers", 3)
+        config.set((), "postprocessors", [{
+            "name"  : "metadata/print@after",
+            "format": "{num} {_thread}",
+        }])
+
+        def download(url, pathfmt):
+            # finish downloads in reverse order
+            time.sleep((4 - pathfmt.kwdict["num"]) / 20)
+            pathfmt.kwdict["_thread"] = threading.current_thread().name
+            with pathfmt.open() as fp:
+                fp.write(url.encode())
+            return True
+
+        extr = TestExtractor.from_url("test:")
+        tjob = self.jobclass(extr)
+        with patch.object(tjob, "download", download):
+            out = self._capture_stdout(tjob)
+
+        self.assertEqual(tjob.workers, 3)
+        self.assertEqual(tjob.status, 0)
+        lines = out.splitlines()
+        self.assertEqual([line[0] for line in lines], ["1", "2", "3"])
+        for line in lines:
+            self.assertTrue(line[2:].startswith("download"), line)
+
+        with open(os.path.join(
+                self.dir.name, "test_category", "test_2.jpg")) as fp:
+            self.assertEqual(fp.read(), "https://example.org/2.jpg")
+
+    def test_workers_skip(self):
+        config.set((), "base-directory", self.dir.name)
+        config.set(("output",), "mode", False)
+        config.set(("downloader",), "workers", 2)
+        config.set((), "skip", "abort:2")
+
+        directory = os.path.join(self.dir.name, "test_category")
+        os.makedirs(directory)
+        for num in (1, 3):
+            open(os.path.join(directory, f"test_{num}.jpg"), "w").close()
+
+        def download(url, pathfmt):
+            if pathfmt.kwdict["num"] == 2:
+                return False  # failed downloads do not reset the count
+            with pathfmt.open() as fp:
+                fp.write(url.encode())
+            return True
+
+        tjob = self.jobclass(TestExtractor.from_url("test:"))
+        with patch.object(tjob, "download", download), \
+                self.assertLogs(level="ERROR"):
+            tjob.run()
+        self.assertEqual(tjob._skipcnt, 2)
+
+    def test_workers_prepare(self):
+        config.set((), "base-directory", self.dir.name)
+        config.set(("downloader",), "workers", 3)
+        config.set((), "postprocessors", [{
+            "name"  : "metadata/print@prepare",
+            "format": "{num}",
+        }])
+
+        extr = TestExtractorNoop.from_url("test:noop")
+        tjob = self.jobclass(extr)
+        tjob.initialize()
+        self.assertEqual(tjob.workers, 0)
+        self.assertNotIn("handle_url", tjob.__dict__)
+
+    def test_stream_postprocessors(self):
+        config.set((), "base-directory", self.dir.name)
+
+        config.set((), "postprocessors", [{"name": "zip"}])
+        tjob = self.jobclass(TestExtractor.from_url("test:"))
+        tjob.initialize()
+        self.assertIsNotNone(tjob.stream)
+
+        # 'after' and 'finalize' hooks of other postprocessors
+        for event in ("after", "finalize"):
+            config.set((), "postprocessors", [
+                {"name": "zip"},
+                {"name": "mtime", "event": event},
+            ])
+            tjob = self.jobclass(TestExtractor.from_url("test:"))
+            tjob.initialize()
+            self.assertIsNone(tjob.stream, event)
+
+    def test_postprocessor_workers(self):
+        config.set((), "base-directory", self.dir.name)
+        config.set(("output",), "mode", False)
+
+        def download(url, pathfmt):
+            with pathfmt.open() as fp:
+                fp.write(url.encode())
+            return True
+
+        def file(pathfmt):
+            # finish in reverse order
+            time.sleep((4 - pathfmt.kwdict["num"]) / 20)
+            pathfmt.kwdict["_thread"] = threading.current_thread().name
+
+        def after(pathfmt):
+            kwdict = pathfmt.kwdict
+            results.append((kwdict["num"], kwdict["_thread"],
+                            os.path.exists(pathfmt.realpath)))
+
+        results = []
+        extr = TestExtractor.from_url("test:")
+        tjob = self.jobclass(extr)
+        tjob.initialize()
+        tjob.hooks = collections.defaultdict(list)
+        tjob.register_hooks({"file": file}, {"workers": 3})
+        tjob.register_hooks({"after": after})
+        self.assertIsInstance(tjob.hooks["file"][0], job.AsyncHook)
+
+        with patch.object(tjob, "download", download):
+            tjob.run()
+
+        self.assertEqual(tjob.status, 0)
+        self.assertEqual([r[0] for r in results], [1, 2, 3])
+        for _, thread, exists in results:
+            self.assertTrue(thread.startswith("postprocessor"), thread)
+            self.assertTrue(exists)
+
+    def test_postprocessor_workers_error(self):
+        config.set((), "base-directory", self.dir.name)
+        config.set(("output",), "mode", False)
+        config.set((), "download", False)
+
+        def file(pathfmt):
+            if pathfmt.kwdict["num"] == 2:
+                raise ValueError("foo")
+            results.append(pathfmt.kwdict["num"])
+
+        results = []
+        extr = TestExtractor.from_url("test:")
+        tjob = self.jobclass(extr)
+        tjob.initialize()
+        tjob.hooks = collections.defaultdict(list)
+        tjob.register_hooks({"after": file}, {"workers": 1})
+
+        with self.assertLogs("download", "ERROR") as cm:
+            tjob.run()
+
+        self.assertEqual(tjob.status, 1)
+        self.assertEqual(results, [1, 3])
+        self.assertEqual(cm.output, ["ERROR:download:ValueError: foo"])
+
+    def test_postprocessor_workers_errors(self):
+        config.set((), "base-directory", self.dir.name)
+        config.set(("output",), "mode", False)
+        config.set((), "download", False)
+
+        def file(pathfmt):
+            if pathfmt.kwdict["num"] != 2:
+                raise ValueError(pathfmt.kwdict["num"])
+
+        def after(pathfmt):
+            results.append(pathfmt.kwdict["num"])
+
+        results = []
+        extr = TestExtractor.from_url("test:")
+        tjob = self.jobclass(extr)
+        tjob.initialize()
+        tjob.hooks = collections.defaultdict(list)
+        tjob.register_hooks({"file": file}, {"workers": 2})
+        tjob.register_hooks({"after": after})
+
+        with self.assertLogs("download", "ERROR") as cm:
+            tjob.run()
+
+        self.assertEqual(tjob.status, 1)
+        self.assertEqual(results, [2])
+        self.assertEqual(sorted(cm.output), [
+            "ERROR:download:ValueError: 1", "ERROR:download:ValueError: 3"])
+        self.assertFalse(tjob._pp_pending)
+
+    def test_postprocessor_workers_exists(self):
+        config.set((), "base-directory", self.dir.name)
+        config.set(("output",), "mode", False)
+        config.set(("extractor",), "filename", "same.{extension}")
+
+        def download(url, pathfmt):
+            downloads.append(url)
+            pathfmt.part_enable()
+            with pathfmt.open() as fp:
+                fp.write(url.encode())
+            return True
+
+        def file(pathfmt):
+            time.sleep(0.05)
+
+        downloads = []
+        extr = TestExtractor.from_url("test:")
+        tjob = self.jobclass(extr)
+        tjob.initialize()
+        tjob.hooks = collections.defaultdict(list)
+        tjob.register_hooks({"file": file}, {"workers": 3})
+
+        with patch.object(tjob, "download", download):
+            tjob.run()
+
+        self.assertEqual(downloads, ["https://example.org/1.jpg"])
+        with open(os.path.join(
+                self.dir.name, "test_category", "same.jpg")) as fp:
+            self.assertEqual(fp.read(), "https://example.org/1.jpg")
+
+    def test_postprocessor_workers_threadsafe(self):
+        config.set(("output",), "mode", False)
+        config.set((), "download", False)
+
+        class PP():
+            threadsafe = False
+
+            def __init__(self):
+                self.active = self.max = 0
+                self.lock = threading.Lock()
+
+            def run(self, pathfmt):
+                with self.lock:
+                    self.active += 1
+                    self.max = max(self.max, self.active)
+                time.sleep(0.05)
+                with self.lock:
+                    self.active -= 1
+
+        pp1 = PP()
+        pp2 = PP()
+        pp2.threadsafe = True
+
+        extr = TestExtractor.from_url("test:")
+        tjob = self.jobclass(extr)
+        tjob.initialize()
+        tjob.hooks = collections.defaultdict(list)
+        tjob.register_hooks({"after": pp1.run}, {"workers": 3})
+        tjob.register_hooks({"after": pp2.run}, {"workers": 3})
+        tjob.run()
+
+        self.assertEqual(pp1.max, 1)
+        self.assertGreater(pp2.max, 1)
+
+    def test_postprocessor_workers_prepare(self):
+        tjob = self.jobclass(TestExtractorNoop.from_url("test:noop"))
+        tjob.hooks = collections.defaultdict(list)
+        tjob.register_hooks(
+            {"prepare": print, "file": print}, {"workers": 2, "name": "test"})
+        self.assertIs(tjob.hooks["file"][0], print)
+        self.assertIsNone(tjob._pp_pending)
+
+    def test_children_concurrency(self):
+        config.set((), "children-concurrency", 3)
+        config.set(("output",), "mode", False)
+        config.set((), "download", False)
+
+        extr = TestExtractorChildren.from_url("test:children")
+        tjob = self.jobclass(extr)
+        with self.assertLogs(level="INFO") as cm:
+            tjob.run()
+
+        self.assertEqual(tjob.status, 1)
+        self.assertEqual(len(tjob.visited), 4)
+
+        # logs of concurrently running children get emitted in order
+        messages = [
+            (record.getMessage(), record.threadName)
+            for record in cm.records
+            if record.name == "test_category"
+        ]
+        self.assertEqual([msg for msg, _ in messages], [
+            "child 1",
+            "child 2",
+            "An unexpected error occurred: ZeroDivisionError - division by "
+            "zero. Please run gallery-dl again with the --verbose flag, copy "
+            "its output and report this issue on "
+            "https://github.com/mikf/gallery-dl/issues .",
+            "child 3",
+            "child 4",
+        ])
+        for _, thread in messages:
+            self.assertTrue(thread.startswith("child"), thread)
+
+    def test_children_concurrency_output(self):
+        config.set((), "children-concurrency", 3)
+        config.set(("output",), "mode", "pipe")
+
+        extr = TestExtractorChildren.from_url("test:children")
+        tjob = job.SimulationJob(extr)
+        with self.assertLogs(level="INFO"):
+            output = self._capture_stdout(tjob)
+
+        # output of concurrently running children gets written in order
+        skip = job.output.CHAR_SKIP
+        self.assertEqual(output, f"{skip}1.jpg\n{skip}3.jpg\n{skip}4.jpg\n")
+
+    def test_children_concurrency_skip(self):
+        tjob = self.jobclass(TestExtractorNoop.from_url("test:noop"))
+        tjob._children_max = 2
+
+        def commit(base, count, reset=False):
+            child = Mock(_skipcnt=count, _skipbase=base, _skipreset=reset)
+            tjob._handle_queue_commit(child, {}, 0, True)
+            return tjob._skipcnt
+
+        # children started with a count of 0
+        # while earlier ones were still running
+        self.assertEqual(commit(0, 2), 2)
+        self.assertEqual(commit(0, 3), 5)
+        # started with a count of 5
+        self.assertEqual(commit(5, 6), 6)
+        # downloaded a file
+        self.assertEqual(commit(2, 1, True), 1)
+
+        tjob._children_max = 0
+        self.assertEqual(commit(1, 4), 4)
+
+    def test_children_visited(self):
+        parent = self.jobclass(
+            TestExtractorChildren.from_url("test:children"))
+        child = self.jobclass(
+            TestExtractorChildren.from_url("test:child:1"), parent)
+        self.assertIs(child.visited, parent.visited)
+        self.assertIs(child._visited_lock, parent._visited_lock)
+        self.assertIsInstance(child.out, job.output.BufferOutput)
+
+    def test_watermark(self):
+        config.set((), "download", False)
+        config.set(("output",), "mode", False)
+
+        extr = TestExtractor.from_url("test:")
+        extr.watermark = watermark = Mock()
+        tjob = self.jobclass(extr)
+        tjob.run()
+        watermark.commit.assert_called_once_with()
+
+        extr = TestExtractor.from_url("test:")
+        extr.watermark = watermark = Mock()
+        tjob = self.jobclass(extr)
+        tjob.status = 4
+        tjob.run()
+        watermark.commit.assert_not_called()
+
+        extr = TestExtractor.from_url("test:")
+        extr.watermark = watermark = Mock()
+        tjob = job.SimulationJob(extr)
+        tjob.run()
+        self.assertEqual(tjob.status, 0)
+        watermark.commit.assert_not_called()
+
 
 class TestKeywordJob(TestJob):
     jobclass = job.KeywordJob
@@ -455,6 +816,71 @@ class TestDataJob(TestJob):
         for line in file.getvalue().split():
             self.assertRegex(line, r"""^\[[23],("http[^"]+",)?\{.+\}\]$""")
 
+    def test_stream(self):
+        extr = TestExtractor.from_url("test:")
+        tjob = self.jobclass(extr, file=io.StringIO())
+        tjob.run()
+        expected = tjob.file.getvalue()
+
+        for buffer in (True, 3, 100):
+            config.set(("output",), "stream", buffer)
+            extr = TestExtractor.from_url("test:")
+            tjob = self.jobclass(extr, file=io.StringIO())
+            tjob.run()
+            self.assertEqual(tjob.file.getvalue(), expected)
+            self.assertEqual(tjob.data, [])
+            self.assertEqual(tjob.data_urls, [])
+
+        extr = TestExtractorException.from_url("test:exception")
+        tjob = self.jobclass(extr, file=io.StringIO())
+        tjob.run()
+        self.assertEqual(util.json_loads(tjob.file.getvalue())[-1], [
+            -1, {"error": "ZeroDivisionError",
+                 "message": "division by zero"},
+        ])
+
+        extr = TestExtractorNoop.from_url("test:noop")
+        tjob = self.jobclass(extr, file=io.StringIO())
+        tjob.run()
+        self.assertEqual(tjob.file.getvalue(), "[]\n")
+
+    def test_stream_jsonl(self):
+        config.set(("output",), "stream", True)
+        config.set(("output",), "jsonl", True)
+        config.set(("output",), "num-to-str", True)
+
+        extr = TestExtractor.from_url("test:")
+        tjob = self.jobclass(extr, file=io.StringIO())
+        tjob.run()
+        self.assertEqual(tjob.data, [])
+
+        lines = tjob.file.getvalue().splitlines()
+        self.assertEqual(len(lines), 4)
+        msg = util.json_loads(lines[-1])
+        self.assertEqual(msg[1], "https://example.org/3.jpg")
+        self.assertEqual(msg[2]["num"], "3")
+        self.assertEqual(msg[2]["user"]["id"], "123")
+
+        # extractor data stays unchanged
+        self.assertEqual(extr.user["id"], 123)
+
+    def test_stream_resolve(self):
+        extr = TestExtractorParent.from_url("test:parent:1")
+        tjob = self.jobclass(extr, file=io.StringIO(), resolve=64)
+        tjob.run()
+        expected = tjob.file.getvalue()
+
+        config.set(("output",), "stream", True)
+        extr = TestExtractorParent.from_url("test:parent:1")
+        tjob = self.jobclass(extr, file=io.StringIO(), resolve=64)
+        tjob.run()
+        self.assertEqual(tjob.data_urls, [])
+        self.assertEqual(tjob.file.getvalue(), expected)
+
+        urls = [msg[1] for msg in util.json_loads(expected)
+                if msg[0] == Message.Url]
+        self.assertEqual(len(urls), 27)
+
     def test_opt_init(self):
         config.set((), "init", True)
 
@@ -574,6 +1000,29 @@ class TestExtractorParent(Extractor):
             }
 
 
+class TestExtractorChildren(Extractor):
+    category = "test_category"
+    subcategory = "test_subcategory_children"
+    pattern = r"test:child(ren|:\d+)$"
+
+    def items(self):
+        if self.groups[0] == "ren":
+            for i in range(1, 5):
+                yield Message.Queue, f"test:child:{i}", {
+                    "_extractor": TestExtractorChildren}
+            return
+
+        # finish children in reverse order
+        num = int(self.groups[0][1:])
+        time.sleep((5 - num) / 20)
+        self.log.info("child %s", num)
+        if num == 2:
+            1/0
+        yield Message.Directory, "", {}
+        yield Message.Url, f"https://example.org/{num}.jpg", {
+            "filename": str(num), "extension": "jpg"}
+
+
 class TestExtractorException(Extractor):
     category = "test_category"
     subcategory = "test_subcategory_exception"
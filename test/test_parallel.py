@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Mike Fährmann
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+import os
+import sys
+import unittest
+from unittest.mock import Mock, patch
+
+import logging
+import tempfile
+import multiprocessing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gallery_dl import parallel, config, job, InputManager, ExtendedUrl  # noqa E402
+
+try:
+    multiprocessing.get_context("fork")
+except ValueError:
+    FORK = False
+else:
+    FORK = True
+
+
+class TestParallel(unittest.TestCase):
+
+    def tearDown(self):
+        config.clear()
+
+    def test_group_urls(self):
+        gconf = [(["extractor"], "foo", 1)]
+        lconf = [(["extractor"], "bar", 2)]
+        urls = [
+            "https://danbooru.donmai.us/posts/1",
+            "noop",
+            ("https://danbooru.donmai.us/posts/2", "file", None, [2]),
+            ExtendedUrl("noop", gconf, lconf),
+            "foo:bar",
+            "https://danbooru.donmai.us/posts/3",
+            "https://example.org/1.jpg",
+            "https://example.com/2.jpg",
+            "https://example.org/3.jpg",
+        ]
+
+        self.assertEqual(parallel.group_urls(urls), [
+            [
+                (0, "https://danbooru.donmai.us/posts/1", []),
+                (2, "https://danbooru.donmai.us/posts/2", []),
+                (5, "https://danbooru.donmai.us/posts/3", gconf),
+            ],
+            [
+                (1, "noop", []),
+                (3, "noop", gconf + lconf),
+            ],
+            [
+                (4, "foo:bar", gconf),
+            ],
+            [
+                (6, "https://example.org/1.jpg", gconf),
+                (8, "https://example.org/3.jpg", gconf),
+            ],
+            [
+                (7, "https://example.com/2.jpg", gconf),
+            ],
+        ])
+
+    def test_run_job(self):
+        self.assertEqual(parallel.run_job(job.DownloadJob, "noop", ()), 0)
+        self.assertEqual(parallel.run_job(job.DownloadJob, "foo:bar", ()), 64)
+
+        config.set((), "foo", "bar")
+        jobtype = Mock(__name__="TestJob")
+        jobtype.return_value.run.side_effect = lambda: config.get((), "foo")
+        conf = [((), "foo", "baz")]
+        self.assertEqual(parallel.run_job(jobtype, "noop", conf), "baz")
+        self.assertEqual(config.get((), "foo"), "bar")
+
+        jobtype.return_value.run.side_effect = ValueError("foo")
+        with self.assertLogs("parallel", "ERROR") as cm:
+            self.assertEqual(parallel.run_job(jobtype, "noop", ()), 1)
+        self.assertEqual(cm.output, ["ERROR:parallel:ValueError: foo"])
+
+    @unittest.skipIf(not FORK, "no 'fork' support")
+    def test_run(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "input.txt")
+            with open(path, "w") as fp:
+                fp.write("noop\nfoo:bar\n-G filename = \"x\"\nnoop\n"
+                         "https://danbooru.donmai.us/posts/1\n")
+
+            manager = InputManager()
+            manager.log = logging.getLogger("inputfile")
+            manager.err = Mock()
+            manager.add_file(path, "c")
+
+            # workers are able to start processes of their own
+            jobtype = Mock(__name__="TestJob")
+            jobtype.return_value.run.side_effect = \
+                lambda: int(multiprocessing.current_process().daemon)
+            self.assertEqual(parallel.run(manager, jobtype, 4), 0)
+
+            with open(path) as fp:
+                self.assertEqual(fp.read(), (
+                    "# noop\n# foo:bar\n-G filename = \"x\"\n# noop\n"
+                    "# https://danbooru.donmai.us/posts/1\n"))
+            manager.err.info.assert_not_called()
+
+    @unittest.skipIf(not FORK, "no 'fork' support")
+    def test_run_error(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "input.txt")
+            with open(path, "w") as fp:
+                fp.write("noop\nfoo:bar\nnoop\n")
+
+            manager = InputManager()
+            manager.log = logging.getLogger("inputfile")
+            manager.err = Mock()
+            manager.add_file(path, "d")
+
+            self.assertEqual(parallel.run(manager, job.DownloadJob, 2), 64)
+
+            # failed URLs get moved to the error file
+            with open(path) as fp:
+                self.assertEqual(fp.read(), "")
+            manager.err.info.assert_called_once_with("foo:bar")
+
+    @unittest.skipIf(not FORK, "no 'fork' support")
+    def test_run_exception(self):
+        # unsupported URLs end up in the same group and worker
+        manager = Mock(urls=["foo:1", "foo:2", "foo:3", "foo:4"])
+        selected = []
+        manager.select.side_effect = selected.append
+
+        def run(url):
+            if url == "foo:2":
+                raise ValueError(url)
+            return 0
+
+        jobtype = Mock(__name__="TestJob")
+        jobtype.side_effect = lambda url: Mock(run=lambda: run(url))
+        with patch.object(parallel.log, "error"), \
+                patch.object(parallel.log, "debug"):
+            self.assertEqual(parallel.run(manager, jobtype, 2), 1)
+
+        # URLs after the failed one still get processed
+        self.assertEqual(selected, [0, 1, 2, 3])
+        self.assertEqual(manager.error.call_count, 1)
+        self.assertEqual(manager.success.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
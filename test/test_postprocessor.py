@@ -12,7 +12,10 @@ import sys
 import unittest
 from unittest.mock import Mock, mock_open, patch, call
 
+import time
 import shutil
+import struct
+import hashlib
 import logging
 import zipfile
 import tempfile
@@ -38,12 +41,20 @@ class FakeJob():
         self.out = output.NullOutput()
         self.get_logger = logging.getLogger
         self.hooks = collections.defaultdict(list)
+        self.digests = set()
+        self.stream = None
         self.status = 0
 
     def register_hooks(self, hooks, options=None):
         for hook, callback in hooks.items():
             self.hooks[hook].append(callback)
 
+    def register_digests(self, names):
+        self.digests.update(names)
+
+    def register_stream(self, callback):
+        self.stream = callback
+
 
 class TestPostprocessorModule(unittest.TestCase):
 
@@ -92,6 +103,8 @@ class BasePostprocessorTest(unittest.TestCase):
 
     def tearDown(self):
         self.job.hooks.clear()
+        self.job.digests.clear()
+        self.job.stream = None
         self.job.status = 0
 
     def _create(self, options=None, data=None):
@@ -211,6 +224,91 @@ class ClassifyTest(BasePostprocessorTest):
         self.assertEqual(self.pathfmt.realpath, f"{path}/file.foo")
 
 
+class CompareTest(BasePostprocessorTest):
+
+    def test_compare_replace(self):
+        self._create()
+        # no digests computed for every download
+        self.assertEqual(self.job.digests, set())
+        pathfmt = self.pathfmt
+        pathfmt.part_enable()
+
+        os.makedirs(pathfmt.realdirectory, exist_ok=True)
+        with open(pathfmt.realpath, "wb") as fp:
+            fp.write(b"Foo Bar\n")
+        with pathfmt.open() as fp:
+            fp.write(b"Foo Baz\n")
+
+        pathfmt.delete = False
+        self._trigger()
+        self.assertFalse(pathfmt.delete)
+
+        with pathfmt.open() as fp:
+            fp.write(b"Foo Bar\n")
+
+        pathfmt.delete = False
+        self._trigger()
+        self.assertTrue(pathfmt.delete)
+
+    def test_compare_digests(self):
+        self._create()
+        pathfmt = self.pathfmt
+        pathfmt.part_enable()
+
+        os.makedirs(pathfmt.realdirectory, exist_ok=True)
+        with open(pathfmt.realpath, "wb") as fp:
+            fp.write(b"Foo Bar\n")
+        with pathfmt.open() as fp:
+            fp.write(b"Foo Bar\n")
+
+        stat = os.stat(pathfmt.temppath)
+        pathfmt.kwdict["_digests"] = digests = {
+            "path" : pathfmt.temppath,
+            "size" : stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "hexdigests": {"sha256": hashlib.sha256(
+                b"Foo Bar\n").hexdigest()},
+        }
+
+        pathfmt.delete = False
+        with patch("builtins.open", wraps=open) as m:
+            self._trigger()
+        self.assertTrue(pathfmt.delete)
+        # '.part' file did not get read again
+        m.assert_called_once_with(pathfmt.realpath, "rb")
+
+        digests["hexdigests"]["sha256"] = "0" * 64
+        pathfmt.delete = False
+        self._trigger()
+        self.assertFalse(pathfmt.delete)
+
+    def test_compare_early_exit(self):
+        self._create()
+        pathfmt = self.pathfmt
+        pathfmt.part_enable()
+
+        os.makedirs(pathfmt.realdirectory, exist_ok=True)
+        with open(pathfmt.realpath, "wb") as fp:
+            fp.write(b"A" * 100000)
+        with pathfmt.open() as fp:
+            fp.write(b"B" * 100000)
+
+        reads = []
+        pp = self.job.hooks["file"][0].__self__
+        open_orig = open
+
+        def open_counted(path, mode):
+            fp = open_orig(path, mode)
+            read = fp.read
+            fp.read = lambda size: reads.append(size) or read(size)
+            return fp
+
+        pathfmt.delete = False
+        with patch("builtins.open", open_counted):
+            self.assertFalse(pp._compare(pathfmt.realpath, pathfmt.temppath))
+        self.assertEqual(len(reads), 2)
+
+
 class DirectoryTest(BasePostprocessorTest):
 
     def test_default(self):
@@ -547,6 +645,37 @@ class HashTest(BasePostprocessorTest):
             "3e1095b50736c4fd1e2deea152e3c8ecd5993462a747208e4d842659935a1c62",
             kwdict["sha512"], "sha512")
 
+    def test_digests(self):
+        self._create({"hashes": "md5,sha1:foo"})
+        self.assertEqual(self.job.digests, {"md5", "sha1"})
+
+        with self.pathfmt.open() as fp:
+            fp.write(b"Foo Bar\n")
+
+        # use digests computed while downloading
+        stat = os.stat(self.pathfmt.temppath)
+        self.pathfmt.kwdict["_digests"] = {
+            "path" : self.pathfmt.temppath,
+            "size" : stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "hexdigests": {"md5": "abc", "sha1": "def"},
+        }
+        self._trigger()
+
+        kwdict = self.pathfmt.kwdict
+        self.assertEqual(kwdict["md5"], "abc")
+        self.assertEqual(kwdict["foo"], "def")
+
+        # ignore digests of modified files
+        with self.pathfmt.open("ab") as fp:
+            fp.write(b"Foo Bar\n")
+        self._trigger()
+
+        self.assertEqual(kwdict["md5"], hashlib.md5(
+            b"Foo Bar\nFoo Bar\n").hexdigest())
+        self.assertEqual(kwdict["foo"], hashlib.sha1(
+            b"Foo Bar\nFoo Bar\n").hexdigest())
+
 
 class MetadataTest(BasePostprocessorTest):
 
@@ -1226,6 +1355,165 @@ class ZipTest(BasePostprocessorTest):
 
         os.unlink(pp.zfile.filename)
 
+    def test_zip_safe_write(self):
+        pp = self._create({"mode": "safe"})
+
+        self.pathfmt.temppath = path = f"{self.pathfmt.realdirectory}file"
+        os.makedirs(self.pathfmt.realdirectory, exist_ok=True)
+        with open(path, "w") as fp:
+            fp.write("foobar\n")
+
+        for i in range(3):
+            self.pathfmt.filename = f"file{i}.ext"
+            self._trigger()
+
+            # archive is complete after each file
+            with zipfile.ZipFile(pp.args[0]) as file:
+                self.assertEqual(len(file.NameToInfo), i+1)
+                self.assertEqual(file.read(f"file{i}.ext"), b"foobar\n")
+
+        self._trigger(("finalize",))
+        with zipfile.ZipFile(pp.args[0]) as file:
+            self.assertEqual(len(file.NameToInfo), 3)
+        os.unlink(pp.args[0])
+
+    def test_zip_safe_write_fallback(self):
+        pp = self._create({"mode": "safe"})
+
+        self.pathfmt.temppath = path = f"{self.pathfmt.realdirectory}file"
+        os.makedirs(self.pathfmt.realdirectory, exist_ok=True)
+        with open(path, "w") as fp:
+            fp.write("foobar\n")
+
+        with patch("gallery_dl.postprocessor.zip.has_internals",
+                   return_value=False):
+            self.assertIsNone(pp.stream(self.pathfmt, 7))
+
+            for i in range(3):
+                self.pathfmt.filename = f"file{i}.ext"
+                self._trigger()
+                self.assertIsNone(pp.zfile)
+
+                with zipfile.ZipFile(pp.args[0]) as file:
+                    self.assertEqual(len(file.NameToInfo), i+1)
+
+        self._trigger(("finalize",))
+        os.unlink(pp.args[0])
+
+    def test_zip_internals(self):
+        with zipfile.ZipFile(
+                os.path.join(self.dir.name, "test.zip"), "w") as file:
+            self.assertTrue(postprocessor.zip.has_internals(file))
+
+    def test_zip_stream(self):
+        pp = self._create({"keep-files": False})
+        self.assertEqual(self.job.stream, pp.stream)
+        pathfmt = self.pathfmt
+
+        # successful download
+        pathfmt.filename = "file1.ext"
+        with pp.stream(pathfmt, 7) as fp:
+            fp.write(b"foo")
+            fp.write(b"bar\n")
+            self.assertEqual(fp.tell(), 7)
+            fp.commit()
+        pathfmt.delete = False
+        self._trigger()
+        self.assertTrue(pathfmt.delete)
+        self.assertEqual(len(pp.zfile.NameToInfo), 1)
+
+        # failed download
+        pathfmt.filename = "file2.ext"
+        with pp.stream(pathfmt, 0) as fp:
+            fp.write(b"foo")
+        self.assertEqual(len(pp.zfile.NameToInfo), 1)
+
+        pathfmt.filename = "file3.ext"
+        with pp.stream(pathfmt, 0) as fp:
+            fp.write(b"baz\n")
+            fp.commit()
+
+        # existing entry
+        pathfmt.filename = "file1.ext"
+        self.assertIsNone(pp.stream(pathfmt, 0))
+
+        self._trigger(("finalize",))
+        with zipfile.ZipFile(pp.args[0]) as file:
+            self.assertIsNone(file.testzip())
+            self.assertEqual(file.namelist(), ["file1.ext", "file3.ext"])
+            self.assertEqual(file.read("file1.ext"), b"foobar\n")
+            self.assertEqual(file.read("file3.ext"), b"baz\n")
+        os.unlink(pp.args[0])
+
+    def test_zip_stream_mtime(self):
+        pp = self._create({"keep-files": False})
+        pathfmt = self.pathfmt
+        mtime = 1445412480
+
+        for num, value in enumerate((
+                None, "Wed, 21 Oct 2015 07:28:00 GMT", mtime)):
+            pathfmt.filename = f"file{num}.ext"
+            pathfmt.kwdict["_mtime_http"] = value
+            with pp.stream(pathfmt, 4) as fp:
+                fp.write(b"foo\n")
+                fp.commit()
+            self._trigger()
+        del pathfmt.kwdict["_mtime_http"]
+
+        self._trigger(("finalize",))
+        date_time = time.localtime(mtime)[:6]
+        with zipfile.ZipFile(pp.args[0]) as file:
+            self.assertIsNone(file.testzip())
+            infos = file.infolist()
+            self.assertNotEqual(infos[0].date_time, date_time)
+            for info in infos[1:]:
+                self.assertEqual(info.date_time, date_time)
+                self.assertEqual(file.read(info), b"foo\n")
+
+                # local file header
+                file.fp.seek(info.header_offset + 10)
+                self.assertEqual(file.fp.read(4), struct.pack(
+                    "<HH",
+                    date_time[3] << 11 | date_time[4] << 5 |
+                    date_time[5] // 2,
+                    (date_time[0] - 1980) << 9 |
+                    date_time[1] << 5 | date_time[2]))
+        os.unlink(pp.args[0])
+
+    def test_zip_stream_safe(self):
+        pp = self._create({"mode": "safe"})
+        pathfmt = self.pathfmt
+
+        for num in range(3):
+            pathfmt.filename = f"file{num}.ext"
+            with pp.stream(pathfmt, 0) as fp:
+                fp.write(b"foobar\n")
+                if num != 1:
+                    fp.commit()
+            if num != 1:
+                self._trigger()
+
+            # readable while still open
+            with zipfile.ZipFile(pp.args[0]) as file:
+                self.assertIsNone(file.testzip())
+                self.assertEqual(len(file.namelist()), 1 if num < 2 else 2)
+
+        self.assertTrue(postprocessor.zip.has_internals(pp.zfile))
+        self._trigger(("finalize",))
+        with zipfile.ZipFile(pp.args[0]) as file:
+            self.assertIsNone(file.testzip())
+            self.assertEqual(file.namelist(), ["file0.ext", "file2.ext"])
+            self.assertEqual(file.read("file2.ext"), b"foobar\n")
+        os.unlink(pp.args[0])
+
+    def test_zip_stream_disabled(self):
+        self._create({"keep-files": True})
+        self.assertIs(self.job.stream, None)
+        self._create({"compression": "zip"})
+        self.assertIs(self.job.stream, None)
+        self._create({"stream": False})
+        self.assertIs(self.job.stream, None)
+
     def test_zip_write_mock(self):
 
         def side_effect(_, name):
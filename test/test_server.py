@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+import os
+import sys
+import unittest
+
+import json
+import types
+import socket
+import logging
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gallery_dl import server, config  # noqa E402
+
+
+class TestServer(unittest.TestCase):
+
+    def setUp(self):
+        config.set(("output",), "mode", "null")
+
+    def tearDown(self):
+        config.clear()
+
+    def _run(self, *requests, token="secret"):
+        client, conn = socket.socketpair()
+        try:
+            for request in requests:
+                if isinstance(request, dict) and "token" not in request:
+                    request["token"] = token
+                if not isinstance(request, str):
+                    request = json.dumps(request)
+                client.sendall(request.encode() + b"\n")
+            client.shutdown(socket.SHUT_WR)
+
+            server.Handler(
+                conn, None, types.SimpleNamespace(token="secret"))
+            conn.close()
+
+            with client.makefile("rb") as fp:
+                return [json.loads(line) for line in fp]
+        finally:
+            client.close()
+            conn.close()
+
+    def _status(self, events):
+        return [e["status"] for e in events if e["event"] == "status"]
+
+    def test_noop(self):
+        events = self._run({"url": "noop"}, {"url": "noop"})
+        self.assertEqual(events, [
+            {"event": "status", "status": 0},
+            {"event": "status", "status": 0},
+        ])
+
+    def test_unsupported(self):
+        events = self._run({"url": "foo:bar"})
+        self.assertEqual(events, [
+            {"event": "log", "level": "error", "name": "server",
+             "message": "Unsupported URL 'foo:bar'"},
+            {"event": "status", "status": 64},
+        ])
+
+    def test_invalid(self):
+        events = self._run(
+            "foobar",
+            {"foo": "bar"},
+            {"url": "noop", "type": "foo"},
+            {"url": "noop"},
+        )
+        self.assertEqual(self._status(events), [128, 128, 128, 0])
+        self.assertEqual(events[2]["event"], "log")
+        self.assertEqual(events[2]["level"], "error")
+
+    def test_data(self):
+        url = "https://example.org/image.jpg"
+        events = self._run({"url": url, "type": "data"})
+
+        data = [e["message"] for e in events if e["event"] == "data"]
+        self.assertEqual(len(data), 2)
+        self.assertEqual(data[0][0], 2)  # Message.Directory
+        self.assertEqual(data[1][:2], [3, url])  # Message.Url
+        self.assertEqual(data[1][2]["filename"], "image")
+        self.assertEqual(self._status(events), [0])
+
+    def test_options(self):
+        url = "https://example.org/image.jpg"
+        events = self._run(
+            {"url": url, "type": "simulate",
+             "options": {"filename": "foo.{extension}"}},
+            {"url": url, "type": "simulate"},
+        )
+
+        skipped = [e["path"] for e in events if e["event"] == "skip"]
+        self.assertEqual(skipped, ["foo.jpg", "example.org__image.jpg"])
+        self.assertEqual(self._status(events), [0, 0])
+        self.assertIsNone(config.get((), "filename"))
+
+    def test_token(self):
+        events = self._run(
+            {"url": "noop", "token": "foo"},
+            {"url": "noop"},
+        )
+        self.assertEqual(events, [
+            {"event": "status", "status": 128, "message": "Invalid token"},
+        ])
+
+        events = self._run({"url": "noop", "token": None})
+        self.assertEqual(self._status(events), [128])
+
+    def test_options_forbidden(self):
+        for options in (
+            {"postprocessors": [{"name": "exec", "command": "foo"}]},
+            {"extractor.postprocessors": []},
+            {"exec.command": "foo"},
+            {"image-filter": "True"},
+            {"cookies": "/etc/passwd"},
+            {"filename": "\fE __import__('os').getpid()"},
+            {"filename": {"True": "foo"}},
+            {"postprocessor.exec.filename": "foo"},
+        ):
+            events = self._run({"url": "noop", "options": options})
+            self.assertEqual(self._status(events), [128], options)
+            self.assertEqual(events[0]["event"], "log")
+            self.assertIn("Invalid request", events[0]["message"])
+
+        events = self._run({"url": "noop", "options": {
+            "extractor.example.videos": False,
+            "extractor.directory": ["{category}", "{id}"],
+        }})
+        self.assertEqual(self._status(events), [0])
+
+    def test_write_token(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "server.token")
+            token = server._write_token(path)
+            self.assertEqual(len(token), 32)
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o600)
+            with open(path) as fp:
+                self.assertEqual(fp.read(), token + "\n")
+            self.assertNotEqual(server._write_token(path), token)
+
+    def test_loglevel(self):
+        root = logging.getLogger()
+        level = root.level
+        root.setLevel(logging.NOTSET)
+        try:
+            events = self._run({"url": "noop", "loglevel": "debug"})
+        finally:
+            root.setLevel(level)
+        self.assertEqual(events[0], {
+            "event": "log", "level": "debug", "name": "server",
+            "message": "Starting DownloadJob for 'noop'"})
+
+
+if __name__ == "__main__":
+    unittest.main()
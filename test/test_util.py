@@ -13,6 +13,8 @@ import unittest
 from unittest.mock import Mock, patch
 
 import io
+import json
+import math
 import time
 import random
 import string
@@ -592,6 +594,115 @@ def hash(value):
         self.assertEqual(expr(value), result)
 
 
+class TestJSON(unittest.TestCase):
+
+    OBJ = {
+        "str"  : "foo/\"bar\"\\\n\x01\x7f",
+        "uni"  : "äöü 日本語 \U0001f600 \u2028",
+        "int"  : [0, -1, 2**63-1, 2**64-1, -2**70],
+        "const": [None, True, False, util.NONE],
+        "date" : datetime.datetime(2010, 1, 1, 12, 30),
+        "set"  : {1},
+        "empty": [[], {}],
+        1      : {"nested": {"a": [1, {"b": 2}]}},
+    }
+
+    def _encode(self, obj, **kwargs):
+        kwargs.setdefault("default", util.json_default)
+        kwargs.setdefault("check_circular", False)
+        return json.JSONEncoder(**kwargs).encode(obj)
+
+    def test_json_dumps(self):
+        self.assertEqual(
+            util.json_dumps(self.OBJ),
+            self._encode(self.OBJ, separators=(",", ":")))
+        self.assertEqual(util.json_dumps(util.NONE), "null")
+        self.assertEqual(util.json_dumps("ä"), '"\\u00e4"')
+
+    def test_json_encoder(self):
+        obj = self.OBJ.copy()
+        del obj[1]  # mixed key types cannot be sorted
+
+        for args in (
+            (False, False, None, None),
+            (False, False, (",", ":"), None),
+            (True, True, [",", ":"], None),
+            (False, True, None, 2),
+            (True, False, None, 2),
+            (False, False, (",", ": "), 2),
+            (False, False, None, 4),
+            (False, False, None, "\t"),
+        ):
+            ensure_ascii, sort_keys, separators, indent = args
+            self.assertEqual(
+                util.json_encoder(*args)(obj),
+                self._encode(obj, ensure_ascii=ensure_ascii,
+                             sort_keys=sort_keys, indent=indent,
+                             separators=separators and tuple(separators)),
+                args)
+
+    def test_json_backends(self):
+        floats = [float("nan"), float("inf"), -float("inf"),
+                  1e16, 1e-7, 0.5, 1.5e300]
+        expected = self._encode(floats, separators=(",", ":"))
+        self.assertEqual(
+            expected, "[NaN,Infinity,-Infinity,1e+16,1e-07,0.5,1.5e+300]")
+        if util.orjson is None:
+            self.assertEqual(util.json_dumps(floats), expected)
+
+        try:
+            import orjson
+        except ImportError:
+            raise unittest.SkipTest("orjson not installed")
+
+        obj = self.OBJ.copy()
+        del obj[1]
+        with patch.object(util, "orjson", orjson):
+            for args in (
+                (True, False, (",", ":"), None),
+                (False, False, (",", ":"), None),
+                (True, True, None, 2),
+                (False, False, None, 2),
+            ):
+                ensure_ascii, sort_keys, separators, indent = args
+                self.assertEqual(
+                    util.json_encoder(*args)(obj),
+                    self._encode(obj, ensure_ascii=ensure_ascii,
+                                 sort_keys=sort_keys, indent=indent,
+                                 separators=separators),
+                    args)
+
+            # documented differences
+            self.assertEqual(
+                util.json_encoder(True, False, (",", ":"))(floats),
+                "[null,null,null,1e16,1e-7,0.5,1.5e300]")
+
+    def test_json_loads(self):
+        data = self._encode(self.OBJ, ensure_ascii=False)
+        self.assertEqual(util.json_loads(data), json.loads(data))
+
+        self.assertEqual(
+            util.json_loads("[123456789012345678901234567890, "
+                            "-9300000000000000000, 18446744073709551615]"),
+            [123456789012345678901234567890,
+             -9300000000000000000, 18446744073709551615])
+        self.assertEqual(util.json_loads('"\\ud800"'), "\ud800")
+        self.assertTrue(math.isnan(util.json_loads("NaN")))
+
+        with self.assertRaises(ValueError):
+            util.json_loads("{")
+
+    def test_dump_json(self):
+        obj = [{"b": "ä", "a": [1, 2]}, {}]
+        for ensure_ascii in (True, False):
+            for indent in (2, 4):
+                fp = io.StringIO()
+                util.dump_json(obj, fp, ensure_ascii, indent)
+                self.assertEqual(fp.getvalue(), json.dumps(
+                    obj, ensure_ascii=ensure_ascii,
+                    indent=indent, sort_keys=True) + "\n")
+
+
 class TestOther(unittest.TestCase):
 
     def test_bencode(self):
@@ -1201,6 +1312,65 @@ value = 123
         with response as ctx:
             self.assertIs(response, ctx)
 
+    def test_retry_after(self):
+        response = Mock(headers={})
+        self.assertIsNone(util.retry_after(response))
+
+        response.headers["retry-after"] = "120"
+        self.assertEqual(util.retry_after(response), 120.0)
+        response.headers["retry-after"] = "-5"
+        self.assertEqual(util.retry_after(response), 0.0)
+        response.headers["retry-after"] = "foobar"
+        self.assertIsNone(util.retry_after(response))
+
+        with patch("time.time") as t:
+            t.return_value = 1445412480.0
+            response.headers["retry-after"] = "Wed, 21 Oct 2015 07:30:00 GMT"
+            self.assertEqual(util.retry_after(response), 120.0)
+            response.headers["retry-after"] = "Wed, 21 Oct 2015 07:00:00 GMT"
+            self.assertEqual(util.retry_after(response), 0.0)
+
+    def test_ratelimiter(self):
+        with patch("time.monotonic") as t:
+            t.return_value = 100.0
+            limiter = util.RateLimiter()
+
+            self.assertEqual(limiter.acquire(2.0), 0.0)
+            # concurrent requests get consecutive slots
+            self.assertEqual(limiter.acquire(2.0), 2.0)
+            self.assertEqual(limiter.acquire(2.0), 4.0)
+
+            # interval starts after the end of a request
+            t.return_value = 110.0
+            limiter.release()
+            t.return_value = 111.0
+            self.assertEqual(limiter.acquire(2.0), 1.0)
+
+            t.return_value = 120.0
+            limiter.block(30.0)
+            limiter.block(5.0)
+            self.assertEqual(limiter.acquire(), 30.0)
+            self.assertEqual(limiter.acquire(2.0), 32.0)
+
+    def test_ratelimiter_hosts(self):
+        limiter = util.ratelimiter("https://example.org/foo")
+        self.assertIsInstance(limiter, util.RateLimiter)
+        self.assertIs(util.ratelimiter("https://example.org/bar?baz"), limiter)
+
+        self.assertIsNot(util.ratelimiter("https://api.example.org/"), limiter)
+        self.assertIsNot(util.ratelimiter("https://example.org/foo",
+                                          "download"), limiter)
+
+    def test_ratelimiter_bounded(self):
+        with patch.object(util, "RATE_LIMITERS", util.lru.LRUCache(
+                "test", 3)) as limiters:
+            for num in range(10):
+                util.ratelimiter(f"https://{num}.example.org/")
+            self.assertEqual(len(limiters), 3)
+            self.assertEqual(
+                [root for _, root in limiters],
+                [f"https://{num}.example.org" for num in (7, 8, 9)])
+
 
 class TestExtractor():
     category = "test_category"
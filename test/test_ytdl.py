@@ -11,6 +11,10 @@ import os
 import sys
 import unittest
 
+import types
+import logging
+import http.cookiejar
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from gallery_dl import ytdl, util, config  # noqa E402
 
@@ -309,5 +313,137 @@ class Test_CommandlineArguments_YtDlp(Test_CommandlineArguments):
                ("firefox", "profile", "KEYRING", "container"))
 
 
+class FakeYoutubeDL():
+
+    def __init__(self, params):
+        self.params = params
+        self.cookiejar = http.cookiejar.CookieJar()
+
+
+class FakeYoutubeDLCookies(FakeYoutubeDL):
+
+    def __init__(self, params):
+        FakeYoutubeDL.__init__(self, params)
+        self.cookiejar.set_cookie(http.cookiejar.Cookie(
+            0, "initial", "1", None, False,
+            "example.org", False, False, "/", False,
+            False, None, False, None, None, {}))
+
+
+class Test_Pool(unittest.TestCase):
+
+    def setUp(self):
+        self.module = types.SimpleNamespace(
+            __name__="fake_ytdl", YoutubeDL=FakeYoutubeDL)
+        self.obj = types.SimpleNamespace(
+            config=lambda key, default=None: default, log=logging.getLogger())
+        ytdl.POOL.clear()
+
+    def tearDown(self):
+        ytdl.POOL.clear()
+
+    def test_reuse(self):
+        acquire = ytdl.acquire_YoutubeDL
+
+        y1 = acquire(self.module, self.obj, {"retries": 1})
+        y2 = acquire(self.module, self.obj, {"retries": 1})
+        self.assertIsNot(y1, y2)
+        self.assertEqual(y1.params["logger"], self.obj.log)
+
+        ytdl.release_YoutubeDL(y1)
+        self.assertIsNone(y1.params["logger"])
+        self.assertIs(acquire(self.module, self.obj, {"retries": 1}), y1)
+
+        ytdl.release_YoutubeDL(y2)
+        self.assertIsNot(acquire(self.module, self.obj, {"retries": 2}), y2)
+        self.assertIsNot(acquire(self.module, self.obj, {"retries": 1},
+                                 {"extract_flat": True}), y2)
+
+        y3 = acquire(self.module, self.obj, {"retries": 1})
+        self.assertIs(y3, y2)
+        self.assertIs(y3.params["logger"], self.obj.log)
+        self.assertTrue(y3.params["__gdl_initialize"])
+
+    def test_key(self):
+        acquire = ytdl.acquire_YoutubeDL
+
+        y1 = acquire(self.module, self.obj, {
+            "postprocessors": [{"key": "FFmpegMetadata", "add": True}],
+            "http_headers": {"Referer": "https://example.org/"},
+        })
+        ytdl.release_YoutubeDL(y1)
+        self.assertIs(acquire(self.module, self.obj, {
+            "http_headers": {"Referer": "https://example.org/"},
+            "postprocessors": [{"add": True, "key": "FFmpegMetadata"}],
+        }), y1)
+
+        def match_filter(info_dict):
+            pass
+
+        y2 = acquire(self.module, self.obj, {"match_filter": match_filter})
+        self.assertNotIn("__gdl_pool", y2.params)
+        ytdl.release_YoutubeDL(y2)
+        self.assertIsNot(
+            acquire(self.module, self.obj, {"match_filter": match_filter}),
+            y2)
+
+    def test_size(self):
+        acquire = ytdl.acquire_YoutubeDL
+        instances = [acquire(self.module, self.obj, {})
+                     for _ in range(ytdl.POOL_SIZE + 2)]
+        for y in instances:
+            ytdl.release_YoutubeDL(y)
+        idle, = ytdl.POOL.values()
+        self.assertEqual(idle, instances[:ytdl.POOL_SIZE])
+
+    def _cookie(self, name, value, domain="example.org"):
+        return http.cookiejar.Cookie(
+            0, name, value, None, False,
+            domain, False, False, "/", False,
+            False, None, False, None, None, {})
+
+    def test_release_state(self):
+        module = types.SimpleNamespace(
+            __name__="fake_ytdl", YoutubeDL=FakeYoutubeDLCookies)
+        y = ytdl.acquire_YoutubeDL(module, self.obj, {"ratelimit": 1000})
+        params = y.params
+        params["__gdl_progress"] = print
+        del params["__gdl_initialize"]
+
+        # changes by downloaders and extractors
+        params["ratelimit"] = 5000
+        params["outtmpl"] = {"default": "/tmp/foo"}
+        ytdl.set_cookies(y, (self._cookie("session", "abc"),))
+        y.cookiejar.set_cookie(self._cookie("manifest", "1", "cdn.org"))
+
+        ytdl.release_YoutubeDL(y)
+        self.assertIs(y.params, params)
+        self.assertEqual(params["ratelimit"], 1000)
+        self.assertNotIn("outtmpl", params)
+        self.assertNotIn("__gdl_cookies", params)
+        self.assertIs(params["__gdl_progress"], util.noop)
+        self.assertEqual(
+            [(c.name, c.value) for c in y.cookiejar], [("initial", "1")])
+
+        self.assertIs(ytdl.acquire_YoutubeDL(
+            module, self.obj, {"ratelimit": 1000}), y)
+        self.assertTrue(params["__gdl_initialize"])
+        self.assertIs(params["logger"], self.obj.log)
+
+    def test_cookies(self):
+        cookie = self._cookie
+        y = ytdl.acquire_YoutubeDL(self.module, self.obj, {})
+        y.cookiejar.set_cookie(cookie("own", "1"))
+
+        ytdl.set_cookies(y, (cookie("a", "1"), cookie("b", "2")))
+        self.assertEqual(
+            sorted(c.name for c in y.cookiejar), ["a", "b", "own"])
+
+        ytdl.set_cookies(y, (cookie("b", "3"),))
+        self.assertEqual(
+            sorted((c.name, c.value) for c in y.cookiejar),
+            [("b", "3"), ("own", "1")])
+
+
 if __name__ == "__main__":
     unittest.main(warnings="ignore")